@@ -0,0 +1 @@
+"""Benchmark scripts for the todo persistence and API layers."""
@@ -0,0 +1,158 @@
+"""Compare the sync and async API stacks under many concurrent connections.
+
+Both applications are served in-process through ``httpx.ASGITransport`` and
+share a temporary database, so the numbers reflect request handling and
+database access rather than network overhead.
+
+The sync stack is given an unpooled engine. With the default bounded pool,
+once more requests are in flight than AnyIO has worker threads, every worker
+blocks waiting for a connection held by a request that needs a worker to
+commit, and requests only fail after the pool timeout. The async stack waits
+for connections on the event loop and is measured with its regular engine.
+
+Run with ``python -m benchmarks.bench_async_stack [--requests N]
+[--concurrency N]``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from dddpy.infrastructure.di.injection import get_async_session, get_session
+from dddpy.infrastructure.settings import settings
+from dddpy.infrastructure.sqlite.database import (
+    Base,
+    create_async_sqlite_engine,
+)
+from dddpy.infrastructure.sqlite.profile import (
+    apply_sqlite_profile,
+    get_sqlite_profile,
+)
+from dddpy.presentation.api.todo.handlers import (
+    AsyncTodoApiRouteHandler,
+    TodoApiRouteHandler,
+)
+
+SEED_TODOS = 200
+
+
+def build_app(
+    handler: TodoApiRouteHandler,
+    factory: sessionmaker[Session],
+    async_factory: async_sessionmaker[AsyncSession],
+) -> FastAPI:
+    """Build an application whose sessions point at the benchmark database."""
+
+    def override_session() -> Iterator[Session]:
+        with factory.begin() as session:
+            yield session
+
+    async def override_async_session() -> AsyncIterator[AsyncSession]:
+        async with async_factory.begin() as session:
+            yield session
+
+    app = FastAPI()
+    handler.register_routes(app)
+    app.dependency_overrides[get_session] = override_session
+    app.dependency_overrides[get_async_session] = override_async_session
+    return app
+
+
+async def run_load(
+    app: FastAPI, requests: int, concurrency: int, writes: bool
+) -> tuple[float, float, float, int]:
+    """Fire requests with a bounded number in flight and collect latencies."""
+    transport = httpx.ASGITransport(app=app)
+    limit = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://bench'
+    ) as client:
+        ids = [
+            (await client.post('/todos', json={'title': f'Seed {i}'})).json()['id']
+            for i in range(SEED_TODOS)
+        ]
+
+        async def one(i: int) -> None:
+            nonlocal errors
+            async with limit:
+                started = time.perf_counter()
+                if writes:
+                    response = await client.post('/todos', json={'title': f'T {i}'})
+                else:
+                    response = await client.get(f'/todos/{ids[i % len(ids)]}')
+                latencies.append(time.perf_counter() - started)
+                if response.is_error:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    return requests / elapsed, statistics.median(latencies), p99, errors
+
+
+def main() -> None:
+    """Run the read and write scenarios against both stacks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=500)
+    args = parser.parse_args()
+
+    profile = get_sqlite_profile(settings.sqlite_profile)
+    handlers = {
+        'sync': TodoApiRouteHandler(),
+        'async': AsyncTodoApiRouteHandler(),
+    }
+
+    print(f'profile={settings.sqlite_profile} concurrency={args.concurrency}')
+    print(
+        f'{"stack":<6} {"scenario":<8} {"req/s":>8} '
+        f'{"p50 ms":>8} {"p99 ms":>8} {"errors":>7}'
+    )
+    for name, handler in handlers.items():
+        for writes in (False, True):
+            with tempfile.TemporaryDirectory() as directory:
+                url = f'sqlite:///{Path(directory) / "bench.db"}'
+                engine = create_engine(
+                    url, connect_args=profile.connect_args(), poolclass=NullPool
+                )
+                apply_sqlite_profile(engine, profile)
+                async_engine = create_async_sqlite_engine(url, profile)
+                Base.metadata.create_all(bind=engine)
+                app = build_app(
+                    handler,
+                    sessionmaker(bind=engine),
+                    async_sessionmaker(bind=async_engine, expire_on_commit=False),
+                )
+
+                rate, p50, p99, errors = asyncio.run(
+                    run_load(app, args.requests, args.concurrency, writes)
+                )
+                asyncio.run(async_engine.dispose())
+                engine.dispose()
+
+            scenario = 'write' if writes else 'read'
+            print(
+                f'{name:<6} {scenario:<8} {rate:>8.0f} '
+                f'{p50 * 1000:>8.1f} {p99 * 1000:>8.1f} {errors:>7}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""Measure what resolving the todo use case dependencies costs per request.
+
+Three applications expose one sync endpoint that returns without touching
+the database, so the numbers are the dependency graph alone:
+
+* ``none`` takes no dependencies, as a floor for FastAPI itself.
+* ``per-request`` wires the use case the way ``injection`` used to: sync
+  ``get_session``, ``get_todo_repository`` and use case dependencies, each
+  run on a worker thread, building a new use case for every request.
+* ``singleton`` uses ``get_find_todo_stats_usecase`` as it is today, which
+  binds the request session and returns the shared use case.
+
+The sessions never connect, so no database is needed. Run with
+``python -m benchmarks.bench_dependency_overhead [--requests N]
+[--concurrency N]``.
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.orm import Session
+
+from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.infrastructure.di.injection import get_find_todo_stats_usecase
+from dddpy.infrastructure.sqlite.database import SessionLocal
+from dddpy.infrastructure.sqlite.todo.todo_repository import new_todo_repository
+from dddpy.usecase.todo import (
+    FindTodoStatsUseCase,
+    new_find_todo_stats_usecase,
+)
+
+
+def get_per_request_session() -> Iterator[Session]:
+    """Yield a session the way the sync ``get_session`` dependency did."""
+    session: Session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def get_per_request_todo_repository(
+    session: Session = Depends(get_per_request_session),
+) -> TodoRepository:
+    """Build a repository for the request session."""
+    return new_todo_repository(session)
+
+
+def get_per_request_find_todo_stats_usecase(
+    todo_repository: TodoRepository = Depends(get_per_request_todo_repository),
+) -> FindTodoStatsUseCase:
+    """Build the stats use case for the request repository."""
+    return new_find_todo_stats_usecase(todo_repository)
+
+
+def build_app(dependency: Callable[..., Any] | None) -> FastAPI:
+    """Build an application with one endpoint taking the given dependency."""
+    app = FastAPI()
+
+    if dependency is None:
+
+        @app.get('/stats')
+        def stats() -> dict[str, str]:
+            return {}
+
+    else:
+
+        @app.get('/stats')
+        def stats_with_dependency(
+            usecase: Any = Depends(dependency),
+        ) -> dict[str, str]:
+            return {}
+
+    return app
+
+
+async def run_load(app: FastAPI, requests: int, concurrency: int) -> float:
+    """Fire requests with a bounded number in flight and return µs/request."""
+    transport = httpx.ASGITransport(app=app)
+    limit = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://bench'
+    ) as client:
+
+        async def one() -> None:
+            async with limit:
+                response = await client.get('/stats')
+                response.raise_for_status()
+
+        await one()
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    return elapsed / requests * 1_000_000
+
+
+def main() -> None:
+    """Serve every wiring and print the time spent per request."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=1)
+    args = parser.parse_args()
+
+    wirings: dict[str, Callable[..., Any] | None] = {
+        'none': None,
+        'per-request': get_per_request_find_todo_stats_usecase,
+        'singleton': get_find_todo_stats_usecase,
+    }
+
+    print(f'concurrency={args.concurrency}')
+    print(f'{"wiring":<12} {"µs/req":>8}')
+    for name, dependency in wirings.items():
+        per_request = asyncio.run(
+            run_load(build_app(dependency), args.requests, args.concurrency)
+        )
+        print(f'{name:<12} {per_request:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""Compare per-request commits with group commit under concurrent writers.
+
+Every writer thread stands in for one request at a time: it saves a new
+todo and waits until the write is durable. The per-request strategy commits
+each save in its own transaction, as ``get_session`` does; the group-commit
+strategy hands the save to a ``WriteCoordinator``.
+
+Run with ``python -m benchmarks.bench_group_commit [--writers N]
+[--writes N] [--profile NAME] [--window-ms N]``.
+"""
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoTitle
+from dddpy.infrastructure.sqlite.database import Base, create_sqlite_engine
+from dddpy.infrastructure.sqlite.profile import SQLITE_PROFILES
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+from dddpy.infrastructure.sqlite.write_coordinator import WriteCoordinator
+
+Writer = Callable[[Todo], None]
+
+
+def per_request_writer(factory: sessionmaker[Session]) -> Writer:
+    """Return a writer committing every save in its own transaction."""
+
+    def write(todo: Todo) -> None:
+        with factory.begin() as session:
+            TodoRepositoryImpl(session).save(todo)
+
+    return write
+
+
+def group_commit_writer(coordinator: WriteCoordinator) -> Writer:
+    """Return a writer handing every save to the coordinator."""
+
+    def write(todo: Todo) -> None:
+        coordinator.write(lambda session: TodoRepositoryImpl(session).save(todo))
+
+    return write
+
+
+def run(write: Writer, writers: int, writes: int) -> tuple[float, float]:
+    """Run the writers concurrently and return writes/s and p99 latency in ms."""
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def worker(index: int) -> None:
+        own = []
+        for i in range(writes):
+            todo = Todo.create(TodoTitle(f'Todo {index}-{i}'))
+            started = time.perf_counter()
+            write(todo)
+            own.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(own)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    return len(latencies) / elapsed, p99 * 1000
+
+
+def main() -> None:
+    """Run both strategies against fresh databases and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--writers', type=int, default=16)
+    parser.add_argument('--writes', type=int, default=100)
+    parser.add_argument('--profile', choices=sorted(SQLITE_PROFILES), default='durable')
+    parser.add_argument('--window-ms', type=float, default=2.0)
+    args = parser.parse_args()
+
+    profile = SQLITE_PROFILES[args.profile]
+    print(f'{"strategy":<13} {"writes/s":>9} {"p99 ms":>8}')
+    for name in ('per-request', 'group-commit'):
+        with tempfile.TemporaryDirectory() as directory:
+            url = f'sqlite:///{Path(directory) / "bench.db"}'
+            engine = create_sqlite_engine(url, profile)
+            Base.metadata.create_all(bind=engine)
+            factory = sessionmaker(bind=engine)
+            coordinator = WriteCoordinator(
+                factory, args.window_ms / 1000, max_batch=args.writers
+            )
+            write = (
+                per_request_writer(factory)
+                if name == 'per-request'
+                else group_commit_writer(coordinator)
+            )
+
+            rate, p99 = run(write, args.writers, args.writes)
+            coordinator.close()
+            engine.dispose()
+
+        print(f'{name:<13} {rate:>9.0f} {p99:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Compare write and read throughput of the SQLite connection profiles.
+
+Run with ``python -m benchmarks.bench_sqlite_profiles [--rows N]``.
+"""
+
+import argparse
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoId, TodoTitle
+from dddpy.infrastructure.sqlite.database import Base, create_sqlite_engine
+from dddpy.infrastructure.sqlite.profile import SQLITE_PROFILES
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+
+READER_THREADS = 4
+MIXED_SECONDS = 2.0
+
+
+def bench_writes(factory: sessionmaker[Session], rows: int) -> list[TodoId]:
+    """Insert todos one transaction at a time, like one request per todo."""
+    ids = []
+    for i in range(rows):
+        todo = Todo.create(TodoTitle(f'Todo {i}'))
+        with factory.begin() as session:
+            TodoRepositoryImpl(session).save(todo)
+        ids.append(todo.id)
+    return ids
+
+
+def bench_reads(factory: sessionmaker[Session], ids: list[TodoId], reads: int) -> None:
+    """Load random todos by id, one short transaction per lookup."""
+    for todo_id in random.choices(ids, k=reads):
+        with factory() as session:
+            TodoRepositoryImpl(session).find_by_id(todo_id)
+
+
+def bench_mixed(
+    factory: sessionmaker[Session], ids: list[TodoId]
+) -> tuple[int, int, int]:
+    """Run one writer and several readers concurrently for a fixed duration."""
+    stop = threading.Event()
+    counts = {'reads': 0, 'writes': 0, 'errors': 0}
+    lock = threading.Lock()
+
+    def count(key: str) -> None:
+        with lock:
+            counts[key] += 1
+
+    def reader() -> None:
+        while not stop.is_set():
+            try:
+                bench_reads(factory, ids, 1)
+                count('reads')
+            except OperationalError:
+                count('errors')
+
+    def writer() -> None:
+        while not stop.is_set():
+            try:
+                bench_writes(factory, 1)
+                count('writes')
+            except OperationalError:
+                count('errors')
+
+    threads = [threading.Thread(target=reader) for _ in range(READER_THREADS)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(MIXED_SECONDS)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return counts['writes'], counts['reads'], counts['errors']
+
+
+def main() -> None:
+    """Run the benchmark for every profile and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(
+        f'{"profile":<10} {"writes/s":>10} {"reads/s":>10} '
+        f'{"mixed w/s":>10} {"mixed r/s":>10} {"errors":>7}'
+    )
+    for name, profile in SQLITE_PROFILES.items():
+        with tempfile.TemporaryDirectory() as directory:
+            url = f'sqlite:///{Path(directory) / "bench.db"}'
+            engine = create_sqlite_engine(url, profile)
+            Base.metadata.create_all(bind=engine)
+            factory = sessionmaker(bind=engine)
+
+            started = time.perf_counter()
+            ids = bench_writes(factory, args.rows)
+            writes = args.rows / (time.perf_counter() - started)
+
+            started = time.perf_counter()
+            bench_reads(factory, ids, args.rows)
+            reads = args.rows / (time.perf_counter() - started)
+
+            mixed_writes, mixed_reads, errors = bench_mixed(factory, ids)
+            engine.dispose()
+
+        print(
+            f'{name:<10} {writes:>10.0f} {reads:>10.0f} '
+            f'{mixed_writes / MIXED_SECONDS:>10.0f} '
+            f'{mixed_reads / MIXED_SECONDS:>10.0f} {errors:>7}'
+        )
+
+
+if __name__ == '__main__':
+    main()
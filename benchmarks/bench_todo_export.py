@@ -0,0 +1,90 @@
+"""Show that the NDJSON export keeps memory flat as the table grows.
+
+Each size is exported twice through ``TodoRepositoryImpl.iter_all`` and the
+same encoder ``GET /todos/export`` uses: once timed, once under tracemalloc
+to record the peak memory allocated while streaming. The peak should stay
+roughly the same whatever the number of rows.
+
+Run with ``python -m benchmarks.bench_todo_export [--todos N] [--gzip]``.
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+from sqlalchemy import Engine, create_engine, insert
+from sqlalchemy.orm import Session
+
+from dddpy.domain.todo.value_objects import TodoStatus
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo.todo_dto import TodoDTO
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+from dddpy.presentation.api.todo.ndjson import todo_ndjson_chunks
+
+SEED_CHUNK = 10_000
+
+
+def seed(engine: Engine, start: int, stop: int) -> None:
+    """Insert todos numbered ``start`` to ``stop`` with Core statements."""
+    now = int(time.time() * 1000)
+    with engine.begin() as connection:
+        for offset in range(start, stop, SEED_CHUNK):
+            connection.execute(
+                insert(TodoDTO),
+                [
+                    {
+                        'id': uuid.uuid4(),
+                        'title': f'Todo {i}',
+                        'description': f'Description {i}' if i % 2 else None,
+                        'status': TodoStatus.NOT_STARTED.value,
+                        'created_at': now - i,
+                        'updated_at': now,
+                        'completed_at': None,
+                    }
+                    for i in range(offset, min(offset + SEED_CHUNK, stop))
+                ],
+            )
+
+
+def export(engine: Engine, compress: bool) -> int:
+    """Stream every todo through the encoder and return the body size."""
+    with Session(engine) as session:
+        todos = TodoRepositoryImpl(session).iter_all()
+        return sum(len(chunk) for chunk in todo_ndjson_chunks(todos, compress))
+
+
+def main() -> None:
+    """Export growing tables and print throughput and peak memory."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--todos', type=int, default=100_000)
+    parser.add_argument('--gzip', action='store_true')
+    args = parser.parse_args()
+
+    sizes = [args.todos // 8, args.todos // 2, args.todos]
+    print(f'{"rows":>9} {"rows/s":>9} {"body MiB":>9} {"peak MiB":>9}')
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f'sqlite:///{Path(directory) / "bench.db"}')
+        Base.metadata.create_all(bind=engine)
+        seeded = 0
+        for size in sizes:
+            seed(engine, seeded, size)
+            seeded = size
+
+            started = time.perf_counter()
+            body = export(engine, args.gzip)
+            rate = size / (time.perf_counter() - started)
+
+            tracemalloc.start()
+            export(engine, args.gzip)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            print(f'{size:>9} {rate:>9.0f} {body / 2**20:>9.1f} {peak / 2**20:>9.2f}')
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
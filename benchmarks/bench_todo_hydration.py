@@ -0,0 +1,80 @@
+"""Measure the per-row cost of hydrating todos loaded from SQLite.
+
+Rows are read once into ``TodoDTO`` instances, so the timings cover only the
+conversion to domain entities. "strict" re-runs the value object checks as
+``DDDPY_STRICT_HYDRATION=1`` does; "trusted" is the default path that wraps
+the stored values directly.
+
+Run with ``python -m benchmarks.bench_todo_hydration [--todos N] [--rounds N]``.
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo.todo_dto import TodoDTO
+
+
+def seed(session: Session, count: int) -> None:
+    """Store todos; half have descriptions and a third are completed."""
+    for i in range(count):
+        todo = Todo(
+            TodoId.generate(),
+            TodoTitle(f'Todo {i}'),
+            TodoDescription(f'Description {i}') if i % 2 else None,
+        )
+        if i % 3 == 0:
+            todo.complete()
+        session.add(TodoDTO.from_entity(todo))
+    session.commit()
+
+
+def time_per_row(
+    hydrate: Callable[[TodoDTO], Todo], dtos: list[TodoDTO], rounds: int
+) -> float:
+    """Return the median microseconds spent hydrating one row."""
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for dto in dtos:
+            hydrate(dto)
+        samples.append((time.perf_counter() - started) / len(dtos))
+    return statistics.median(samples) * 1_000_000
+
+
+def main() -> None:
+    """Hydrate the same rows through both paths and print the cost."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--todos', type=int, default=10_000)
+    parser.add_argument('--rounds', type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f'sqlite:///{Path(directory) / "bench.db"}')
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as session:
+            seed(session, args.todos)
+        with Session(engine) as session:
+            dtos = list(session.scalars(select(TodoDTO)))
+        engine.dispose()
+
+    strict = time_per_row(TodoDTO.to_validated_entity, dtos, args.rounds)
+    trusted = time_per_row(TodoDTO.to_trusted_entity, dtos, args.rounds)
+
+    print(f'{"path":<8} {"us/row":>8} {"ms/list":>8}')
+    for name, cost in (('strict', strict), ('trusted', trusted)):
+        print(f'{name:<8} {cost:>8.2f} {cost * args.todos / 1000:>8.1f}')
+    print(f'saved {1 - trusted / strict:.0%} per hydrated row')
+
+
+if __name__ == '__main__':
+    main()
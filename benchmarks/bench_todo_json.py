@@ -0,0 +1,104 @@
+"""Compare response-model serialization with the pre-encoded JSON fast path.
+
+Two coroutine routes return the same in-memory todos. The "schema" route
+builds ``TodoSchema`` instances and lets FastAPI validate and serialize them
+through ``response_model``, as the handlers do by default. The "fast" route
+returns ``encode_todo``/``encode_todos`` output, as they do with
+``DDDPY_FAST_JSON=true``. Requests go through ``httpx.ASGITransport``, so
+the timings include FastAPI's request handling but no network or database.
+
+Run with ``python -m benchmarks.bench_todo_json [--requests N]``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI, Response
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoDescription, TodoTitle
+from dddpy.presentation.api.todo.schemas import TodoSchema
+from dddpy.presentation.api.todo.todo_json import (
+    encode_todo,
+    encode_todos,
+    json_response,
+)
+
+SIZES = (1, 20, 1000)
+ROUNDS = 5
+
+
+def make_todos(count: int) -> list[Todo]:
+    """Build todos; half have descriptions and a third are completed."""
+    todos = []
+    for i in range(count):
+        todo = Todo.create(
+            TodoTitle(f'Todo {i}'),
+            TodoDescription(f'Description {i}') if i % 2 else None,
+        )
+        if i % 3 == 0:
+            todo.complete()
+        todos.append(todo)
+    return todos
+
+
+def build_app(todos: list[Todo]) -> FastAPI:
+    """Expose the todos through both serialization paths."""
+    app = FastAPI()
+
+    @app.get('/schema/one', response_model=TodoSchema)
+    async def schema_one() -> TodoSchema:
+        return TodoSchema.from_entity(todos[0])
+
+    @app.get('/schema/many', response_model=list[TodoSchema])
+    async def schema_many(count: int) -> list[TodoSchema]:
+        return [TodoSchema.from_entity(todo) for todo in todos[:count]]
+
+    @app.get('/fast/one', response_model=TodoSchema)
+    async def fast_one() -> Response:
+        return json_response(encode_todo(todos[0]))
+
+    @app.get('/fast/many', response_model=list[TodoSchema])
+    async def fast_many(count: int) -> Response:
+        return json_response(encode_todos(todos[:count]))
+
+    return app
+
+
+async def time_requests(app: FastAPI, url: str, requests: int) -> float:
+    """Return the median microseconds per request over several rounds."""
+    transport = httpx.ASGITransport(app=app)
+    rounds = []
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://bench'
+    ) as client:
+        await client.get(url)
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            for _ in range(requests):
+                response = await client.get(url)
+                response.raise_for_status()
+            rounds.append((time.perf_counter() - started) / requests)
+    return statistics.median(rounds) * 1_000_000
+
+
+def main() -> None:
+    """Time both paths for each response size and print the speedup."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=100)
+    args = parser.parse_args()
+
+    app = build_app(make_todos(max(SIZES)))
+    print(f'{"todos":>6} {"schema us":>10} {"fast us":>10} {"speedup":>8}')
+    for size in SIZES:
+        path = 'one' if size == 1 else f'many?count={size}'
+        schema = asyncio.run(time_requests(app, f'/schema/{path}', args.requests))
+        fast = asyncio.run(time_requests(app, f'/fast/{path}', args.requests))
+        print(f'{size:>6} {schema:>10.0f} {fast:>10.0f} {schema / fast:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
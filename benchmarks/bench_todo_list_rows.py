@@ -0,0 +1,92 @@
+"""Compare loading todo lists through ORM instances and through plain rows.
+
+The "orm" path selects ``TodoDTO`` instances and converts each with
+``to_entity``, as the repository did before. The "rows" path selects
+``TODO_COLUMNS`` and maps the result with ``todos_from_rows``, as
+``find_all`` and ``find_by_ids`` now do. Each round uses a fresh session so
+the ORM path pays for populating the identity map every time.
+
+Run with ``python -m benchmarks.bench_todo_list_rows [--todos N] [--rounds N]``.
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.orm import Session
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo.todo_dto import (
+    TODO_COLUMNS,
+    TodoDTO,
+    todos_from_rows,
+)
+
+
+def seed(engine: Engine, count: int) -> None:
+    """Store todos; half have descriptions and a third are completed."""
+    with Session(engine) as session:
+        for i in range(count):
+            todo = Todo(
+                TodoId.generate(),
+                TodoTitle(f'Todo {i}'),
+                TodoDescription(f'Description {i}') if i % 2 else None,
+            )
+            if i % 3 == 0:
+                todo.complete()
+            session.add(TodoDTO.from_entity(todo))
+        session.commit()
+
+
+def load_orm(session: Session) -> list[Todo]:
+    """Load every todo through ORM instances."""
+    return [todo_dto.to_entity() for todo_dto in session.scalars(select(TodoDTO))]
+
+
+def load_rows(session: Session) -> list[Todo]:
+    """Load every todo through plain rows and batch mapping."""
+    return todos_from_rows(session.execute(select(*TODO_COLUMNS)).all())
+
+
+def rows_per_second(
+    load: Callable[[Session], list[Todo]], engine: Engine, rounds: int
+) -> float:
+    """Return the median number of todos loaded per second."""
+    samples = []
+    for _ in range(rounds):
+        with Session(engine) as session:
+            started = time.perf_counter()
+            todos = load(session)
+            samples.append(len(todos) / (time.perf_counter() - started))
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Load the same table through both paths and print the throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--todos', type=int, default=10_000)
+    parser.add_argument('--rounds', type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f'sqlite:///{Path(directory) / "bench.db"}')
+        Base.metadata.create_all(bind=engine)
+        seed(engine, args.todos)
+        orm = rows_per_second(load_orm, engine, args.rounds)
+        rows = rows_per_second(load_rows, engine, args.rounds)
+        engine.dispose()
+
+    print(f'{"path":<6} {"rows/s":>10} {"us/row":>8}')
+    for name, rate in (('orm', orm), ('rows', rows)):
+        print(f'{name:<6} {rate:>10.0f} {1_000_000 / rate:>8.2f}')
+    print(f'{rows / orm:.1f}x rows/s with plain rows')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""Measure the memory held by each hydrated todo entity.
+
+The "before" column hydrates mirrors of the entity and value objects as they
+were declared before they became slotted dataclasses; the "after" column
+uses the real domain classes. Both hydrate the same rows the way
+``TodoDTO.to_entity`` does, so UUIDs and strings come from the rows and only
+the objects created during hydration are counted.
+
+Run with ``python -m benchmarks.bench_todo_memory [--todos N]``.
+"""
+
+import argparse
+import gc
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import (
+    TodoDescription,
+    TodoId,
+    TodoStatus,
+    TodoTitle,
+)
+
+Row = tuple[uuid.UUID, str, str | None, str, int, int, int | None]
+
+
+@dataclass(frozen=True)
+class DictTodoId:
+    """Unslotted mirror of ``TodoId``."""
+
+    value: uuid.UUID
+
+
+@dataclass(frozen=True)
+class DictTodoTitle:
+    """Unslotted mirror of ``TodoTitle``."""
+
+    value: str
+
+
+@dataclass(frozen=True)
+class DictTodoDescription:
+    """Unslotted mirror of ``TodoDescription``."""
+
+    value: str
+
+
+@dataclass(eq=False)
+class DictTodo:
+    """Unslotted mirror of ``Todo``."""
+
+    id: DictTodoId
+    title: DictTodoTitle
+    description: DictTodoDescription | None = None
+    status: TodoStatus = TodoStatus.NOT_STARTED
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    completed_at: datetime | None = None
+
+
+def make_rows(count: int) -> list[Row]:
+    """Build persisted-looking rows; half have descriptions, a third are done."""
+    now = int(datetime.now(UTC).timestamp() * 1000)
+    return [
+        (
+            uuid.uuid4(),
+            f'Todo {i}',
+            f'Description {i}' if i % 2 else None,
+            TodoStatus.COMPLETED.value if i % 3 == 0 else TodoStatus.IN_PROGRESS.value,
+            now - i,
+            now,
+            now if i % 3 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def hydrate_dict(row: Row) -> DictTodo:
+    """Hydrate a row into the unslotted mirrors."""
+    id_, title, description, status, created_at, updated_at, completed_at = row
+    return DictTodo(
+        DictTodoId(id_),
+        DictTodoTitle(title),
+        DictTodoDescription(description) if description else None,
+        TodoStatus(status),
+        datetime.fromtimestamp(created_at / 1000, tz=UTC),
+        datetime.fromtimestamp(updated_at / 1000, tz=UTC),
+        datetime.fromtimestamp(completed_at / 1000, tz=UTC) if completed_at else None,
+    )
+
+
+def hydrate_slotted(row: Row) -> Todo:
+    """Hydrate a row into the domain classes."""
+    id_, title, description, status, created_at, updated_at, completed_at = row
+    return Todo(
+        TodoId(id_),
+        TodoTitle(title),
+        TodoDescription(description) if description else None,
+        TodoStatus(status),
+        datetime.fromtimestamp(created_at / 1000, tz=UTC),
+        datetime.fromtimestamp(updated_at / 1000, tz=UTC),
+        datetime.fromtimestamp(completed_at / 1000, tz=UTC) if completed_at else None,
+    )
+
+
+def bytes_per_todo(hydrate: Callable[[Row], object], rows: list[Row]) -> float:
+    """Return the traced bytes retained per hydrated todo."""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    todos = [hydrate(row) for row in rows]
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del todos
+    return retained / len(rows)
+
+
+def main() -> None:
+    """Hydrate the same rows with both class layouts and print the cost."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--todos', type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.todos)
+    before = bytes_per_todo(hydrate_dict, rows)
+    after = bytes_per_todo(hydrate_slotted, rows)
+
+    print(f'{"layout":<10} {"bytes/todo":>11} {"MiB total":>10}')
+    for name, size in (('before', before), ('after', after)):
+        print(f'{name:<10} {size:>11.0f} {size * args.todos / 2**20:>10.1f}')
+    print(f'saved {1 - after / before:.0%} per hydrated todo')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Compare read-check-save transitions with single-statement transitions.
+
+Both strategies start and then complete every todo on one connection. The
+read-check-save strategy loads the todo, checks its status in Python, and
+saves it, as the use cases used to; the conditional strategy issues one
+``UPDATE ... RETURNING`` per transition.
+
+Run with ``python -m benchmarks.bench_todo_transitions [--todos N]``.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoId, TodoStatus, TodoTitle
+from dddpy.infrastructure.sqlite.database import Base, create_sqlite_engine
+from dddpy.infrastructure.sqlite.profile import SQLITE_PROFILES
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+
+Strategy = Callable[[TodoRepositoryImpl, TodoId], None]
+
+
+def read_check_save(repository: TodoRepositoryImpl, todo_id: TodoId) -> None:
+    """Start and complete a todo by loading, checking, and saving it."""
+    for expected, change in (
+        (TodoStatus.NOT_STARTED, Todo.start),
+        (TodoStatus.IN_PROGRESS, Todo.complete),
+    ):
+        todo = repository.find_by_id(todo_id)
+        assert todo is not None
+        assert todo.status == expected
+        change(todo)
+        repository.save(todo)
+
+
+def conditional(repository: TodoRepositoryImpl, todo_id: TodoId) -> None:
+    """Start and complete a todo with one conditional statement each."""
+    for status, expected in (
+        (TodoStatus.IN_PROGRESS, TodoStatus.NOT_STARTED),
+        (TodoStatus.COMPLETED, TodoStatus.IN_PROGRESS),
+    ):
+        assert repository.transition(todo_id, status, (expected,), datetime.now())
+
+
+def main() -> None:
+    """Run both strategies against fresh databases and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--todos', type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f'{"strategy":<16} {"todos/s":>9} {"statements":>11}')
+    strategies: dict[str, Strategy] = {
+        'read-check-save': read_check_save,
+        'conditional': conditional,
+    }
+    for name, strategy in strategies.items():
+        engine = create_sqlite_engine('sqlite://', SQLITE_PROFILES['durable'])
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as session:
+            repository = TodoRepositoryImpl(session)
+            todos = [Todo.create(TodoTitle(f'Todo {i}')) for i in range(args.todos)]
+            repository.add_many(todos)
+            session.commit()
+
+            statements = 0
+
+            def count(*_: object) -> None:
+                nonlocal statements
+                statements += 1
+
+            event.listen(engine, 'before_cursor_execute', count)
+            started = time.perf_counter()
+            for todo in todos:
+                strategy(repository, todo.id)
+            elapsed = time.perf_counter() - started
+            session.commit()
+        engine.dispose()
+
+        print(f'{name:<16} {args.todos / elapsed:>9.0f} {statements:>11}')
+
+
+if __name__ == '__main__':
+    main()
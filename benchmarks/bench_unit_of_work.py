@@ -0,0 +1,73 @@
+"""Compare starting todos with a commit per todo against one unit of work.
+
+Run with ``python -m benchmarks.bench_unit_of_work [--todos N]``.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoId, TodoTitle
+from dddpy.infrastructure.sqlite.database import Base, create_sqlite_engine
+from dddpy.infrastructure.sqlite.profile import SQLITE_PROFILES
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+from dddpy.infrastructure.sqlite.todo.todo_unit_of_work import new_todo_unit_of_work
+from dddpy.usecase.todo import new_start_todo_usecase
+
+
+def seed(factory: sessionmaker[Session], todos: int) -> list[TodoId]:
+    """Insert unstarted todos in a single transaction."""
+    created = [Todo.create(TodoTitle(f'Todo {i}')) for i in range(todos)]
+    with factory.begin() as session:
+        TodoRepositoryImpl(session).add_many(created)
+    return [todo.id for todo in created]
+
+
+def start_per_commit(factory: sessionmaker[Session], ids: list[TodoId]) -> None:
+    """Start every todo in its own transaction, like one request per todo."""
+    for todo_id in ids:
+        with new_todo_unit_of_work(factory()) as uow:
+            new_start_todo_usecase(uow.todos).execute(todo_id)
+            uow.commit()
+
+
+def start_in_one_unit(factory: sessionmaker[Session], ids: list[TodoId]) -> None:
+    """Start every todo inside one unit of work and commit once."""
+    with new_todo_unit_of_work(factory()) as uow:
+        start_todo = new_start_todo_usecase(uow.todos)
+        for todo_id in ids:
+            start_todo.execute(todo_id)
+        uow.commit()
+
+
+def main() -> None:
+    """Run both strategies for every profile and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--todos', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f'{"profile":<10} {"per commit/s":>13} {"one unit/s":>11}')
+    for name, profile in SQLITE_PROFILES.items():
+        rates = []
+        for strategy in (start_per_commit, start_in_one_unit):
+            with tempfile.TemporaryDirectory() as directory:
+                url = f'sqlite:///{Path(directory) / "bench.db"}'
+                engine = create_sqlite_engine(url, profile)
+                Base.metadata.create_all(bind=engine)
+                factory = sessionmaker(bind=engine)
+                ids = seed(factory, args.todos)
+
+                started = time.perf_counter()
+                strategy(factory, ids)
+                rates.append(args.todos / (time.perf_counter() - started))
+                engine.dispose()
+
+        print(f'{name:<10} {rates[0]:>13.0f} {rates[1]:>11.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -13,7 +13,7 @@ from dddpy.domain.todo.value_objects import (
 ALREADY_COMPLETED_ERROR_MESSAGE = 'Already completed'
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Todo:
     """Represent a todo item tracked by the domain.
 
@@ -25,6 +25,8 @@ class Todo:
         created_at: Timestamp when the todo was created.
         updated_at: Timestamp when the todo was last updated.
         completed_at: Optional timestamp when the todo was completed.
+        version: Number of times the todo has been stored; 0 until the first
+            save. Writes based on an outdated version are rejected.
     """
 
     id: TodoId
@@ -34,6 +36,7 @@ class Todo:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     completed_at: datetime | None = None
+    version: int = 0
 
     def __hash__(self) -> int:
         """Return a hash value based on the entity identity."""
@@ -4,12 +4,18 @@ from __future__ import annotations
 
 from .todo_already_completed_error import TodoAlreadyCompletedError
 from .todo_already_started_error import TodoAlreadyStartedError
+from .todo_conflict_error import TodoConflictError
+from .todo_invalid_cursor_error import TodoInvalidCursorError
+from .todo_invalid_filter_error import TodoInvalidFilterError
 from .todo_not_found_error import TodoNotFoundError
 from .todo_not_started_error import TodoNotStartedError
 
 __all__ = (
     'TodoAlreadyCompletedError',
     'TodoAlreadyStartedError',
+    'TodoConflictError',
+    'TodoInvalidCursorError',
+    'TodoInvalidFilterError',
     'TodoNotFoundError',
     'TodoNotStartedError',
 )
@@ -0,0 +1,11 @@
+"""Define exception for writes based on an outdated todo."""
+
+
+class TodoConflictError(Exception):
+    """Raise when a todo changed after it was read and the write would lose it."""
+
+    message = 'The Todo was modified by another request; reload it and retry.'
+
+    def __str__(self):
+        """Return the default human-readable error message."""
+        return TodoConflictError.message
@@ -0,0 +1,11 @@
+"""Define exception for malformed todo listing cursors."""
+
+
+class TodoInvalidCursorError(Exception):
+    """Raise when a pagination cursor cannot be decoded."""
+
+    message = 'The cursor you specified is invalid.'
+
+    def __str__(self):
+        """Return the default human-readable error message."""
+        return TodoInvalidCursorError.message
@@ -0,0 +1,11 @@
+"""Define exception for todo listing filters no index can serve."""
+
+
+class TodoInvalidFilterError(Exception):
+    """Raise when a listing bounds a timestamp other than its sort key."""
+
+    message = 'Time bounds must apply to the timestamp the todos are sorted by.'
+
+    def __str__(self):
+        """Return the default human-readable error message."""
+        return TodoInvalidFilterError.message
@@ -2,6 +2,30 @@
 
 from __future__ import annotations
 
+from .async_todo_repository import AsyncTodoRepository
+from .todo_filter import TodoFilter
+from .todo_list_version import TodoListVersion
+from .todo_page import (
+    DEFAULT_TODO_EXPORT_BATCH_SIZE,
+    DEFAULT_TODO_PAGE_SIZE,
+    MAX_TODO_PAGE_SIZE,
+    TodoPage,
+)
 from .todo_repository import TodoRepository
+from .todo_search_page import TodoSearchHit, TodoSearchPage
+from .todo_unit_of_work import AsyncTodoUnitOfWork, TodoUnitOfWork
 
-__all__ = ('TodoRepository',)
+__all__ = (
+    'DEFAULT_TODO_EXPORT_BATCH_SIZE',
+    'DEFAULT_TODO_PAGE_SIZE',
+    'MAX_TODO_PAGE_SIZE',
+    'AsyncTodoRepository',
+    'AsyncTodoUnitOfWork',
+    'TodoFilter',
+    'TodoListVersion',
+    'TodoPage',
+    'TodoRepository',
+    'TodoSearchHit',
+    'TodoSearchPage',
+    'TodoUnitOfWork',
+)
@@ -0,0 +1,257 @@
+"""Define the asynchronous repository abstraction for todo entities."""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Collection, Sequence
+from datetime import datetime
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.repositories.todo_filter import TodoFilter
+from dddpy.domain.todo.repositories.todo_list_version import TodoListVersion
+from dddpy.domain.todo.repositories.todo_page import (
+    DEFAULT_TODO_EXPORT_BATCH_SIZE,
+    DEFAULT_TODO_PAGE_SIZE,
+    TodoPage,
+)
+from dddpy.domain.todo.repositories.todo_search_page import TodoSearchPage
+from dddpy.domain.todo.value_objects import TodoId, TodoSortKey, TodoStatus
+
+
+class AsyncTodoRepository(ABC):
+    """Provide the abstraction for non-blocking todo persistence operations."""
+
+    @abstractmethod
+    async def save(self, todo: Todo) -> None:
+        """Persist the provided todo entity.
+
+        Args:
+            todo: Todo instance to store or update.
+        """
+
+    @abstractmethod
+    async def save_many(self, todos: Sequence[Todo]) -> set[TodoId]:
+        """Persist the provided todo entities, inserting or updating each one.
+
+        A stored todo that changed after it was read is left as it is, while
+        the others are still saved.
+
+        Args:
+            todos: Todo instances to store or update.
+
+        Returns:
+            set[TodoId]: Identifiers of the todos that were not saved because
+                they changed concurrently.
+        """
+
+    @abstractmethod
+    async def add_many(self, todos: Sequence[Todo]) -> None:
+        """Insert new todo entities without checking for existing rows.
+
+        Args:
+            todos: Todo instances that are not stored yet.
+        """
+
+    @abstractmethod
+    async def transition(
+        self,
+        todo_id: TodoId,
+        status: TodoStatus,
+        from_statuses: Collection[TodoStatus],
+        at: datetime,
+    ) -> Todo | None:
+        """Move a todo to a new status if it is in one of the expected ones.
+
+        The check and the write are one atomic step, so two concurrent
+        transitions cannot both succeed. Moving to ``COMPLETED`` also records
+        ``at`` as the completion time.
+
+        Args:
+            todo_id: Identifier of the todo to move.
+            status: Status to move the todo to.
+            from_statuses: Statuses the todo may currently be in.
+            at: Time of the transition.
+
+        Returns:
+            Optional[Todo]: Todo as stored after the transition; None when no
+                todo with that ID is in one of ``from_statuses``.
+        """
+
+    @abstractmethod
+    async def find_by_id(self, todo_id: TodoId) -> Todo | None:
+        """Retrieve a todo by its identifier.
+
+        Args:
+            todo_id: Identifier of the todo to fetch.
+
+        Returns:
+            Optional[Todo]: The matching todo when found; otherwise None.
+        """
+
+    @abstractmethod
+    async def find_by_ids(self, todo_ids: Sequence[TodoId]) -> list[Todo]:
+        """Retrieve the todos matching the provided identifiers.
+
+        Args:
+            todo_ids: Identifiers of the todos to fetch.
+
+        Returns:
+            List[Todo]: The todos that were found, in no particular order.
+        """
+
+    @abstractmethod
+    async def find_all(
+        self,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+        sort_key: TodoSortKey = TodoSortKey.CREATED_AT,
+        todo_filter: TodoFilter | None = None,
+    ) -> TodoPage:
+        """Return one page of todos ordered by the given timestamp, newest first.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+            sort_key: Timestamp used to order the todos.
+            todo_filter: Criteria the listed todos must meet, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded.
+            TodoInvalidFilterError: If a time bound applies to a timestamp
+                other than the sort key.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> TodoSearchPage:
+        """Return one page of todos whose title or description match the query.
+
+        Every whitespace-separated term of the query must appear in the title
+        or the description. Hits are ordered by relevance, best match first.
+
+        Args:
+            query: Terms to look for.
+            limit: Maximum number of hits in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded or was
+                issued for a different query.
+
+        Returns:
+            TodoSearchPage: The matching todos and the cursor for the next page.
+        """
+
+    @abstractmethod
+    def iter_all(
+        self, batch_size: int = DEFAULT_TODO_EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Todo]:
+        """Stream every todo without holding the whole collection in memory.
+
+        Args:
+            batch_size: Number of rows fetched from storage at a time.
+
+        Returns:
+            AsyncIterator[Todo]: Todos in storage order.
+        """
+
+    @abstractmethod
+    async def find_version(self, todo_id: TodoId) -> int | None:
+        """Return the stored version of a todo without loading the entity.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[int]: Current version when the todo exists; otherwise None.
+        """
+
+    @abstractmethod
+    async def find_status(self, todo_id: TodoId) -> TodoStatus | None:
+        """Return the stored status of a todo without loading the entity.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[TodoStatus]: Current status when the todo exists;
+                otherwise None.
+        """
+
+    @abstractmethod
+    async def find_list_version(self) -> TodoListVersion:
+        """Return the current version of the todo collection.
+
+        Returns:
+            TodoListVersion: Marker that changes whenever any todo is written.
+        """
+
+    @abstractmethod
+    async def count_by_status(self) -> dict[TodoStatus, int]:
+        """Return how many todos are in each status.
+
+        Returns:
+            dict[TodoStatus, int]: Count for every status, zero included.
+        """
+
+    @abstractmethod
+    async def delete(self, todo_id: TodoId) -> None:
+        """Remove the todo identified by the provided ID.
+
+        Args:
+            todo_id: Identifier of the todo to delete.
+        """
+
+    @abstractmethod
+    async def delete_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Delete up to ``limit`` todos completed before the given time.
+
+        Oldest completions go first, so repeated calls walk the backlog.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos deleted by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the deleted todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+
+    @abstractmethod
+    async def archive_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Archive up to ``limit`` todos completed before the given time.
+
+        Archived todos are still found by identifier, but are no longer
+        listed, searched, or counted. Oldest completions go first.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos archived by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the archived todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+
+    @abstractmethod
+    async def find_archived(
+        self, limit: int = DEFAULT_TODO_PAGE_SIZE, cursor: str | None = None
+    ) -> TodoPage:
+        """Retrieve one page of archived todos, most recently completed first.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
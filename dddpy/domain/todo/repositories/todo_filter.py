@@ -0,0 +1,48 @@
+"""Define the criteria that narrow a todo listing."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from dddpy.domain.todo.value_objects import TodoSortKey, TodoStatus
+
+
+@dataclass(frozen=True)
+class TodoFilter:
+    """Select the todos a listing returns; unset criteria match every todo.
+
+    Time bounds are exclusive, and a listing may only bound the timestamp
+    it is sorted by: each page is then one seek of a (timestamp, id) index.
+
+    Attributes:
+        statuses: Statuses to keep, or empty for any status.
+        created_after: Keep todos created after this time.
+        created_before: Keep todos created before this time.
+        updated_after: Keep todos last updated after this time.
+        updated_before: Keep todos last updated before this time.
+    """
+
+    statuses: tuple[TodoStatus, ...] = ()
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    updated_after: datetime | None = None
+    updated_before: datetime | None = None
+
+    def bounds_only(self, sort_key: TodoSortKey) -> bool:
+        """Tell whether every time bound applies to the given sort key.
+
+        Args:
+            sort_key: Timestamp the listing is sorted by.
+
+        Returns:
+            bool: True when no other timestamp is bounded.
+        """
+        bounded = {
+            TodoSortKey.CREATED_AT: (self.created_after, self.created_before),
+            TodoSortKey.UPDATED_AT: (self.updated_after, self.updated_before),
+        }
+        return all(
+            value is None
+            for key, values in bounded.items()
+            if key is not sort_key
+            for value in values
+        )
@@ -0,0 +1,23 @@
+"""Define the version marker of the todo collection."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class TodoListVersion:
+    """Summarize the todo collection so that any write changes the value.
+
+    Creating or updating a todo moves ``latest_update`` forward, and deleting
+    one bumps ``deletions``; together with ``count`` this identifies the state
+    of the collection without loading any todo.
+
+    Attributes:
+        count: Number of stored todos.
+        latest_update: Most recent ``updated_at`` of any todo, if any exist.
+        deletions: Number of todos deleted since the store was created.
+    """
+
+    count: int
+    latest_update: datetime | None
+    deletions: int
@@ -0,0 +1,23 @@
+"""Define the page of todos returned by repository listings."""
+
+from dataclasses import dataclass
+
+from dddpy.domain.todo.entities import Todo
+
+DEFAULT_TODO_PAGE_SIZE = 20
+MAX_TODO_PAGE_SIZE = 100
+# Rows fetched per round trip when streaming the whole collection.
+DEFAULT_TODO_EXPORT_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class TodoPage:
+    """Represent one page of todos and the cursor for the following page.
+
+    Attributes:
+        items: Todos contained in the page, in listing order.
+        next_cursor: Opaque cursor for the next page, or None on the last page.
+    """
+
+    items: list[Todo]
+    next_cursor: str | None = None
@@ -0,0 +1,34 @@
+"""Define the page of ranked matches returned by todo searches."""
+
+from dataclasses import dataclass
+
+from dddpy.domain.todo.entities import Todo
+
+
+@dataclass(frozen=True)
+class TodoSearchHit:
+    """Represent one todo matching a search, with the matched terms marked.
+
+    Attributes:
+        todo: The matching todo.
+        title_highlight: Full title with every matched term marked.
+        description_snippet: Excerpt of the description around the best
+            match, or None when the todo has no description.
+    """
+
+    todo: Todo
+    title_highlight: str
+    description_snippet: str | None = None
+
+
+@dataclass(frozen=True)
+class TodoSearchPage:
+    """Represent one page of search hits and the cursor for the following page.
+
+    Attributes:
+        items: Hits contained in the page, best match first.
+        next_cursor: Opaque cursor for the next page, or None on the last page.
+    """
+
+    items: list[TodoSearchHit]
+    next_cursor: str | None = None
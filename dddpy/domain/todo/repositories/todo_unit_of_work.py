@@ -0,0 +1,91 @@
+"""Define the transaction boundary shared by todo use cases."""
+
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Self
+
+from dddpy.domain.todo.repositories.async_todo_repository import AsyncTodoRepository
+from dddpy.domain.todo.repositories.todo_repository import TodoRepository
+
+
+class TodoUnitOfWork(ABC):
+    """Collect the todo writes of any number of use cases into one transaction.
+
+    Hand ``todos`` to every use case taking part, then call ``commit`` once.
+    Leaving the ``with`` block discards whatever was not committed.
+
+    Attributes:
+        todos: Repository whose writes join the unit of work.
+    """
+
+    todos: TodoRepository
+
+    def __enter__(self) -> Self:
+        """Start the unit of work.
+
+        Returns:
+            Self: This unit of work.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Roll back any writes that were not committed and release resources."""
+        self.rollback()
+        self.close()
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Make every write collected so far durable in a single commit."""
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard every write collected since the last commit."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the resources held by the unit of work."""
+
+
+class AsyncTodoUnitOfWork(ABC):
+    """Collect the todo writes of async use cases into one transaction.
+
+    Attributes:
+        todos: Async repository whose writes join the unit of work.
+    """
+
+    todos: AsyncTodoRepository
+
+    async def __aenter__(self) -> Self:
+        """Start the unit of work.
+
+        Returns:
+            Self: This unit of work.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Roll back any writes that were not committed and release resources."""
+        await self.rollback()
+        await self.close()
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Make every write collected so far durable in a single commit."""
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Discard every write collected since the last commit."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the resources held by the unit of work."""
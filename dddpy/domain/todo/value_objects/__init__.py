@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from .todo_description import TodoDescription
 from .todo_id import TodoId
+from .todo_sort_key import TodoSortKey
 from .todo_status import TodoStatus
 from .todo_title import TodoTitle
 
-__all__ = ('TodoDescription', 'TodoId', 'TodoStatus', 'TodoTitle')
+__all__ = ('TodoDescription', 'TodoId', 'TodoSortKey', 'TodoStatus', 'TodoTitle')
@@ -6,7 +6,7 @@ MAX_DESCRIPTION_LENGTH = 1000
 DESCRIPTION_TOO_LONG_ERROR_MESSAGE = 'Description must be 1000 characters or less'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TodoDescription:
     """Represent the optional description for a todo item."""
 
@@ -21,6 +21,23 @@ class TodoDescription:
         if len(self.value) > MAX_DESCRIPTION_LENGTH:
             raise ValueError(DESCRIPTION_TOO_LONG_ERROR_MESSAGE)
 
+    @staticmethod
+    def from_trusted(value: str) -> 'TodoDescription':
+        """Wrap a description that was already validated, skipping the checks.
+
+        Intended for values read back from storage, which were validated
+        when they were written.
+
+        Args:
+            value: Previously validated description string.
+
+        Returns:
+            TodoDescription: Value object wrapping the string.
+        """
+        description = object.__new__(TodoDescription)
+        object.__setattr__(description, 'value', value)
+        return description
+
     def __str__(self) -> str:
         """Return the wrapped description string."""
         return self.value
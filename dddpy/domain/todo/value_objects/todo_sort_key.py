@@ -0,0 +1,15 @@
+"""Define the Todo sort key enumeration."""
+
+from enum import Enum
+
+
+class TodoSortKey(Enum):
+    """Enumerate timestamps that todo listings can be ordered by."""
+
+    CREATED_AT = 'created_at'
+    UPDATED_AT = 'updated_at'
+    COMPLETED_AT = 'completed_at'
+
+    def __str__(self) -> str:
+        """Return the underlying sort key string."""
+        return self.value
@@ -7,7 +7,7 @@ TITLE_REQUIRED_ERROR_MESSAGE = 'Title is required'
 TITLE_TOO_LONG_ERROR_MESSAGE = 'Title must be 100 characters or less'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TodoTitle:
     """Represent the title for a todo item."""
 
@@ -24,6 +24,23 @@ class TodoTitle:
         if len(self.value) > MAX_TITLE_LENGTH:
             raise ValueError(TITLE_TOO_LONG_ERROR_MESSAGE)
 
+    @staticmethod
+    def from_trusted(value: str) -> 'TodoTitle':
+        """Wrap a title that was already validated, skipping the checks.
+
+        Intended for values read back from storage, which were validated
+        when they were written.
+
+        Args:
+            value: Previously validated title string.
+
+        Returns:
+            TodoTitle: Value object wrapping the string.
+        """
+        title = object.__new__(TodoTitle)
+        object.__setattr__(title, 'value', value)
+        return title
+
     def __str__(self) -> str:
         """Return the wrapped title string."""
         return self.value
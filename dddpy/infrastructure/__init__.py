@@ -2,6 +2,6 @@
 
 from __future__ import annotations
 
-from . import di, sqlite
+from . import cache, di, settings, sqlite
 
-__all__ = ('di', 'sqlite')
+__all__ = ('cache', 'di', 'settings', 'sqlite')
@@ -0,0 +1,18 @@
+"""Provide in-process caches for domain entities."""
+
+from .caching_todo_repository import (
+    AsyncCachingTodoRepository,
+    CachingTodoRepository,
+    new_async_caching_todo_repository,
+    new_caching_todo_repository,
+)
+from .todo_entity_cache import TodoCacheStats, TodoEntityCache
+
+__all__ = (
+    'AsyncCachingTodoRepository',
+    'CachingTodoRepository',
+    'TodoCacheStats',
+    'TodoEntityCache',
+    'new_async_caching_todo_repository',
+    'new_caching_todo_repository',
+)
@@ -0,0 +1,601 @@
+"""Read-through caching decorators for the todo repositories."""
+
+from collections.abc import AsyncIterator, Collection, Iterator, Sequence
+from datetime import datetime
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.repositories import (
+    DEFAULT_TODO_EXPORT_BATCH_SIZE,
+    DEFAULT_TODO_PAGE_SIZE,
+    AsyncTodoRepository,
+    TodoFilter,
+    TodoListVersion,
+    TodoPage,
+    TodoRepository,
+    TodoSearchPage,
+)
+from dddpy.domain.todo.value_objects import TodoId, TodoSortKey, TodoStatus
+from dddpy.infrastructure.cache.todo_entity_cache import TodoEntityCache
+
+
+def _split_cached(
+    cache: TodoEntityCache, todo_ids: Sequence[TodoId]
+) -> tuple[list[Todo], list[TodoId]]:
+    """Partition identifiers into cached todos and identifiers to load."""
+    found: list[Todo] = []
+    missing: list[TodoId] = []
+    for todo_id in todo_ids:
+        todo = cache.get(todo_id)
+        if todo is None:
+            missing.append(todo_id)
+        else:
+            found.append(todo)
+    return found, missing
+
+
+class CachingTodoRepository(TodoRepository):
+    """Serve todo lookups by ID from a shared cache before the wrapped repository.
+
+    Writes evict the affected entries immediately. Because the write is not
+    visible to other sessions until commit, a concurrent request may cache
+    the previous row in between; call ``invalidate_written`` once the
+    transaction commits to evict those entries again.
+    """
+
+    def __init__(self, repository: TodoRepository, cache: TodoEntityCache):
+        """Store the wrapped repository and the shared cache.
+
+        Args:
+            repository: Repository that owns persistence.
+            cache: Process-wide entity cache.
+        """
+        self.repository = repository
+        self.cache = cache
+        self._written: set[TodoId] = set()
+
+    def save(self, todo: Todo) -> None:
+        """Persist the todo and evict its cached entry, even on a conflict.
+
+        Args:
+            todo: Todo entity to store.
+        """
+        try:
+            self.repository.save(todo)
+        finally:
+            self._evict([todo.id])
+
+    def save_many(self, todos: Sequence[Todo]) -> set[TodoId]:
+        """Persist the todos and evict their cached entries, even on failure.
+
+        Args:
+            todos: Todo entities to store.
+
+        Returns:
+            set[TodoId]: Identifiers of the todos that changed concurrently.
+        """
+        try:
+            return self.repository.save_many(todos)
+        finally:
+            self._evict([todo.id for todo in todos])
+
+    def add_many(self, todos: Sequence[Todo]) -> None:
+        """Insert the new todos and evict any stale entries for their IDs.
+
+        Args:
+            todos: Todo entities that are not stored yet.
+        """
+        self.repository.add_many(todos)
+        self._evict([todo.id for todo in todos])
+
+    def transition(
+        self,
+        todo_id: TodoId,
+        status: TodoStatus,
+        from_statuses: Collection[TodoStatus],
+        at: datetime,
+    ) -> Todo | None:
+        """Move the todo to a new status and evict its cached entry, even on failure.
+
+        Args:
+            todo_id: Identifier of the todo to move.
+            status: Status to move the todo to.
+            from_statuses: Statuses the todo may currently be in.
+            at: Time of the transition.
+
+        Returns:
+            Optional[Todo]: Todo as stored after the transition; None when no
+                todo with that ID is in one of ``from_statuses``.
+        """
+        try:
+            return self.repository.transition(todo_id, status, from_statuses, at)
+        finally:
+            self._evict([todo_id])
+
+    def find_by_id(self, todo_id: TodoId) -> Todo | None:
+        """Return the cached todo, loading and caching it on a miss.
+
+        Args:
+            todo_id: Identifier of the todo to fetch.
+
+        Returns:
+            Optional[Todo]: The matching todo when found; otherwise None.
+        """
+        todo = self.cache.get(todo_id)
+        if todo is None:
+            todo = self.repository.find_by_id(todo_id)
+            if todo is not None:
+                self.cache.put(todo)
+        return todo
+
+    def find_by_ids(self, todo_ids: Sequence[TodoId]) -> list[Todo]:
+        """Return the todos matching the identifiers, loading only misses.
+
+        Args:
+            todo_ids: Identifiers of the todos to fetch.
+
+        Returns:
+            list[Todo]: Todos that exist; unknown identifiers are skipped.
+        """
+        found, missing = _split_cached(self.cache, todo_ids)
+        if missing:
+            loaded = self.repository.find_by_ids(missing)
+            for todo in loaded:
+                self.cache.put(todo)
+            found.extend(loaded)
+        return found
+
+    def find_all(
+        self,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+        sort_key: TodoSortKey = TodoSortKey.CREATED_AT,
+        todo_filter: TodoFilter | None = None,
+    ) -> TodoPage:
+        """Return one page of todos straight from the wrapped repository.
+
+        Args:
+            limit: Maximum number of todos to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+            sort_key: Timestamp used to order the todos.
+            todo_filter: Criteria the listed todos must meet, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return self.repository.find_all(
+            limit=limit, cursor=cursor, sort_key=sort_key, todo_filter=todo_filter
+        )
+
+    def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> TodoSearchPage:
+        """Return one page of search hits straight from the wrapped repository.
+
+        Args:
+            query: Terms to look for.
+            limit: Maximum number of hits to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoSearchPage: The matching todos and the cursor for the next page.
+        """
+        return self.repository.search(query, limit=limit, cursor=cursor)
+
+    def iter_all(
+        self, batch_size: int = DEFAULT_TODO_EXPORT_BATCH_SIZE
+    ) -> Iterator[Todo]:
+        """Stream every todo straight from the wrapped repository.
+
+        Args:
+            batch_size: Number of rows fetched from storage at a time.
+
+        Returns:
+            Iterator[Todo]: Todos in storage order.
+        """
+        return self.repository.iter_all(batch_size)
+
+    def find_version(self, todo_id: TodoId) -> int | None:
+        """Return the stored version, bypassing the cache.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[int]: Current version when the todo exists; otherwise None.
+        """
+        return self.repository.find_version(todo_id)
+
+    def find_status(self, todo_id: TodoId) -> TodoStatus | None:
+        """Return the stored status, bypassing the cache.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[TodoStatus]: Current status when the todo exists;
+                otherwise None.
+        """
+        return self.repository.find_status(todo_id)
+
+    def find_list_version(self) -> TodoListVersion:
+        """Return the collection version straight from the wrapped repository.
+
+        Returns:
+            TodoListVersion: Marker that changes whenever any todo is written.
+        """
+        return self.repository.find_list_version()
+
+    def count_by_status(self) -> dict[TodoStatus, int]:
+        """Return the status counts straight from the wrapped repository.
+
+        Returns:
+            dict[TodoStatus, int]: Count for every status, zero included.
+        """
+        return self.repository.count_by_status()
+
+    def delete(self, todo_id: TodoId) -> None:
+        """Delete the todo and evict its cached entry.
+
+        Args:
+            todo_id: Identifier of the todo to delete.
+        """
+        self.repository.delete(todo_id)
+        self._evict([todo_id])
+
+    def delete_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Delete the oldest completed todos and evict their cached entries.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos deleted by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the deleted todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+        deleted = self.repository.delete_completed_before(completed_before, limit)
+        self._evict(deleted)
+        return deleted
+
+    def archive_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Archive the oldest completed todos and evict their cached entries.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos archived by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the archived todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+        archived = self.repository.archive_completed_before(completed_before, limit)
+        self._evict(archived)
+        return archived
+
+    def find_archived(
+        self, limit: int = DEFAULT_TODO_PAGE_SIZE, cursor: str | None = None
+    ) -> TodoPage:
+        """Return one page of archived todos straight from the wrapped repository.
+
+        Args:
+            limit: Maximum number of todos to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return self.repository.find_archived(limit, cursor)
+
+    def invalidate_written(self) -> None:
+        """Evict every todo written through this repository once more."""
+        self.cache.invalidate(self._written)
+        self._written.clear()
+
+    def _evict(self, todo_ids: list[TodoId]) -> None:
+        """Evict entries now and remember them for ``invalidate_written``."""
+        self.cache.invalidate(todo_ids)
+        self._written.update(todo_ids)
+
+
+class AsyncCachingTodoRepository(AsyncTodoRepository):
+    """Async counterpart of ``CachingTodoRepository`` sharing the same cache."""
+
+    def __init__(self, repository: AsyncTodoRepository, cache: TodoEntityCache):
+        """Store the wrapped repository and the shared cache.
+
+        Args:
+            repository: Async repository that owns persistence.
+            cache: Process-wide entity cache.
+        """
+        self.repository = repository
+        self.cache = cache
+        self._written: set[TodoId] = set()
+
+    async def save(self, todo: Todo) -> None:
+        """Persist the todo and evict its cached entry, even on a conflict.
+
+        Args:
+            todo: Todo entity to store.
+        """
+        try:
+            await self.repository.save(todo)
+        finally:
+            self._evict([todo.id])
+
+    async def save_many(self, todos: Sequence[Todo]) -> set[TodoId]:
+        """Persist the todos and evict their cached entries, even on failure.
+
+        Args:
+            todos: Todo entities to store.
+
+        Returns:
+            set[TodoId]: Identifiers of the todos that changed concurrently.
+        """
+        try:
+            return await self.repository.save_many(todos)
+        finally:
+            self._evict([todo.id for todo in todos])
+
+    async def add_many(self, todos: Sequence[Todo]) -> None:
+        """Insert the new todos and evict any stale entries for their IDs.
+
+        Args:
+            todos: Todo entities that are not stored yet.
+        """
+        await self.repository.add_many(todos)
+        self._evict([todo.id for todo in todos])
+
+    async def transition(
+        self,
+        todo_id: TodoId,
+        status: TodoStatus,
+        from_statuses: Collection[TodoStatus],
+        at: datetime,
+    ) -> Todo | None:
+        """Move the todo to a new status and evict its cached entry, even on failure.
+
+        Args:
+            todo_id: Identifier of the todo to move.
+            status: Status to move the todo to.
+            from_statuses: Statuses the todo may currently be in.
+            at: Time of the transition.
+
+        Returns:
+            Optional[Todo]: Todo as stored after the transition; None when no
+                todo with that ID is in one of ``from_statuses``.
+        """
+        try:
+            return await self.repository.transition(todo_id, status, from_statuses, at)
+        finally:
+            self._evict([todo_id])
+
+    async def find_by_id(self, todo_id: TodoId) -> Todo | None:
+        """Return the cached todo, loading and caching it on a miss.
+
+        Args:
+            todo_id: Identifier of the todo to fetch.
+
+        Returns:
+            Optional[Todo]: The matching todo when found; otherwise None.
+        """
+        todo = self.cache.get(todo_id)
+        if todo is None:
+            todo = await self.repository.find_by_id(todo_id)
+            if todo is not None:
+                self.cache.put(todo)
+        return todo
+
+    async def find_by_ids(self, todo_ids: Sequence[TodoId]) -> list[Todo]:
+        """Return the todos matching the identifiers, loading only misses.
+
+        Args:
+            todo_ids: Identifiers of the todos to fetch.
+
+        Returns:
+            list[Todo]: Todos that exist; unknown identifiers are skipped.
+        """
+        found, missing = _split_cached(self.cache, todo_ids)
+        if missing:
+            loaded = await self.repository.find_by_ids(missing)
+            for todo in loaded:
+                self.cache.put(todo)
+            found.extend(loaded)
+        return found
+
+    async def find_all(
+        self,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+        sort_key: TodoSortKey = TodoSortKey.CREATED_AT,
+        todo_filter: TodoFilter | None = None,
+    ) -> TodoPage:
+        """Return one page of todos straight from the wrapped repository.
+
+        Args:
+            limit: Maximum number of todos to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+            sort_key: Timestamp used to order the todos.
+            todo_filter: Criteria the listed todos must meet, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return await self.repository.find_all(
+            limit=limit, cursor=cursor, sort_key=sort_key, todo_filter=todo_filter
+        )
+
+    async def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> TodoSearchPage:
+        """Return one page of search hits straight from the wrapped repository.
+
+        Args:
+            query: Terms to look for.
+            limit: Maximum number of hits to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoSearchPage: The matching todos and the cursor for the next page.
+        """
+        return await self.repository.search(query, limit=limit, cursor=cursor)
+
+    def iter_all(
+        self, batch_size: int = DEFAULT_TODO_EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Todo]:
+        """Stream every todo straight from the wrapped repository.
+
+        Args:
+            batch_size: Number of rows fetched from storage at a time.
+
+        Returns:
+            AsyncIterator[Todo]: Todos in storage order.
+        """
+        return self.repository.iter_all(batch_size)
+
+    async def find_version(self, todo_id: TodoId) -> int | None:
+        """Return the stored version, bypassing the cache.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[int]: Current version when the todo exists; otherwise None.
+        """
+        return await self.repository.find_version(todo_id)
+
+    async def find_status(self, todo_id: TodoId) -> TodoStatus | None:
+        """Return the stored status, bypassing the cache.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[TodoStatus]: Current status when the todo exists;
+                otherwise None.
+        """
+        return await self.repository.find_status(todo_id)
+
+    async def find_list_version(self) -> TodoListVersion:
+        """Return the collection version straight from the wrapped repository.
+
+        Returns:
+            TodoListVersion: Marker that changes whenever any todo is written.
+        """
+        return await self.repository.find_list_version()
+
+    async def count_by_status(self) -> dict[TodoStatus, int]:
+        """Return the status counts straight from the wrapped repository.
+
+        Returns:
+            dict[TodoStatus, int]: Count for every status, zero included.
+        """
+        return await self.repository.count_by_status()
+
+    async def delete(self, todo_id: TodoId) -> None:
+        """Delete the todo and evict its cached entry.
+
+        Args:
+            todo_id: Identifier of the todo to delete.
+        """
+        await self.repository.delete(todo_id)
+        self._evict([todo_id])
+
+    async def delete_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Delete the oldest completed todos and evict their cached entries.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos deleted by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the deleted todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+        deleted = await self.repository.delete_completed_before(completed_before, limit)
+        self._evict(deleted)
+        return deleted
+
+    async def archive_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Archive the oldest completed todos and evict their cached entries.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos archived by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the archived todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+        archived = await self.repository.archive_completed_before(
+            completed_before, limit
+        )
+        self._evict(archived)
+        return archived
+
+    async def find_archived(
+        self, limit: int = DEFAULT_TODO_PAGE_SIZE, cursor: str | None = None
+    ) -> TodoPage:
+        """Return one page of archived todos straight from the wrapped repository.
+
+        Args:
+            limit: Maximum number of todos to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return await self.repository.find_archived(limit, cursor)
+
+    def invalidate_written(self) -> None:
+        """Evict every todo written through this repository once more."""
+        self.cache.invalidate(self._written)
+        self._written.clear()
+
+    def _evict(self, todo_ids: list[TodoId]) -> None:
+        """Evict entries now and remember them for ``invalidate_written``."""
+        self.cache.invalidate(todo_ids)
+        self._written.update(todo_ids)
+
+
+def new_caching_todo_repository(
+    repository: TodoRepository, cache: TodoEntityCache
+) -> CachingTodoRepository:
+    """Wrap a repository with the shared entity cache.
+
+    Args:
+        repository: Repository that owns persistence.
+        cache: Process-wide entity cache.
+
+    Returns:
+        CachingTodoRepository: Caching decorator around the repository.
+    """
+    return CachingTodoRepository(repository, cache)
+
+
+def new_async_caching_todo_repository(
+    repository: AsyncTodoRepository, cache: TodoEntityCache
+) -> AsyncCachingTodoRepository:
+    """Wrap an async repository with the shared entity cache.
+
+    Args:
+        repository: Async repository that owns persistence.
+        cache: Process-wide entity cache.
+
+    Returns:
+        AsyncCachingTodoRepository: Caching decorator around the repository.
+    """
+    return AsyncCachingTodoRepository(repository, cache)
@@ -0,0 +1,129 @@
+"""Process-wide LRU cache of todo entities with a time-to-live."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoId
+
+INVALID_CACHE_BOUNDS_ERROR_MESSAGE = 'Cache size and TTL must be positive'
+
+
+@dataclass(frozen=True)
+class TodoCacheStats:
+    """Snapshot of the cache counters.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that found no live entry.
+        evictions: Entries dropped because the cache was full.
+        size: Number of entries currently cached.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class TodoEntityCache:
+    """Keep recently read todos in memory, bounded by size and age.
+
+    The cache is shared by every request, so all access is serialized by a
+    lock. Entities are copied on the way in and out because use cases mutate
+    the todos they load before saving them.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Configure the cache bounds.
+
+        Args:
+            max_size: Maximum number of entities kept before evicting the
+                least recently used one.
+            ttl_seconds: Seconds after which an entry is treated as missing.
+            clock: Monotonic time source, replaceable in tests.
+
+        Raises:
+            ValueError: If a bound is not positive.
+        """
+        if max_size < 1 or ttl_seconds <= 0:
+            raise ValueError(INVALID_CACHE_BOUNDS_ERROR_MESSAGE)
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[TodoId, tuple[float, Todo]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, todo_id: TodoId) -> Todo | None:
+        """Return a copy of the cached todo, or None when absent or expired.
+
+        Args:
+            todo_id: Identifier of the todo to look up.
+
+        Returns:
+            Optional[Todo]: Cached todo when a live entry exists.
+        """
+        with self._lock:
+            entry = self._entries.get(todo_id)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[todo_id]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(todo_id)
+            self._hits += 1
+            return replace(entry[1])
+
+    def put(self, todo: Todo) -> None:
+        """Cache a copy of the todo, evicting the oldest entry when full.
+
+        Args:
+            todo: Todo loaded from the underlying repository.
+        """
+        expires_at = self._clock() + self.ttl_seconds
+        with self._lock:
+            self._entries[todo.id] = (expires_at, replace(todo))
+            self._entries.move_to_end(todo.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, todo_ids: Iterable[TodoId]) -> None:
+        """Drop any cached entries for the given identifiers.
+
+        Args:
+            todo_ids: Identifiers of todos that were written or deleted.
+        """
+        with self._lock:
+            for todo_id in todo_ids:
+                self._entries.pop(todo_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry while keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> TodoCacheStats:
+        """Return the current counters.
+
+        Returns:
+            TodoCacheStats: Hit, miss, and eviction counts and current size.
+        """
+        with self._lock:
+            return TodoCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
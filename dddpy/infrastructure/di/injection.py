@@ -1,34 +1,147 @@
 """Dependency injection configuration for the application."""
 
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
 
 from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from dddpy.domain.todo.repositories import TodoRepository
-from dddpy.infrastructure.sqlite.database import SessionLocal
+from dddpy.domain.todo.repositories import AsyncTodoRepository, TodoRepository
+from dddpy.infrastructure.cache import (
+    TodoEntityCache,
+    new_async_caching_todo_repository,
+    new_caching_todo_repository,
+)
+from dddpy.infrastructure.di.todo_context import (
+    bind_async_todo_unit_of_work,
+    bind_todo_unit_of_work,
+    new_async_context_todo_unit_of_work,
+    new_context_todo_unit_of_work,
+)
+from dddpy.infrastructure.settings import settings
+from dddpy.infrastructure.sqlite.database import AsyncSessionLocal, SessionLocal
+from dddpy.infrastructure.sqlite.session_tracking import (
+    mark_session_read_only,
+    session_needs_commit,
+)
+from dddpy.infrastructure.sqlite.todo.async_todo_repository import (
+    new_async_todo_repository,
+)
+from dddpy.infrastructure.sqlite.todo.group_commit_todo_repository import (
+    new_async_group_commit_todo_repository,
+    new_group_commit_todo_repository,
+)
+from dddpy.infrastructure.sqlite.todo.todo_identity_map import (
+    disable_todo_identity_map,
+)
 from dddpy.infrastructure.sqlite.todo.todo_repository import new_todo_repository
+from dddpy.infrastructure.sqlite.todo.todo_unit_of_work import (
+    new_async_todo_unit_of_work,
+    new_todo_unit_of_work,
+)
+from dddpy.infrastructure.sqlite.write_coordinator import WriteCoordinator
 from dddpy.usecase.todo import (
-    CompleteTodoUseCase,
-    CreateTodoUseCase,
-    DeleteTodoUseCase,
-    FindTodoByIdUseCase,
-    FindTodosUseCase,
-    StartTodoUseCase,
-    UpdateTodoUseCase,
+    new_async_complete_todo_usecase,
+    new_async_create_todo_usecase,
+    new_async_delete_todo_usecase,
+    new_async_export_todos_usecase,
+    new_async_find_archived_todos_usecase,
+    new_async_find_todo_by_id_usecase,
+    new_async_find_todo_stats_usecase,
+    new_async_find_todo_version_usecase,
+    new_async_find_todos_usecase,
+    new_async_find_todos_version_usecase,
+    new_async_import_todos_usecase,
+    new_async_purge_completed_todos_usecase,
+    new_async_search_todos_usecase,
+    new_async_start_todo_usecase,
+    new_async_update_todo_usecase,
+    new_async_upsert_todos_usecase,
     new_complete_todo_usecase,
     new_create_todo_usecase,
     new_delete_todo_usecase,
+    new_export_todos_usecase,
+    new_find_archived_todos_usecase,
     new_find_todo_by_id_usecase,
+    new_find_todo_stats_usecase,
+    new_find_todo_version_usecase,
     new_find_todos_usecase,
+    new_find_todos_version_usecase,
+    new_import_todos_usecase,
+    new_purge_completed_todos_usecase,
+    new_search_todos_usecase,
     new_start_todo_usecase,
     new_update_todo_usecase,
+    new_upsert_todos_usecase,
+)
+
+todo_entity_cache: TodoEntityCache | None = (
+    TodoEntityCache(settings.todo_cache_size, settings.todo_cache_ttl_seconds)
+    if settings.todo_cache_enabled
+    else None
+)
+
+# Worker processes start on first use, so an idle pool costs nothing.
+todo_import_executor: ProcessPoolExecutor | None = (
+    ProcessPoolExecutor(settings.import_workers)
+    if settings.import_workers > 0
+    else None
 )
 
+# The writer thread starts on the first write, so an idle coordinator costs
+# nothing.
+todo_write_coordinator: WriteCoordinator | None = (
+    WriteCoordinator(
+        SessionLocal,
+        settings.group_commit_window_ms / 1000,
+        settings.group_commit_max_batch,
+    )
+    if settings.group_commit
+    else None
+)
+
+
+# Use cases hold no per-request state, so each is built once over a unit of
+# work that forwards to the one bound to the request context. A request then
+# only builds its session-scoped repository stack, in async dependencies that
+# need no thread pool hop.
+todo_unit_of_work = new_context_todo_unit_of_work()
+async_todo_unit_of_work = new_async_context_todo_unit_of_work()
+_todos = todo_unit_of_work.todos
+_async_todos = async_todo_unit_of_work.todos
+
+
+def _close_session(session: Session, *, commit: bool) -> None:
+    """Commit or roll back the session, then close it."""
+    try:
+        if commit:
+            session.commit()
+        else:
+            session.rollback()
+    finally:
+        session.close()
+
+
+async def _end_session(session: Session, *, commit: bool) -> None:
+    """End the session, in the thread pool only when it holds a connection."""
+    if session.in_transaction():
+        await run_in_threadpool(_close_session, session, commit=commit)
+    else:
+        # Nothing began a transaction, so no connection was checked out and
+        # ending the session does no I/O.
+        _close_session(session, commit=commit)
+
 
-def get_session() -> Iterator[Session]:
+async def get_session() -> AsyncIterator[Session]:
     """Yield a managed SQLAlchemy session for request handling.
 
+    The session checks out a connection on its first query, so a request
+    rejected before it touches the database never uses the pool. A
+    transaction that only read is rolled back instead of committed.
+
     Yields:
         Session: Database session with automatic commit or rollback.
 
@@ -38,119 +151,261 @@ def get_session() -> Iterator[Session]:
     session: Session = SessionLocal()
     try:
         yield session
-        session.commit()
     except Exception:
-        session.rollback()
+        await _end_session(session, commit=False)
         raise
-    finally:
-        session.close()
+    await _end_session(session, commit=session_needs_commit(session))
 
 
-def get_todo_repository(session: Session = Depends(get_session)) -> TodoRepository:
-    """Provide a repository instance bound to the current session.
+async def use_read_only_session(session: Session = Depends(get_session)) -> None:
+    """Run the request's queries in a read-only transaction.
+
+    Add it to the ``dependencies`` of routes that never write.
 
     Args:
         session: Active SQLAlchemy session provided by FastAPI.
-
-    Returns:
-        TodoRepository: Repository configured with the session.
     """
-    return new_todo_repository(session)
+    mark_session_read_only(session)
 
 
-def get_create_todo_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
-) -> CreateTodoUseCase:
-    """Provide the create-todo use case with injected repository.
+def _new_todo_repository(session: Session) -> TodoRepository:
+    """Build the repository stack used by one request session.
 
     Args:
-        todo_repository: Repository dependency supplied by FastAPI.
+        session: Session of the current request.
 
     Returns:
-        CreateTodoUseCase: Configured use case implementation.
+        TodoRepository: Repository configured with the session.
     """
-    return new_create_todo_usecase(todo_repository)
-
-
-def get_start_todo_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
-) -> StartTodoUseCase:
-    """Provide the start-todo use case with injected repository.
+    repository = new_todo_repository(session)
+    if todo_write_coordinator is not None:
+        # Writes commit in the coordinator's session, so todos tracked by
+        # this one would go stale.
+        disable_todo_identity_map(session)
+        repository = new_group_commit_todo_repository(
+            repository, todo_write_coordinator
+        )
+    if todo_entity_cache is None:
+        return repository
+
+    caching = new_caching_todo_repository(repository, todo_entity_cache)
+    event.listen(session, 'after_commit', lambda _: caching.invalidate_written())
+    if todo_write_coordinator is not None:
+        # Group-committed writes are durable however this session ends.
+        event.listen(
+            session, 'after_soft_rollback', lambda *_: caching.invalidate_written()
+        )
+    return caching
+
+
+async def bind_todo_session(session: Session = Depends(get_session)) -> None:
+    """Bind a unit of work over the request session to the request context.
+
+    This is an ``async def`` dependency so the binding is made in the
+    request's own context, which sync endpoints inherit in the thread pool.
 
     Args:
-        todo_repository: Repository dependency supplied by FastAPI.
-
-    Returns:
-        StartTodoUseCase: Configured use case implementation.
+        session: Active SQLAlchemy session provided by FastAPI.
     """
-    return new_start_todo_usecase(todo_repository)
+    bind_todo_unit_of_work(
+        new_todo_unit_of_work(session, _new_todo_repository(session))
+    )
 
 
-def get_complete_todo_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
-) -> CompleteTodoUseCase:
-    """Provide the complete-todo use case with injected repository.
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    """Yield a managed asynchronous session for request handling.
 
-    Args:
-        todo_repository: Repository dependency supplied by FastAPI.
+    Yields:
+        AsyncSession: Database session with automatic commit or rollback.
 
-    Returns:
-        CompleteTodoUseCase: Configured use case implementation.
+    Raises:
+        Exception: Propagates any database or application error after rollback.
     """
-    return new_complete_todo_usecase(todo_repository)
+    session: AsyncSession = AsyncSessionLocal()
+    try:
+        yield session
+        if session_needs_commit(session.sync_session):
+            await session.commit()
+        else:
+            await session.rollback()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
 
 
-def get_update_todo_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
-) -> UpdateTodoUseCase:
-    """Provide the update-todo use case with injected repository.
+async def use_async_read_only_session(
+    session: AsyncSession = Depends(get_async_session),
+) -> None:
+    """Run the request's async queries in a read-only transaction.
 
     Args:
-        todo_repository: Repository dependency supplied by FastAPI.
-
-    Returns:
-        UpdateTodoUseCase: Configured use case implementation.
+        session: Active asynchronous session provided by FastAPI.
     """
-    return new_update_todo_usecase(todo_repository)
+    mark_session_read_only(session.sync_session)
 
 
-def get_delete_todo_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
-) -> DeleteTodoUseCase:
-    """Provide the delete-todo use case with injected repository.
+def _new_async_todo_repository(session: AsyncSession) -> AsyncTodoRepository:
+    """Build the async repository stack used by one request session.
 
     Args:
-        todo_repository: Repository dependency supplied by FastAPI.
+        session: Asynchronous session of the current request.
 
     Returns:
-        DeleteTodoUseCase: Configured use case implementation.
+        AsyncTodoRepository: Repository configured with the session.
     """
-    return new_delete_todo_usecase(todo_repository)
+    repository = new_async_todo_repository(session)
+    if todo_write_coordinator is not None:
+        disable_todo_identity_map(session.sync_session)
+        repository = new_async_group_commit_todo_repository(
+            repository, todo_write_coordinator
+        )
+    if todo_entity_cache is None:
+        return repository
+
+    caching = new_async_caching_todo_repository(repository, todo_entity_cache)
+    event.listen(
+        session.sync_session, 'after_commit', lambda _: caching.invalidate_written()
+    )
+    if todo_write_coordinator is not None:
+        event.listen(
+            session.sync_session,
+            'after_soft_rollback',
+            lambda *_: caching.invalidate_written(),
+        )
+    return caching
+
+
+async def bind_async_todo_session(
+    session: AsyncSession = Depends(get_async_session),
+) -> None:
+    """Bind an async unit of work over the request session to the request context.
 
+    Args:
+        session: Active asynchronous session provided by FastAPI.
+    """
+    bind_async_todo_unit_of_work(
+        new_async_todo_unit_of_work(session, _new_async_todo_repository(session))
+    )
 
-def get_find_todo_by_id_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
-) -> FindTodoByIdUseCase:
-    """Provide the find-by-id use case with injected repository.
+
+def _use_case_dependency(
+    usecase: object, bind_session: Callable[..., Awaitable[None]]
+) -> Callable[..., Awaitable[object]]:
+    """Build the dependency that provides a shared use case to a route.
 
     Args:
-        todo_repository: Repository dependency supplied by FastAPI.
+        usecase: Use case built over a context unit of work.
+        bind_session: Dependency binding the request session before the use
+            case runs.
 
     Returns:
-        FindTodoByIdUseCase: Configured use case implementation.
+        Callable[..., Awaitable[object]]: ``async def`` dependency returning
+            the use case.
     """
-    return new_find_todo_by_id_usecase(todo_repository)
 
+    async def provide(_: None = Depends(bind_session)) -> object:
+        return usecase
 
-def get_find_todos_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
-) -> FindTodosUseCase:
-    """Provide the list-todos use case with injected repository.
+    return provide
 
-    Args:
-        todo_repository: Repository dependency supplied by FastAPI.
 
-    Returns:
-        FindTodosUseCase: Configured use case implementation.
-    """
-    return new_find_todos_usecase(todo_repository)
+get_create_todo_usecase = _use_case_dependency(
+    new_create_todo_usecase(_todos), bind_todo_session
+)
+get_start_todo_usecase = _use_case_dependency(
+    new_start_todo_usecase(_todos), bind_todo_session
+)
+get_complete_todo_usecase = _use_case_dependency(
+    new_complete_todo_usecase(_todos), bind_todo_session
+)
+get_update_todo_usecase = _use_case_dependency(
+    new_update_todo_usecase(_todos), bind_todo_session
+)
+get_delete_todo_usecase = _use_case_dependency(
+    new_delete_todo_usecase(_todos), bind_todo_session
+)
+get_find_todo_by_id_usecase = _use_case_dependency(
+    new_find_todo_by_id_usecase(_todos), bind_todo_session
+)
+get_find_todos_usecase = _use_case_dependency(
+    new_find_todos_usecase(_todos), bind_todo_session
+)
+get_find_archived_todos_usecase = _use_case_dependency(
+    new_find_archived_todos_usecase(_todos), bind_todo_session
+)
+get_search_todos_usecase = _use_case_dependency(
+    new_search_todos_usecase(_todos), bind_todo_session
+)
+get_find_todo_stats_usecase = _use_case_dependency(
+    new_find_todo_stats_usecase(_todos), bind_todo_session
+)
+get_find_todo_version_usecase = _use_case_dependency(
+    new_find_todo_version_usecase(_todos), bind_todo_session
+)
+get_find_todos_version_usecase = _use_case_dependency(
+    new_find_todos_version_usecase(_todos), bind_todo_session
+)
+get_upsert_todos_usecase = _use_case_dependency(
+    new_upsert_todos_usecase(_todos), bind_todo_session
+)
+get_export_todos_usecase = _use_case_dependency(
+    new_export_todos_usecase(_todos), bind_todo_session
+)
+get_import_todos_usecase = _use_case_dependency(
+    new_import_todos_usecase(todo_unit_of_work, todo_import_executor), bind_todo_session
+)
+get_purge_completed_todos_usecase = _use_case_dependency(
+    new_purge_completed_todos_usecase(todo_unit_of_work), bind_todo_session
+)
+get_async_create_todo_usecase = _use_case_dependency(
+    new_async_create_todo_usecase(_async_todos), bind_async_todo_session
+)
+get_async_start_todo_usecase = _use_case_dependency(
+    new_async_start_todo_usecase(_async_todos), bind_async_todo_session
+)
+get_async_complete_todo_usecase = _use_case_dependency(
+    new_async_complete_todo_usecase(_async_todos), bind_async_todo_session
+)
+get_async_update_todo_usecase = _use_case_dependency(
+    new_async_update_todo_usecase(_async_todos), bind_async_todo_session
+)
+get_async_delete_todo_usecase = _use_case_dependency(
+    new_async_delete_todo_usecase(_async_todos), bind_async_todo_session
+)
+get_async_find_todo_by_id_usecase = _use_case_dependency(
+    new_async_find_todo_by_id_usecase(_async_todos), bind_async_todo_session
+)
+get_async_find_todos_usecase = _use_case_dependency(
+    new_async_find_todos_usecase(_async_todos), bind_async_todo_session
+)
+get_async_find_archived_todos_usecase = _use_case_dependency(
+    new_async_find_archived_todos_usecase(_async_todos), bind_async_todo_session
+)
+get_async_search_todos_usecase = _use_case_dependency(
+    new_async_search_todos_usecase(_async_todos), bind_async_todo_session
+)
+get_async_find_todo_stats_usecase = _use_case_dependency(
+    new_async_find_todo_stats_usecase(_async_todos), bind_async_todo_session
+)
+get_async_upsert_todos_usecase = _use_case_dependency(
+    new_async_upsert_todos_usecase(_async_todos), bind_async_todo_session
+)
+get_async_find_todo_version_usecase = _use_case_dependency(
+    new_async_find_todo_version_usecase(_async_todos), bind_async_todo_session
+)
+get_async_find_todos_version_usecase = _use_case_dependency(
+    new_async_find_todos_version_usecase(_async_todos), bind_async_todo_session
+)
+get_async_export_todos_usecase = _use_case_dependency(
+    new_async_export_todos_usecase(_async_todos), bind_async_todo_session
+)
+get_async_import_todos_usecase = _use_case_dependency(
+    new_async_import_todos_usecase(async_todo_unit_of_work, todo_import_executor),
+    bind_async_todo_session,
+)
+get_async_purge_completed_todos_usecase = _use_case_dependency(
+    new_async_purge_completed_todos_usecase(async_todo_unit_of_work),
+    bind_async_todo_session,
+)
@@ -0,0 +1,140 @@
+"""Bind the request's todo unit of work to the running context.
+
+Use cases hold no per-request state, so the application builds them once
+over the unit of work returned by ``new_context_todo_unit_of_work``. Each
+request only binds its own unit of work, and every call made through the
+context unit of work is forwarded to it. Requests run in separate contexts,
+so concurrent requests never see each other's session.
+
+Attributes are looked up on the bound object by name when they are used,
+so a method added to an interface is forwarded without being listed here.
+"""
+
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any, cast
+
+from dddpy.domain.todo.repositories import (
+    AsyncTodoRepository,
+    AsyncTodoUnitOfWork,
+    TodoRepository,
+    TodoUnitOfWork,
+)
+
+_todo_unit_of_work: ContextVar[TodoUnitOfWork] = ContextVar('todo_unit_of_work')
+_async_todo_unit_of_work: ContextVar[AsyncTodoUnitOfWork] = ContextVar(
+    'async_todo_unit_of_work'
+)
+
+
+def bind_todo_unit_of_work(unit_of_work: TodoUnitOfWork) -> None:
+    """Make the unit of work the one used by the running context.
+
+    Bind it from an ``async def`` dependency: sync dependencies run in a
+    copied context on a worker thread, so their binding would be lost.
+
+    Args:
+        unit_of_work: Unit of work of the current request.
+    """
+    _todo_unit_of_work.set(unit_of_work)
+
+
+def current_todo_unit_of_work() -> TodoUnitOfWork:
+    """Return the unit of work bound to the running context.
+
+    Returns:
+        TodoUnitOfWork: Unit of work of the current request.
+
+    Raises:
+        LookupError: If no unit of work was bound in this context.
+    """
+    return _todo_unit_of_work.get()
+
+
+def bind_async_todo_unit_of_work(unit_of_work: AsyncTodoUnitOfWork) -> None:
+    """Make the async unit of work the one used by the running context.
+
+    Args:
+        unit_of_work: Async unit of work of the current request.
+    """
+    _async_todo_unit_of_work.set(unit_of_work)
+
+
+def current_async_todo_unit_of_work() -> AsyncTodoUnitOfWork:
+    """Return the async unit of work bound to the running context.
+
+    Returns:
+        AsyncTodoUnitOfWork: Async unit of work of the current request.
+
+    Raises:
+        LookupError: If no async unit of work was bound in this context.
+    """
+    return _async_todo_unit_of_work.get()
+
+
+class _ContextProxy:
+    """Forward attribute lookups to the object a resolver returns.
+
+    Methods of the interface resolve the bound object only when they are
+    called, so a method fetched in one context reaches the object bound to
+    the context it is called in. Async methods return the awaitable of the
+    bound object unchanged.
+    """
+
+    def __init__(
+        self, interface: type, resolve: Callable[[], object], **attributes: object
+    ):
+        """Store the resolver and the attributes kept on the proxy itself.
+
+        Args:
+            interface: Type whose methods are forwarded when called.
+            resolve: Returns the object bound to the running context.
+            **attributes: Attributes answered by the proxy instead of the
+                bound object.
+        """
+        self._interface = interface
+        self._resolve = resolve
+        vars(self).update(attributes)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the attribute of the object bound to the running context."""
+        if not callable(getattr(self._interface, name, None)):
+            return getattr(self._resolve(), name)
+
+        def forward(*args: Any, **kwargs: Any) -> Any:
+            return getattr(self._resolve(), name)(*args, **kwargs)
+
+        return forward
+
+
+def new_context_todo_unit_of_work() -> TodoUnitOfWork:
+    """Instantiate a unit of work forwarding to the one bound to the context.
+
+    Its ``todos`` stay the same object across requests, so use cases may
+    keep them, while every call on them reaches the bound unit of work.
+
+    Returns:
+        TodoUnitOfWork: Unit of work following the running context.
+    """
+    todos = _ContextProxy(TodoRepository, lambda: current_todo_unit_of_work().todos)
+    return cast(
+        'TodoUnitOfWork',
+        _ContextProxy(TodoUnitOfWork, current_todo_unit_of_work, todos=todos),
+    )
+
+
+def new_async_context_todo_unit_of_work() -> AsyncTodoUnitOfWork:
+    """Instantiate an async unit of work forwarding to the bound one.
+
+    Returns:
+        AsyncTodoUnitOfWork: Async unit of work following the running context.
+    """
+    todos = _ContextProxy(
+        AsyncTodoRepository, lambda: current_async_todo_unit_of_work().todos
+    )
+    return cast(
+        'AsyncTodoUnitOfWork',
+        _ContextProxy(
+            AsyncTodoUnitOfWork, current_async_todo_unit_of_work, todos=todos
+        ),
+    )
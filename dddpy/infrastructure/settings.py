@@ -0,0 +1,136 @@
+"""Read deployment settings from environment variables."""
+
+import os
+from dataclasses import dataclass
+
+DEFAULT_DATABASE_URL = 'sqlite:///./db/sqlite.db'
+DEFAULT_SQLITE_PROFILE = 'balanced'
+DEFAULT_TODO_CACHE_SIZE = 1024
+DEFAULT_TODO_CACHE_TTL_SECONDS = 5.0
+DEFAULT_GROUP_COMMIT_WINDOW_MS = 2.0
+DEFAULT_GROUP_COMMIT_MAX_BATCH = 256
+DEFAULT_ARCHIVE_INTERVAL_SECONDS = 3600.0
+
+_TRUE_VALUES = frozenset({'1', 'true', 'yes', 'on'})
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean flag from the environment.
+
+    Args:
+        name: Environment variable to read.
+        default: Value used when the variable is unset.
+
+    Returns:
+        bool: Whether the flag is enabled.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUE_VALUES
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer from the environment.
+
+    Args:
+        name: Environment variable to read.
+        default: Value used when the variable is unset.
+
+    Returns:
+        int: Parsed value.
+    """
+    value = os.environ.get(name)
+    return default if value is None else int(value)
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float from the environment.
+
+    Args:
+        name: Environment variable to read.
+        default: Value used when the variable is unset.
+
+    Returns:
+        float: Parsed value.
+    """
+    value = os.environ.get(name)
+    return default if value is None else float(value)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Hold the settings that vary between deployments.
+
+    Attributes:
+        database_url: SQLAlchemy URL of the SQLite database.
+        sqlite_profile: Name of the SQLite connection profile to apply.
+        async_api: Whether the API serves requests with async route handlers.
+        todo_cache_enabled: Whether todo lookups by ID go through the cache.
+        todo_cache_size: Maximum number of todos kept in the cache.
+        todo_cache_ttl_seconds: Seconds a cached todo stays valid.
+        strict_hydration: Whether todos loaded from storage are re-validated.
+        import_workers: Processes validating NDJSON imports; 0 validates
+            in the request process.
+        fast_json: Whether todo responses are encoded without response models.
+        group_commit: Whether todo writes are committed in groups by one
+            writer thread instead of by each request.
+        group_commit_window_ms: Milliseconds the writer waits for more
+            writes after the first one of a group.
+        group_commit_max_batch: Most writes committed in one group.
+        archive_after_days: Days after completion at which todos move to the
+            archive table; 0 disables archival.
+        archive_interval_seconds: Seconds between archival runs.
+    """
+
+    database_url: str = DEFAULT_DATABASE_URL
+    sqlite_profile: str = DEFAULT_SQLITE_PROFILE
+    async_api: bool = False
+    todo_cache_enabled: bool = False
+    todo_cache_size: int = DEFAULT_TODO_CACHE_SIZE
+    todo_cache_ttl_seconds: float = DEFAULT_TODO_CACHE_TTL_SECONDS
+    strict_hydration: bool = False
+    import_workers: int = 0
+    fast_json: bool = False
+    group_commit: bool = False
+    group_commit_window_ms: float = DEFAULT_GROUP_COMMIT_WINDOW_MS
+    group_commit_max_batch: int = DEFAULT_GROUP_COMMIT_MAX_BATCH
+    archive_after_days: float = 0.0
+    archive_interval_seconds: float = DEFAULT_ARCHIVE_INTERVAL_SECONDS
+
+    @staticmethod
+    def from_env() -> 'Settings':
+        """Build settings from ``DDDPY_*`` environment variables.
+
+        Returns:
+            Settings: Settings with environment overrides applied.
+        """
+        return Settings(
+            database_url=os.environ.get('DDDPY_DATABASE_URL', DEFAULT_DATABASE_URL),
+            sqlite_profile=os.environ.get(
+                'DDDPY_SQLITE_PROFILE', DEFAULT_SQLITE_PROFILE
+            ),
+            async_api=_env_flag('DDDPY_ASYNC_API', default=False),
+            todo_cache_enabled=_env_flag('DDDPY_TODO_CACHE', default=False),
+            todo_cache_size=_env_int('DDDPY_TODO_CACHE_SIZE', DEFAULT_TODO_CACHE_SIZE),
+            todo_cache_ttl_seconds=_env_float(
+                'DDDPY_TODO_CACHE_TTL', DEFAULT_TODO_CACHE_TTL_SECONDS
+            ),
+            strict_hydration=_env_flag('DDDPY_STRICT_HYDRATION', default=False),
+            import_workers=_env_int('DDDPY_IMPORT_WORKERS', 0),
+            fast_json=_env_flag('DDDPY_FAST_JSON', default=False),
+            group_commit=_env_flag('DDDPY_GROUP_COMMIT', default=False),
+            group_commit_window_ms=_env_float(
+                'DDDPY_GROUP_COMMIT_WINDOW_MS', DEFAULT_GROUP_COMMIT_WINDOW_MS
+            ),
+            group_commit_max_batch=_env_int(
+                'DDDPY_GROUP_COMMIT_MAX_BATCH', DEFAULT_GROUP_COMMIT_MAX_BATCH
+            ),
+            archive_after_days=_env_float('DDDPY_ARCHIVE_AFTER_DAYS', 0.0),
+            archive_interval_seconds=_env_float(
+                'DDDPY_ARCHIVE_INTERVAL', DEFAULT_ARCHIVE_INTERVAL_SECONDS
+            ),
+        )
+
+
+settings = Settings.from_env()
@@ -0,0 +1,65 @@
+"""Run maintenance commands against the configured SQLite database.
+
+Run with ``python -m dddpy.infrastructure.sqlite <command>``.
+"""
+
+import argparse
+
+from dddpy.infrastructure.sqlite.database import engine
+from dddpy.infrastructure.sqlite.migrations import (
+    apply_migrations,
+    migrate,
+    schema_version,
+)
+from dddpy.infrastructure.sqlite.todo.todo_search_dto import rebuild_todo_search
+from dddpy.infrastructure.sqlite.todo.todo_status_count_dto import (
+    reconcile_todo_status_counts,
+)
+
+
+def migrate_schema() -> None:
+    """Apply every pending schema migration, online ones included."""
+    apply_migrations(engine, migrate(engine))
+    with engine.connect() as connection:
+        version = schema_version(connection)
+    print(f'Schema is at version {version}.')
+
+
+def rebuild_search() -> None:
+    """Migrate the schema, then rebuild the todo search index."""
+    migrate_schema()
+    with engine.begin() as connection:
+        indexed = rebuild_todo_search(connection)
+    print(f'Indexed {indexed} todos for search.')
+
+
+def reconcile_stats() -> None:
+    """Migrate the schema, then recount todos per status."""
+    migrate_schema()
+    with engine.begin() as connection:
+        drift = reconcile_todo_status_counts(connection)
+    if not drift:
+        print('Status counts match the todo table.')
+    for status, delta in sorted(drift.items()):
+        print(f'Corrected {status} count by {delta:+d}.')
+
+
+COMMANDS = {
+    'migrate': migrate_schema,
+    'rebuild-search': rebuild_search,
+    'reconcile-stats': reconcile_stats,
+}
+
+
+def main() -> None:
+    """Parse the command line and run the requested command."""
+    parser = argparse.ArgumentParser(
+        prog='python -m dddpy.infrastructure.sqlite', description=__doc__
+    )
+    parser.add_argument('command', choices=sorted(COMMANDS))
+    args = parser.parse_args()
+    COMMANDS[args.command]()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,53 @@
 """Database configuration and session management for SQLite."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-SQLALCHEMY_DATABASE_URL = 'sqlite:///./db/sqlite.db'
+from dddpy.infrastructure.settings import settings
+from dddpy.infrastructure.sqlite.profile import (
+    SQLiteProfile,
+    apply_sqlite_profile,
+    get_sqlite_profile,
+)
+
+SQLALCHEMY_DATABASE_URL = settings.database_url
+
+
+def create_sqlite_engine(url: str, profile: SQLiteProfile) -> Engine:
+    """Create an engine whose connections use the given profile.
+
+    Args:
+        url: SQLAlchemy URL of the SQLite database.
+        profile: Connection profile applied to every new connection.
+
+    Returns:
+        Engine: Configured SQLAlchemy engine.
+    """
+    engine = create_engine(url, connect_args=profile.connect_args())
+    apply_sqlite_profile(engine, profile)
+    return engine
+
+
+def create_async_sqlite_engine(url: str, profile: SQLiteProfile) -> AsyncEngine:
+    """Create an aiosqlite engine whose connections use the given profile.
+
+    Args:
+        url: SQLAlchemy URL of the SQLite database; the driver is replaced
+            with aiosqlite.
+        profile: Connection profile applied to every new connection.
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={
-        'check_same_thread': False,
-    },
+    Returns:
+        AsyncEngine: Configured asynchronous SQLAlchemy engine.
+    """
+    async_url = make_url(url).set(drivername='sqlite+aiosqlite')
+    engine = create_async_engine(async_url, connect_args=profile.connect_args())
+    apply_sqlite_profile(engine.sync_engine, profile)
+    return engine
+
+
+engine = create_sqlite_engine(
+    SQLALCHEMY_DATABASE_URL, get_sqlite_profile(settings.sqlite_profile)
 )
 
 SessionLocal = sessionmaker(
@@ -17,11 +55,16 @@ SessionLocal = sessionmaker(
     autoflush=True,
 )
 
+async_engine = create_async_sqlite_engine(
+    SQLALCHEMY_DATABASE_URL, get_sqlite_profile(settings.sqlite_profile)
+)
 
-class Base(DeclarativeBase):
-    """Base class for SQLAlchemy declarative models."""
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=True,
+    expire_on_commit=False,
+)
 
 
-def create_tables():
-    """Create all database tables defined in SQLAlchemy models."""
-    Base.metadata.create_all(bind=engine)
+class Base(DeclarativeBase):
+    """Base class for SQLAlchemy declarative models."""
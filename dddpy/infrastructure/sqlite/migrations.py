@@ -0,0 +1,216 @@
+"""Evolve the SQLite schema through ordered steps recorded in ``user_version``.
+
+Each step runs in its own ``BEGIN IMMEDIATE`` transaction together with the
+``PRAGMA user_version`` update that records it, so a step is applied
+exactly once even when several processes start together. Once the database
+is current, startup costs one ``PRAGMA user_version`` read.
+
+Steps must be idempotent. The first step creates every table declared on
+``Base.metadata``, so on a new database it already builds what later steps
+add: declare tables and indexes on the models and let steps create them
+with ``IF NOT EXISTS`` semantics.
+"""
+
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, Engine, text
+
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo import TodoDTO
+from dddpy.infrastructure.sqlite.todo.todo_search_dto import rebuild_todo_search
+from dddpy.infrastructure.sqlite.todo.todo_status_count_dto import (
+    reconcile_todo_status_counts,
+)
+
+logger = logging.getLogger(__name__)
+
+# Single-column indexes of the original todo table. The composite
+# (timestamp, id) and (status, timestamp, id) indexes serve every query
+# they did, so keeping them would only slow down writes.
+_SUPERSEDED_TODO_INDEXES = (
+    'ix_todo_status',
+    'ix_todo_created_at',
+    'ix_todo_updated_at',
+    'ix_todo_completed_at',
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema change and the version it brings the database to.
+
+    Attributes:
+        version: ``user_version`` recorded once the step is applied; steps
+            are numbered consecutively from 1.
+        description: What the step changes, for logs.
+        apply: Runs the change on a connection inside the step's transaction.
+        online: Whether the step may run in the background while requests
+            are served, such as an index build that queries can do without.
+    """
+
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+    online: bool = False
+
+
+def create_index(table_name: str, index_name: str) -> Callable[[Connection], None]:
+    """Return a step body that builds an index declared on a model.
+
+    Pair it with ``online=True`` to build the index after startup. SQLite
+    builds an index in one transaction: WAL readers carry on, while writers
+    wait for it up to the busy timeout.
+
+    Args:
+        table_name: Name of the table declaring the index.
+        index_name: Name of the index in the table's ``__table_args__``.
+
+    Returns:
+        Callable[[Connection], None]: Creates the index unless it exists.
+    """
+
+    def apply(connection: Connection) -> None:
+        table = Base.metadata.tables[table_name]
+        index = next(index for index in table.indexes if index.name == index_name)
+        index.create(connection, checkfirst=True)
+
+    return apply
+
+
+def _create_schema(connection: Connection) -> None:
+    """Create missing tables with their indexes, triggers and seed rows."""
+    Base.metadata.create_all(connection)
+
+
+def _add_todo_version_column(connection: Connection) -> None:
+    """Add the version column to todo tables created before it existed."""
+    columns = connection.execute(
+        text(f'PRAGMA table_info({TodoDTO.__tablename__})')
+    ).all()
+    if 'version' not in {column.name for column in columns}:
+        connection.execute(
+            text('ALTER TABLE todo ADD COLUMN version INTEGER NOT NULL DEFAULT 1')
+        )
+
+
+def _create_missing_indexes(connection: Connection) -> None:
+    """Build declared indexes that tables created earlier lack."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+def _drop_superseded_todo_indexes(connection: Connection) -> None:
+    """Drop the original single-column todo indexes where they remain."""
+    for index_name in _SUPERSEDED_TODO_INDEXES:
+        connection.execute(text(f'DROP INDEX IF EXISTS {index_name}'))
+
+
+def _backfill_todo_read_models(connection: Connection) -> None:
+    """Index and count the todos stored before the search and count tables.
+
+    Step 1 creates those tables empty on a database that already holds
+    todos; their triggers only track writes made afterwards.
+    """
+    rebuild_todo_search(connection)
+    reconcile_todo_status_counts(connection)
+
+
+MIGRATIONS = (
+    # Databases created before migrations existed are at version 0 and
+    # already hold part of this schema; create_all only adds what is missing.
+    Migration(1, 'Create the todo schema', _create_schema),
+    Migration(2, 'Add the todo version column', _add_todo_version_column),
+    # create_all skips the indexes of tables that already exist.
+    Migration(3, 'Build missing indexes', _create_missing_indexes, online=True),
+    Migration(
+        4,
+        'Drop superseded single-column todo indexes',
+        _drop_superseded_todo_indexes,
+        online=True,
+    ),
+    Migration(
+        5,
+        'Index completed todos by status',
+        create_index(TodoDTO.__tablename__, 'ix_todo_status_completed_at_id'),
+        online=True,
+    ),
+    # One transaction: searches see the old index until the new one commits.
+    Migration(
+        6,
+        'Backfill the todo search index and status counts',
+        _backfill_todo_read_models,
+        online=True,
+    ),
+)
+
+
+def schema_version(connection: Connection) -> int:
+    """Return the version recorded in the database.
+
+    Args:
+        connection: Connection to the database.
+
+    Returns:
+        int: Version of the last applied step; 0 for a database that never
+            ran one.
+    """
+    return connection.exec_driver_sql('PRAGMA user_version').scalar_one()
+
+
+def migrate(
+    engine: Engine, migrations: Sequence[Migration] = MIGRATIONS
+) -> list[Migration]:
+    """Apply the pending steps that must complete before serving requests.
+
+    Online steps are left out when only online steps follow them, so they
+    can run in the background with ``apply_migrations``. An online step
+    followed by a blocking one runs now, since steps apply in order.
+
+    Args:
+        engine: Engine of the database to migrate.
+        migrations: Steps in version order.
+
+    Raises:
+        ValueError: If the steps are not numbered consecutively from 1.
+
+    Returns:
+        list[Migration]: Pending online steps left to apply.
+    """
+    if [migration.version for migration in migrations] != list(
+        range(1, len(migrations) + 1)
+    ):
+        msg = 'Migrations must be numbered consecutively from 1'
+        raise ValueError(msg)
+    with engine.connect() as connection:
+        version = schema_version(connection)
+    pending = list(migrations[version:])
+    blocking = len(pending)
+    while blocking and pending[blocking - 1].online:
+        blocking -= 1
+    apply_migrations(engine, pending[:blocking])
+    return pending[blocking:]
+
+
+def apply_migrations(engine: Engine, migrations: Sequence[Migration]) -> None:
+    """Apply the steps in order, skipping those already recorded.
+
+    Args:
+        engine: Engine of the database to migrate.
+        migrations: Consecutive steps in version order.
+    """
+    for migration in migrations:
+        with engine.connect() as connection:
+            # Take the write lock before reading the version, so a process
+            # starting at the same time waits and then skips the step.
+            connection.exec_driver_sql('BEGIN IMMEDIATE')
+            if schema_version(connection) >= migration.version:
+                continue
+            migration.apply(connection)
+            connection.exec_driver_sql(f'PRAGMA user_version = {migration.version}')
+            connection.commit()
+        logger.info(
+            'Applied schema migration %d: %s', migration.version, migration.description
+        )
@@ -0,0 +1,137 @@
+"""Define SQLite connection profiles applied to every new connection."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """Describe the pragmas and driver options for SQLite connections.
+
+    Attributes:
+        journal_mode: Value for ``PRAGMA journal_mode`` (e.g. WAL, DELETE).
+        synchronous: Value for ``PRAGMA synchronous`` (OFF, NORMAL, FULL).
+        busy_timeout_ms: Milliseconds to wait for a lock before failing.
+        cache_size: Page cache size; negative values are KiB.
+        mmap_size: Bytes of the database file to memory-map; 0 disables it.
+        temp_store: Where temporary tables and indexes live (FILE, MEMORY).
+        statement_cache_size: Prepared statements cached per connection.
+    """
+
+    journal_mode: str
+    synchronous: str
+    busy_timeout_ms: int
+    cache_size: int
+    mmap_size: int
+    temp_store: str
+    statement_cache_size: int
+
+    def pragmas(self) -> list[str]:
+        """Return the PRAGMA statements that apply this profile.
+
+        Returns:
+            list[str]: Statements to run on each new connection.
+        """
+        return [
+            f'PRAGMA journal_mode = {self.journal_mode}',
+            f'PRAGMA synchronous = {self.synchronous}',
+            f'PRAGMA busy_timeout = {self.busy_timeout_ms}',
+            f'PRAGMA cache_size = {self.cache_size}',
+            f'PRAGMA mmap_size = {self.mmap_size}',
+            f'PRAGMA temp_store = {self.temp_store}',
+        ]
+
+    def connect_args(self) -> dict[str, Any]:
+        """Return the sqlite3 driver arguments for this profile.
+
+        Returns:
+            dict[str, Any]: Keyword arguments for ``sqlite3.connect``.
+        """
+        return {
+            'check_same_thread': False,
+            'timeout': self.busy_timeout_ms / 1000,
+            'cached_statements': self.statement_cache_size,
+        }
+
+
+SQLITE_PROFILES = {
+    # SQLite's own defaults: rollback journal and an fsync on every commit.
+    'legacy': SQLiteProfile(
+        journal_mode='DELETE',
+        synchronous='FULL',
+        busy_timeout_ms=5000,
+        cache_size=-2000,
+        mmap_size=0,
+        temp_store='DEFAULT',
+        statement_cache_size=128,
+    ),
+    # WAL lets readers run alongside the writer; every commit is still fsynced.
+    'durable': SQLiteProfile(
+        journal_mode='WAL',
+        synchronous='FULL',
+        busy_timeout_ms=5000,
+        cache_size=-65536,
+        mmap_size=268435456,
+        temp_store='MEMORY',
+        statement_cache_size=256,
+    ),
+    # WAL with fsync at checkpoints only: no corruption on power loss, but the
+    # last commits before the loss may be rolled back.
+    'balanced': SQLiteProfile(
+        journal_mode='WAL',
+        synchronous='NORMAL',
+        busy_timeout_ms=5000,
+        cache_size=-65536,
+        mmap_size=268435456,
+        temp_store='MEMORY',
+        statement_cache_size=256,
+    ),
+    # No fsync at all. Only for disposable databases such as bulk loads or tests.
+    'unsafe': SQLiteProfile(
+        journal_mode='WAL',
+        synchronous='OFF',
+        busy_timeout_ms=5000,
+        cache_size=-65536,
+        mmap_size=268435456,
+        temp_store='MEMORY',
+        statement_cache_size=256,
+    ),
+}
+
+
+def get_sqlite_profile(name: str) -> SQLiteProfile:
+    """Look up a connection profile by name.
+
+    Args:
+        name: One of the keys of ``SQLITE_PROFILES``.
+
+    Raises:
+        ValueError: If no profile has the given name.
+
+    Returns:
+        SQLiteProfile: The matching profile.
+    """
+    try:
+        return SQLITE_PROFILES[name]
+    except KeyError as e:
+        choices = ', '.join(SQLITE_PROFILES)
+        msg = f'Unknown SQLite profile {name!r}; expected one of: {choices}'
+        raise ValueError(msg) from e
+
+
+def apply_sqlite_profile(engine: Engine, profile: SQLiteProfile) -> None:
+    """Run the profile's pragmas whenever the engine opens a connection.
+
+    Args:
+        engine: Engine whose new DBAPI connections receive the pragmas.
+        profile: Profile to apply.
+    """
+
+    @event.listens_for(engine, 'connect')
+    def _set_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in profile.pragmas():
+            cursor.execute(pragma)
+        cursor.close()
@@ -0,0 +1,91 @@
+"""Track whether a session wrote anything and keep read-only sessions read-only."""
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.pool import Pool
+
+READ_ONLY_KEY = 'read_only'
+CONNECTION_KEY = 'transaction_connection'
+QUERY_ONLY_KEY = 'query_only'
+
+
+def mark_session_read_only(session: Session) -> None:
+    """Run the session's transactions with ``PRAGMA query_only`` switched on.
+
+    Call it before the session's first query. Any write then fails with an
+    ``OperationalError`` instead of taking SQLite's write lock, and the
+    connection is switched back when it returns to the pool.
+
+    Args:
+        session: Session that only reads.
+    """
+    session.info[READ_ONLY_KEY] = True
+
+
+def session_has_writes(session: Session) -> bool:
+    """Tell whether the session's open transaction has anything to commit.
+
+    The SQLite drivers only open a database transaction before a statement
+    that writes, so the driver connection tells whether one ran, however it
+    was executed.
+
+    Args:
+        session: Session to inspect.
+
+    Returns:
+        bool: True when ORM changes are pending or a write ran since the
+            last commit or rollback.
+    """
+    if session.new or session.dirty or session.deleted:
+        return True
+    connection: Connection | None = session.info.get(CONNECTION_KEY)
+    driver_connection = connection and connection.connection.driver_connection
+    return bool(driver_connection and driver_connection.in_transaction)
+
+
+def session_needs_commit(session: Session) -> bool:
+    """Tell whether ending the session should commit rather than roll back.
+
+    A transaction that only read has nothing to make durable, so it is
+    rolled back. A session that never began one commits, which does no I/O
+    and still runs its ``after_commit`` hooks.
+
+    Args:
+        session: Session about to end.
+
+    Returns:
+        bool: False only when the open transaction has no writes.
+    """
+    return not session.in_transaction() or session_has_writes(session)
+
+
+@event.listens_for(Session, 'after_begin')
+def _track_connection(
+    session: Session, _transaction: SessionTransaction, connection: Connection
+) -> None:
+    """Remember the transaction's connection and apply read-only mode to it."""
+    session.info[CONNECTION_KEY] = connection
+    if session.info.get(READ_ONLY_KEY) and not connection.info.get(QUERY_ONLY_KEY):
+        connection.exec_driver_sql('PRAGMA query_only = ON')
+        connection.info[QUERY_ONLY_KEY] = True
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _forget_connection(session: Session, transaction: SessionTransaction) -> None:
+    """Drop the connection once the outermost transaction releases it."""
+    if transaction.parent is None:
+        session.info.pop(CONNECTION_KEY, None)
+
+
+@event.listens_for(Pool, 'checkin')
+def _reset_query_only(dbapi_connection: Any, connection_record: Any) -> None:
+    """Let the next checkout of a read-only connection write again."""
+    if dbapi_connection is not None and connection_record.info.pop(
+        QUERY_ONLY_KEY, False
+    ):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA query_only = OFF')
+        cursor.close()
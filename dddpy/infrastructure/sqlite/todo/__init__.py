@@ -2,7 +2,18 @@
 
 from __future__ import annotations
 
+from .todo_archive_dto import TodoArchiveDTO
 from .todo_dto import TodoDTO
+from .todo_list_state_dto import TodoListStateDTO
 from .todo_repository import TodoRepositoryImpl
+from .todo_search_dto import TodoSearchKeyDTO
+from .todo_status_count_dto import TodoStatusCountDTO
 
-__all__ = ('TodoDTO', 'TodoRepositoryImpl')
+__all__ = (
+    'TodoArchiveDTO',
+    'TodoDTO',
+    'TodoListStateDTO',
+    'TodoRepositoryImpl',
+    'TodoSearchKeyDTO',
+    'TodoStatusCountDTO',
+)
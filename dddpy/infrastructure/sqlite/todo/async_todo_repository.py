@@ -0,0 +1,322 @@
+"""SQLite implementation of the asynchronous Todo repository."""
+
+from collections.abc import AsyncIterator, Collection, Sequence
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.repositories import (
+    DEFAULT_TODO_EXPORT_BATCH_SIZE,
+    DEFAULT_TODO_PAGE_SIZE,
+    AsyncTodoRepository,
+    TodoFilter,
+    TodoListVersion,
+    TodoPage,
+    TodoSearchPage,
+)
+from dddpy.domain.todo.value_objects import TodoId, TodoSortKey, TodoStatus
+from dddpy.infrastructure.sqlite.todo.todo_dto import TODO_COLUMNS, todos_from_rows
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+
+
+class AsyncTodoRepositoryImpl(AsyncTodoRepository):
+    """Persist todos through an aiosqlite-backed AsyncSession.
+
+    Each call runs the SQLite repository inside ``AsyncSession.run_sync``, so
+    both stacks share one set of queries while the I/O is awaited on the event
+    loop instead of blocking a worker thread.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Store the SQLAlchemy async session dependency.
+
+        Args:
+            session: Active async session bound to the aiosqlite engine.
+        """
+        self.session = session
+
+    async def transition(
+        self,
+        todo_id: TodoId,
+        status: TodoStatus,
+        from_statuses: Collection[TodoStatus],
+        at: datetime,
+    ) -> Todo | None:
+        """Move a todo to a new status in one conditional ``UPDATE``.
+
+        Args:
+            todo_id: Identifier of the todo to move.
+            status: Status to move the todo to.
+            from_statuses: Statuses the todo may currently be in.
+            at: Time of the transition.
+
+        Returns:
+            Optional[Todo]: Todo as stored after the transition; None when no
+                todo with that ID is in one of ``from_statuses``.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).transition(
+                todo_id, status, from_statuses, at
+            )
+        )
+
+    async def find_by_id(self, todo_id: TodoId) -> Todo | None:
+        """Return a todo matching the provided identifier.
+
+        Args:
+            todo_id: Identifier of the todo to fetch.
+
+        Returns:
+            Optional[Todo]: The matching todo when found; otherwise None.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).find_by_id(todo_id)
+        )
+
+    async def find_by_ids(self, todo_ids: Sequence[TodoId]) -> list[Todo]:
+        """Return the todos matching the provided identifiers.
+
+        Args:
+            todo_ids: Identifiers of the todos to fetch.
+
+        Returns:
+            List[Todo]: The todos that were found, in no particular order.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).find_by_ids(todo_ids)
+        )
+
+    async def find_all(
+        self,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+        sort_key: TodoSortKey = TodoSortKey.CREATED_AT,
+        todo_filter: TodoFilter | None = None,
+    ) -> TodoPage:
+        """Return one page of todos using keyset pagination.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+            sort_key: Timestamp used to order the todos.
+            todo_filter: Criteria the listed todos must meet, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded.
+            TodoInvalidFilterError: If a time bound applies to a timestamp
+                other than the sort key.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).find_all(
+                limit=limit, cursor=cursor, sort_key=sort_key, todo_filter=todo_filter
+            )
+        )
+
+    async def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> TodoSearchPage:
+        """Return one page of todos matching the query, best match first.
+
+        Args:
+            query: Terms to look for.
+            limit: Maximum number of hits in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded or was
+                issued for a different query.
+
+        Returns:
+            TodoSearchPage: The matching todos and the cursor for the next page.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).search(
+                query, limit=limit, cursor=cursor
+            )
+        )
+
+    async def count_by_status(self) -> dict[TodoStatus, int]:
+        """Return how many todos are in each status.
+
+        Returns:
+            dict[TodoStatus, int]: Count for every status, zero included.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).count_by_status()
+        )
+
+    async def save(self, todo: Todo) -> None:
+        """Persist new or updated todo data.
+
+        Args:
+            todo: Todo entity to create or update.
+        """
+        await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).save(todo)
+        )
+
+    async def save_many(self, todos: Sequence[Todo]) -> set[TodoId]:
+        """Insert or update todos with chunked multi-row upserts.
+
+        Args:
+            todos: Todo entities to create or update.
+
+        Returns:
+            set[TodoId]: Identifiers of the todos that changed concurrently.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).save_many(todos)
+        )
+
+    async def add_many(self, todos: Sequence[Todo]) -> None:
+        """Insert new todos with a single ``executemany`` call.
+
+        Args:
+            todos: Todo entities that are not stored yet.
+        """
+        await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).add_many(todos)
+        )
+
+    async def iter_all(
+        self, batch_size: int = DEFAULT_TODO_EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Todo]:
+        """Stream every todo in batches over a server-side cursor.
+
+        Unlike the other methods this one cannot go through ``run_sync``,
+        which would have to return the whole result at once. Instead each
+        batch is awaited from ``AsyncSession.stream``.
+
+        Args:
+            batch_size: Number of rows fetched from storage at a time.
+
+        Yields:
+            Todo: Each stored todo.
+        """
+        result = await self.session.stream(
+            select(*TODO_COLUMNS).execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            for todo in todos_from_rows(partition):
+                yield todo
+
+    async def find_version(self, todo_id: TodoId) -> int | None:
+        """Return the stored version of a todo without loading the entity.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[int]: Current version when the todo exists; otherwise None.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).find_version(todo_id)
+        )
+
+    async def find_status(self, todo_id: TodoId) -> TodoStatus | None:
+        """Return the stored status of a todo without loading the entity.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[TodoStatus]: Current status when the todo exists;
+                otherwise None.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).find_status(todo_id)
+        )
+
+    async def find_list_version(self) -> TodoListVersion:
+        """Return the current version of the todo collection.
+
+        Returns:
+            TodoListVersion: Marker that changes whenever any todo is written.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).find_list_version()
+        )
+
+    async def delete(self, todo_id: TodoId) -> None:
+        """Remove a todo by its identifier.
+
+        Args:
+            todo_id: Identifier of the todo to delete.
+        """
+        await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).delete(todo_id)
+        )
+
+    async def delete_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Delete the oldest completed todos in one bounded statement.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos deleted by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the deleted todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).delete_completed_before(
+                completed_before, limit
+            )
+        )
+
+    async def archive_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Move the oldest completed todos into the archive table.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos archived by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the archived todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).archive_completed_before(
+                completed_before, limit
+            )
+        )
+
+    async def find_archived(
+        self, limit: int = DEFAULT_TODO_PAGE_SIZE, cursor: str | None = None
+    ) -> TodoPage:
+        """Return one page of archived todos, most recently completed first.
+
+        Args:
+            limit: Maximum number of todos to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return await self.session.run_sync(
+            lambda session: TodoRepositoryImpl(session).find_archived(limit, cursor)
+        )
+
+
+def new_async_todo_repository(session: AsyncSession) -> AsyncTodoRepository:
+    """Instantiate an aiosqlite-backed todo repository.
+
+    Args:
+        session: Active async session bound to the aiosqlite engine.
+
+    Returns:
+        AsyncTodoRepository: Configured repository implementation.
+    """
+    return AsyncTodoRepositoryImpl(session)
@@ -0,0 +1,552 @@
+"""Repository decorators that route todo writes through group commit."""
+
+from collections.abc import AsyncIterator, Collection, Iterator, Sequence
+from datetime import datetime
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.repositories import (
+    DEFAULT_TODO_EXPORT_BATCH_SIZE,
+    DEFAULT_TODO_PAGE_SIZE,
+    AsyncTodoRepository,
+    TodoFilter,
+    TodoListVersion,
+    TodoPage,
+    TodoRepository,
+    TodoSearchPage,
+)
+from dddpy.domain.todo.value_objects import TodoId, TodoSortKey, TodoStatus
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+from dddpy.infrastructure.sqlite.write_coordinator import WriteCoordinator
+
+
+class GroupCommitTodoRepository(TodoRepository):
+    """Read through the wrapped repository and group-commit every write.
+
+    Each write is handed to the shared coordinator and returns once the
+    group holding it is durable, so the write no longer waits for the
+    caller's session to commit. Reads still use the wrapped repository.
+    """
+
+    def __init__(self, repository: TodoRepository, coordinator: WriteCoordinator):
+        """Store the wrapped repository and the shared coordinator.
+
+        Args:
+            repository: Repository serving reads.
+            coordinator: Process-wide coordinator committing the writes.
+        """
+        self.repository = repository
+        self.coordinator = coordinator
+
+    def save(self, todo: Todo) -> None:
+        """Persist the todo in the next committed group.
+
+        Args:
+            todo: Todo entity to store.
+        """
+        self.coordinator.write(lambda session: TodoRepositoryImpl(session).save(todo))
+
+    def save_many(self, todos: Sequence[Todo]) -> set[TodoId]:
+        """Persist the todos together in the next committed group.
+
+        Args:
+            todos: Todo entities to store.
+
+        Returns:
+            set[TodoId]: Identifiers of the todos that changed concurrently.
+        """
+        return self.coordinator.write(
+            lambda session: TodoRepositoryImpl(session).save_many(todos)
+        )
+
+    def add_many(self, todos: Sequence[Todo]) -> None:
+        """Insert the new todos together in the next committed group.
+
+        Args:
+            todos: Todo entities that are not stored yet.
+        """
+        self.coordinator.write(
+            lambda session: TodoRepositoryImpl(session).add_many(todos)
+        )
+
+    def transition(
+        self,
+        todo_id: TodoId,
+        status: TodoStatus,
+        from_statuses: Collection[TodoStatus],
+        at: datetime,
+    ) -> Todo | None:
+        """Move the todo to a new status in the next committed group.
+
+        Args:
+            todo_id: Identifier of the todo to move.
+            status: Status to move the todo to.
+            from_statuses: Statuses the todo may currently be in.
+            at: Time of the transition.
+
+        Returns:
+            Optional[Todo]: Todo as stored after the transition; None when no
+                todo with that ID is in one of ``from_statuses``.
+        """
+        return self.coordinator.write(
+            lambda session: TodoRepositoryImpl(session).transition(
+                todo_id, status, from_statuses, at
+            )
+        )
+
+    def find_by_id(self, todo_id: TodoId) -> Todo | None:
+        """Return a todo straight from the wrapped repository.
+
+        Args:
+            todo_id: Identifier of the todo to fetch.
+
+        Returns:
+            Optional[Todo]: The matching todo when found; otherwise None.
+        """
+        return self.repository.find_by_id(todo_id)
+
+    def find_by_ids(self, todo_ids: Sequence[TodoId]) -> list[Todo]:
+        """Return the todos straight from the wrapped repository.
+
+        Args:
+            todo_ids: Identifiers of the todos to fetch.
+
+        Returns:
+            list[Todo]: Todos that exist; unknown identifiers are skipped.
+        """
+        return self.repository.find_by_ids(todo_ids)
+
+    def find_all(
+        self,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+        sort_key: TodoSortKey = TodoSortKey.CREATED_AT,
+        todo_filter: TodoFilter | None = None,
+    ) -> TodoPage:
+        """Return one page of todos straight from the wrapped repository.
+
+        Args:
+            limit: Maximum number of todos to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+            sort_key: Timestamp used to order the todos.
+            todo_filter: Criteria the listed todos must meet, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return self.repository.find_all(
+            limit=limit, cursor=cursor, sort_key=sort_key, todo_filter=todo_filter
+        )
+
+    def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> TodoSearchPage:
+        """Return one page of search hits straight from the wrapped repository.
+
+        Args:
+            query: Terms to look for.
+            limit: Maximum number of hits to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoSearchPage: The matching todos and the cursor for the next page.
+        """
+        return self.repository.search(query, limit=limit, cursor=cursor)
+
+    def iter_all(
+        self, batch_size: int = DEFAULT_TODO_EXPORT_BATCH_SIZE
+    ) -> Iterator[Todo]:
+        """Stream every todo straight from the wrapped repository.
+
+        Args:
+            batch_size: Number of rows fetched from storage at a time.
+
+        Returns:
+            Iterator[Todo]: Todos in storage order.
+        """
+        return self.repository.iter_all(batch_size)
+
+    def find_version(self, todo_id: TodoId) -> int | None:
+        """Return the stored version straight from the wrapped repository.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[int]: Current version when the todo exists; otherwise None.
+        """
+        return self.repository.find_version(todo_id)
+
+    def find_status(self, todo_id: TodoId) -> TodoStatus | None:
+        """Return the stored status straight from the wrapped repository.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[TodoStatus]: Current status when the todo exists;
+                otherwise None.
+        """
+        return self.repository.find_status(todo_id)
+
+    def find_list_version(self) -> TodoListVersion:
+        """Return the collection version straight from the wrapped repository.
+
+        Returns:
+            TodoListVersion: Marker that changes whenever any todo is written.
+        """
+        return self.repository.find_list_version()
+
+    def count_by_status(self) -> dict[TodoStatus, int]:
+        """Return the status counts straight from the wrapped repository.
+
+        Returns:
+            dict[TodoStatus, int]: Count for every status, zero included.
+        """
+        return self.repository.count_by_status()
+
+    def delete(self, todo_id: TodoId) -> None:
+        """Delete the todo in the next committed group.
+
+        Args:
+            todo_id: Identifier of the todo to delete.
+        """
+        self.coordinator.write(
+            lambda session: TodoRepositoryImpl(session).delete(todo_id)
+        )
+
+    def delete_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Delete the oldest completed todos in the next committed group.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos deleted by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the deleted todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+        return self.coordinator.write(
+            lambda session: TodoRepositoryImpl(session).delete_completed_before(
+                completed_before, limit
+            )
+        )
+
+    def archive_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Archive the oldest completed todos in the next committed group.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos archived by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the archived todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+        return self.coordinator.write(
+            lambda session: TodoRepositoryImpl(session).archive_completed_before(
+                completed_before, limit
+            )
+        )
+
+    def find_archived(
+        self, limit: int = DEFAULT_TODO_PAGE_SIZE, cursor: str | None = None
+    ) -> TodoPage:
+        """Return one page of archived todos straight from the wrapped repository.
+
+        Args:
+            limit: Maximum number of todos to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return self.repository.find_archived(limit, cursor)
+
+
+def new_group_commit_todo_repository(
+    repository: TodoRepository, coordinator: WriteCoordinator
+) -> GroupCommitTodoRepository:
+    """Wrap a repository so its writes are group-committed.
+
+    Args:
+        repository: Repository serving reads.
+        coordinator: Process-wide coordinator committing the writes.
+
+    Returns:
+        GroupCommitTodoRepository: Group-commit decorator around the repository.
+    """
+    return GroupCommitTodoRepository(repository, coordinator)
+
+
+class AsyncGroupCommitTodoRepository(AsyncTodoRepository):
+    """Read through an async repository and group-commit its writes.
+
+    Writes run on the coordinator's thread and are awaited without blocking
+    the event loop; see ``GroupCommitTodoRepository``.
+    """
+
+    def __init__(self, repository: AsyncTodoRepository, coordinator: WriteCoordinator):
+        """Store the wrapped repository and the shared coordinator.
+
+        Args:
+            repository: Repository serving reads.
+            coordinator: Process-wide coordinator committing the writes.
+        """
+        self.repository = repository
+        self.coordinator = coordinator
+
+    async def save(self, todo: Todo) -> None:
+        """Persist the todo in the next committed group.
+
+        Args:
+            todo: Todo entity to store.
+        """
+        await self.coordinator.write_async(
+            lambda session: TodoRepositoryImpl(session).save(todo)
+        )
+
+    async def save_many(self, todos: Sequence[Todo]) -> set[TodoId]:
+        """Persist the todos together in the next committed group.
+
+        Args:
+            todos: Todo entities to store.
+
+        Returns:
+            set[TodoId]: Identifiers of the todos that changed concurrently.
+        """
+        return await self.coordinator.write_async(
+            lambda session: TodoRepositoryImpl(session).save_many(todos)
+        )
+
+    async def add_many(self, todos: Sequence[Todo]) -> None:
+        """Insert the new todos together in the next committed group.
+
+        Args:
+            todos: Todo entities that are not stored yet.
+        """
+        await self.coordinator.write_async(
+            lambda session: TodoRepositoryImpl(session).add_many(todos)
+        )
+
+    async def transition(
+        self,
+        todo_id: TodoId,
+        status: TodoStatus,
+        from_statuses: Collection[TodoStatus],
+        at: datetime,
+    ) -> Todo | None:
+        """Move the todo to a new status in the next committed group.
+
+        Args:
+            todo_id: Identifier of the todo to move.
+            status: Status to move the todo to.
+            from_statuses: Statuses the todo may currently be in.
+            at: Time of the transition.
+
+        Returns:
+            Optional[Todo]: Todo as stored after the transition; None when no
+                todo with that ID is in one of ``from_statuses``.
+        """
+        return await self.coordinator.write_async(
+            lambda session: TodoRepositoryImpl(session).transition(
+                todo_id, status, from_statuses, at
+            )
+        )
+
+    async def find_by_id(self, todo_id: TodoId) -> Todo | None:
+        """Return a todo straight from the wrapped repository.
+
+        Args:
+            todo_id: Identifier of the todo to fetch.
+
+        Returns:
+            Optional[Todo]: The matching todo when found; otherwise None.
+        """
+        return await self.repository.find_by_id(todo_id)
+
+    async def find_by_ids(self, todo_ids: Sequence[TodoId]) -> list[Todo]:
+        """Return the todos straight from the wrapped repository.
+
+        Args:
+            todo_ids: Identifiers of the todos to fetch.
+
+        Returns:
+            list[Todo]: Todos that exist; unknown identifiers are skipped.
+        """
+        return await self.repository.find_by_ids(todo_ids)
+
+    async def find_all(
+        self,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+        sort_key: TodoSortKey = TodoSortKey.CREATED_AT,
+        todo_filter: TodoFilter | None = None,
+    ) -> TodoPage:
+        """Return one page of todos straight from the wrapped repository.
+
+        Args:
+            limit: Maximum number of todos to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+            sort_key: Timestamp used to order the todos.
+            todo_filter: Criteria the listed todos must meet, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return await self.repository.find_all(
+            limit=limit, cursor=cursor, sort_key=sort_key, todo_filter=todo_filter
+        )
+
+    async def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> TodoSearchPage:
+        """Return one page of search hits straight from the wrapped repository.
+
+        Args:
+            query: Terms to look for.
+            limit: Maximum number of hits to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoSearchPage: The matching todos and the cursor for the next page.
+        """
+        return await self.repository.search(query, limit=limit, cursor=cursor)
+
+    def iter_all(
+        self, batch_size: int = DEFAULT_TODO_EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Todo]:
+        """Stream every todo straight from the wrapped repository.
+
+        Args:
+            batch_size: Number of rows fetched from storage at a time.
+
+        Returns:
+            AsyncIterator[Todo]: Todos in storage order.
+        """
+        return self.repository.iter_all(batch_size)
+
+    async def find_version(self, todo_id: TodoId) -> int | None:
+        """Return the stored version straight from the wrapped repository.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[int]: Current version when the todo exists; otherwise None.
+        """
+        return await self.repository.find_version(todo_id)
+
+    async def find_status(self, todo_id: TodoId) -> TodoStatus | None:
+        """Return the stored status straight from the wrapped repository.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[TodoStatus]: Current status when the todo exists;
+                otherwise None.
+        """
+        return await self.repository.find_status(todo_id)
+
+    async def find_list_version(self) -> TodoListVersion:
+        """Return the collection version straight from the wrapped repository.
+
+        Returns:
+            TodoListVersion: Marker that changes whenever any todo is written.
+        """
+        return await self.repository.find_list_version()
+
+    async def count_by_status(self) -> dict[TodoStatus, int]:
+        """Return the status counts straight from the wrapped repository.
+
+        Returns:
+            dict[TodoStatus, int]: Count for every status, zero included.
+        """
+        return await self.repository.count_by_status()
+
+    async def delete(self, todo_id: TodoId) -> None:
+        """Delete the todo in the next committed group.
+
+        Args:
+            todo_id: Identifier of the todo to delete.
+        """
+        await self.coordinator.write_async(
+            lambda session: TodoRepositoryImpl(session).delete(todo_id)
+        )
+
+    async def delete_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Delete the oldest completed todos in the next committed group.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos deleted by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the deleted todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+        return await self.coordinator.write_async(
+            lambda session: TodoRepositoryImpl(session).delete_completed_before(
+                completed_before, limit
+            )
+        )
+
+    async def archive_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Archive the oldest completed todos in the next committed group.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos archived by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the archived todos; fewer than
+                ``limit`` once no older completed todos remain.
+        """
+        return await self.coordinator.write_async(
+            lambda session: TodoRepositoryImpl(session).archive_completed_before(
+                completed_before, limit
+            )
+        )
+
+    async def find_archived(
+        self, limit: int = DEFAULT_TODO_PAGE_SIZE, cursor: str | None = None
+    ) -> TodoPage:
+        """Return one page of archived todos straight from the wrapped repository.
+
+        Args:
+            limit: Maximum number of todos to return.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return await self.repository.find_archived(limit, cursor)
+
+
+def new_async_group_commit_todo_repository(
+    repository: AsyncTodoRepository, coordinator: WriteCoordinator
+) -> AsyncGroupCommitTodoRepository:
+    """Wrap an async repository so its writes are group-committed.
+
+    Args:
+        repository: Async repository serving reads.
+        coordinator: Process-wide coordinator committing the writes.
+
+    Returns:
+        AsyncGroupCommitTodoRepository: Group-commit decorator around the repository.
+    """
+    return AsyncGroupCommitTodoRepository(repository, coordinator)
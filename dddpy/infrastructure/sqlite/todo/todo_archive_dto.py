@@ -0,0 +1,43 @@
+"""Keep completed todos that are no longer in active use out of the todo table."""
+
+from uuid import UUID
+
+from sqlalchemy import Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from dddpy.infrastructure.sqlite.database import Base
+
+
+class TodoArchiveDTO(Base):
+    """Represent an archived todo, stored with the columns of ``TodoDTO``.
+
+    Archived rows are moved out of the todo table, so they no longer weigh
+    on its indexes, triggers, or page cache. Only the (completed_at, id)
+    index used to browse the archive is kept.
+    """
+
+    __tablename__ = 'todo_archive'
+    __table_args__ = (Index('ix_todo_archive_completed_at_id', 'completed_at', 'id'),)
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, autoincrement=False)
+    title: Mapped[str] = mapped_column(String(100), nullable=False)
+    description: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+    status: Mapped[str] = mapped_column(nullable=False)
+    created_at: Mapped[int] = mapped_column(nullable=False)
+    updated_at: Mapped[int] = mapped_column(nullable=False)
+    completed_at: Mapped[int | None] = mapped_column(nullable=True)
+    version: Mapped[int] = mapped_column(nullable=False)
+
+
+# Column order matches TODO_COLUMNS, so rows move between the tables with
+# INSERT ... SELECT and map with todos_from_rows.
+TODO_ARCHIVE_COLUMNS = (
+    TodoArchiveDTO.id,
+    TodoArchiveDTO.title,
+    TodoArchiveDTO.description,
+    TodoArchiveDTO.status,
+    TodoArchiveDTO.created_at,
+    TodoArchiveDTO.updated_at,
+    TodoArchiveDTO.completed_at,
+    TodoArchiveDTO.version,
+)
@@ -0,0 +1,60 @@
+"""Move old completed todos to the archive table in the background."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from dddpy.infrastructure.sqlite.todo.todo_unit_of_work import new_todo_unit_of_work
+from dddpy.usecase.todo import new_archive_completed_todos_usecase
+
+logger = logging.getLogger(__name__)
+
+
+def archive_completed_todos(
+    session_factory: Callable[[], Session], retention: timedelta
+) -> int:
+    """Archive every todo completed longer ago than the retention period.
+
+    Args:
+        session_factory: Creates the session the archival commits through.
+        retention: How long a completed todo stays in the todo table.
+
+    Returns:
+        int: Number of todos archived.
+    """
+    with new_todo_unit_of_work(session_factory()) as unit_of_work:
+        return new_archive_completed_todos_usecase(unit_of_work).execute(
+            datetime.now(UTC) - retention
+        )
+
+
+async def run_todo_archive_job(
+    session_factory: Callable[[], Session],
+    retention: timedelta,
+    interval_seconds: float,
+) -> None:
+    """Archive old completed todos now and then every interval until cancelled.
+
+    Each run happens on a worker thread, so the event loop keeps serving
+    requests while chunks are moved. A failed run is logged and retried at
+    the next interval.
+
+    Args:
+        session_factory: Creates the sessions the archival commits through.
+        retention: How long a completed todo stays in the todo table.
+        interval_seconds: Seconds between the end of one run and the next.
+    """
+    while True:
+        try:
+            archived = await asyncio.to_thread(
+                archive_completed_todos, session_factory, retention
+            )
+        except Exception:
+            logger.exception('Archiving completed todos failed.')
+        else:
+            if archived:
+                logger.info('Archived %d completed todos.', archived)
+        await asyncio.sleep(interval_seconds)
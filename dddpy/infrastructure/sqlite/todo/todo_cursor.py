@@ -0,0 +1,134 @@
+"""Encode and decode opaque keyset cursors for todo listings."""
+
+import base64
+import binascii
+import json
+import math
+from typing import Any
+from uuid import UUID
+
+from dddpy.domain.todo.exceptions import TodoInvalidCursorError
+from dddpy.domain.todo.value_objects import TodoSortKey
+
+# Range of the INTEGER values SQLite can bind.
+_MIN_INTEGER = -(2**63)
+_MAX_INTEGER = 2**63 - 1
+# Errors a malformed cursor raises while decoding; deeply nested JSON
+# exhausts the recursion limit instead of failing to parse.
+_DECODE_ERRORS = (
+    binascii.Error,
+    UnicodeDecodeError,
+    TypeError,
+    ValueError,
+    RecursionError,
+)
+
+
+def _encode_payload(payload: list[Any]) -> str:
+    """Serialize a JSON payload as URL-safe base64 without padding."""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+def _decode_payload(cursor: str) -> Any:
+    """Reverse ``_encode_payload``, letting decoding errors propagate."""
+    padded = cursor + '=' * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def _is_integer(value: Any) -> bool:
+    """Tell whether a decoded value is an integer SQLite can bind."""
+    return (
+        isinstance(value, int)
+        and not isinstance(value, bool)
+        and _MIN_INTEGER <= value <= _MAX_INTEGER
+    )
+
+
+def encode_todo_cursor(sort_key: TodoSortKey, sort_value: int, todo_id: UUID) -> str:
+    """Encode the position after the given row as an opaque cursor.
+
+    Args:
+        sort_key: Timestamp the listing is ordered by.
+        sort_value: Stored millisecond value of the sort column for the row.
+        todo_id: Identifier of the row, used as the tie-breaker.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    return _encode_payload([sort_key.value, sort_value, todo_id.hex])
+
+
+def decode_todo_cursor(cursor: str, sort_key: TodoSortKey) -> tuple[int, UUID]:
+    """Decode a cursor produced by encode_todo_cursor.
+
+    Args:
+        cursor: Cursor string supplied by the client.
+        sort_key: Timestamp the listing is ordered by.
+
+    Raises:
+        TodoInvalidCursorError: If the cursor is malformed or was issued for a
+            different sort key.
+
+    Returns:
+        tuple[int, UUID]: Sort column value and identifier of the last seen row.
+    """
+    try:
+        key, sort_value, todo_id = _decode_payload(cursor)
+    except _DECODE_ERRORS as e:
+        raise TodoInvalidCursorError from e
+
+    if (
+        key != sort_key.value
+        or not _is_integer(sort_value)
+        or not isinstance(todo_id, str)
+    ):
+        raise TodoInvalidCursorError
+    try:
+        last_id = UUID(hex=todo_id)
+    except ValueError as e:
+        raise TodoInvalidCursorError from e
+    return sort_value, last_id
+
+
+def encode_todo_search_cursor(query: str, score: float, key: int) -> str:
+    """Encode the position after the given search hit as an opaque cursor.
+
+    Args:
+        query: Search query the hit was returned for.
+        score: Relevance score of the hit; lower is better.
+        key: Search index key of the hit, used as the tie-breaker.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    return _encode_payload([query, score, key])
+
+
+def decode_todo_search_cursor(cursor: str, query: str) -> tuple[float, int]:
+    """Decode a cursor produced by encode_todo_search_cursor.
+
+    Args:
+        cursor: Cursor string supplied by the client.
+        query: Search query of the requested page.
+
+    Raises:
+        TodoInvalidCursorError: If the cursor is malformed or was issued for a
+            different query.
+
+    Returns:
+        tuple[float, int]: Score and search index key of the last seen hit.
+    """
+    try:
+        cursor_query, score, key = _decode_payload(cursor)
+    except _DECODE_ERRORS as e:
+        raise TodoInvalidCursorError from e
+
+    if (
+        cursor_query != query
+        or not isinstance(score, int | float)
+        or isinstance(score, bool)
+        or not math.isfinite(score)
+        or not _is_integer(key)
+    ):
+        raise TodoInvalidCursorError
+    return float(score), key
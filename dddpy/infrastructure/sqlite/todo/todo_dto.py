@@ -1,9 +1,11 @@
 """Map todo entities to and from SQLite persistence models."""
 
-from datetime import UTC, datetime
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from dddpy.domain.todo.entities import Todo
@@ -13,37 +15,122 @@ from dddpy.domain.todo.value_objects import (
     TodoStatus,
     TodoTitle,
 )
+from dddpy.infrastructure.settings import settings
 from dddpy.infrastructure.sqlite.database import Base
 
+TODO_STATUSES = {status.value: status for status in TodoStatus}
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def from_epoch_ms(value: int) -> datetime:
+    """Convert a stored epoch-millisecond timestamp to an aware datetime.
+
+    Args:
+        value: Milliseconds since the Unix epoch.
+
+    Returns:
+        datetime: UTC timestamp.
+    """
+    # Passing tz positionally is measurably faster than tz=UTC.
+    return datetime.fromtimestamp(value / 1000, UTC)
+
+
+def to_epoch_ms(value: datetime) -> int:
+    """Convert a datetime to the stored epoch-millisecond form.
+
+    Integer timedelta division avoids the float rounding of ``timestamp()``,
+    so a value read back with ``from_epoch_ms`` converts to the same number.
+    Naive values are taken as local time, as ``timestamp()`` does.
+
+    Args:
+        value: Timestamp, aware or in local time.
+
+    Returns:
+        int: Milliseconds since the Unix epoch.
+    """
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return (value - EPOCH) // timedelta(milliseconds=1)
+
 
 class TodoDTO(Base):
     """Represent the SQLite persistence model for todos."""
 
     __tablename__ = 'todo'
+    __table_args__ = (
+        # Keyset pagination orders by (timestamp, id); the trailing id column
+        # lets SQLite seek and walk these indexes without a sort step.
+        Index('ix_todo_created_at_id', 'created_at', 'id'),
+        Index('ix_todo_updated_at_id', 'updated_at', 'id'),
+        Index('ix_todo_completed_at_id', 'completed_at', 'id'),
+        # Status filters seek to one status and walk it in listing order.
+        # They also serve plain status lookups, so status needs no index
+        # of its own.
+        Index('ix_todo_status_created_at_id', 'status', 'created_at', 'id'),
+        Index('ix_todo_status_updated_at_id', 'status', 'updated_at', 'id'),
+        Index('ix_todo_status_completed_at_id', 'status', 'completed_at', 'id'),
+    )
+
     id: Mapped[UUID] = mapped_column(primary_key=True, autoincrement=False)
     title: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str | None] = mapped_column(String(1000), nullable=True)
-    status: Mapped[str] = mapped_column(index=True, nullable=False)
-    created_at: Mapped[int] = mapped_column(index=True, nullable=False)
-    updated_at: Mapped[int] = mapped_column(index=True, nullable=False)
-    completed_at: Mapped[int | None] = mapped_column(index=True, nullable=True)
+    status: Mapped[str] = mapped_column(nullable=False)
+    created_at: Mapped[int] = mapped_column(nullable=False)
+    updated_at: Mapped[int] = mapped_column(nullable=False)
+    completed_at: Mapped[int | None] = mapped_column(nullable=True)
+    version: Mapped[int] = mapped_column(nullable=False, default=1, server_default='1')
 
     def to_entity(self) -> Todo:
         """Convert the DTO into a domain entity.
 
+        Stored values were validated when they were written, so they are
+        wrapped without re-running the value object checks unless
+        ``DDDPY_STRICT_HYDRATION`` is enabled.
+
+        Returns:
+            Todo: Domain entity reconstructed from persisted values.
+        """
+        if settings.strict_hydration:
+            return self.to_validated_entity()
+        return self.to_trusted_entity()
+
+    def to_trusted_entity(self) -> Todo:
+        """Convert the DTO into a domain entity without re-validating values.
+
         Returns:
             Todo: Domain entity reconstructed from persisted values.
         """
+        return Todo(
+            TodoId(self.id),
+            TodoTitle.from_trusted(self.title),
+            TodoDescription.from_trusted(self.description)
+            if self.description
+            else None,
+            TODO_STATUSES[self.status],
+            from_epoch_ms(self.created_at),
+            from_epoch_ms(self.updated_at),
+            from_epoch_ms(self.completed_at) if self.completed_at else None,
+            self.version,
+        )
+
+    def to_validated_entity(self) -> Todo:
+        """Convert the DTO into a domain entity, validating every value.
+
+        Returns:
+            Todo: Domain entity reconstructed from persisted values.
+
+        Raises:
+            ValueError: If a stored value violates a value object rule.
+        """
         return Todo(
             TodoId(self.id),
             TodoTitle(self.title),
             TodoDescription(self.description) if self.description else None,
             TodoStatus(self.status),
-            datetime.fromtimestamp(self.created_at / 1000, tz=UTC),
-            datetime.fromtimestamp(self.updated_at / 1000, tz=UTC),
-            datetime.fromtimestamp(self.completed_at / 1000, tz=UTC)
-            if self.completed_at
-            else None,
+            from_epoch_ms(self.created_at),
+            from_epoch_ms(self.updated_at),
+            from_epoch_ms(self.completed_at) if self.completed_at else None,
+            self.version,
         )
 
     @staticmethod
@@ -56,14 +143,95 @@ class TodoDTO(Base):
         Returns:
             TodoDTO: DTO populated for persistence.
         """
-        return TodoDTO(
-            id=todo.id.value,
-            title=todo.title.value,
-            description=todo.description.value if todo.description else None,
-            status=todo.status.value,
-            created_at=int(todo.created_at.timestamp() * 1000),
-            updated_at=int(todo.updated_at.timestamp() * 1000),
-            completed_at=int(todo.completed_at.timestamp() * 1000)
+        return TodoDTO(**TodoDTO.values_from_entity(todo))
+
+    @staticmethod
+    def values_from_entity(todo: Todo) -> dict[str, Any]:
+        """Map a domain entity to column values for Core statements.
+
+        ``version`` is the value the row holds once the write succeeds, one
+        past the version the entity was read at.
+
+        Args:
+            todo: Domain entity to convert.
+
+        Returns:
+            dict[str, Any]: Column names mapped to persisted values.
+        """
+        return {
+            'id': todo.id.value,
+            'title': todo.title.value,
+            'description': todo.description.value if todo.description else None,
+            'status': todo.status.value,
+            'created_at': to_epoch_ms(todo.created_at),
+            'updated_at': to_epoch_ms(todo.updated_at),
+            'completed_at': to_epoch_ms(todo.completed_at)
             if todo.completed_at
             else None,
+            'version': todo.version + 1,
+        }
+
+
+# Column order matches the Todo constructor, so rows unpack positionally.
+TODO_COLUMNS = (
+    TodoDTO.id,
+    TodoDTO.title,
+    TodoDTO.description,
+    TodoDTO.status,
+    TodoDTO.created_at,
+    TodoDTO.updated_at,
+    TodoDTO.completed_at,
+    TodoDTO.version,
+)
+
+
+def todos_from_rows(rows: Sequence[Sequence[Any]]) -> list[Todo]:
+    """Convert rows selected from ``TODO_COLUMNS`` into domain entities.
+
+    Read-only queries select plain columns instead of ``TodoDTO`` instances,
+    which keeps rows out of the session identity map. Every distinct
+    timestamp in the result is converted once and shared by the entities
+    that carry it; the values are immutable, so sharing is safe.
+
+    Args:
+        rows: Rows whose columns follow ``TODO_COLUMNS``.
+
+    Returns:
+        list[Todo]: Entities in the order of the rows.
+    """
+    moments: dict[int, datetime] = {}
+    for row in rows:
+        # The three timestamps follow the status column.
+        for value in row[4:7]:
+            if value is not None and value not in moments:
+                moments[value] = from_epoch_ms(value)
+
+    if settings.strict_hydration:
+        title_of, description_of, status_of = TodoTitle, TodoDescription, TodoStatus
+    else:
+        title_of = TodoTitle.from_trusted
+        description_of = TodoDescription.from_trusted
+        status_of = TODO_STATUSES.__getitem__
+
+    return [
+        Todo(
+            TodoId(id_),
+            title_of(title),
+            description_of(description) if description else None,
+            status_of(status),
+            moments[created_at],
+            moments[updated_at],
+            moments[completed_at] if completed_at is not None else None,
+            version,
         )
+        for (
+            id_,
+            title,
+            description,
+            status,
+            created_at,
+            updated_at,
+            completed_at,
+            version,
+        ) in rows
+    ]
@@ -0,0 +1,53 @@
+"""Track the todos a session has loaded or written, one entity per ID."""
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoId
+
+IDENTITY_MAP_KEY = 'todo_identity_map'
+IDENTITY_MAP_DISABLED_KEY = 'todo_identity_map_disabled'
+
+
+def todo_identity_map(session: Session) -> dict[TodoId, Todo]:
+    """Return the todos the session has loaded or written, by identifier.
+
+    Entries live in ``Session.info`` until the session commits or rolls
+    back, so every repository bound to the session shares them. When
+    tracking is disabled a fresh dict is returned, so lookups miss and
+    entries written to it are dropped.
+
+    Args:
+        session: Session the todos were read or written through.
+
+    Returns:
+        dict[TodoId, Todo]: Tracked todos, keyed by identifier.
+    """
+    if session.info.get(IDENTITY_MAP_DISABLED_KEY):
+        return {}
+    return session.info.setdefault(IDENTITY_MAP_KEY, {})
+
+
+def disable_todo_identity_map(session: Session) -> None:
+    """Stop tracking todos for a session whose writes commit elsewhere.
+
+    Args:
+        session: Session that must always read todos from the database.
+    """
+    session.info[IDENTITY_MAP_DISABLED_KEY] = True
+    session.info.pop(IDENTITY_MAP_KEY, None)
+
+
+@event.listens_for(Session, 'after_commit')
+def _forget_committed(session: Session) -> None:
+    """Drop tracked todos once other sessions may change the rows."""
+    session.info.pop(IDENTITY_MAP_KEY, None)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _forget_rolled_back(session: Session, *_: Any) -> None:
+    """Drop tracked todos whose writes were rolled back."""
+    session.info.pop(IDENTITY_MAP_KEY, None)
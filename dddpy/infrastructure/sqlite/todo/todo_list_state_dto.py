@@ -0,0 +1,33 @@
+"""Track collection-wide todo state that rows alone cannot express."""
+
+from sqlalchemy import DDL, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from dddpy.infrastructure.sqlite.database import Base
+
+TODO_LIST_STATE_ID = 1
+
+
+class TodoListStateDTO(Base):
+    """Single-row table holding the number of deleted todos.
+
+    A deletion leaves no row behind, so without this counter deleting one
+    todo and creating another could leave the collection version unchanged.
+    """
+
+    __tablename__ = 'todo_list_state'
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    deletions: Mapped[int] = mapped_column(nullable=False, default=0)
+
+
+# Every statement is idempotent and runs on each create_all, so databases
+# created before this table existed gain the row and trigger on next start.
+for statement in (
+    f'INSERT OR IGNORE INTO todo_list_state (id, deletions) '
+    f'VALUES ({TODO_LIST_STATE_ID}, 0)',
+    'CREATE TRIGGER IF NOT EXISTS todo_count_deletions AFTER DELETE ON todo '
+    f'BEGIN UPDATE todo_list_state SET deletions = deletions + 1 '
+    f'WHERE id = {TODO_LIST_STATE_ID}; END',
+):
+    event.listen(Base.metadata, 'after_create', DDL(statement))
@@ -1,13 +1,162 @@
 """SQLite implementation of Todo repository."""
 
-from sqlalchemy import desc
+import operator
+from collections.abc import Collection, Iterator, Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Select,
+    bindparam,
+    delete,
+    desc,
+    func,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy import insert as insert_rows
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.orm.session import Session
 
 from dddpy.domain.todo.entities import Todo
-from dddpy.domain.todo.repositories import TodoRepository
-from dddpy.domain.todo.value_objects import TodoId
-from dddpy.infrastructure.sqlite.todo import TodoDTO
+from dddpy.domain.todo.exceptions import TodoConflictError, TodoInvalidFilterError
+from dddpy.domain.todo.repositories import (
+    DEFAULT_TODO_EXPORT_BATCH_SIZE,
+    DEFAULT_TODO_PAGE_SIZE,
+    TodoFilter,
+    TodoListVersion,
+    TodoPage,
+    TodoRepository,
+    TodoSearchHit,
+    TodoSearchPage,
+)
+from dddpy.domain.todo.value_objects import TodoId, TodoSortKey, TodoStatus
+from dddpy.infrastructure.sqlite.todo import TodoDTO, TodoListStateDTO
+from dddpy.infrastructure.sqlite.todo.todo_archive_dto import (
+    TODO_ARCHIVE_COLUMNS,
+    TodoArchiveDTO,
+)
+from dddpy.infrastructure.sqlite.todo.todo_cursor import (
+    decode_todo_cursor,
+    decode_todo_search_cursor,
+    encode_todo_cursor,
+    encode_todo_search_cursor,
+)
+from dddpy.infrastructure.sqlite.todo.todo_dto import (
+    TODO_COLUMNS,
+    from_epoch_ms,
+    to_epoch_ms,
+    todos_from_rows,
+)
+from dddpy.infrastructure.sqlite.todo.todo_identity_map import todo_identity_map
+from dddpy.infrastructure.sqlite.todo.todo_list_state_dto import TODO_LIST_STATE_ID
+from dddpy.infrastructure.sqlite.todo.todo_search_dto import (
+    TodoSearchKeyDTO,
+    todo_search,
+    todo_search_description_snippet,
+    todo_search_match,
+    todo_search_match_expression,
+    todo_search_score,
+    todo_search_title_highlight,
+)
+from dddpy.infrastructure.sqlite.todo.todo_status_count_dto import TodoStatusCountDTO
+
+# Keeps each multi-row statement well below SQLite's bound parameter limit.
+BATCH_CHUNK_SIZE = 500
+
+# Columns a save rewrites; id and created_at never change.
+UPDATED_COLUMNS = (
+    'title',
+    'description',
+    'status',
+    'updated_at',
+    'completed_at',
+    'version',
+)
+
+# A versioned write: matches only while the row is at the version read.
+VERSIONED_UPDATE = (
+    update(TodoDTO)
+    .where(
+        TodoDTO.id == bindparam('todo_id'),
+        TodoDTO.version == bindparam('read_version'),
+    )
+    .values({column: bindparam(column) for column in UPDATED_COLUMNS})
+)
+
+# Largest value an SQLite INTEGER holds; the first page seeks down from it.
+MAX_SORT_VALUE = 2**63 - 1
+
+SORT_COLUMNS = {
+    TodoSortKey.CREATED_AT: TodoDTO.created_at,
+    TodoSortKey.UPDATED_AT: TodoDTO.updated_at,
+    TodoSortKey.COMPLETED_AT: TodoDTO.completed_at,
+}
+
+
+def _filter_conditions(todo_filter: TodoFilter) -> list[ColumnElement[bool]]:
+    """Translate the time bounds of a filter into column conditions.
+
+    Statuses are left out; ``find_all`` applies them per index seek.
+
+    Args:
+        todo_filter: Criteria the listed todos must meet.
+
+    Returns:
+        list[ColumnElement[bool]]: Conditions to combine with AND.
+    """
+    bounds = (
+        (TodoDTO.created_at, operator.gt, todo_filter.created_after),
+        (TodoDTO.created_at, operator.lt, todo_filter.created_before),
+        (TodoDTO.updated_at, operator.gt, todo_filter.updated_after),
+        (TodoDTO.updated_at, operator.lt, todo_filter.updated_before),
+    )
+    return [
+        compare(column, to_epoch_ms(value))
+        for column, compare, value in bounds
+        if value is not None
+    ]
+
+
+def _page_query(
+    conditions: list[ColumnElement[bool]],
+    column: InstrumentedAttribute[Any],
+    limit: int,
+) -> Select[Any]:
+    """Select one page of todos in (timestamp, id) order, newest first."""
+    return (
+        select(*TODO_COLUMNS)
+        .where(*conditions)
+        .order_by(desc(column), desc(TodoDTO.id))
+        .limit(limit + 1)
+    )
+
+
+def _merged_page_query(
+    seeks: list[Select[Any]],
+    column: InstrumentedAttribute[Any],
+    limit: int,
+) -> CompoundSelect:
+    """Merge per-status selects into one page in (timestamp, id) order.
+
+    The selects carry no ORDER BY of their own, so SQLite walks each status
+    index in order and merges the walks, stopping once the page is full.
+    """
+    merged = union_all(*seeks)
+    ordered = merged.selected_columns
+    return merged.order_by(desc(ordered[column.key]), desc(ordered.id)).limit(limit + 1)
+
+
+def _updated_values(todo: Todo) -> dict[str, Any]:
+    """Return the values a save writes over the stored row."""
+    values = TodoDTO.values_from_entity(todo)
+    return {column: values[column] for column in UPDATED_COLUMNS}
 
 
 class TodoRepositoryImpl(TodoRepository):
@@ -21,64 +170,658 @@ class TodoRepositoryImpl(TodoRepository):
         """
         self.session = session
 
+    def transition(
+        self,
+        todo_id: TodoId,
+        status: TodoStatus,
+        from_statuses: Collection[TodoStatus],
+        at: datetime,
+    ) -> Todo | None:
+        """Move a todo to a new status in one conditional ``UPDATE``.
+
+        The statement is ``UPDATE ... WHERE id = ? AND status IN (...)
+        RETURNING ...``, so the status check, the write, and reading the
+        result back share one round trip. The version advances like any save.
+
+        Args:
+            todo_id: Identifier of the todo to move.
+            status: Status to move the todo to.
+            from_statuses: Statuses the todo may currently be in.
+            at: Time of the transition.
+
+        Returns:
+            Optional[Todo]: Todo as stored after the transition; None when no
+                todo with that ID is in one of ``from_statuses``.
+        """
+        at_ms = to_epoch_ms(at)
+        values: dict[str, Any] = {
+            'status': status.value,
+            'updated_at': at_ms,
+            'version': TodoDTO.version + 1,
+        }
+        if status == TodoStatus.COMPLETED:
+            values['completed_at'] = at_ms
+        rows = (
+            self.session.connection()
+            .execute(
+                update(TodoDTO)
+                .where(
+                    TodoDTO.id == todo_id.value,
+                    TodoDTO.status.in_([value.value for value in from_statuses]),
+                )
+                .values(values)
+                .returning(*TODO_COLUMNS)
+            )
+            .all()
+        )
+        todos = todos_from_rows(rows)
+        identity_map = todo_identity_map(self.session)
+        if not todos:
+            identity_map.pop(todo_id, None)
+            return None
+        identity_map[todo_id] = todos[0]
+        return todos[0]
+
     def find_by_id(self, todo_id: TodoId) -> Todo | None:
         """Return a todo matching the provided identifier.
 
+        A todo this session already loaded or wrote is returned from the
+        identity map without a query, as the same entity instance. A todo
+        missing from the todo table is looked up in the archive.
+
         Args:
             todo_id: Identifier of the todo to fetch.
 
         Returns:
             Optional[Todo]: The matching todo when found; otherwise None.
         """
+        identity_map = todo_identity_map(self.session)
+        todo = identity_map.get(todo_id)
+        if todo is not None:
+            return todo
+
         try:
             row = self.session.query(TodoDTO).filter_by(id=todo_id.value).one()
         except NoResultFound:
-            return None
+            archived = self._find_archived_by_ids([todo_id.value])
+            if not archived:
+                return None
+            todo = archived[0]
+        else:
+            todo = row.to_entity()
+        identity_map[todo_id] = todo
+        return todo
 
-        return row.to_entity()
+    def find_by_ids(self, todo_ids: Sequence[TodoId]) -> list[Todo]:
+        """Return the todos matching the provided identifiers.
 
-    def find_all(self) -> list[Todo]:
-        """Return todos ordered by creation date with an upper limit.
+        Args:
+            todo_ids: Identifiers of the todos to fetch.
 
         Returns:
-            List[Todo]: Up to 20 todos sorted by newest first.
+            List[Todo]: The todos that were found, in no particular order;
+                archived ones included.
         """
-        rows = (
-            self.session.query(TodoDTO)
-            .order_by(desc(TodoDTO.created_at))
-            .limit(20)
+        ids = [todo_id.value for todo_id in todo_ids]
+        todos: list[Todo] = []
+        for start in range(0, len(ids), BATCH_CHUNK_SIZE):
+            chunk = ids[start : start + BATCH_CHUNK_SIZE]
+            rows = self.session.execute(
+                select(*TODO_COLUMNS).where(TodoDTO.id.in_(chunk))
+            ).all()
+            todos.extend(todos_from_rows(rows))
+        if len(todos) < len(set(ids)):
+            found = {todo.id.value for todo in todos}
+            todos.extend(
+                self._find_archived_by_ids([id_ for id_ in ids if id_ not in found])
+            )
+        return todos
+
+    def _find_archived_by_ids(self, ids: Sequence[UUID]) -> list[Todo]:
+        """Return the archived todos among the given identifiers."""
+        todos: list[Todo] = []
+        for start in range(0, len(ids), BATCH_CHUNK_SIZE):
+            chunk = ids[start : start + BATCH_CHUNK_SIZE]
+            rows = self.session.execute(
+                select(*TODO_ARCHIVE_COLUMNS).where(TodoArchiveDTO.id.in_(chunk))
+            ).all()
+            todos.extend(todos_from_rows(rows))
+        return todos
+
+    def find_all(
+        self,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+        sort_key: TodoSortKey = TodoSortKey.CREATED_AT,
+        todo_filter: TodoFilter | None = None,
+    ) -> TodoPage:
+        """Return one page of todos using keyset pagination.
+
+        The page is read by seeking the (timestamp, id) index past the cursor
+        position, so every page costs the same regardless of its depth. Todos
+        without a completion time are not listed when sorting by completed_at.
+        Plain columns are selected and mapped in one batch, so no ORM
+        instances are created for the page.
+
+        A status filter seeks the (status, timestamp, id) index instead. With
+        several statuses, each index walk is merged in order, so no status is
+        walked past the page either. Time bounds must apply to the sort key,
+        so they narrow the same seek rather than forcing a scan or a sort.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+            sort_key: Timestamp used to order the todos.
+            todo_filter: Criteria the listed todos must meet, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded.
+            TodoInvalidFilterError: If a time bound applies to a timestamp
+                other than the sort key.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        if todo_filter and not todo_filter.bounds_only(sort_key):
+            raise TodoInvalidFilterError
+        column = SORT_COLUMNS[sort_key]
+        conditions: list[ColumnElement[bool]] = (
+            _filter_conditions(todo_filter) if todo_filter else []
+        )
+        if cursor is None:
+            # Also skips todos without a completion time: NULL never matches.
+            conditions.append(column <= MAX_SORT_VALUE)
+        else:
+            sort_value, last_id = decode_todo_cursor(cursor, sort_key)
+            conditions.append(tuple_(column, TodoDTO.id) < (sort_value, last_id))
+
+        statuses = set(todo_filter.statuses) if todo_filter else set()
+        if len(statuses) == len(TodoStatus):
+            statuses.clear()
+        status_conditions = [
+            TodoDTO.status == status.value
+            for status in sorted(statuses, key=operator.attrgetter('value'))
+        ]
+        stmt: Select[Any] | CompoundSelect
+        if len(status_conditions) > 1:
+            seeks = [
+                select(*TODO_COLUMNS).where(*conditions, status_condition)
+                for status_condition in status_conditions
+            ]
+            stmt = _merged_page_query(seeks, column, limit)
+        else:
+            stmt = _page_query([*conditions, *status_conditions], column, limit)
+
+        rows = self.session.execute(stmt).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_todo_cursor(
+                sort_key, getattr(last, column.key), last.id
+            )
+        return TodoPage(todos_from_rows(rows), next_cursor)
+
+    def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> TodoSearchPage:
+        """Return one page of todos matching the query, best match first.
+
+        The FTS5 index answers the match and ranks it with BM25, weighting
+        title matches above description matches, so no todo row is scanned.
+        Pages continue after the (score, key) of the previous page's last
+        hit. Scores depend on index-wide statistics, so writes between two
+        page requests may shift hits across the page boundary.
+
+        Args:
+            query: Terms to look for.
+            limit: Maximum number of hits in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded or was
+                issued for a different query.
+
+        Returns:
+            TodoSearchPage: The matching todos and the cursor for the next page.
+        """
+        after = decode_todo_search_cursor(cursor, query) if cursor else None
+        match = todo_search_match_expression(query)
+        if match is None:
+            return TodoSearchPage([])
+
+        score = todo_search_score.label('score')
+        stmt = (
+            select(
+                *TODO_COLUMNS,
+                todo_search_title_highlight.label('title_highlight'),
+                todo_search_description_snippet.label('description_snippet'),
+                score,
+                TodoSearchKeyDTO.id.label('search_key'),
+            )
+            .select_from(todo_search)
+            .join(TodoSearchKeyDTO, TodoSearchKeyDTO.id == todo_search.c.rowid)
+            .join(TodoDTO, TodoDTO.id == TodoSearchKeyDTO.todo_id)
+            .where(todo_search_match(match))
+            .order_by(score, TodoSearchKeyDTO.id)
+            .limit(limit + 1)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(todo_search_score, TodoSearchKeyDTO.id) > after)
+
+        rows = self.session.execute(stmt).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_todo_search_cursor(query, last.score, last.search_key)
+        columns = len(TODO_COLUMNS)
+        todos = todos_from_rows([row[:columns] for row in rows])
+        return TodoSearchPage(
+            [
+                TodoSearchHit(
+                    todo,
+                    title_highlight=row.title_highlight,
+                    description_snippet=row.description_snippet
+                    if todo.description is not None
+                    else None,
+                )
+                for todo, row in zip(todos, rows, strict=True)
+            ],
+            next_cursor,
+        )
+
+    def iter_all(
+        self, batch_size: int = DEFAULT_TODO_EXPORT_BATCH_SIZE
+    ) -> Iterator[Todo]:
+        """Stream every todo in batches over a server-side cursor.
+
+        With ``yield_per`` the result is buffered one batch at a time and rows
+        are mapped without ORM instances, so memory stays flat regardless of
+        the table size. The table is scanned in storage order; no sort is
+        needed.
+
+        Args:
+            batch_size: Number of rows fetched from storage at a time.
+
+        Yields:
+            Todo: Each stored todo.
+        """
+        result = self.session.execute(
+            select(*TODO_COLUMNS).execution_options(yield_per=batch_size)
+        )
+        for partition in result.partitions():
+            yield from todos_from_rows(partition)
+
+    def find_version(self, todo_id: TodoId) -> int | None:
+        """Return the stored version of a todo without loading the entity.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[int]: Current version when the todo exists; otherwise None.
+        """
+        version = self.session.scalar(
+            select(TodoDTO.version).where(TodoDTO.id == todo_id.value)
+        )
+        if version is None:
+            version = self.session.scalar(
+                select(TodoArchiveDTO.version).where(TodoArchiveDTO.id == todo_id.value)
+            )
+        return version
+
+    def find_status(self, todo_id: TodoId) -> TodoStatus | None:
+        """Return the stored status of a todo without loading the entity.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[TodoStatus]: Current status when the todo exists;
+                otherwise None.
+        """
+        status = self.session.scalar(
+            select(TodoDTO.status).where(TodoDTO.id == todo_id.value)
+        )
+        if status is None:
+            status = self.session.scalar(
+                select(TodoArchiveDTO.status).where(TodoArchiveDTO.id == todo_id.value)
+            )
+        return TodoStatus(status) if status is not None else None
+
+    def find_list_version(self) -> TodoListVersion:
+        """Return the current version of the todo collection.
+
+        The three values come from independent scalar subqueries in a single
+        statement: max(updated_at) is answered from the end of the
+        (updated_at, id) index, count(*) walks the smallest index, and the
+        deletion counter is a single-row lookup. No todo row is read.
+
+        Returns:
+            TodoListVersion: Marker that changes whenever any todo is written.
+        """
+        row = self.session.execute(
+            select(
+                select(func.count()).select_from(TodoDTO).scalar_subquery(),
+                select(func.max(TodoDTO.updated_at)).scalar_subquery(),
+                select(TodoListStateDTO.deletions)
+                .where(TodoListStateDTO.id == TODO_LIST_STATE_ID)
+                .scalar_subquery(),
+            )
+        ).one()
+        count, latest_update, deletions = row
+        return TodoListVersion(
+            count=count,
+            latest_update=from_epoch_ms(latest_update)
+            if latest_update is not None
+            else None,
+            deletions=deletions or 0,
+        )
+
+    def count_by_status(self) -> dict[TodoStatus, int]:
+        """Return how many todos are in each status.
+
+        The counts are read from the trigger-maintained counter table, one
+        row per status, so the cost does not grow with the number of todos.
+
+        Returns:
+            dict[TodoStatus, int]: Count for every status, zero included.
+        """
+        stored = dict(
+            self.session.execute(
+                select(TodoStatusCountDTO.status, TodoStatusCountDTO.count)
+            )
+            .tuples()
             .all()
         )
-        return [todo_dto.to_entity() for todo_dto in rows]
+        return {status: stored.get(status.value, 0) for status in TodoStatus}
 
     def save(self, todo: Todo) -> None:
-        """Persist new or updated todo data.
+        """Insert a new todo, or update a stored one unless it changed since read.
+
+        An update is a single ``UPDATE ... WHERE id = ? AND version = ?``, so
+        the row is never read first and a concurrent write cannot be
+        overwritten. The entity's version is advanced once the write succeeds.
+        Saving an archived todo moves it back into the todo table.
 
         Args:
             todo: Todo entity to create or update.
+
+        Raises:
+            TodoConflictError: If the stored todo was changed or deleted after
+                the entity was read.
         """
-        todo_dto = TodoDTO.from_entity(todo)
-        try:
-            existing_todo = (
-                self.session.query(TodoDTO).filter_by(id=todo.id.value).one()
+        if todo.version == 0:
+            self.add_many([todo])
+            todo_identity_map(self.session)[todo.id] = todo
+            return
+
+        identity_map = todo_identity_map(self.session)
+        if self._update_stored([todo]):
+            identity_map.pop(todo.id, None)
+            raise TodoConflictError
+        todo.version += 1
+        identity_map[todo.id] = todo
+
+    def save_many(self, todos: Sequence[Todo]) -> set[TodoId]:
+        """Insert new todos and conditionally update stored ones in bulk.
+
+        New todos are inserted with one ``executemany`` call, and stored ones
+        are updated with another of the same versioned ``UPDATE`` that
+        ``save`` issues, so no row is read before it is written. Archived
+        todos are moved back into the todo table.
+
+        Args:
+            todos: Todo entities to create or update.
+
+        Returns:
+            set[TodoId]: Identifiers of the stored todos that were changed or
+                deleted after they were read; their rows are left untouched.
+        """
+        stored = [todo for todo in todos if todo.version > 0]
+        self.add_many([todo for todo in todos if todo.version == 0])
+        if not stored:
+            return set()
+
+        conflicts = self._update_stored(stored)
+        # Bulk writes are not tracked, so large batches do not pin every
+        # entity in memory until the commit.
+        identity_map = todo_identity_map(self.session)
+        for todo in stored:
+            identity_map.pop(todo.id, None)
+            if todo.id not in conflicts:
+                todo.version += 1
+        return conflicts
+
+    def _update_stored(self, todos: Sequence[Todo]) -> set[TodoId]:
+        """Run the versioned update for stored todos, restoring archived ones.
+
+        The stored rows are only read back when some update matched no row,
+        so saving todos that were all current costs one statement.
+
+        Returns:
+            set[TodoId]: Identifiers of the todos that were not updated.
+        """
+        if self._run_versioned_update(todos) == len(todos):
+            return set()
+        unsaved = self._find_unsaved(todos)
+        restored = self._restore_archived([todo.id.value for todo in unsaved])
+        if restored:
+            self._run_versioned_update(
+                [todo for todo in unsaved if todo.id.value in restored]
             )
-        except NoResultFound:
-            self.session.add(todo_dto)
+            unsaved = self._find_unsaved(unsaved)
+        return {todo.id for todo in unsaved}
 
-        else:
-            existing_todo.title = todo_dto.title
-            existing_todo.description = todo_dto.description
-            existing_todo.status = todo_dto.status
-            existing_todo.updated_at = todo_dto.updated_at
-            existing_todo.completed_at = todo_dto.completed_at
+    def _find_unsaved(self, todos: Sequence[Todo]) -> list[Todo]:
+        """Return the todos whose stored row does not hold what they wrote.
+
+        A row that another writer already brought to the same values at the
+        same version counts as saved, since the outcome is identical.
+        """
+        rows = self.session.execute(
+            select(TodoDTO.id, *(getattr(TodoDTO, c) for c in UPDATED_COLUMNS)).where(
+                TodoDTO.id.in_([todo.id.value for todo in todos])
+            )
+        ).all()
+        stored = {row[0]: tuple(row[1:]) for row in rows}
+        return [
+            todo
+            for todo in todos
+            if stored.get(todo.id.value) != tuple(_updated_values(todo).values())
+        ]
+
+    def _run_versioned_update(self, todos: Sequence[Todo]) -> int:
+        """Execute ``VERSIONED_UPDATE`` for the todos and count matched rows."""
+        return (
+            self.session.connection()
+            .execute(
+                VERSIONED_UPDATE,
+                [
+                    {
+                        'todo_id': todo.id.value,
+                        'read_version': todo.version,
+                        **_updated_values(todo),
+                    }
+                    for todo in todos
+                ],
+            )
+            .rowcount
+        )
+
+    def _restore_archived(self, ids: Sequence[UUID]) -> set[UUID]:
+        """Move archived todos among the identifiers back into the todo table."""
+        connection = self.session.connection()
+        restored = set(
+            connection.execute(
+                insert_rows(TodoDTO)
+                .from_select(
+                    [column.key for column in TODO_COLUMNS],
+                    select(*TODO_ARCHIVE_COLUMNS).where(TodoArchiveDTO.id.in_(ids)),
+                )
+                .returning(TodoDTO.id)
+            ).scalars()
+        )
+        if restored:
+            connection.execute(
+                delete(TodoArchiveDTO).where(TodoArchiveDTO.id.in_(restored))
+            )
+        return restored
+
+    def add_many(self, todos: Sequence[Todo]) -> None:
+        """Insert new todos with a single ``executemany`` call.
+
+        The driver reuses one prepared statement for every row. Each entity's
+        version is advanced to the stored version 1.
+
+        Args:
+            todos: Todo entities that are not stored yet.
+        """
+        if todos:
+            self.session.execute(
+                insert_rows(TodoDTO),
+                [TodoDTO.values_from_entity(todo) for todo in todos],
+            )
+            for todo in todos:
+                todo.version += 1
 
     def delete(self, todo_id: TodoId) -> None:
-        """Remove a todo by its identifier.
+        """Remove a todo by its identifier, from the archive if it is there.
 
         Args:
             todo_id: Identifier of the todo to delete.
         """
-        self.session.query(TodoDTO).filter_by(id=todo_id.value).delete()
+        if not self.session.query(TodoDTO).filter_by(id=todo_id.value).delete():
+            self.session.execute(
+                delete(TodoArchiveDTO).where(TodoArchiveDTO.id == todo_id.value)
+            )
+        todo_identity_map(self.session).pop(todo_id, None)
+
+    def delete_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Delete the oldest completed todos in one bounded statement.
+
+        The statement is ``DELETE ... WHERE id IN (SELECT id ... WHERE
+        completed_at < ? ORDER BY completed_at LIMIT ?) RETURNING id``. The
+        subquery walks ``ix_todo_completed_at_id`` from its start, so a chunk
+        never scans the todos that are kept. Only completed todos have a
+        completion time.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos deleted by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the deleted todos, in no particular
+                order; fewer than ``limit`` once no older completed todos
+                remain.
+        """
+        chunk = (
+            select(TodoDTO.id)
+            .where(TodoDTO.completed_at < to_epoch_ms(completed_before))
+            .order_by(TodoDTO.completed_at, TodoDTO.id)
+            .limit(limit)
+        )
+        deleted = [
+            TodoId(todo_id)
+            for todo_id in self.session.connection()
+            .execute(
+                delete(TodoDTO)
+                .where(TodoDTO.id.in_(chunk.scalar_subquery()))
+                .returning(TodoDTO.id)
+            )
+            .scalars()
+        ]
+        identity_map = todo_identity_map(self.session)
+        for todo_id in deleted:
+            identity_map.pop(todo_id, None)
+        return deleted
+
+    def archive_completed_before(
+        self, completed_before: datetime, limit: int
+    ) -> list[TodoId]:
+        """Move the oldest completed todos into the archive table.
+
+        The chunk is picked by walking ``ix_todo_completed_at_id`` from its
+        start, copied with one ``INSERT ... SELECT``, and removed with one
+        ``DELETE``. The delete fires the todo table triggers, so archived
+        todos leave the status counts and the search index.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+            limit: Most todos archived by this call.
+
+        Returns:
+            list[TodoId]: Identifiers of the archived todos, oldest first;
+                fewer than ``limit`` once no older completed todos remain.
+        """
+        connection = self.session.connection()
+        ids = list(
+            connection.execute(
+                select(TodoDTO.id)
+                .where(TodoDTO.completed_at < to_epoch_ms(completed_before))
+                .order_by(TodoDTO.completed_at, TodoDTO.id)
+                .limit(limit)
+            ).scalars()
+        )
+        if not ids:
+            return []
+
+        connection.execute(
+            insert_rows(TodoArchiveDTO).from_select(
+                [column.key for column in TODO_ARCHIVE_COLUMNS],
+                select(*TODO_COLUMNS).where(TodoDTO.id.in_(ids)),
+            )
+        )
+        connection.execute(delete(TodoDTO).where(TodoDTO.id.in_(ids)))
+        archived = [TodoId(todo_id) for todo_id in ids]
+        identity_map = todo_identity_map(self.session)
+        for todo_id in archived:
+            identity_map.pop(todo_id, None)
+        return archived
+
+    def find_archived(
+        self, limit: int = DEFAULT_TODO_PAGE_SIZE, cursor: str | None = None
+    ) -> TodoPage:
+        """Return one page of archived todos, most recently completed first.
+
+        Pages are read by seeking ``ix_todo_archive_completed_at_id`` past the
+        cursor position, like ``find_all``.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        column = TodoArchiveDTO.completed_at
+        stmt = (
+            select(*TODO_ARCHIVE_COLUMNS)
+            .order_by(desc(column), desc(TodoArchiveDTO.id))
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            sort_value, last_id = decode_todo_cursor(cursor, TodoSortKey.COMPLETED_AT)
+            stmt = stmt.where(tuple_(column, TodoArchiveDTO.id) < (sort_value, last_id))
+
+        rows = self.session.execute(stmt).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_todo_cursor(
+                TodoSortKey.COMPLETED_AT, last.completed_at, last.id
+            )
+        return TodoPage(todos_from_rows(rows), next_cursor)
 
 
 def new_todo_repository(session: Session) -> TodoRepository:
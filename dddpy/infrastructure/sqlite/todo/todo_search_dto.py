@@ -0,0 +1,152 @@
+"""Index todo titles and descriptions for full-text search with SQLite FTS5."""
+
+from uuid import UUID
+
+from sqlalchemy import (
+    DDL,
+    Connection,
+    Integer,
+    String,
+    column,
+    delete,
+    event,
+    func,
+    insert,
+    literal_column,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo.todo_dto import TodoDTO
+
+SEARCH_HIGHLIGHT_OPEN = '<mark>'
+SEARCH_HIGHLIGHT_CLOSE = '</mark>'
+SEARCH_SNIPPET_ELLIPSIS = '…'
+# Tokens of description shown around the best match.
+SEARCH_SNIPPET_TOKENS = 16
+# bm25 column weights: a title match counts twice a description match.
+SEARCH_TITLE_WEIGHT = 2.0
+SEARCH_DESCRIPTION_WEIGHT = 1.0
+
+
+class TodoSearchKeyDTO(Base):
+    """Assign each todo the integer key its search index entry is stored under.
+
+    FTS5 identifies documents by an integer rowid. The implicit rowid of the
+    UUID-keyed todo table may change on VACUUM, so the index is keyed by
+    this table's INTEGER PRIMARY KEY instead.
+    """
+
+    __tablename__ = 'todo_search_key'
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    todo_id: Mapped[UUID] = mapped_column(unique=True, nullable=False)
+
+
+# The FTS5 virtual table cannot be declared through the ORM; this construct
+# only names its columns for query building.
+todo_search = table(
+    'todo_search',
+    column('rowid', Integer),
+    column('title', String),
+    column('description', String),
+)
+
+_todo_search_table = literal_column('todo_search')
+todo_search_match = _todo_search_table.op('MATCH')
+todo_search_score = func.bm25(
+    _todo_search_table, SEARCH_TITLE_WEIGHT, SEARCH_DESCRIPTION_WEIGHT
+)
+todo_search_title_highlight = func.highlight(
+    _todo_search_table, 0, SEARCH_HIGHLIGHT_OPEN, SEARCH_HIGHLIGHT_CLOSE
+)
+todo_search_description_snippet = func.snippet(
+    _todo_search_table,
+    1,
+    SEARCH_HIGHLIGHT_OPEN,
+    SEARCH_HIGHLIGHT_CLOSE,
+    SEARCH_SNIPPET_ELLIPSIS,
+    SEARCH_SNIPPET_TOKENS,
+)
+
+
+def todo_search_match_expression(query: str) -> str | None:
+    """Turn free text into an FTS5 query requiring every term.
+
+    Each term is quoted as an FTS5 string, so operators, column filters, and
+    unbalanced quotes in user input are matched literally instead of being
+    parsed as query syntax.
+
+    Args:
+        query: Search text supplied by the client.
+
+    Returns:
+        Optional[str]: FTS5 query, or None when the text has no terms.
+    """
+    terms = query.split()
+    if not terms:
+        return None
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+# Every statement is idempotent and runs on each create_all, so databases
+# created before search existed gain the index and triggers on next start;
+# run rebuild_todo_search once to index the todos they already hold.
+for statement in (
+    'CREATE VIRTUAL TABLE IF NOT EXISTS todo_search USING fts5('
+    "title, description, tokenize = 'unicode61 remove_diacritics 2')",
+    'CREATE TRIGGER IF NOT EXISTS todo_search_insert AFTER INSERT ON todo '
+    'BEGIN INSERT INTO todo_search_key (todo_id) VALUES (new.id); '
+    'INSERT INTO todo_search (rowid, title, description) VALUES ('
+    '(SELECT id FROM todo_search_key WHERE todo_id = new.id), '
+    'new.title, new.description); END',
+    # Status changes and upserts rewrite the row without touching its text;
+    # the WHEN clause keeps them from re-indexing it.
+    'CREATE TRIGGER IF NOT EXISTS todo_search_update '
+    'AFTER UPDATE OF title, description ON todo '
+    'WHEN old.title IS NOT new.title OR old.description IS NOT new.description '
+    'BEGIN UPDATE todo_search SET title = new.title, '
+    'description = new.description WHERE rowid = '
+    '(SELECT id FROM todo_search_key WHERE todo_id = new.id); END',
+    'CREATE TRIGGER IF NOT EXISTS todo_search_delete AFTER DELETE ON todo '
+    'BEGIN DELETE FROM todo_search WHERE rowid = '
+    '(SELECT id FROM todo_search_key WHERE todo_id = old.id); '
+    'DELETE FROM todo_search_key WHERE todo_id = old.id; END',
+):
+    event.listen(Base.metadata, 'after_create', DDL(statement))
+
+
+def rebuild_todo_search(connection: Connection) -> int:
+    """Rebuild the search index from the todo table.
+
+    Backfills databases whose todos were stored before the index existed,
+    and repairs an index that drifted from the table. Run it inside a
+    transaction so searches never see a half-built index.
+
+    Args:
+        connection: Connection to the database to re-index.
+
+    Returns:
+        int: Number of todos indexed.
+    """
+    connection.execute(delete(todo_search))
+    connection.execute(delete(TodoSearchKeyDTO))
+    connection.execute(
+        insert(TodoSearchKeyDTO).from_select(['todo_id'], select(TodoDTO.id))
+    )
+    connection.execute(
+        insert(todo_search).from_select(
+            ['rowid', 'title', 'description'],
+            select(TodoSearchKeyDTO.id, TodoDTO.title, TodoDTO.description).join(
+                TodoDTO, TodoDTO.id == TodoSearchKeyDTO.todo_id
+            ),
+        )
+    )
+    # Merge the freshly written segments so the first searches stay fast.
+    connection.execute(
+        text("INSERT INTO todo_search (todo_search) VALUES ('optimize')")
+    )
+    return connection.scalar(select(func.count()).select_from(TodoSearchKeyDTO)) or 0
@@ -0,0 +1,88 @@
+"""Keep per-status todo counts that can be read without counting rows."""
+
+from sqlalchemy import DDL, Connection, event, func, select, update
+from sqlalchemy.orm import Mapped, mapped_column
+
+from dddpy.domain.todo.value_objects import TodoStatus
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo.todo_dto import TodoDTO
+
+
+class TodoStatusCountDTO(Base):
+    """One row per status holding the number of todos in that status.
+
+    Triggers on the todo table adjust the rows inside the statement that
+    writes the todo, so the counts commit or roll back with it.
+    """
+
+    __tablename__ = 'todo_status_count'
+
+    status: Mapped[str] = mapped_column(primary_key=True)
+    count: Mapped[int] = mapped_column(nullable=False, default=0)
+
+
+def _adjust(status: str, delta: str) -> str:
+    """Return the trigger statement that moves one status count by delta."""
+    return (
+        f'UPDATE todo_status_count SET count = count {delta} 1 WHERE status = {status};'
+    )
+
+
+# Every statement is idempotent and runs on each create_all. A missing row
+# is seeded from the todo table, so databases created before the counters
+# existed start with the right numbers; existing rows are left alone.
+for statement in (
+    *(
+        'INSERT OR IGNORE INTO todo_status_count (status, count) '
+        f"SELECT '{status.value}', count(*) FROM todo "
+        f"WHERE status = '{status.value}'"
+        for status in TodoStatus
+    ),
+    'CREATE TRIGGER IF NOT EXISTS todo_status_count_insert AFTER INSERT ON todo '
+    f'BEGIN {_adjust("new.status", "+")} END',
+    'CREATE TRIGGER IF NOT EXISTS todo_status_count_delete AFTER DELETE ON todo '
+    f'BEGIN {_adjust("old.status", "-")} END',
+    'CREATE TRIGGER IF NOT EXISTS todo_status_count_update '
+    'AFTER UPDATE OF status ON todo WHEN old.status IS NOT new.status '
+    f'BEGIN {_adjust("old.status", "-")} {_adjust("new.status", "+")} END',
+):
+    event.listen(Base.metadata, 'after_create', DDL(statement))
+
+
+def reconcile_todo_status_counts(connection: Connection) -> dict[str, int]:
+    """Recompute the status counts from the todo table and store them.
+
+    The recount walks the whole status index, so it is meant for
+    maintenance, not for serving requests. Run it inside a transaction so
+    writes cannot slip in between the recount and the update.
+
+    Args:
+        connection: Connection to the database to reconcile.
+
+    Returns:
+        dict[str, int]: For each status whose stored count was wrong, the
+            actual count minus the stored one.
+    """
+    actual = dict(
+        connection.execute(
+            select(TodoDTO.status, func.count()).group_by(TodoDTO.status)
+        )
+        .tuples()
+        .all()
+    )
+    stored = dict(
+        connection.execute(select(TodoStatusCountDTO.status, TodoStatusCountDTO.count))
+        .tuples()
+        .all()
+    )
+    drift: dict[str, int] = {}
+    for status in TodoStatus:
+        count = actual.get(status.value, 0)
+        if count != stored.get(status.value, 0):
+            drift[status.value] = count - stored.get(status.value, 0)
+            connection.execute(
+                update(TodoStatusCountDTO)
+                .where(TodoStatusCountDTO.status == status.value)
+                .values(count=count)
+            )
+    return drift
@@ -0,0 +1,107 @@
+"""SQLite implementation of the todo unit of work."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from dddpy.domain.todo.repositories import (
+    AsyncTodoRepository,
+    AsyncTodoUnitOfWork,
+    TodoRepository,
+    TodoUnitOfWork,
+)
+from dddpy.infrastructure.sqlite.todo.async_todo_repository import (
+    new_async_todo_repository,
+)
+from dddpy.infrastructure.sqlite.todo.todo_repository import new_todo_repository
+
+
+class TodoUnitOfWorkImpl(TodoUnitOfWork):
+    """Run todo writes inside the transaction of one SQLAlchemy session.
+
+    Repository writes execute inside the open transaction as they happen,
+    so later reads in the same unit see them, but nothing reaches disk
+    until ``commit``: starting ten thousand todos costs one commit and one
+    fsync rather than ten thousand.
+    """
+
+    def __init__(self, session: Session, todos: TodoRepository | None = None):
+        """Bind the unit of work to a session.
+
+        Args:
+            session: Session whose transaction collects the writes.
+            todos: Repository bound to ``session``; a plain SQLite
+                repository is created when omitted.
+        """
+        self.session = session
+        self.todos = todos if todos is not None else new_todo_repository(session)
+
+    def commit(self) -> None:
+        """Commit the session transaction."""
+        self.session.commit()
+
+    def rollback(self) -> None:
+        """Roll back the session transaction."""
+        self.session.rollback()
+
+    def close(self) -> None:
+        """Close the session."""
+        self.session.close()
+
+
+def new_todo_unit_of_work(
+    session: Session, todos: TodoRepository | None = None
+) -> TodoUnitOfWork:
+    """Instantiate a SQLite-backed todo unit of work.
+
+    Args:
+        session: Session whose transaction collects the writes.
+        todos: Repository bound to ``session``; a plain SQLite repository is
+            created when omitted.
+
+    Returns:
+        TodoUnitOfWork: Configured unit of work implementation.
+    """
+    return TodoUnitOfWorkImpl(session, todos)
+
+
+class AsyncTodoUnitOfWorkImpl(AsyncTodoUnitOfWork):
+    """Run async todo writes inside the transaction of one AsyncSession."""
+
+    def __init__(self, session: AsyncSession, todos: AsyncTodoRepository | None = None):
+        """Bind the unit of work to an async session.
+
+        Args:
+            session: Async session whose transaction collects the writes.
+            todos: Repository bound to ``session``; a plain SQLite
+                repository is created when omitted.
+        """
+        self.session = session
+        self.todos = todos if todos is not None else new_async_todo_repository(session)
+
+    async def commit(self) -> None:
+        """Commit the session transaction."""
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        """Roll back the session transaction."""
+        await self.session.rollback()
+
+    async def close(self) -> None:
+        """Close the session."""
+        await self.session.close()
+
+
+def new_async_todo_unit_of_work(
+    session: AsyncSession, todos: AsyncTodoRepository | None = None
+) -> AsyncTodoUnitOfWork:
+    """Instantiate a SQLite-backed async todo unit of work.
+
+    Args:
+        session: Async session whose transaction collects the writes.
+        todos: Repository bound to ``session``; a plain SQLite repository is
+            created when omitted.
+
+    Returns:
+        AsyncTodoUnitOfWork: Configured unit of work implementation.
+    """
+    return AsyncTodoUnitOfWorkImpl(session, todos)
@@ -0,0 +1,158 @@
+"""Group concurrent writes into shared SQLite transactions."""
+
+import asyncio
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+T = TypeVar('T')
+
+
+@dataclass
+class _PendingWrite:
+    """Pair a write with the future its caller waits on."""
+
+    job: Callable[[Session], Any]
+    future: Future[Any] = field(default_factory=Future)
+
+
+class WriteCoordinator:
+    """Run writes from many callers on one thread and commit them in groups.
+
+    The writer thread takes the first pending write, keeps collecting more
+    for up to ``window_seconds`` or until ``max_batch`` are queued, and runs
+    them in one transaction, each inside its own savepoint so a failing
+    write is rolled back alone. A caller's future resolves only once the
+    shared commit is durable, so one fsync acknowledges the whole group.
+    Writes queued while a group commits form the next group.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        window_seconds: float,
+        max_batch: int,
+    ):
+        """Store the configuration; the writer thread starts on first use.
+
+        Args:
+            session_factory: Creates the sessions the writer thread commits.
+            window_seconds: How long to wait for more writes after the first.
+            max_batch: Most writes committed together.
+        """
+        self.session_factory = session_factory
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self._pending: queue.SimpleQueue[_PendingWrite | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, job: Callable[[Session], T]) -> Future[T]:
+        """Queue a write for the next group.
+
+        Args:
+            job: Writes through the session it receives and returns a result.
+
+        Returns:
+            Future[T]: Resolves with the result after the group commits, or
+                with the error that the job or the commit raised.
+        """
+        self._ensure_started()
+        pending = _PendingWrite(job)
+        self._pending.put(pending)
+        return pending.future
+
+    def write(self, job: Callable[[Session], T]) -> T:
+        """Run a write in the next group and wait until it is durable.
+
+        Args:
+            job: Writes through the session it receives and returns a result.
+
+        Returns:
+            T: Result of the job.
+        """
+        return self.submit(job).result()
+
+    async def write_async(self, job: Callable[[Session], T]) -> T:
+        """Run a write in the next group without blocking the event loop.
+
+        Args:
+            job: Writes through the session it receives and returns a result.
+
+        Returns:
+            T: Result of the job.
+        """
+        return await asyncio.wrap_future(self.submit(job))
+
+    def close(self) -> None:
+        """Commit the writes already queued, then stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._pending.put(None)
+            thread.join()
+
+    def _ensure_started(self) -> None:
+        """Start the writer thread unless it is already running."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='dddpy-group-commit', daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Commit groups of writes until ``close`` is called."""
+        running = True
+        while running:
+            batch, running = self._collect()
+            if batch:
+                self._commit(batch)
+
+    def _collect(self) -> tuple[list[_PendingWrite], bool]:
+        """Wait for one write, then gather more until the window closes."""
+        first = self._pending.get()
+        if first is None:
+            return [], False
+        batch = [first]
+        deadline = time.monotonic() + self.window_seconds
+        while len(batch) < self.max_batch:
+            try:
+                pending = self._pending.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if pending is None:
+                return batch, False
+            batch.append(pending)
+        return batch, True
+
+    def _commit(self, batch: list[_PendingWrite]) -> None:
+        """Run every write of the group in one transaction and commit it."""
+        results: list[tuple[_PendingWrite, Any]] = []
+        with self.session_factory() as session:
+            try:
+                # pysqlite only opens a transaction before DML, so without an
+                # explicit BEGIN the first savepoint release would commit.
+                session.execute(text('BEGIN IMMEDIATE'))
+                for pending in batch:
+                    try:
+                        with session.begin_nested():
+                            results.append((pending, pending.job(session)))
+                    except Exception as e:
+                        pending.future.set_exception(e)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+                return
+        for pending, result in results:
+            pending.future.set_result(result)
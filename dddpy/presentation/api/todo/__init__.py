@@ -2,6 +2,6 @@
 
 from __future__ import annotations
 
-from . import error_messages, handlers, schemas
+from . import error_messages, etags, handlers, ndjson, schemas, todo_json
 
-__all__ = ('error_messages', 'handlers', 'schemas')
+__all__ = ('error_messages', 'etags', 'handlers', 'ndjson', 'schemas', 'todo_json')
@@ -4,12 +4,18 @@ from __future__ import annotations
 
 from .todo_already_completed_error_message import ErrorMessageTodoAlreadyCompleted
 from .todo_already_started_error_message import ErrorMessageTodoAlreadyStarted
+from .todo_conflict_error_message import ErrorMessageTodoConflict
+from .todo_invalid_cursor_error_message import ErrorMessageTodoInvalidCursor
+from .todo_invalid_filter_error_message import ErrorMessageTodoInvalidFilter
 from .todo_not_found_error_message import ErrorMessageTodoNotFound
 from .todo_not_started_error_message import ErrorMessageTodoNotStarted
 
 __all__ = (
     'ErrorMessageTodoAlreadyCompleted',
     'ErrorMessageTodoAlreadyStarted',
+    'ErrorMessageTodoConflict',
+    'ErrorMessageTodoInvalidCursor',
+    'ErrorMessageTodoInvalidFilter',
     'ErrorMessageTodoNotFound',
     'ErrorMessageTodoNotStarted',
 )
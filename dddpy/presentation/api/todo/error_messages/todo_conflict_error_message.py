@@ -0,0 +1,11 @@
+"""Expose the error schema returned for a write based on an outdated todo."""
+
+from pydantic import BaseModel, Field
+
+from dddpy.domain.todo.exceptions import TodoConflictError
+
+
+class ErrorMessageTodoConflict(BaseModel):
+    """Represent the conflict error response payload."""
+
+    detail: str = Field(examples=[TodoConflictError.message])
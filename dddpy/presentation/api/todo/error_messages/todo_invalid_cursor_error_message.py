@@ -0,0 +1,11 @@
+"""Expose the error schema returned for an invalid listing cursor."""
+
+from pydantic import BaseModel, Field
+
+from dddpy.domain.todo.exceptions import TodoInvalidCursorError
+
+
+class ErrorMessageTodoInvalidCursor(BaseModel):
+    """Represent the invalid-cursor error response payload."""
+
+    detail: str = Field(examples=[TodoInvalidCursorError.message])
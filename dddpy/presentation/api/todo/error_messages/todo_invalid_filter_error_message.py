@@ -0,0 +1,11 @@
+"""Expose the error schema returned for an unsupported listing filter."""
+
+from pydantic import BaseModel, Field
+
+from dddpy.domain.todo.exceptions import TodoInvalidFilterError
+
+
+class ErrorMessageTodoInvalidFilter(BaseModel):
+    """Represent the invalid-filter error response payload."""
+
+    detail: str = Field(examples=[TodoInvalidFilterError.message])
@@ -0,0 +1,116 @@
+"""Build and compare entity tags for conditional todo requests."""
+
+import hashlib
+from datetime import datetime
+
+from fastapi import Response, status
+
+from dddpy.domain.todo.repositories import TodoListVersion
+
+ETAG_HEADER = 'ETag'
+
+
+def _epoch_ms(value: datetime | None) -> int:
+    """Convert a timestamp the same way ``TodoSchema`` serializes it."""
+    return int(value.timestamp() * 1000) if value is not None else 0
+
+
+def _strong_etag(*parts: object) -> str:
+    """Hash the parts into a quoted strong entity tag."""
+    digest = hashlib.blake2b(
+        '\x1f'.join(str(part) for part in parts).encode(), digest_size=16
+    )
+    return f'"{digest.hexdigest()}"'
+
+
+# Never equal to a stored version, so an unrecognized If-Match always conflicts.
+UNMATCHABLE_VERSION = -1
+
+
+def todo_etag(version: int) -> str:
+    """Return the entity tag of a single todo representation.
+
+    Every write advances a todo's version, so the version alone identifies
+    the representation. It is sent as is, so clients can echo it in
+    ``If-Match``.
+
+    Args:
+        version: Current version of the todo.
+
+    Returns:
+        str: Quoted strong entity tag.
+    """
+    return f'"{version}"'
+
+
+def if_match_version(if_match: str | None) -> int | None:
+    """Read the todo version a client expects from an ``If-Match`` header.
+
+    ``If-Match`` uses strong comparison, so weak tags, lists of several
+    tags, and tags this API never issued cannot match any version.
+
+    Args:
+        if_match: Raw header value sent by the client, if any.
+
+    Returns:
+        Optional[int]: Expected version; None when the header is absent or
+            ``*``, and ``UNMATCHABLE_VERSION`` when it cannot match.
+    """
+    if if_match is None or if_match.strip() == '*':
+        return None
+    tag = if_match.strip()
+    digits = tag.removeprefix('"').removesuffix('"')
+    if tag != f'"{digits}"' or not (digits.isascii() and digits.isdigit()):
+        return UNMATCHABLE_VERSION
+    return int(digits)
+
+
+def todo_list_etag(version: TodoListVersion, *query: object) -> str:
+    """Return the entity tag of one page of the todo list.
+
+    Args:
+        version: Current version of the todo collection.
+        query: Parameters that select the page, such as limit and cursor.
+
+    Returns:
+        str: Quoted strong entity tag.
+    """
+    return _strong_etag(
+        'todos',
+        version.count,
+        _epoch_ms(version.latest_update),
+        version.deletions,
+        *query,
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against the current entity tag.
+
+    ``If-None-Match`` uses weak comparison, so ``W/`` prefixes are ignored.
+
+    Args:
+        if_none_match: Raw header value sent by the client, if any.
+        etag: Current entity tag of the resource.
+
+    Returns:
+        bool: Whether the client already holds the current representation.
+    """
+    if if_none_match is None:
+        return False
+    candidates = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response carrying the current entity tag.
+
+    Args:
+        etag: Current entity tag of the resource.
+
+    Returns:
+        Response: Response telling the client to reuse its cached copy.
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag}
+    )
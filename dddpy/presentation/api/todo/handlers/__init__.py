@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from .async_todo_api_route_handler import AsyncTodoApiRouteHandler
 from .todo_api_route_handler import TodoApiRouteHandler
 
-__all__ = ('TodoApiRouteHandler',)
+__all__ = ('AsyncTodoApiRouteHandler', 'TodoApiRouteHandler')
@@ -0,0 +1,612 @@
+"""Controller for handling Todo-related HTTP requests without blocking."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import (
+    Depends,
+    FastAPI,
+    Header,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+
+from dddpy.domain.todo.value_objects import TodoId
+from dddpy.infrastructure.di.injection import (
+    get_async_complete_todo_usecase,
+    get_async_create_todo_usecase,
+    get_async_delete_todo_usecase,
+    get_async_export_todos_usecase,
+    get_async_find_archived_todos_usecase,
+    get_async_find_todo_by_id_usecase,
+    get_async_find_todo_stats_usecase,
+    get_async_find_todo_version_usecase,
+    get_async_find_todos_usecase,
+    get_async_find_todos_version_usecase,
+    get_async_import_todos_usecase,
+    get_async_purge_completed_todos_usecase,
+    get_async_search_todos_usecase,
+    get_async_start_todo_usecase,
+    get_async_update_todo_usecase,
+    get_async_upsert_todos_usecase,
+    use_async_read_only_session,
+)
+from dddpy.presentation.api.todo.etags import (
+    etag_matches,
+    if_match_version,
+    not_modified,
+    todo_etag,
+    todo_list_etag,
+)
+from dddpy.presentation.api.todo.handlers.todo_api_route_handler import (
+    TodoApiRouteHandler,
+)
+from dddpy.presentation.api.todo.handlers.todo_route_support import (
+    CREATE_RESPONSES,
+    DELETE_RESPONSES,
+    EXPORT_RESPONSES,
+    IMPORT_REQUEST_BODY,
+    LIST_RESPONSES,
+    SEARCH_RESPONSES,
+    TODO_RESPONSES,
+    WRITE_RESPONSES,
+    export_headers,
+    import_ndjson,
+    parse_todo_fields,
+    render_todo,
+    render_todo_page,
+    render_versioned_todo,
+    set_next_cursor,
+    todo_http_errors,
+)
+from dddpy.presentation.api.todo.ndjson import (
+    NDJSON_MEDIA_TYPE,
+    async_todo_ndjson_chunks,
+)
+from dddpy.presentation.api.todo.schemas import (
+    TodoArchiveQuerySchema,
+    TodoBatchResultSchema,
+    TodoBatchSchema,
+    TodoCreateSchema,
+    TodoImportResultSchema,
+    TodoListQuerySchema,
+    TodoPurgeQuerySchema,
+    TodoPurgeResultSchema,
+    TodoSchema,
+    TodoSearchHitSchema,
+    TodoSearchQuerySchema,
+    TodoStatsSchema,
+    TodoUpdateSchema,
+)
+from dddpy.usecase.todo import (
+    AsyncCompleteTodoUseCase,
+    AsyncCreateTodoUseCase,
+    AsyncDeleteTodoUseCase,
+    AsyncExportTodosUseCase,
+    AsyncFindArchivedTodosUseCase,
+    AsyncFindTodoByIdUseCase,
+    AsyncFindTodoStatsUseCase,
+    AsyncFindTodosUseCase,
+    AsyncFindTodosVersionUseCase,
+    AsyncFindTodoVersionUseCase,
+    AsyncImportTodosUseCase,
+    AsyncPurgeCompletedTodosUseCase,
+    AsyncSearchTodosUseCase,
+    AsyncStartTodoUseCase,
+    AsyncUpdateTodoUseCase,
+    AsyncUpsertTodosUseCase,
+)
+
+
+class AsyncTodoApiRouteHandler(TodoApiRouteHandler):
+    """Register todo endpoints as coroutines backed by async use cases.
+
+    Unlike the synchronous handler, requests are served on the event loop
+    instead of occupying a worker thread while SQLite is busy.
+    """
+
+    def _register_get_todos_route(self, app: FastAPI) -> None:
+        """Register the route that returns all todos."""
+
+        @app.get(
+            '/todos',
+            dependencies=[Depends(use_async_read_only_session)],
+            response_model=list[TodoSchema],
+            status_code=200,
+            responses=LIST_RESPONSES,
+        )
+        async def get_todos(
+            response: Response,
+            query: Annotated[TodoListQuerySchema, Query()],
+            if_none_match: str | None = Header(default=None),
+            version_usecase: AsyncFindTodosVersionUseCase = Depends(
+                get_async_find_todos_version_usecase
+            ),
+            usecase: AsyncFindTodosUseCase = Depends(get_async_find_todos_usecase),
+        ) -> list[TodoSchema] | Response:
+            """Return one page of todos, newest first.
+
+            Args:
+                response: Response used to expose the next page cursor.
+                query: Page size, cursor, sort order, and filters of the
+                    requested page.
+                if_none_match: ETags of the page the client already holds.
+                version_usecase: Use case reading the todo list version.
+                usecase: Use case responsible for retrieving todos.
+
+            Returns:
+                list[TodoSchema] | Response: Serialized todos, or an empty 304
+                    response when the client's copy is current.
+
+            Raises:
+                HTTPException: When the cursor is invalid or an unexpected error occurs.
+            """
+            with todo_http_errors():
+                version = await version_usecase.execute()
+
+            todo_filter = query.to_filter()
+            etag = todo_list_etag(
+                version, query.limit, query.cursor, query.sort, todo_filter
+            )
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+            with todo_http_errors():
+                page = await usecase.execute(
+                    limit=query.limit,
+                    cursor=query.cursor,
+                    sort_key=query.sort,
+                    todo_filter=todo_filter,
+                )
+
+            return render_todo_page(page.items, page.next_cursor, response, etag)
+
+    def _register_export_todos_route(self, app: FastAPI) -> None:
+        """Register the route that streams every todo as NDJSON."""
+
+        @app.get(
+            '/todos/export',
+            dependencies=[Depends(use_async_read_only_session)],
+            response_class=StreamingResponse,
+            responses=EXPORT_RESPONSES,
+        )
+        async def export_todos(
+            gzip: bool = Query(default=False),
+            usecase: AsyncExportTodosUseCase = Depends(get_async_export_todos_usecase),
+        ) -> StreamingResponse:
+            """Stream every todo, one JSON object per line.
+
+            Args:
+                gzip: Whether to compress the body with gzip.
+                usecase: Use case streaming the todos.
+
+            Returns:
+                StreamingResponse: NDJSON body produced lazily.
+            """
+            return StreamingResponse(
+                async_todo_ndjson_chunks(usecase.execute(), compress=gzip),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers=export_headers(gzip),
+            )
+
+    def _register_search_todos_route(self, app: FastAPI) -> None:
+        """Register the route that searches todo titles and descriptions."""
+
+        @app.get(
+            '/todos/search',
+            dependencies=[Depends(use_async_read_only_session)],
+            response_model=list[TodoSearchHitSchema],
+            status_code=200,
+            responses=SEARCH_RESPONSES,
+        )
+        async def search_todos(
+            response: Response,
+            query: Annotated[TodoSearchQuerySchema, Query()],
+            usecase: AsyncSearchTodosUseCase = Depends(get_async_search_todos_usecase),
+        ) -> list[TodoSearchHitSchema]:
+            """Return one page of todos matching the query, best match first.
+
+            Args:
+                response: Response used to expose the next page cursor.
+                query: Search text, page size, and cursor of the requested page.
+                usecase: Use case responsible for searching todos.
+
+            Returns:
+                list[TodoSearchHitSchema]: Matching todos with highlights.
+
+            Raises:
+                HTTPException: When the cursor is invalid or an unexpected error occurs.
+            """
+            with todo_http_errors():
+                page = await usecase.execute(
+                    query.q, limit=query.limit, cursor=query.cursor
+                )
+
+            set_next_cursor(response, page.next_cursor)
+            return [TodoSearchHitSchema.from_hit(hit) for hit in page.items]
+
+    def _register_todo_stats_route(self, app: FastAPI) -> None:
+        """Register the route that reports how many todos are in each status."""
+
+        @app.get(
+            '/todos/stats',
+            dependencies=[Depends(use_async_read_only_session)],
+            response_model=TodoStatsSchema,
+            status_code=200,
+        )
+        async def get_todo_stats(
+            usecase: AsyncFindTodoStatsUseCase = Depends(
+                get_async_find_todo_stats_usecase
+            ),
+        ) -> TodoStatsSchema:
+            """Return the number of todos in total and in each status.
+
+            Args:
+                usecase: Use case responsible for reading the counts.
+
+            Returns:
+                TodoStatsSchema: Counts per status and their sum.
+
+            Raises:
+                HTTPException: When an unexpected error occurs.
+            """
+            with todo_http_errors():
+                counts = await usecase.execute()
+
+            return TodoStatsSchema.from_counts(counts)
+
+    def _register_archived_todos_route(self, app: FastAPI) -> None:
+        """Register the route that browses archived todos."""
+
+        @app.get(
+            '/todos/archive',
+            dependencies=[Depends(use_async_read_only_session)],
+            response_model=list[TodoSchema],
+            status_code=200,
+            responses=SEARCH_RESPONSES,
+        )
+        async def get_archived_todos(
+            response: Response,
+            query: Annotated[TodoArchiveQuerySchema, Query()],
+            usecase: AsyncFindArchivedTodosUseCase = Depends(
+                get_async_find_archived_todos_usecase
+            ),
+        ) -> list[TodoSchema] | Response:
+            """Return one page of archived todos, most recently completed first.
+
+            Args:
+                response: Response used to expose the next page cursor.
+                query: Page size and cursor of the requested page.
+                usecase: Use case responsible for reading archived todos.
+
+            Returns:
+                list[TodoSchema] | Response: Serialized archived todos.
+
+            Raises:
+                HTTPException: When the cursor is invalid or an unexpected error occurs.
+            """
+            with todo_http_errors():
+                page = await usecase.execute(limit=query.limit, cursor=query.cursor)
+
+            return render_todo_page(page.items, page.next_cursor, response)
+
+    def _register_get_todo_route(self, app: FastAPI) -> None:
+        """Register the route that returns a single todo."""
+
+        @app.get(
+            '/todos/{todo_id}',
+            dependencies=[Depends(use_async_read_only_session)],
+            response_model=TodoSchema,
+            status_code=200,
+            responses=TODO_RESPONSES,
+        )
+        async def get_todo(
+            todo_id: UUID,
+            response: Response,
+            if_none_match: str | None = Header(default=None),
+            version_usecase: AsyncFindTodoVersionUseCase = Depends(
+                get_async_find_todo_version_usecase
+            ),
+            usecase: AsyncFindTodoByIdUseCase = Depends(
+                get_async_find_todo_by_id_usecase
+            ),
+        ) -> TodoSchema | Response:
+            """Return a single todo by identifier.
+
+            When the client sends If-None-Match, only the todo's version is
+            read to decide whether a 304 is enough.
+
+            Args:
+                todo_id: Identifier of the requested todo.
+                response: Response used to expose the ETag.
+                if_none_match: ETags of the todo the client already holds.
+                version_usecase: Use case reading the todo's version.
+                usecase: Use case responsible for todo retrieval.
+
+            Returns:
+                TodoSchema | Response: Serialized todo, or an empty 304
+                    response when the client's copy is current.
+
+            Raises:
+                HTTPException: When the todo is missing or an unexpected error occurs.
+            """
+            uuid = TodoId(todo_id)
+            with todo_http_errors():
+                version = await version_usecase.execute(uuid) if if_none_match else None
+
+            if version is not None:
+                etag = todo_etag(version)
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
+            with todo_http_errors():
+                todo = await usecase.execute(uuid)
+
+            return render_versioned_todo(todo, response)
+
+    def _register_create_todo_route(self, app: FastAPI) -> None:
+        """Register the route that creates a todo."""
+
+        @app.post(
+            '/todos',
+            response_model=TodoSchema,
+            status_code=201,
+            responses=CREATE_RESPONSES,
+        )
+        async def create_todo(
+            data: TodoCreateSchema,
+            usecase: AsyncCreateTodoUseCase = Depends(get_async_create_todo_usecase),
+        ) -> TodoSchema | Response:
+            """Create a todo from the request payload.
+
+            Args:
+                data: Payload containing todo creation fields.
+                usecase: Use case responsible for creating todos.
+
+            Returns:
+                TodoSchema | Response: Serialized todo returned to the client.
+
+            Raises:
+                HTTPException: When validation or use case execution fails.
+            """
+            title, description = parse_todo_fields(data.title, data.description)
+
+            with todo_http_errors():
+                todo = await usecase.execute(title, description)
+
+            return render_todo(todo, status_code=status.HTTP_201_CREATED)
+
+    def _register_batch_todos_route(self, app: FastAPI) -> None:
+        """Register the route that creates or updates todos in bulk."""
+
+        @app.post(
+            '/todos/batch',
+            response_model=TodoBatchResultSchema,
+            status_code=200,
+        )
+        async def batch_todos(
+            data: TodoBatchSchema,
+            usecase: AsyncUpsertTodosUseCase = Depends(get_async_upsert_todos_usecase),
+        ) -> TodoBatchResultSchema:
+            """Create or update many todos in a single request.
+
+            Items with an id update the existing todo; items without one are
+            created. Invalid or unknown items, and todos changed by another
+            request since they were read, are reported per item.
+
+            Args:
+                data: Payload containing the todos to create or update.
+                usecase: Use case responsible for bulk upserts.
+
+            Returns:
+                TodoBatchResultSchema: Per-item results returned to the client.
+
+            Raises:
+                HTTPException: When the use case raises an unexpected error.
+            """
+            with todo_http_errors():
+                results = await usecase.execute(data.to_items())
+
+            return TodoBatchResultSchema.from_results(results)
+
+    def _register_import_todos_route(self, app: FastAPI) -> None:
+        """Register the route that imports todos from an NDJSON body."""
+
+        @app.post(
+            '/todos/import',
+            response_model=TodoImportResultSchema,
+            status_code=200,
+            openapi_extra=IMPORT_REQUEST_BODY,
+        )
+        async def import_todos(
+            request: Request,
+            usecase: AsyncImportTodosUseCase = Depends(get_async_import_todos_usecase),
+        ) -> TodoImportResultSchema:
+            """Create todos from an NDJSON body, one JSON object per line.
+
+            Args:
+                request: Request whose body is streamed.
+                usecase: Use case validating and storing each chunk.
+
+            Returns:
+                TodoImportResultSchema: Accepted and rejected counts, and the
+                    reasons for the first rejected lines.
+            """
+            return await import_ndjson(request.stream(), usecase.execute)
+
+    def _register_update_todo_route(self, app: FastAPI) -> None:
+        """Register the route that updates an existing todo."""
+
+        @app.put(
+            '/todos/{todo_id}',
+            response_model=TodoSchema,
+            status_code=200,
+            responses=WRITE_RESPONSES,
+        )
+        async def update_todo(
+            todo_id: UUID,
+            response: Response,
+            data: TodoUpdateSchema,
+            if_match: str | None = Header(default=None),
+            usecase: AsyncUpdateTodoUseCase = Depends(get_async_update_todo_usecase),
+        ) -> TodoSchema | Response:
+            """Update a todo identified by the path parameter.
+
+            Args:
+                todo_id: Identifier of the todo to update.
+                response: Response used to expose the ETag.
+                data: Payload containing fields to update.
+                if_match: ETag of the version the client edited, if any.
+                usecase: Use case responsible for updating todos.
+
+            Returns:
+                TodoSchema | Response: Serialized todo returned to the client.
+
+            Raises:
+                HTTPException: When validation fails or the todo cannot be updated.
+            """
+            _id = TodoId(todo_id)
+
+            title, description = parse_todo_fields(data.title, data.description)
+
+            with todo_http_errors():
+                todo = await usecase.execute(
+                    _id,
+                    title,
+                    description,
+                    expected_version=if_match_version(if_match),
+                )
+
+            return render_versioned_todo(todo, response)
+
+    def _register_start_todo_route(self, app: FastAPI) -> None:
+        """Register the route that starts a todo."""
+
+        @app.patch(
+            '/todos/{todo_id}/start',
+            response_model=TodoSchema,
+            status_code=200,
+            responses=WRITE_RESPONSES,
+        )
+        async def start_todo(
+            todo_id: UUID,
+            response: Response,
+            usecase: AsyncStartTodoUseCase = Depends(get_async_start_todo_usecase),
+        ) -> TodoSchema | Response:
+            """Start a todo via the corresponding use case.
+
+            Args:
+                todo_id: Identifier of the todo to start.
+                response: Response used to expose the ETag.
+                usecase: Use case responsible for starting todos.
+
+            Returns:
+                TodoSchema | Response: Serialized todo returned to the client.
+
+            Raises:
+                HTTPException: When lifecycle rules prevent the transition.
+            """
+            _id = TodoId(todo_id)
+            with todo_http_errors():
+                todo = await usecase.execute(_id)
+
+            return render_versioned_todo(todo, response)
+
+    def _register_complete_todo_route(self, app: FastAPI) -> None:
+        """Register the route that completes a todo."""
+
+        @app.patch(
+            '/todos/{todo_id}/complete',
+            response_model=TodoSchema,
+            status_code=200,
+            responses=WRITE_RESPONSES,
+        )
+        async def complete_todo(
+            todo_id: UUID,
+            response: Response,
+            usecase: AsyncCompleteTodoUseCase = Depends(
+                get_async_complete_todo_usecase
+            ),
+        ) -> TodoSchema | Response:
+            """Complete a todo via the corresponding use case.
+
+            Args:
+                todo_id: Identifier of the todo to complete.
+                response: Response used to expose the ETag.
+                usecase: Use case responsible for completing todos.
+
+            Returns:
+                TodoSchema | Response: Serialized todo returned to the client.
+
+            Raises:
+                HTTPException: When lifecycle rules prevent completion.
+            """
+            _id = TodoId(todo_id)
+            with todo_http_errors():
+                todo = await usecase.execute(_id)
+
+            return render_versioned_todo(todo, response)
+
+    def _register_delete_todo_route(self, app: FastAPI) -> None:
+        """Register the route that deletes a todo."""
+
+        @app.delete(
+            '/todos/{todo_id}',
+            status_code=204,
+            responses=DELETE_RESPONSES,
+        )
+        async def delete_todo(
+            todo_id: UUID,
+            usecase: AsyncDeleteTodoUseCase = Depends(get_async_delete_todo_usecase),
+        ) -> Response:
+            """Delete a todo via the corresponding use case.
+
+            Args:
+                todo_id: Identifier of the todo to delete.
+                usecase: Use case responsible for deleting todos.
+
+            Returns:
+                Response: Empty response confirming the deletion.
+
+            Raises:
+                HTTPException: When the todo does not exist.
+            """
+            _id = TodoId(todo_id)
+            with todo_http_errors():
+                await usecase.execute(_id)
+
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    def _register_purge_completed_todos_route(self, app: FastAPI) -> None:
+        """Register the route that deletes old completed todos in bulk."""
+
+        @app.delete(
+            '/todos',
+            response_model=TodoPurgeResultSchema,
+            status_code=200,
+        )
+        async def purge_completed_todos(
+            query: Annotated[TodoPurgeQuerySchema, Query()],
+            usecase: AsyncPurgeCompletedTodosUseCase = Depends(
+                get_async_purge_completed_todos_usecase
+            ),
+        ) -> TodoPurgeResultSchema:
+            """Delete every todo completed before the cutoff.
+
+            Args:
+                query: Completion-time cutoff of the purge.
+                usecase: Use case responsible for purging todos.
+
+            Returns:
+                TodoPurgeResultSchema: Number of todos deleted.
+
+            Raises:
+                HTTPException: When an unexpected error occurs.
+            """
+            with todo_http_errors():
+                deleted = await usecase.execute(query.cutoff())
+
+            return TodoPurgeResultSchema(deleted=deleted)
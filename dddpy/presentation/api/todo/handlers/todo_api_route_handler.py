@@ -1,37 +1,101 @@
 """Controller for handling Todo-related HTTP requests."""
 
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends, FastAPI, HTTPException, status
-
-from dddpy.domain.todo.exceptions import (
-    TodoAlreadyCompletedError,
-    TodoAlreadyStartedError,
-    TodoNotFoundError,
-    TodoNotStartedError,
+from fastapi import (
+    Depends,
+    FastAPI,
+    Header,
+    Query,
+    Request,
+    Response,
+    status,
 )
-from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from dddpy.domain.todo.value_objects import TodoId
 from dddpy.infrastructure.di.injection import (
     get_complete_todo_usecase,
     get_create_todo_usecase,
+    get_delete_todo_usecase,
+    get_export_todos_usecase,
+    get_find_archived_todos_usecase,
     get_find_todo_by_id_usecase,
+    get_find_todo_stats_usecase,
+    get_find_todo_version_usecase,
     get_find_todos_usecase,
+    get_find_todos_version_usecase,
+    get_import_todos_usecase,
+    get_purge_completed_todos_usecase,
+    get_search_todos_usecase,
     get_start_todo_usecase,
     get_update_todo_usecase,
+    get_upsert_todos_usecase,
+    use_read_only_session,
+)
+from dddpy.presentation.api.todo.etags import (
+    etag_matches,
+    if_match_version,
+    not_modified,
+    todo_etag,
+    todo_list_etag,
+)
+from dddpy.presentation.api.todo.handlers.todo_route_support import (
+    CREATE_RESPONSES,
+    DELETE_RESPONSES,
+    EXPORT_RESPONSES,
+    IMPORT_REQUEST_BODY,
+    LIST_RESPONSES,
+    SEARCH_RESPONSES,
+    TODO_RESPONSES,
+    WRITE_RESPONSES,
+    export_headers,
+    import_ndjson,
+    parse_todo_fields,
+    render_todo,
+    render_todo_page,
+    render_versioned_todo,
+    set_next_cursor,
+    todo_http_errors,
+)
+from dddpy.presentation.api.todo.ndjson import (
+    NDJSON_MEDIA_TYPE,
+    todo_ndjson_chunks,
 )
-from dddpy.presentation.api.todo.error_messages import ErrorMessageTodoNotFound
 from dddpy.presentation.api.todo.schemas import (
+    TodoArchiveQuerySchema,
+    TodoBatchResultSchema,
+    TodoBatchSchema,
     TodoCreateSchema,
+    TodoImportResultSchema,
+    TodoListQuerySchema,
+    TodoPurgeQuerySchema,
+    TodoPurgeResultSchema,
     TodoSchema,
+    TodoSearchHitSchema,
+    TodoSearchQuerySchema,
+    TodoStatsSchema,
     TodoUpdateSchema,
 )
 from dddpy.usecase.todo import (
     CompleteTodoUseCase,
     CreateTodoUseCase,
+    DeleteTodoUseCase,
+    ExportTodosUseCase,
+    FindArchivedTodosUseCase,
     FindTodoByIdUseCase,
+    FindTodoStatsUseCase,
     FindTodosUseCase,
+    FindTodosVersionUseCase,
+    FindTodoVersionUseCase,
+    ImportTodosUseCase,
+    PurgeCompletedTodosUseCase,
+    SearchTodosUseCase,
     StartTodoUseCase,
     UpdateTodoUseCase,
+    UpsertTodosUseCase,
 )
 
 
@@ -45,89 +109,264 @@ class TodoApiRouteHandler:
             app: FastAPI instance that receives the todo routes.
         """
         self._register_get_todos_route(app)
+        # Registered before /todos/{todo_id} so "export", "search", "stats",
+        # and "archive" are not read as ids.
+        self._register_export_todos_route(app)
+        self._register_search_todos_route(app)
+        self._register_todo_stats_route(app)
+        self._register_archived_todos_route(app)
         self._register_get_todo_route(app)
         self._register_create_todo_route(app)
+        self._register_batch_todos_route(app)
+        self._register_import_todos_route(app)
         self._register_update_todo_route(app)
         self._register_start_todo_route(app)
         self._register_complete_todo_route(app)
-
-    @staticmethod
-    def _build_todo_description(description: str | None) -> TodoDescription | None:
-        """Convert an optional description string into a value object."""
-        return TodoDescription(description) if description else None
+        self._register_delete_todo_route(app)
+        self._register_purge_completed_todos_route(app)
 
     def _register_get_todos_route(self, app: FastAPI) -> None:
         """Register the route that returns all todos."""
 
         @app.get(
             '/todos',
+            dependencies=[Depends(use_read_only_session)],
             response_model=list[TodoSchema],
             status_code=200,
+            responses=LIST_RESPONSES,
         )
         def get_todos(
+            response: Response,
+            query: Annotated[TodoListQuerySchema, Query()],
+            if_none_match: str | None = Header(default=None),
+            version_usecase: FindTodosVersionUseCase = Depends(
+                get_find_todos_version_usecase
+            ),
             usecase: FindTodosUseCase = Depends(get_find_todos_usecase),
-        ) -> list[TodoSchema]:
-            """Return the latest todos.
+        ) -> list[TodoSchema] | Response:
+            """Return one page of todos, newest first.
 
             Args:
+                response: Response used to expose the next page cursor.
+                query: Page size, cursor, sort order, and filters of the
+                    requested page.
+                if_none_match: ETags of the page the client already holds.
+                version_usecase: Use case reading the todo list version.
                 usecase: Use case responsible for retrieving todos.
 
             Returns:
-                list[TodoSchema]: Serialized todos returned to the client.
+                list[TodoSchema] | Response: Serialized todos, or an empty 304
+                    response when the client's copy is current.
 
             Raises:
-                HTTPException: When the use case raises an unexpected error.
+                HTTPException: When the cursor is invalid or an unexpected error occurs.
+            """
+            with todo_http_errors():
+                version = version_usecase.execute()
+
+            todo_filter = query.to_filter()
+            etag = todo_list_etag(
+                version, query.limit, query.cursor, query.sort, todo_filter
+            )
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+            with todo_http_errors():
+                page = usecase.execute(
+                    limit=query.limit,
+                    cursor=query.cursor,
+                    sort_key=query.sort,
+                    todo_filter=todo_filter,
+                )
+
+            return render_todo_page(page.items, page.next_cursor, response, etag)
+
+    def _register_export_todos_route(self, app: FastAPI) -> None:
+        """Register the route that streams every todo as NDJSON."""
+
+        @app.get(
+            '/todos/export',
+            dependencies=[Depends(use_read_only_session)],
+            response_class=StreamingResponse,
+            responses=EXPORT_RESPONSES,
+        )
+        def export_todos(
+            gzip: bool = Query(default=False),
+            usecase: ExportTodosUseCase = Depends(get_export_todos_usecase),
+        ) -> StreamingResponse:
+            """Stream every todo, one JSON object per line.
+
+            Todos are read in batches over a server-side cursor and encoded as
+            they arrive, so memory stays flat regardless of the table size.
+
+            Args:
+                gzip: Whether to compress the body with gzip.
+                usecase: Use case streaming the todos.
+
+            Returns:
+                StreamingResponse: NDJSON body produced lazily.
+            """
+            return StreamingResponse(
+                todo_ndjson_chunks(usecase.execute(), compress=gzip),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers=export_headers(gzip),
+            )
+
+    def _register_search_todos_route(self, app: FastAPI) -> None:
+        """Register the route that searches todo titles and descriptions."""
+
+        @app.get(
+            '/todos/search',
+            dependencies=[Depends(use_read_only_session)],
+            response_model=list[TodoSearchHitSchema],
+            status_code=200,
+            responses=SEARCH_RESPONSES,
+        )
+        def search_todos(
+            response: Response,
+            query: Annotated[TodoSearchQuerySchema, Query()],
+            usecase: SearchTodosUseCase = Depends(get_search_todos_usecase),
+        ) -> list[TodoSearchHitSchema]:
+            """Return one page of todos matching the query, best match first.
+
+            Args:
+                response: Response used to expose the next page cursor.
+                query: Search text, page size, and cursor of the requested page.
+                usecase: Use case responsible for searching todos.
+
+            Returns:
+                list[TodoSearchHitSchema]: Matching todos with highlights.
+
+            Raises:
+                HTTPException: When the cursor is invalid or an unexpected error occurs.
+            """
+            with todo_http_errors():
+                page = usecase.execute(query.q, limit=query.limit, cursor=query.cursor)
+
+            set_next_cursor(response, page.next_cursor)
+            return [TodoSearchHitSchema.from_hit(hit) for hit in page.items]
+
+    def _register_todo_stats_route(self, app: FastAPI) -> None:
+        """Register the route that reports how many todos are in each status."""
+
+        @app.get(
+            '/todos/stats',
+            dependencies=[Depends(use_read_only_session)],
+            response_model=TodoStatsSchema,
+            status_code=200,
+        )
+        def get_todo_stats(
+            usecase: FindTodoStatsUseCase = Depends(get_find_todo_stats_usecase),
+        ) -> TodoStatsSchema:
+            """Return the number of todos in total and in each status.
+
+            The counts are maintained on every write, so reading them costs the
+            same however many todos exist.
+
+            Args:
+                usecase: Use case responsible for reading the counts.
+
+            Returns:
+                TodoStatsSchema: Counts per status and their sum.
+
+            Raises:
+                HTTPException: When an unexpected error occurs.
             """
-            try:
-                data = usecase.execute()
-                return [TodoSchema.from_entity(todo) for todo in data]
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                ) from e
+            with todo_http_errors():
+                counts = usecase.execute()
+
+            return TodoStatsSchema.from_counts(counts)
+
+    def _register_archived_todos_route(self, app: FastAPI) -> None:
+        """Register the route that browses archived todos."""
+
+        @app.get(
+            '/todos/archive',
+            dependencies=[Depends(use_read_only_session)],
+            response_model=list[TodoSchema],
+            status_code=200,
+            responses=SEARCH_RESPONSES,
+        )
+        def get_archived_todos(
+            response: Response,
+            query: Annotated[TodoArchiveQuerySchema, Query()],
+            usecase: FindArchivedTodosUseCase = Depends(
+                get_find_archived_todos_usecase
+            ),
+        ) -> list[TodoSchema] | Response:
+            """Return one page of archived todos, most recently completed first.
+
+            Archived todos are completed todos moved out of the todo table
+            after the retention period. They are still returned by
+            ``GET /todos/{todo_id}``, but not listed, searched, or counted.
+
+            Args:
+                response: Response used to expose the next page cursor.
+                query: Page size and cursor of the requested page.
+                usecase: Use case responsible for reading archived todos.
+
+            Returns:
+                list[TodoSchema] | Response: Serialized archived todos.
+
+            Raises:
+                HTTPException: When the cursor is invalid or an unexpected error occurs.
+            """
+            with todo_http_errors():
+                page = usecase.execute(limit=query.limit, cursor=query.cursor)
+
+            return render_todo_page(page.items, page.next_cursor, response)
 
     def _register_get_todo_route(self, app: FastAPI) -> None:
         """Register the route that returns a single todo."""
 
         @app.get(
             '/todos/{todo_id}',
+            dependencies=[Depends(use_read_only_session)],
             response_model=TodoSchema,
             status_code=200,
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    'model': ErrorMessageTodoNotFound,
-                },
-            },
+            responses=TODO_RESPONSES,
         )
         def get_todo(
             todo_id: UUID,
+            response: Response,
+            if_none_match: str | None = Header(default=None),
+            version_usecase: FindTodoVersionUseCase = Depends(
+                get_find_todo_version_usecase
+            ),
             usecase: FindTodoByIdUseCase = Depends(get_find_todo_by_id_usecase),
-        ) -> TodoSchema:
+        ) -> TodoSchema | Response:
             """Return a single todo by identifier.
 
+            When the client sends If-None-Match, only the todo's version is
+            read to decide whether a 304 is enough.
+
             Args:
                 todo_id: Identifier of the requested todo.
+                response: Response used to expose the ETag.
+                if_none_match: ETags of the todo the client already holds.
+                version_usecase: Use case reading the todo's version.
                 usecase: Use case responsible for todo retrieval.
 
             Returns:
-                TodoSchema: Serialized todo returned to the client.
+                TodoSchema | Response: Serialized todo, or an empty 304
+                    response when the client's copy is current.
 
             Raises:
                 HTTPException: When the todo is missing or an unexpected error occurs.
             """
             uuid = TodoId(todo_id)
-            try:
+            with todo_http_errors():
+                version = version_usecase.execute(uuid) if if_none_match else None
+
+            if version is not None:
+                etag = todo_etag(version)
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
+            with todo_http_errors():
                 todo = usecase.execute(uuid)
-            except TodoNotFoundError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=e.message,
-                ) from e
-            except Exception as exc:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                ) from exc
-            return TodoSchema.from_entity(todo)
+
+            return render_versioned_todo(todo, response)
 
     def _register_create_todo_route(self, app: FastAPI) -> None:
         """Register the route that creates a todo."""
@@ -136,14 +375,12 @@ class TodoApiRouteHandler:
             '/todos',
             response_model=TodoSchema,
             status_code=201,
-            responses={
-                status.HTTP_400_BAD_REQUEST: {},
-            },
+            responses=CREATE_RESPONSES,
         )
         def create_todo(
             data: TodoCreateSchema,
             usecase: CreateTodoUseCase = Depends(get_create_todo_usecase),
-        ) -> TodoSchema:
+        ) -> TodoSchema | Response:
             """Create a todo from the request payload.
 
             Args:
@@ -151,28 +388,81 @@ class TodoApiRouteHandler:
                 usecase: Use case responsible for creating todos.
 
             Returns:
-                TodoSchema: Serialized todo returned to the client.
+                TodoSchema | Response: Serialized todo returned to the client.
 
             Raises:
                 HTTPException: When validation or use case execution fails.
             """
-            try:
-                title = TodoTitle(data.title)
-                description = self._build_todo_description(data.description)
-            except ValueError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=str(e),
-                ) from e
-
-            try:
+            title, description = parse_todo_fields(data.title, data.description)
+
+            with todo_http_errors():
                 todo = usecase.execute(title, description)
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                ) from e
 
-            return TodoSchema.from_entity(todo)
+            return render_todo(todo, status_code=status.HTTP_201_CREATED)
+
+    def _register_batch_todos_route(self, app: FastAPI) -> None:
+        """Register the route that creates or updates todos in bulk."""
+
+        @app.post(
+            '/todos/batch',
+            response_model=TodoBatchResultSchema,
+            status_code=200,
+        )
+        def batch_todos(
+            data: TodoBatchSchema,
+            usecase: UpsertTodosUseCase = Depends(get_upsert_todos_usecase),
+        ) -> TodoBatchResultSchema:
+            """Create or update many todos in a single request.
+
+            Items with an id update the existing todo; items without one are
+            created. Invalid or unknown items, and todos changed by another
+            request since they were read, are reported per item.
+
+            Args:
+                data: Payload containing the todos to create or update.
+                usecase: Use case responsible for bulk upserts.
+
+            Returns:
+                TodoBatchResultSchema: Per-item results returned to the client.
+
+            Raises:
+                HTTPException: When the use case raises an unexpected error.
+            """
+            with todo_http_errors():
+                results = usecase.execute(data.to_items())
+
+            return TodoBatchResultSchema.from_results(results)
+
+    def _register_import_todos_route(self, app: FastAPI) -> None:
+        """Register the route that imports todos from an NDJSON body."""
+
+        @app.post(
+            '/todos/import',
+            response_model=TodoImportResultSchema,
+            status_code=200,
+            openapi_extra=IMPORT_REQUEST_BODY,
+        )
+        async def import_todos(
+            request: Request,
+            usecase: ImportTodosUseCase = Depends(get_import_todos_usecase),
+        ) -> TodoImportResultSchema:
+            """Create todos from an NDJSON body, one JSON object per line.
+
+            The body is read incrementally, so this route is a coroutine even
+            on the synchronous stack; each chunk is stored on a worker thread.
+
+            Args:
+                request: Request whose body is streamed.
+                usecase: Use case validating and storing each chunk.
+
+            Returns:
+                TodoImportResultSchema: Accepted and rejected counts, and the
+                    reasons for the first rejected lines.
+            """
+            return await import_ndjson(
+                request.stream(),
+                lambda lines: run_in_threadpool(usecase.execute, lines),
+            )
 
     def _register_update_todo_route(self, app: FastAPI) -> None:
         """Register the route that updates an existing todo."""
@@ -181,54 +471,43 @@ class TodoApiRouteHandler:
             '/todos/{todo_id}',
             response_model=TodoSchema,
             status_code=200,
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    'model': ErrorMessageTodoNotFound,
-                },
-            },
+            responses=WRITE_RESPONSES,
         )
         def update_todo(
             todo_id: UUID,
+            response: Response,
             data: TodoUpdateSchema,
+            if_match: str | None = Header(default=None),
             usecase: UpdateTodoUseCase = Depends(get_update_todo_usecase),
-        ) -> TodoSchema:
+        ) -> TodoSchema | Response:
             """Update a todo identified by the path parameter.
 
             Args:
                 todo_id: Identifier of the todo to update.
+                response: Response used to expose the ETag.
                 data: Payload containing fields to update.
+                if_match: ETag of the version the client edited, if any.
                 usecase: Use case responsible for updating todos.
 
             Returns:
-                TodoSchema: Serialized todo returned to the client.
+                TodoSchema | Response: Serialized todo returned to the client.
 
             Raises:
                 HTTPException: When validation fails or the todo cannot be updated.
             """
             _id = TodoId(todo_id)
 
-            try:
-                title = TodoTitle(data.title)
-                description = self._build_todo_description(data.description)
-            except ValueError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=str(e),
-                ) from e
-
-            try:
-                todo = usecase.execute(_id, title, description)
-            except TodoNotFoundError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=e.message,
-                ) from e
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                ) from e
-
-            return TodoSchema.from_entity(todo)
+            title, description = parse_todo_fields(data.title, data.description)
+
+            with todo_http_errors():
+                todo = usecase.execute(
+                    _id,
+                    title,
+                    description,
+                    expected_version=if_match_version(if_match),
+                )
+
+            return render_versioned_todo(todo, response)
 
     def _register_start_todo_route(self, app: FastAPI) -> None:
         """Register the route that starts a todo."""
@@ -237,52 +516,31 @@ class TodoApiRouteHandler:
             '/todos/{todo_id}/start',
             response_model=TodoSchema,
             status_code=200,
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    'model': ErrorMessageTodoNotFound,
-                },
-            },
+            responses=WRITE_RESPONSES,
         )
         def start_todo(
             todo_id: UUID,
+            response: Response,
             usecase: StartTodoUseCase = Depends(get_start_todo_usecase),
-        ) -> TodoSchema:
+        ) -> TodoSchema | Response:
             """Start a todo via the corresponding use case.
 
             Args:
                 todo_id: Identifier of the todo to start.
+                response: Response used to expose the ETag.
                 usecase: Use case responsible for starting todos.
 
             Returns:
-                TodoSchema: Serialized todo returned to the client.
+                TodoSchema | Response: Serialized todo returned to the client.
 
             Raises:
                 HTTPException: When lifecycle rules prevent the transition.
             """
             _id = TodoId(todo_id)
-            try:
+            with todo_http_errors():
                 todo = usecase.execute(_id)
-            except TodoNotFoundError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=e.message,
-                ) from e
-            except TodoAlreadyStartedError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=e.message,
-                ) from e
-            except TodoAlreadyCompletedError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=e.message,
-                ) from e
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                ) from e
-
-            return TodoSchema.from_entity(todo)
+
+            return render_versioned_todo(todo, response)
 
     def _register_complete_todo_route(self, app: FastAPI) -> None:
         """Register the route that completes a todo."""
@@ -291,49 +549,94 @@ class TodoApiRouteHandler:
             '/todos/{todo_id}/complete',
             response_model=TodoSchema,
             status_code=200,
-            responses={
-                status.HTTP_404_NOT_FOUND: {
-                    'model': ErrorMessageTodoNotFound,
-                },
-            },
+            responses=WRITE_RESPONSES,
         )
         def complete_todo(
             todo_id: UUID,
+            response: Response,
             usecase: CompleteTodoUseCase = Depends(get_complete_todo_usecase),
-        ) -> TodoSchema:
+        ) -> TodoSchema | Response:
             """Complete a todo via the corresponding use case.
 
             Args:
                 todo_id: Identifier of the todo to complete.
+                response: Response used to expose the ETag.
                 usecase: Use case responsible for completing todos.
 
             Returns:
-                TodoSchema: Serialized todo returned to the client.
+                TodoSchema | Response: Serialized todo returned to the client.
 
             Raises:
                 HTTPException: When lifecycle rules prevent completion.
             """
             _id = TodoId(todo_id)
-            try:
+            with todo_http_errors():
                 todo = usecase.execute(_id)
-            except TodoNotFoundError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=e.message,
-                ) from e
-            except TodoNotStartedError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=e.message,
-                ) from e
-            except TodoAlreadyCompletedError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=e.message,
-                ) from e
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                ) from e
-
-            return TodoSchema.from_entity(todo)
+
+            return render_versioned_todo(todo, response)
+
+    def _register_delete_todo_route(self, app: FastAPI) -> None:
+        """Register the route that deletes a todo."""
+
+        @app.delete(
+            '/todos/{todo_id}',
+            status_code=204,
+            responses=DELETE_RESPONSES,
+        )
+        def delete_todo(
+            todo_id: UUID,
+            usecase: DeleteTodoUseCase = Depends(get_delete_todo_usecase),
+        ) -> Response:
+            """Delete a todo via the corresponding use case.
+
+            Args:
+                todo_id: Identifier of the todo to delete.
+                usecase: Use case responsible for deleting todos.
+
+            Returns:
+                Response: Empty response confirming the deletion.
+
+            Raises:
+                HTTPException: When the todo does not exist.
+            """
+            _id = TodoId(todo_id)
+            with todo_http_errors():
+                usecase.execute(_id)
+
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    def _register_purge_completed_todos_route(self, app: FastAPI) -> None:
+        """Register the route that deletes old completed todos in bulk."""
+
+        @app.delete(
+            '/todos',
+            response_model=TodoPurgeResultSchema,
+            status_code=200,
+        )
+        def purge_completed_todos(
+            query: Annotated[TodoPurgeQuerySchema, Query()],
+            usecase: PurgeCompletedTodosUseCase = Depends(
+                get_purge_completed_todos_usecase
+            ),
+        ) -> TodoPurgeResultSchema:
+            """Delete every todo completed before the cutoff.
+
+            The todos are deleted and committed in bounded chunks, so other
+            writers are never blocked for the whole purge. If the purge
+            fails part way, the chunks already committed stay deleted and
+            the request can simply be repeated.
+
+            Args:
+                query: Completion-time cutoff of the purge.
+                usecase: Use case responsible for purging todos.
+
+            Returns:
+                TodoPurgeResultSchema: Number of todos deleted.
+
+            Raises:
+                HTTPException: When an unexpected error occurs.
+            """
+            with todo_http_errors():
+                deleted = usecase.execute(query.cutoff())
+
+            return TodoPurgeResultSchema(deleted=deleted)
@@ -0,0 +1,291 @@
+"""Share route metadata, error mapping, and rendering between todo handlers.
+
+The synchronous and async handlers differ only in how they call their use
+cases; everything a route does before and after that call lives here.
+"""
+
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from fastapi import HTTPException, Response, status
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import (
+    TodoAlreadyCompletedError,
+    TodoAlreadyStartedError,
+    TodoConflictError,
+    TodoInvalidCursorError,
+    TodoInvalidFilterError,
+    TodoNotFoundError,
+    TodoNotStartedError,
+)
+from dddpy.domain.todo.value_objects import TodoDescription, TodoTitle
+from dddpy.infrastructure.settings import settings
+from dddpy.presentation.api.todo.error_messages import (
+    ErrorMessageTodoConflict,
+    ErrorMessageTodoInvalidCursor,
+    ErrorMessageTodoInvalidFilter,
+    ErrorMessageTodoNotFound,
+)
+from dddpy.presentation.api.todo.etags import ETAG_HEADER, todo_etag
+from dddpy.presentation.api.todo.ndjson import NDJSON_MEDIA_TYPE, import_line_chunks
+from dddpy.presentation.api.todo.schemas import TodoImportResultSchema, TodoSchema
+from dddpy.presentation.api.todo.todo_json import (
+    encode_todo,
+    encode_todos,
+    json_response,
+)
+from dddpy.usecase.todo import IMPORT_CHUNK_SIZE, TodoImportLine, TodoImportResult
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+_NEXT_CURSOR_HEADER_DOC = {
+    'description': 'Cursor for the next page; absent on the last page.',
+    'schema': {'type': 'string'},
+}
+
+LIST_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        'headers': {
+            NEXT_CURSOR_HEADER: _NEXT_CURSOR_HEADER_DOC,
+            ETAG_HEADER: {
+                'description': 'Version of this page of the list.',
+                'schema': {'type': 'string'},
+            },
+        },
+    },
+    status.HTTP_304_NOT_MODIFIED: {
+        'description': 'The page matches the If-None-Match ETag.',
+    },
+    status.HTTP_400_BAD_REQUEST: {
+        'model': ErrorMessageTodoInvalidCursor | ErrorMessageTodoInvalidFilter,
+    },
+}
+SEARCH_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        'headers': {NEXT_CURSOR_HEADER: _NEXT_CURSOR_HEADER_DOC},
+    },
+    status.HTTP_400_BAD_REQUEST: {
+        'model': ErrorMessageTodoInvalidCursor,
+    },
+}
+TODO_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        'headers': {
+            ETAG_HEADER: {
+                'description': 'Version of the todo.',
+                'schema': {'type': 'string'},
+            },
+        },
+    },
+    status.HTTP_304_NOT_MODIFIED: {
+        'description': 'The todo matches the If-None-Match ETag.',
+    },
+    status.HTTP_404_NOT_FOUND: {
+        'model': ErrorMessageTodoNotFound,
+    },
+}
+CREATE_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_400_BAD_REQUEST: {},
+}
+WRITE_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_404_NOT_FOUND: {
+        'model': ErrorMessageTodoNotFound,
+    },
+    status.HTTP_409_CONFLICT: {
+        'model': ErrorMessageTodoConflict,
+    },
+}
+DELETE_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_404_NOT_FOUND: {
+        'model': ErrorMessageTodoNotFound,
+    },
+}
+EXPORT_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        'description': 'Every todo as newline-delimited JSON.',
+        'content': {NDJSON_MEDIA_TYPE: {}},
+    },
+}
+IMPORT_REQUEST_BODY: dict[str, Any] = {
+    'requestBody': {
+        'required': True,
+        'content': {
+            NDJSON_MEDIA_TYPE: {
+                'schema': {'type': 'string'},
+                'example': '{"title": "Write report", "description": "Q3"}\n',
+            },
+        },
+    },
+}
+
+ERROR_STATUS_CODES: dict[type[Exception], int] = {
+    TodoNotFoundError: status.HTTP_404_NOT_FOUND,
+    TodoInvalidCursorError: status.HTTP_400_BAD_REQUEST,
+    TodoInvalidFilterError: status.HTTP_400_BAD_REQUEST,
+    TodoAlreadyStartedError: status.HTTP_400_BAD_REQUEST,
+    TodoNotStartedError: status.HTTP_400_BAD_REQUEST,
+    TodoAlreadyCompletedError: status.HTTP_400_BAD_REQUEST,
+    TodoConflictError: status.HTTP_409_CONFLICT,
+}
+_KNOWN_ERRORS = tuple(ERROR_STATUS_CODES)
+
+
+@contextmanager
+def todo_http_errors() -> Iterator[None]:
+    """Translate errors raised by todo use cases into HTTP errors.
+
+    Domain errors listed in ``ERROR_STATUS_CODES`` keep their message; any
+    other error becomes a 500 without details.
+
+    Raises:
+        HTTPException: When the wrapped block raises.
+    """
+    try:
+        yield
+    except HTTPException:
+        raise
+    except _KNOWN_ERRORS as e:
+        raise HTTPException(
+            status_code=ERROR_STATUS_CODES[type(e)],
+            detail=getattr(e, 'message', str(e)),
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        ) from e
+
+
+def parse_todo_fields(
+    title: str, description: str | None
+) -> tuple[TodoTitle, TodoDescription | None]:
+    """Build the value objects of a todo payload.
+
+    Args:
+        title: Raw title from the payload.
+        description: Raw description from the payload, if any.
+
+    Raises:
+        HTTPException: When a value breaks a domain rule.
+
+    Returns:
+        tuple[TodoTitle, TodoDescription | None]: Validated title and
+            description; an empty description becomes None.
+    """
+    try:
+        return TodoTitle(title), TodoDescription(description) if description else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
+def render_todo(
+    todo: Todo,
+    response: Response | None = None,
+    status_code: int = status.HTTP_200_OK,
+) -> TodoSchema | Response:
+    """Serialize one todo, bypassing the response model when fast JSON is on.
+
+    Args:
+        todo: Todo to return.
+        response: Injected response whose headers must be kept, if any.
+        status_code: Status used for the raw response; the route's default
+            applies otherwise.
+
+    Returns:
+        TodoSchema | Response: Schema validated by FastAPI, or pre-encoded
+            JSON sent as is.
+    """
+    if not settings.fast_json:
+        return TodoSchema.from_entity(todo)
+    headers = response.headers if response is not None else None
+    return json_response(encode_todo(todo), status_code, headers)
+
+
+def render_versioned_todo(todo: Todo, response: Response) -> TodoSchema | Response:
+    """Serialize one todo like ``render_todo`` and expose its version as ETag.
+
+    Args:
+        todo: Todo to return.
+        response: Injected response receiving the ETag header.
+
+    Returns:
+        TodoSchema | Response: Serialized todo.
+    """
+    response.headers[ETAG_HEADER] = todo_etag(todo.version)
+    return render_todo(todo, response)
+
+
+def render_todo_page(
+    todos: list[Todo],
+    next_cursor: str | None,
+    response: Response,
+    etag: str | None = None,
+) -> list[TodoSchema] | Response:
+    """Serialize one page of todos, in one encoder call when fast JSON is on.
+
+    Args:
+        todos: Todos of the page.
+        next_cursor: Cursor of the next page; None on the last page.
+        response: Injected response receiving the page headers.
+        etag: Entity tag of the page, if the route issues one.
+
+    Returns:
+        list[TodoSchema] | Response: Schemas validated by FastAPI, or
+            pre-encoded JSON sent as is.
+    """
+    set_next_cursor(response, next_cursor)
+    if etag is not None:
+        response.headers[ETAG_HEADER] = etag
+    if not settings.fast_json:
+        return [TodoSchema.from_entity(todo) for todo in todos]
+    return json_response(encode_todos(todos), headers=response.headers)
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    """Expose the cursor of the next page unless this page is the last.
+
+    Args:
+        response: Injected response receiving the header.
+        next_cursor: Cursor of the next page, if any.
+    """
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+def export_headers(gzip: bool) -> dict[str, str] | None:
+    """Return the headers announcing a gzip-compressed export body.
+
+    Args:
+        gzip: Whether the body is compressed.
+
+    Returns:
+        dict[str, str] | None: Extra response headers, if any.
+    """
+    return {'Content-Encoding': 'gzip'} if gzip else None
+
+
+async def import_ndjson(
+    body: AsyncIterable[bytes],
+    import_chunk: Callable[[list[TodoImportLine]], Awaitable[TodoImportResult]],
+) -> TodoImportResultSchema:
+    """Feed the body to the use case chunk by chunk and total the results.
+
+    Args:
+        body: Request body as it arrives.
+        import_chunk: Stores one chunk of parsed lines.
+
+    Raises:
+        HTTPException: When a chunk cannot be stored. Earlier chunks stay
+            committed.
+
+    Returns:
+        TodoImportResultSchema: Accepted and rejected counts of every chunk.
+    """
+    summary = TodoImportResultSchema()
+    with todo_http_errors():
+        async for lines in import_line_chunks(body, IMPORT_CHUNK_SIZE):
+            summary.add(await import_chunk(lines))
+    return summary
@@ -0,0 +1,133 @@
+"""Encode and split newline-delimited JSON for todo export and import."""
+
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from itertools import islice
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.presentation.api.todo.schemas import TodoSchema
+from dddpy.usecase.todo import MAX_IMPORT_LINE_BYTES, TodoImportLine
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+# Todos encoded into each chunk handed to the server, bounding memory per write.
+NDJSON_CHUNK_SIZE = 1000
+# zlib window bits that select a gzip container instead of a raw deflate one.
+GZIP_WBITS = 31
+# Bytes of import lines buffered before a chunk is handed on, however few
+# lines it holds, so a chunk of long lines stays small in memory.
+IMPORT_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+class _NdjsonEncoder:
+    """Encode batches of todos as NDJSON, optionally gzip-compressed."""
+
+    def __init__(self, compress: bool):
+        """Create the optional streaming compressor."""
+        self._compressor = zlib.compressobj(wbits=GZIP_WBITS) if compress else None
+
+    def encode(self, todos: list[Todo]) -> bytes:
+        """Return the bytes for one batch; may be empty while compressing."""
+        data = ''.join(
+            TodoSchema.from_entity(todo).model_dump_json() + '\n' for todo in todos
+        ).encode()
+        return self._compressor.compress(data) if self._compressor else data
+
+    def finish(self) -> bytes:
+        """Return whatever the compressor still buffers."""
+        return self._compressor.flush() if self._compressor else b''
+
+
+def todo_ndjson_chunks(
+    todos: Iterable[Todo], compress: bool = False
+) -> Iterator[bytes]:
+    """Encode todos as NDJSON, one chunk per ``NDJSON_CHUNK_SIZE`` todos.
+
+    Args:
+        todos: Todos to encode, consumed lazily.
+        compress: Whether to wrap the stream in a gzip container.
+
+    Yields:
+        bytes: Non-empty pieces of the response body.
+    """
+    encoder = _NdjsonEncoder(compress)
+    iterator = iter(todos)
+    while batch := list(islice(iterator, NDJSON_CHUNK_SIZE)):
+        if chunk := encoder.encode(batch):
+            yield chunk
+    if tail := encoder.finish():
+        yield tail
+
+
+async def async_todo_ndjson_chunks(
+    todos: AsyncIterable[Todo], compress: bool = False
+) -> AsyncIterator[bytes]:
+    """Encode an async stream of todos like ``todo_ndjson_chunks``.
+
+    Args:
+        todos: Todos to encode, consumed lazily.
+        compress: Whether to wrap the stream in a gzip container.
+
+    Yields:
+        bytes: Non-empty pieces of the response body.
+    """
+    encoder = _NdjsonEncoder(compress)
+    batch: list[Todo] = []
+    async for todo in todos:
+        batch.append(todo)
+        if len(batch) == NDJSON_CHUNK_SIZE:
+            if chunk := encoder.encode(batch):
+                yield chunk
+            batch = []
+    if batch and (chunk := encoder.encode(batch)):
+        yield chunk
+    if tail := encoder.finish():
+        yield tail
+
+
+async def import_line_chunks(
+    stream: AsyncIterable[bytes],
+    chunk_size: int,
+    max_line_bytes: int = MAX_IMPORT_LINE_BYTES,
+    max_chunk_bytes: int = IMPORT_CHUNK_BYTES,
+) -> AsyncIterator[list[TodoImportLine]]:
+    """Split a request body into chunks of numbered NDJSON lines.
+
+    Only the current partial line and one chunk are buffered, so the upload
+    is never held in memory as a whole; a chunk is handed on once it holds
+    ``chunk_size`` lines or ``max_chunk_bytes`` bytes. A line is kept up to one byte past
+    ``max_line_bytes`` and the rest of it is dropped up to the next newline,
+    so an oversize line costs bounded memory and is still handed on, and
+    rejected, as a line of its own. Blank lines are skipped but still
+    counted, keeping line numbers aligned with the uploaded file.
+
+    Args:
+        stream: Request body as it arrives from the client.
+        chunk_size: Number of lines per chunk.
+        max_line_bytes: Longest line the use case accepts.
+        max_chunk_bytes: Bytes of lines after which a chunk is handed on.
+
+    Yields:
+        list[TodoImportLine]: Up to ``chunk_size`` non-blank lines.
+    """
+    kept = max_line_bytes + 1
+    pending = bytearray()
+    number = 0
+    chunk: list[TodoImportLine] = []
+    chunk_bytes = 0
+    async for data in stream:
+        *complete, tail = data.split(b'\n')
+        for piece in complete:
+            number += 1
+            pending += piece[: max(kept - len(pending), 0)]
+            if pending.strip():
+                chunk.append(TodoImportLine(number, bytes(pending)))
+                chunk_bytes += len(pending)
+            pending.clear()
+            if len(chunk) >= chunk_size or chunk_bytes >= max_chunk_bytes:
+                yield chunk
+                chunk, chunk_bytes = [], 0
+        pending += tail[: max(kept - len(pending), 0)]
+    if pending.strip():
+        chunk.append(TodoImportLine(number + 1, bytes(pending)))
+    if chunk:
+        yield chunk
@@ -2,8 +2,33 @@
 
 from __future__ import annotations
 
+from .todo_archive_query_schema import TodoArchiveQuerySchema
+from .todo_batch_result_schema import TodoBatchItemResultSchema, TodoBatchResultSchema
+from .todo_batch_schema import TodoBatchItemSchema, TodoBatchSchema
 from .todo_create_schema import TodoCreateSchema
+from .todo_import_result_schema import TodoImportErrorSchema, TodoImportResultSchema
+from .todo_list_query_schema import TodoListQuerySchema
+from .todo_purge_schema import TodoPurgeQuerySchema, TodoPurgeResultSchema
 from .todo_schema import TodoSchema
+from .todo_search_schema import TodoSearchHitSchema, TodoSearchQuerySchema
+from .todo_stats_schema import TodoStatsSchema
 from .todo_update_schema import TodoUpdateSchema
 
-__all__ = ('TodoCreateSchema', 'TodoSchema', 'TodoUpdateSchema')
+__all__ = (
+    'TodoArchiveQuerySchema',
+    'TodoBatchItemResultSchema',
+    'TodoBatchItemSchema',
+    'TodoBatchResultSchema',
+    'TodoBatchSchema',
+    'TodoCreateSchema',
+    'TodoImportErrorSchema',
+    'TodoImportResultSchema',
+    'TodoListQuerySchema',
+    'TodoPurgeQuerySchema',
+    'TodoPurgeResultSchema',
+    'TodoSchema',
+    'TodoSearchHitSchema',
+    'TodoSearchQuerySchema',
+    'TodoStatsSchema',
+    'TodoUpdateSchema',
+)
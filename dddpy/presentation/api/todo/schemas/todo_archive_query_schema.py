@@ -0,0 +1,15 @@
+"""Expose the query parameters accepted by the archived todo endpoint."""
+
+from pydantic import BaseModel, Field
+
+from dddpy.domain.todo.repositories import DEFAULT_TODO_PAGE_SIZE, MAX_TODO_PAGE_SIZE
+
+
+class TodoArchiveQuerySchema(BaseModel):
+    """Represent the paging parameters of ``GET /todos/archive``."""
+
+    limit: int = Field(default=DEFAULT_TODO_PAGE_SIZE, ge=1, le=MAX_TODO_PAGE_SIZE)
+    cursor: str | None = Field(
+        default=None,
+        description="Cursor from the previous page's X-Next-Cursor header.",
+    )
@@ -0,0 +1,60 @@
+"""Expose response schemas for bulk todo requests."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from dddpy.presentation.api.todo.schemas.todo_schema import TodoSchema
+from dddpy.usecase.todo import TodoUpsertResult
+
+
+class TodoBatchItemResultSchema(BaseModel):
+    """Represent the outcome of one item in a bulk request."""
+
+    status: Literal['created', 'updated', 'error'] = Field(examples=['created'])
+    todo: TodoSchema | None = None
+    error: str | None = Field(default=None, examples=['Title is required'])
+
+    @staticmethod
+    def from_result(result: TodoUpsertResult) -> 'TodoBatchItemResultSchema':
+        """Build a schema instance from a use case result.
+
+        Args:
+            result: Outcome reported by the use case.
+
+        Returns:
+            TodoBatchItemResultSchema: Pydantic model ready for serialization.
+        """
+        if result.todo is None:
+            return TodoBatchItemResultSchema(status='error', error=result.error)
+        return TodoBatchItemResultSchema(
+            status='created' if result.created else 'updated',
+            todo=TodoSchema.from_entity(result.todo),
+        )
+
+
+class TodoBatchResultSchema(BaseModel):
+    """Represent the per-item results of a bulk request."""
+
+    items: list[TodoBatchItemResultSchema]
+    created: int = Field(examples=[2])
+    updated: int = Field(examples=[1])
+    failed: int = Field(examples=[0])
+
+    @staticmethod
+    def from_results(results: list[TodoUpsertResult]) -> 'TodoBatchResultSchema':
+        """Build a schema instance from the use case results.
+
+        Args:
+            results: Outcomes reported by the use case, in input order.
+
+        Returns:
+            TodoBatchResultSchema: Pydantic model ready for serialization.
+        """
+        items = [TodoBatchItemResultSchema.from_result(result) for result in results]
+        return TodoBatchResultSchema(
+            items=items,
+            created=sum(item.status == 'created' for item in items),
+            updated=sum(item.status == 'updated' for item in items),
+            failed=sum(item.status == 'error' for item in items),
+        )
@@ -0,0 +1,49 @@
+"""Define request schemas for creating and updating todos in bulk."""
+
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from dddpy.domain.todo.value_objects import TodoId
+from dddpy.usecase.todo import TodoUpsertItem
+
+MAX_BATCH_ITEMS = 1000
+
+
+class TodoBatchItemSchema(BaseModel):
+    """Describe one todo to create, or to update when an id is given.
+
+    Lengths are checked per item by the domain so that one invalid item does
+    not reject the whole batch.
+    """
+
+    id: UUID | None = Field(
+        default=None, examples=['123e4567-e89b-12d3-a456-426614174000']
+    )
+    title: str = Field(examples=['Complete the project'])
+    description: str | None = Field(
+        default=None,
+        description='Omit to keep the stored description; an empty string clears it.',
+        examples=['Finish implementing the DDD architecture'],
+    )
+
+
+class TodoBatchSchema(BaseModel):
+    """Validate the payload for a bulk create or update request."""
+
+    items: list[TodoBatchItemSchema] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+    def to_items(self) -> list[TodoUpsertItem]:
+        """Build the use case items of the batch, in request order.
+
+        Returns:
+            list[TodoUpsertItem]: One item per todo to create or update.
+        """
+        return [
+            TodoUpsertItem(
+                title=item.title,
+                description=item.description,
+                todo_id=TodoId(item.id) if item.id else None,
+            )
+            for item in self.items
+        ]
@@ -0,0 +1,40 @@
+"""Expose response schemas for NDJSON todo imports."""
+
+from pydantic import BaseModel, Field
+
+from dddpy.usecase.todo import TodoImportResult
+
+# Caps the response size for uploads with many bad lines; counts stay exact.
+MAX_REPORTED_IMPORT_ERRORS = 1000
+
+
+class TodoImportErrorSchema(BaseModel):
+    """Represent why one line of an import was rejected."""
+
+    line: int = Field(examples=[3])
+    error: str = Field(examples=['Title is required'])
+
+
+class TodoImportResultSchema(BaseModel):
+    """Represent the outcome of an NDJSON import."""
+
+    accepted: int = Field(default=0, examples=[9998])
+    rejected: int = Field(default=0, examples=[2])
+    errors: list[TodoImportErrorSchema] = Field(
+        default_factory=list,
+        description=f'The first {MAX_REPORTED_IMPORT_ERRORS} rejected lines.',
+    )
+
+    def add(self, result: TodoImportResult) -> None:
+        """Fold the result of one imported chunk into the totals.
+
+        Args:
+            result: Outcome reported by the use case for one chunk.
+        """
+        self.accepted += result.accepted
+        self.rejected += result.rejected
+        room = MAX_REPORTED_IMPORT_ERRORS - len(self.errors)
+        self.errors.extend(
+            TodoImportErrorSchema(line=error.line, error=error.error)
+            for error in result.errors[:room]
+        )
@@ -0,0 +1,102 @@
+"""Expose the query parameters accepted by the todo list endpoint."""
+
+from datetime import UTC, datetime, timedelta
+
+from pydantic import BaseModel, Field
+
+from dddpy.domain.todo.repositories import (
+    DEFAULT_TODO_PAGE_SIZE,
+    MAX_TODO_PAGE_SIZE,
+    TodoFilter,
+)
+from dddpy.domain.todo.value_objects import TodoSortKey, TodoStatus
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+# Latest epoch-millisecond time a datetime can hold; query bounds past it
+# are rejected during validation instead of overflowing on conversion.
+MAX_EPOCH_MS = (datetime.max.replace(tzinfo=UTC) - EPOCH) // timedelta(milliseconds=1)
+
+
+def from_epoch_ms(value: int) -> datetime:
+    """Convert a validated epoch-millisecond bound to an exact datetime.
+
+    Args:
+        value: Milliseconds since the Unix epoch, at most ``MAX_EPOCH_MS``.
+
+    Returns:
+        datetime: UTC timestamp.
+    """
+    return EPOCH + timedelta(milliseconds=value)
+
+
+def _from_optional_epoch_ms(value: int | None) -> datetime | None:
+    """Convert an optional epoch-millisecond bound like ``from_epoch_ms``."""
+    return from_epoch_ms(value) if value is not None else None
+
+
+class TodoListQuerySchema(BaseModel):
+    """Represent the paging, sorting, and filtering parameters of ``GET /todos``."""
+
+    limit: int = Field(default=DEFAULT_TODO_PAGE_SIZE, ge=1, le=MAX_TODO_PAGE_SIZE)
+    cursor: str | None = Field(
+        default=None,
+        description="Cursor from the previous page's X-Next-Cursor header.",
+    )
+    sort: TodoSortKey = Field(default=TodoSortKey.CREATED_AT)
+    status: list[TodoStatus] = Field(
+        default_factory=list,
+        description='Only list todos in these statuses; repeat to allow several.',
+    )
+    created_after: int | None = Field(
+        default=None,
+        ge=0,
+        le=MAX_EPOCH_MS,
+        description=(
+            'Only list todos created after this epoch-millisecond time; '
+            'requires sort=created_at.'
+        ),
+    )
+    created_before: int | None = Field(
+        default=None,
+        ge=0,
+        le=MAX_EPOCH_MS,
+        description=(
+            'Only list todos created before this epoch-millisecond time; '
+            'requires sort=created_at.'
+        ),
+    )
+    updated_after: int | None = Field(
+        default=None,
+        ge=0,
+        le=MAX_EPOCH_MS,
+        description=(
+            'Only list todos updated after this epoch-millisecond time; '
+            'requires sort=updated_at.'
+        ),
+    )
+    updated_before: int | None = Field(
+        default=None,
+        ge=0,
+        le=MAX_EPOCH_MS,
+        description=(
+            'Only list todos updated before this epoch-millisecond time; '
+            'requires sort=updated_at.'
+        ),
+    )
+
+    def to_filter(self) -> TodoFilter:
+        """Build the repository filter selected by the query.
+
+        Statuses are deduplicated and sorted, so equivalent queries produce
+        equal filters.
+
+        Returns:
+            TodoFilter: Criteria the listed todos must meet.
+        """
+        return TodoFilter(
+            statuses=tuple(sorted(set(self.status), key=lambda status: status.value)),
+            created_after=_from_optional_epoch_ms(self.created_after),
+            created_before=_from_optional_epoch_ms(self.created_before),
+            updated_after=_from_optional_epoch_ms(self.updated_after),
+            updated_before=_from_optional_epoch_ms(self.updated_before),
+        )
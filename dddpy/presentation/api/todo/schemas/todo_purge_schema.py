@@ -0,0 +1,35 @@
+"""Expose the query parameters and result of the completed todo purge."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from dddpy.presentation.api.todo.schemas.todo_list_query_schema import (
+    MAX_EPOCH_MS,
+    from_epoch_ms,
+)
+
+
+class TodoPurgeQuerySchema(BaseModel):
+    """Represent the cutoff of ``DELETE /todos``."""
+
+    completed_before: int = Field(
+        ge=0,
+        le=MAX_EPOCH_MS,
+        description='Delete todos completed before this epoch-millisecond time.',
+        examples=[1735689600000],
+    )
+
+    def cutoff(self) -> datetime:
+        """Return the cutoff as an exact datetime.
+
+        Returns:
+            datetime: Exclusive upper bound on the completion time.
+        """
+        return from_epoch_ms(self.completed_before)
+
+
+class TodoPurgeResultSchema(BaseModel):
+    """Represent how many todos a purge deleted."""
+
+    deleted: int = Field(examples=[1200])
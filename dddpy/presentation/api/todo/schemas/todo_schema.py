@@ -15,6 +15,7 @@ class TodoSchema(BaseModel):
     created_at: int = Field(examples=[1136214245000])
     updated_at: int = Field(examples=[1136214245000])
     completed_at: int | None = Field(examples=[1136214245000])
+    version: int = Field(examples=[1])
 
     class Config:
         """Configure ORM compatibility for the schema."""
@@ -41,4 +42,5 @@ class TodoSchema(BaseModel):
             completed_at=int(todo.completed_at.timestamp() * 1000)
             if todo.completed_at
             else None,
+            version=todo.version,
         )
@@ -0,0 +1,60 @@
+"""Expose the query parameters and results of the todo search endpoint."""
+
+from pydantic import BaseModel, Field
+
+from dddpy.domain.todo.repositories import (
+    DEFAULT_TODO_PAGE_SIZE,
+    MAX_TODO_PAGE_SIZE,
+    TodoSearchHit,
+)
+from dddpy.presentation.api.todo.schemas.todo_schema import TodoSchema
+
+MAX_TODO_SEARCH_QUERY_LENGTH = 200
+
+
+class TodoSearchQuerySchema(BaseModel):
+    """Represent the search text and paging parameters of ``GET /todos/search``."""
+
+    q: str = Field(
+        min_length=1,
+        max_length=MAX_TODO_SEARCH_QUERY_LENGTH,
+        description='Terms that must all appear in the title or description.',
+        examples=['quarterly report'],
+    )
+    limit: int = Field(default=DEFAULT_TODO_PAGE_SIZE, ge=1, le=MAX_TODO_PAGE_SIZE)
+    cursor: str | None = Field(
+        default=None,
+        description="Cursor from the previous page's X-Next-Cursor header.",
+    )
+
+
+class TodoSearchHitSchema(BaseModel):
+    """Represent one search result with the matched terms marked."""
+
+    todo: TodoSchema
+    title_highlight: str = Field(
+        description='Title with matched terms wrapped in <mark> tags; not HTML-escaped.',
+        examples=['Write the <mark>quarterly</mark> <mark>report</mark>'],
+    )
+    description_snippet: str | None = Field(
+        default=None,
+        description='Excerpt of the description around the best match, marked '
+        'like the title; null when the todo has no description.',
+        examples=['…figures for the <mark>quarterly</mark> review…'],
+    )
+
+    @staticmethod
+    def from_hit(hit: TodoSearchHit) -> 'TodoSearchHitSchema':
+        """Build a schema instance from a repository search hit.
+
+        Args:
+            hit: Matching todo with its highlighted fragments.
+
+        Returns:
+            TodoSearchHitSchema: Pydantic model ready for serialization.
+        """
+        return TodoSearchHitSchema(
+            todo=TodoSchema.from_entity(hit.todo),
+            title_highlight=hit.title_highlight,
+            description_snippet=hit.description_snippet,
+        )
@@ -0,0 +1,31 @@
+"""Expose the todo counts returned by the stats endpoint."""
+
+from pydantic import BaseModel, Field
+
+from dddpy.domain.todo.value_objects import TodoStatus
+
+
+class TodoStatsSchema(BaseModel):
+    """Represent how many todos exist in total and in each status."""
+
+    total: int = Field(examples=[12])
+    not_started: int = Field(examples=[5])
+    in_progress: int = Field(examples=[4])
+    completed: int = Field(examples=[3])
+
+    @staticmethod
+    def from_counts(counts: dict[TodoStatus, int]) -> 'TodoStatsSchema':
+        """Build the response from per-status counts.
+
+        Args:
+            counts: Number of todos in each status.
+
+        Returns:
+            TodoStatsSchema: Counts per status and their sum.
+        """
+        return TodoStatsSchema(
+            total=sum(counts.values()),
+            not_started=counts.get(TodoStatus.NOT_STARTED, 0),
+            in_progress=counts.get(TodoStatus.IN_PROGRESS, 0),
+            completed=counts.get(TodoStatus.COMPLETED, 0),
+        )
@@ -0,0 +1,89 @@
+"""Encode todo entities straight to JSON bytes without building schemas.
+
+The output matches ``TodoSchema`` field for field, so routes can return it
+as a raw response while keeping ``TodoSchema`` as their documented model.
+"""
+
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from typing import Any
+
+from fastapi import Response, status
+from pydantic_core import to_json
+
+from dddpy.domain.todo.entities import Todo
+
+JSON_MEDIA_TYPE = 'application/json'
+
+
+def _epoch_ms(value: datetime) -> int:
+    """Convert a timestamp the same way ``TodoSchema`` serializes it."""
+    return int(value.timestamp() * 1000)
+
+
+def todo_json_fields(todo: Todo) -> dict[str, Any]:
+    """Map a todo to the JSON-ready fields of ``TodoSchema``.
+
+    Args:
+        todo: Domain entity to convert.
+
+    Returns:
+        dict[str, Any]: Field names mapped to plain JSON values.
+    """
+    return {
+        'id': str(todo.id.value),
+        'title': todo.title.value,
+        'description': todo.description.value if todo.description else '',
+        'status': todo.status.value,
+        'created_at': _epoch_ms(todo.created_at),
+        'updated_at': _epoch_ms(todo.updated_at),
+        'completed_at': _epoch_ms(todo.completed_at) if todo.completed_at else None,
+        'version': todo.version,
+    }
+
+
+def encode_todo(todo: Todo) -> bytes:
+    """Encode one todo as a JSON object.
+
+    Args:
+        todo: Domain entity to encode.
+
+    Returns:
+        bytes: UTF-8 JSON document.
+    """
+    return to_json(todo_json_fields(todo))
+
+
+def encode_todos(todos: Iterable[Todo]) -> bytes:
+    """Encode todos as a JSON array in a single call to the encoder.
+
+    Args:
+        todos: Domain entities to encode.
+
+    Returns:
+        bytes: UTF-8 JSON document.
+    """
+    return to_json([todo_json_fields(todo) for todo in todos])
+
+
+def json_response(
+    content: bytes,
+    status_code: int = status.HTTP_200_OK,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Wrap pre-encoded JSON in a response that FastAPI sends untouched.
+
+    Args:
+        content: Encoded JSON document.
+        status_code: HTTP status of the response.
+        headers: Extra headers, such as an ETag.
+
+    Returns:
+        Response: Response carrying the JSON bytes.
+    """
+    return Response(
+        content=content,
+        status_code=status_code,
+        headers=headers,
+        media_type=JSON_MEDIA_TYPE,
+    )
@@ -1,33 +1,116 @@
 """This package provides use cases for Todo entity operations."""
 
+from dddpy.usecase.todo.archive_completed_todos_usecase import (
+    ARCHIVE_CHUNK_SIZE,
+    ArchiveCompletedTodosUseCase,
+    AsyncArchiveCompletedTodosUseCase,
+    new_archive_completed_todos_usecase,
+    new_async_archive_completed_todos_usecase,
+)
 from dddpy.usecase.todo.complete_todo_usecase import (
+    AsyncCompleteTodoUseCase,
     CompleteTodoUseCase,
+    new_async_complete_todo_usecase,
     new_complete_todo_usecase,
 )
 from dddpy.usecase.todo.create_todo_usecase import (
+    AsyncCreateTodoUseCase,
     CreateTodoUseCase,
+    new_async_create_todo_usecase,
     new_create_todo_usecase,
 )
 from dddpy.usecase.todo.delete_todo_usecase import (
+    AsyncDeleteTodoUseCase,
     DeleteTodoUseCase,
+    new_async_delete_todo_usecase,
     new_delete_todo_usecase,
 )
+from dddpy.usecase.todo.export_todos_usecase import (
+    AsyncExportTodosUseCase,
+    ExportTodosUseCase,
+    new_async_export_todos_usecase,
+    new_export_todos_usecase,
+)
+from dddpy.usecase.todo.find_archived_todos_usecase import (
+    AsyncFindArchivedTodosUseCase,
+    FindArchivedTodosUseCase,
+    new_async_find_archived_todos_usecase,
+    new_find_archived_todos_usecase,
+)
 from dddpy.usecase.todo.find_todo_by_id_usecase import (
+    AsyncFindTodoByIdUseCase,
     FindTodoByIdUseCase,
+    new_async_find_todo_by_id_usecase,
     new_find_todo_by_id_usecase,
 )
+from dddpy.usecase.todo.find_todo_stats_usecase import (
+    AsyncFindTodoStatsUseCase,
+    FindTodoStatsUseCase,
+    new_async_find_todo_stats_usecase,
+    new_find_todo_stats_usecase,
+)
+from dddpy.usecase.todo.find_todo_version_usecase import (
+    AsyncFindTodoVersionUseCase,
+    FindTodoVersionUseCase,
+    new_async_find_todo_version_usecase,
+    new_find_todo_version_usecase,
+)
 from dddpy.usecase.todo.find_todos_usecase import (
+    AsyncFindTodosUseCase,
     FindTodosUseCase,
+    new_async_find_todos_usecase,
     new_find_todos_usecase,
 )
+from dddpy.usecase.todo.find_todos_version_usecase import (
+    AsyncFindTodosVersionUseCase,
+    FindTodosVersionUseCase,
+    new_async_find_todos_version_usecase,
+    new_find_todos_version_usecase,
+)
+from dddpy.usecase.todo.import_todos_usecase import (
+    IMPORT_CHUNK_SIZE,
+    MAX_IMPORT_LINE_BYTES,
+    AsyncImportTodosUseCase,
+    ImportTodosUseCase,
+    TodoImportError,
+    TodoImportLine,
+    TodoImportResult,
+    new_async_import_todos_usecase,
+    new_import_todos_usecase,
+)
+from dddpy.usecase.todo.purge_completed_todos_usecase import (
+    PURGE_CHUNK_SIZE,
+    AsyncPurgeCompletedTodosUseCase,
+    PurgeCompletedTodosUseCase,
+    new_async_purge_completed_todos_usecase,
+    new_purge_completed_todos_usecase,
+)
+from dddpy.usecase.todo.search_todos_usecase import (
+    AsyncSearchTodosUseCase,
+    SearchTodosUseCase,
+    new_async_search_todos_usecase,
+    new_search_todos_usecase,
+)
 from dddpy.usecase.todo.start_todo_usecase import (
+    AsyncStartTodoUseCase,
     StartTodoUseCase,
+    new_async_start_todo_usecase,
     new_start_todo_usecase,
 )
 from dddpy.usecase.todo.update_todo_usecase import (
+    AsyncUpdateTodoUseCase,
     UpdateTodoUseCase,
+    new_async_update_todo_usecase,
     new_update_todo_usecase,
 )
+from dddpy.usecase.todo.upsert_todos_usecase import (
+    AsyncUpsertTodosUseCase,
+    TodoUpsertItem,
+    TodoUpsertResult,
+    UpsertTodosUseCase,
+    new_async_upsert_todos_usecase,
+    new_upsert_todos_usecase,
+)
 
 __all__ = [
     'CreateTodoUseCase',
@@ -37,6 +120,25 @@ __all__ = [
     'DeleteTodoUseCase',
     'FindTodoByIdUseCase',
     'FindTodosUseCase',
+    'FindTodoVersionUseCase',
+    'FindTodosVersionUseCase',
+    'UpsertTodosUseCase',
+    'TodoUpsertItem',
+    'TodoUpsertResult',
+    'ExportTodosUseCase',
+    'ImportTodosUseCase',
+    'TodoImportLine',
+    'TodoImportError',
+    'TodoImportResult',
+    'IMPORT_CHUNK_SIZE',
+    'MAX_IMPORT_LINE_BYTES',
+    'SearchTodosUseCase',
+    'FindTodoStatsUseCase',
+    'PurgeCompletedTodosUseCase',
+    'PURGE_CHUNK_SIZE',
+    'ArchiveCompletedTodosUseCase',
+    'ARCHIVE_CHUNK_SIZE',
+    'FindArchivedTodosUseCase',
     'new_create_todo_usecase',
     'new_start_todo_usecase',
     'new_complete_todo_usecase',
@@ -44,4 +146,48 @@ __all__ = [
     'new_delete_todo_usecase',
     'new_find_todo_by_id_usecase',
     'new_find_todos_usecase',
+    'new_find_todo_version_usecase',
+    'new_find_todos_version_usecase',
+    'new_upsert_todos_usecase',
+    'new_export_todos_usecase',
+    'new_import_todos_usecase',
+    'new_search_todos_usecase',
+    'new_find_todo_stats_usecase',
+    'new_purge_completed_todos_usecase',
+    'new_archive_completed_todos_usecase',
+    'new_find_archived_todos_usecase',
+    'AsyncCreateTodoUseCase',
+    'AsyncStartTodoUseCase',
+    'AsyncCompleteTodoUseCase',
+    'AsyncUpdateTodoUseCase',
+    'AsyncDeleteTodoUseCase',
+    'AsyncFindTodoByIdUseCase',
+    'AsyncFindTodosUseCase',
+    'AsyncFindTodoVersionUseCase',
+    'AsyncFindTodosVersionUseCase',
+    'AsyncUpsertTodosUseCase',
+    'AsyncExportTodosUseCase',
+    'AsyncImportTodosUseCase',
+    'AsyncSearchTodosUseCase',
+    'AsyncFindTodoStatsUseCase',
+    'AsyncPurgeCompletedTodosUseCase',
+    'AsyncArchiveCompletedTodosUseCase',
+    'AsyncFindArchivedTodosUseCase',
+    'new_async_create_todo_usecase',
+    'new_async_start_todo_usecase',
+    'new_async_complete_todo_usecase',
+    'new_async_update_todo_usecase',
+    'new_async_delete_todo_usecase',
+    'new_async_find_todo_by_id_usecase',
+    'new_async_find_todos_usecase',
+    'new_async_find_todo_version_usecase',
+    'new_async_find_todos_version_usecase',
+    'new_async_upsert_todos_usecase',
+    'new_async_export_todos_usecase',
+    'new_async_import_todos_usecase',
+    'new_async_search_todos_usecase',
+    'new_async_find_todo_stats_usecase',
+    'new_async_purge_completed_todos_usecase',
+    'new_async_archive_completed_todos_usecase',
+    'new_async_find_archived_todos_usecase',
 ]
@@ -0,0 +1,140 @@
+"""Provide use case implementations for archiving old completed todos."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from functools import partial
+
+from dddpy.domain.todo.repositories import AsyncTodoUnitOfWork, TodoUnitOfWork
+from dddpy.usecase.todo.chunked_maintenance import (
+    MAINTENANCE_CHUNK_SIZE,
+    run_in_chunks,
+    run_in_chunks_async,
+)
+
+ARCHIVE_CHUNK_SIZE = MAINTENANCE_CHUNK_SIZE
+
+
+class ArchiveCompletedTodosUseCase(ABC):
+    """Define the application boundary for archiving old completed todos."""
+
+    @abstractmethod
+    def execute(self, completed_before: datetime) -> int:
+        """Archive every todo completed before the given time.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+
+        Returns:
+            int: Number of todos archived.
+        """
+
+
+class ArchiveCompletedTodosUseCaseImpl(ArchiveCompletedTodosUseCase):
+    """Concrete archival backed by a unit of work.
+
+    Todos are archived through ``run_in_chunks``, one committed chunk of
+    ``chunk_size`` at a time. Chunks committed before a failure stay archived.
+    """
+
+    def __init__(
+        self, unit_of_work: TodoUnitOfWork, chunk_size: int = ARCHIVE_CHUNK_SIZE
+    ):
+        """Store the dependencies.
+
+        Args:
+            unit_of_work: Unit of work archiving and committing the todos.
+            chunk_size: Most todos archived per transaction.
+        """
+        self.unit_of_work = unit_of_work
+        self.chunk_size = chunk_size
+
+    def execute(self, completed_before: datetime) -> int:
+        """Archive old completed todos one committed chunk at a time.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+
+        Returns:
+            int: Number of todos archived.
+        """
+        return run_in_chunks(
+            partial(self.unit_of_work.todos.archive_completed_before, completed_before),
+            self.unit_of_work.commit,
+            self.chunk_size,
+        )
+
+
+def new_archive_completed_todos_usecase(
+    unit_of_work: TodoUnitOfWork, chunk_size: int = ARCHIVE_CHUNK_SIZE
+) -> ArchiveCompletedTodosUseCase:
+    """Instantiate the completed todo archival use case.
+
+    Args:
+        unit_of_work: Unit of work archiving and committing the todos.
+        chunk_size: Most todos archived per transaction.
+
+    Returns:
+        ArchiveCompletedTodosUseCase: Configured use case implementation.
+    """
+    return ArchiveCompletedTodosUseCaseImpl(unit_of_work, chunk_size)
+
+
+class AsyncArchiveCompletedTodosUseCase(ABC):
+    """Define the non-blocking application boundary for archiving todos."""
+
+    @abstractmethod
+    async def execute(self, completed_before: datetime) -> int:
+        """Archive every todo completed before the given time.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+
+        Returns:
+            int: Number of todos archived.
+        """
+
+
+class AsyncArchiveCompletedTodosUseCaseImpl(AsyncArchiveCompletedTodosUseCase):
+    """Concrete archival backed by an async unit of work."""
+
+    def __init__(
+        self, unit_of_work: AsyncTodoUnitOfWork, chunk_size: int = ARCHIVE_CHUNK_SIZE
+    ):
+        """Store the dependencies.
+
+        Args:
+            unit_of_work: Unit of work archiving and committing the todos.
+            chunk_size: Most todos archived per transaction.
+        """
+        self.unit_of_work = unit_of_work
+        self.chunk_size = chunk_size
+
+    async def execute(self, completed_before: datetime) -> int:
+        """Archive old completed todos one committed chunk at a time.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+
+        Returns:
+            int: Number of todos archived.
+        """
+        return await run_in_chunks_async(
+            partial(self.unit_of_work.todos.archive_completed_before, completed_before),
+            self.unit_of_work.commit,
+            self.chunk_size,
+        )
+
+
+def new_async_archive_completed_todos_usecase(
+    unit_of_work: AsyncTodoUnitOfWork, chunk_size: int = ARCHIVE_CHUNK_SIZE
+) -> AsyncArchiveCompletedTodosUseCase:
+    """Instantiate the async completed todo archival use case.
+
+    Args:
+        unit_of_work: Unit of work archiving and committing the todos.
+        chunk_size: Most todos archived per transaction.
+
+    Returns:
+        AsyncArchiveCompletedTodosUseCase: Configured use case implementation.
+    """
+    return AsyncArchiveCompletedTodosUseCaseImpl(unit_of_work, chunk_size)
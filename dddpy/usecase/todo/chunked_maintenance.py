@@ -0,0 +1,60 @@
+"""Run bulk maintenance over todos one committed chunk at a time.
+
+Each chunk is committed on its own, so a run never holds one long write
+transaction: other writers wait for the SQLite write lock for milliseconds,
+not for the whole run. Chunks committed before a failure stay applied.
+"""
+
+from collections.abc import Awaitable, Callable, Sized
+
+# Todos handled per transaction by default.
+MAINTENANCE_CHUNK_SIZE = 500
+
+
+def run_in_chunks(
+    operation: Callable[[int], Sized], commit: Callable[[], None], chunk_size: int
+) -> int:
+    """Repeat a chunked operation, committing after each chunk.
+
+    Args:
+        operation: Handles at most the given number of todos and returns
+            those it handled.
+        commit: Commits the chunk just handled.
+        chunk_size: Most todos handled per transaction.
+
+    Returns:
+        int: Number of todos handled; the run ends with the first chunk
+            that comes back short.
+    """
+    handled = 0
+    while True:
+        chunk = operation(chunk_size)
+        commit()
+        handled += len(chunk)
+        if len(chunk) < chunk_size:
+            return handled
+
+
+async def run_in_chunks_async(
+    operation: Callable[[int], Awaitable[Sized]],
+    commit: Callable[[], Awaitable[None]],
+    chunk_size: int,
+) -> int:
+    """Repeat a chunked operation like ``run_in_chunks``, awaiting each step.
+
+    Args:
+        operation: Handles at most the given number of todos and returns
+            those it handled.
+        commit: Commits the chunk just handled.
+        chunk_size: Most todos handled per transaction.
+
+    Returns:
+        int: Number of todos handled.
+    """
+    handled = 0
+    while True:
+        chunk = await operation(chunk_size)
+        await commit()
+        handled += len(chunk)
+        if len(chunk) < chunk_size:
+            return handled
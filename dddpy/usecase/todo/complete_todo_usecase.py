@@ -1,6 +1,7 @@
 """Provide use case implementations for completing todos."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from dddpy.domain.todo.entities import Todo
 from dddpy.domain.todo.exceptions import (
@@ -8,7 +9,7 @@ from dddpy.domain.todo.exceptions import (
     TodoNotFoundError,
     TodoNotStartedError,
 )
-from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.repositories import AsyncTodoRepository, TodoRepository
 from dddpy.domain.todo.value_objects import TodoId, TodoStatus
 
 
@@ -39,7 +40,9 @@ class CompleteTodoUseCaseImpl(CompleteTodoUseCase):
         self.todo_repository = todo_repository
 
     def execute(self, todo_id: TodoId) -> Todo:
-        """Complete a todo after validating its lifecycle state.
+        """Complete a todo that is in progress, in one atomic write.
+
+        The lifecycle error is only looked up when the write is rejected.
 
         Args:
             todo_id: Identifier of the todo to complete.
@@ -52,20 +55,21 @@ class CompleteTodoUseCaseImpl(CompleteTodoUseCase):
         Returns:
             Todo: Persisted todo marked as completed.
         """
-        todo = self.todo_repository.find_by_id(todo_id)
+        todo = self.todo_repository.transition(
+            todo_id, TodoStatus.COMPLETED, (TodoStatus.IN_PROGRESS,), datetime.now()
+        )
+        if todo is not None:
+            return todo
+
+        status = self.todo_repository.find_status(todo_id)
 
-        if todo is None:
+        if status is None:
             raise TodoNotFoundError
 
-        if todo.status == TodoStatus.NOT_STARTED:
+        if status == TodoStatus.NOT_STARTED:
             raise TodoNotStartedError
 
-        if todo.is_completed:
-            raise TodoAlreadyCompletedError
-
-        todo.complete()
-        self.todo_repository.save(todo)
-        return todo
+        raise TodoAlreadyCompletedError
 
 
 def new_complete_todo_usecase(todo_repository: TodoRepository) -> CompleteTodoUseCase:
@@ -78,3 +82,76 @@ def new_complete_todo_usecase(todo_repository: TodoRepository) -> CompleteTodoUs
         CompleteTodoUseCase: Configured use case implementation.
     """
     return CompleteTodoUseCaseImpl(todo_repository)
+
+
+class AsyncCompleteTodoUseCase(ABC):
+    """Define the non-blocking application boundary for completing todos."""
+
+    @abstractmethod
+    async def execute(self, todo_id: TodoId) -> Todo:
+        """Complete a todo identified by the provided ID.
+
+        Args:
+            todo_id: Identifier of the todo to complete.
+
+        Returns:
+            Todo: Updated todo entity marked as completed.
+        """
+
+
+class AsyncCompleteTodoUseCaseImpl(AsyncCompleteTodoUseCase):
+    """Concrete todo completion use case backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to persist todo updates.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(self, todo_id: TodoId) -> Todo:
+        """Complete a todo that is in progress, in one atomic write.
+
+        The lifecycle error is only looked up when the write is rejected.
+
+        Args:
+            todo_id: Identifier of the todo to complete.
+
+        Raises:
+            TodoNotFoundError: If the todo cannot be located.
+            TodoNotStartedError: If the todo has not been started yet.
+            TodoAlreadyCompletedError: If the todo is already completed.
+
+        Returns:
+            Todo: Persisted todo marked as completed.
+        """
+        todo = await self.todo_repository.transition(
+            todo_id, TodoStatus.COMPLETED, (TodoStatus.IN_PROGRESS,), datetime.now()
+        )
+        if todo is not None:
+            return todo
+
+        status = await self.todo_repository.find_status(todo_id)
+
+        if status is None:
+            raise TodoNotFoundError
+
+        if status == TodoStatus.NOT_STARTED:
+            raise TodoNotStartedError
+
+        raise TodoAlreadyCompletedError
+
+
+def new_async_complete_todo_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncCompleteTodoUseCase:
+    """Instantiate the async todo completion use case.
+
+    Args:
+        todo_repository: Async repository used to persist todo updates.
+
+    Returns:
+        AsyncCompleteTodoUseCase: Configured use case implementation.
+    """
+    return AsyncCompleteTodoUseCaseImpl(todo_repository)
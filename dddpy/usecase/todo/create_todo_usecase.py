@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 
 from dddpy.domain.todo.entities import Todo
-from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.repositories import AsyncTodoRepository, TodoRepository
 from dddpy.domain.todo.value_objects import TodoDescription, TodoTitle
 
 
@@ -63,3 +63,63 @@ def new_create_todo_usecase(todo_repository: TodoRepository) -> CreateTodoUseCas
         CreateTodoUseCase: Configured use case implementation.
     """
     return CreateTodoUseCaseImpl(todo_repository)
+
+
+class AsyncCreateTodoUseCase(ABC):
+    """Define the non-blocking application boundary for creating todos."""
+
+    @abstractmethod
+    async def execute(
+        self, title: TodoTitle, description: TodoDescription | None = None
+    ) -> Todo:
+        """Create a todo using the provided values.
+
+        Args:
+            title: Title for the new todo.
+            description: Optional descriptive text.
+
+        Returns:
+            Todo: Newly created todo entity.
+        """
+
+
+class AsyncCreateTodoUseCaseImpl(AsyncCreateTodoUseCase):
+    """Concrete todo creation use case backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to persist todos.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(
+        self, title: TodoTitle, description: TodoDescription | None = None
+    ) -> Todo:
+        """Create, persist, and return a new todo entity.
+
+        Args:
+            title: Title for the new todo.
+            description: Optional descriptive text.
+
+        Returns:
+            Todo: Newly created todo entity.
+        """
+        todo = Todo.create(title=title, description=description)
+        await self.todo_repository.save(todo)
+        return todo
+
+
+def new_async_create_todo_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncCreateTodoUseCase:
+    """Instantiate the async todo creation use case.
+
+    Args:
+        todo_repository: Async repository used to persist new todos.
+
+    Returns:
+        AsyncCreateTodoUseCase: Configured use case implementation.
+    """
+    return AsyncCreateTodoUseCaseImpl(todo_repository)
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 
 from dddpy.domain.todo.exceptions import TodoNotFoundError
-from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.repositories import AsyncTodoRepository, TodoRepository
 from dddpy.domain.todo.value_objects import TodoId
 
 
@@ -57,3 +57,57 @@ def new_delete_todo_usecase(todo_repository: TodoRepository) -> DeleteTodoUseCas
         DeleteTodoUseCase: Configured use case implementation.
     """
     return DeleteTodoUseCaseImpl(todo_repository)
+
+
+class AsyncDeleteTodoUseCase(ABC):
+    """Define the non-blocking application boundary for deleting todos."""
+
+    @abstractmethod
+    async def execute(self, todo_id: TodoId) -> None:
+        """Delete a todo identified by the provided ID.
+
+        Args:
+            todo_id: Identifier of the todo to delete.
+        """
+
+
+class AsyncDeleteTodoUseCaseImpl(AsyncDeleteTodoUseCase):
+    """Concrete todo deletion use case backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository responsible for todo persistence.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(self, todo_id: TodoId) -> None:
+        """Delete a todo after ensuring it exists.
+
+        Args:
+            todo_id: Identifier of the todo to delete.
+
+        Raises:
+            TodoNotFoundError: If no todo matches the provided identifier.
+        """
+        todo = await self.todo_repository.find_by_id(todo_id)
+
+        if todo is None:
+            raise TodoNotFoundError
+
+        await self.todo_repository.delete(todo_id)
+
+
+def new_async_delete_todo_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncDeleteTodoUseCase:
+    """Instantiate the async todo deletion use case.
+
+    Args:
+        todo_repository: Async repository responsible for todo persistence.
+
+    Returns:
+        AsyncDeleteTodoUseCase: Configured use case implementation.
+    """
+    return AsyncDeleteTodoUseCaseImpl(todo_repository)
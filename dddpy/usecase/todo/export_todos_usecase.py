@@ -0,0 +1,121 @@
+"""Provide use case implementations for exporting every todo."""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.repositories import (
+    DEFAULT_TODO_EXPORT_BATCH_SIZE,
+    AsyncTodoRepository,
+    TodoRepository,
+)
+
+
+class ExportTodosUseCase(ABC):
+    """Define the application boundary for exporting every todo."""
+
+    @abstractmethod
+    def execute(
+        self, batch_size: int = DEFAULT_TODO_EXPORT_BATCH_SIZE
+    ) -> Iterator[Todo]:
+        """Stream every todo.
+
+        Args:
+            batch_size: Number of todos loaded from storage at a time.
+
+        Returns:
+            Iterator[Todo]: Todos in storage order.
+        """
+
+
+class ExportTodosUseCaseImpl(ExportTodosUseCase):
+    """Concrete todo export backed by a repository."""
+
+    def __init__(self, todo_repository: TodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Repository used to read todos.
+        """
+        self.todo_repository = todo_repository
+
+    def execute(
+        self, batch_size: int = DEFAULT_TODO_EXPORT_BATCH_SIZE
+    ) -> Iterator[Todo]:
+        """Stream every todo without loading the collection into memory.
+
+        Args:
+            batch_size: Number of todos loaded from storage at a time.
+
+        Returns:
+            Iterator[Todo]: Todos in storage order.
+        """
+        return self.todo_repository.iter_all(batch_size)
+
+
+def new_export_todos_usecase(todo_repository: TodoRepository) -> ExportTodosUseCase:
+    """Instantiate the todo export use case.
+
+    Args:
+        todo_repository: Repository used to read todos.
+
+    Returns:
+        ExportTodosUseCase: Configured use case implementation.
+    """
+    return ExportTodosUseCaseImpl(todo_repository)
+
+
+class AsyncExportTodosUseCase(ABC):
+    """Define the non-blocking application boundary for exporting every todo."""
+
+    @abstractmethod
+    def execute(
+        self, batch_size: int = DEFAULT_TODO_EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Todo]:
+        """Stream every todo.
+
+        Args:
+            batch_size: Number of todos loaded from storage at a time.
+
+        Returns:
+            AsyncIterator[Todo]: Todos in storage order.
+        """
+
+
+class AsyncExportTodosUseCaseImpl(AsyncExportTodosUseCase):
+    """Concrete todo export backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to read todos.
+        """
+        self.todo_repository = todo_repository
+
+    def execute(
+        self, batch_size: int = DEFAULT_TODO_EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Todo]:
+        """Stream every todo without loading the collection into memory.
+
+        Args:
+            batch_size: Number of todos loaded from storage at a time.
+
+        Returns:
+            AsyncIterator[Todo]: Todos in storage order.
+        """
+        return self.todo_repository.iter_all(batch_size)
+
+
+def new_async_export_todos_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncExportTodosUseCase:
+    """Instantiate the async todo export use case.
+
+    Args:
+        todo_repository: Async repository used to read todos.
+
+    Returns:
+        AsyncExportTodosUseCase: Configured use case implementation.
+    """
+    return AsyncExportTodosUseCaseImpl(todo_repository)
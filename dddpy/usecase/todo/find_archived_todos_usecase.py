@@ -0,0 +1,132 @@
+"""Provide use case implementations for browsing archived todos."""
+
+from abc import ABC, abstractmethod
+
+from dddpy.domain.todo.repositories import (
+    DEFAULT_TODO_PAGE_SIZE,
+    AsyncTodoRepository,
+    TodoPage,
+    TodoRepository,
+)
+
+
+class FindArchivedTodosUseCase(ABC):
+    """Define the application boundary for browsing archived todos."""
+
+    @abstractmethod
+    def execute(
+        self, limit: int = DEFAULT_TODO_PAGE_SIZE, cursor: str | None = None
+    ) -> TodoPage:
+        """Return one page of archived todos, most recently completed first.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+
+
+class FindArchivedTodosUseCaseImpl(FindArchivedTodosUseCase):
+    """Concrete archive browsing use case backed by a repository."""
+
+    def __init__(self, todo_repository: TodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Repository used to read archived todos.
+        """
+        self.todo_repository = todo_repository
+
+    def execute(
+        self, limit: int = DEFAULT_TODO_PAGE_SIZE, cursor: str | None = None
+    ) -> TodoPage:
+        """Return a page of archived todos from the repository.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return self.todo_repository.find_archived(limit=limit, cursor=cursor)
+
+
+def new_find_archived_todos_usecase(
+    todo_repository: TodoRepository,
+) -> FindArchivedTodosUseCase:
+    """Instantiate the archived todo browsing use case.
+
+    Args:
+        todo_repository: Repository used to read archived todos.
+
+    Returns:
+        FindArchivedTodosUseCase: Configured use case implementation.
+    """
+    return FindArchivedTodosUseCaseImpl(todo_repository)
+
+
+class AsyncFindArchivedTodosUseCase(ABC):
+    """Define the non-blocking application boundary for browsing archived todos."""
+
+    @abstractmethod
+    async def execute(
+        self, limit: int = DEFAULT_TODO_PAGE_SIZE, cursor: str | None = None
+    ) -> TodoPage:
+        """Return one page of archived todos, most recently completed first.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+
+
+class AsyncFindArchivedTodosUseCaseImpl(AsyncFindArchivedTodosUseCase):
+    """Concrete archive browsing use case backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to read archived todos.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(
+        self, limit: int = DEFAULT_TODO_PAGE_SIZE, cursor: str | None = None
+    ) -> TodoPage:
+        """Return a page of archived todos from the repository.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return await self.todo_repository.find_archived(limit=limit, cursor=cursor)
+
+
+def new_async_find_archived_todos_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncFindArchivedTodosUseCase:
+    """Instantiate the async archived todo browsing use case.
+
+    Args:
+        todo_repository: Async repository used to read archived todos.
+
+    Returns:
+        AsyncFindArchivedTodosUseCase: Configured use case implementation.
+    """
+    return AsyncFindArchivedTodosUseCaseImpl(todo_repository)
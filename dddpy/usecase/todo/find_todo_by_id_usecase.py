@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 
 from dddpy.domain.todo.entities import Todo
 from dddpy.domain.todo.exceptions import TodoNotFoundError
-from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.repositories import AsyncTodoRepository, TodoRepository
 from dddpy.domain.todo.value_objects import TodoId
 
 
@@ -62,3 +62,61 @@ def new_find_todo_by_id_usecase(todo_repository: TodoRepository) -> FindTodoById
         FindTodoByIdUseCase: Configured use case implementation.
     """
     return FindTodoByIdUseCaseImpl(todo_repository)
+
+
+class AsyncFindTodoByIdUseCase(ABC):
+    """Define the non-blocking application boundary for retrieving a todo by ID."""
+
+    @abstractmethod
+    async def execute(self, todo_id: TodoId) -> Todo:
+        """Return the todo matching the provided identifier.
+
+        Args:
+            todo_id: Identifier of the todo to retrieve.
+
+        Returns:
+            Todo: Todo entity matching the identifier.
+        """
+
+
+class AsyncFindTodoByIdUseCaseImpl(AsyncFindTodoByIdUseCase):
+    """Concrete todo lookup use case backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to retrieve todos.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(self, todo_id: TodoId) -> Todo:
+        """Retrieve a todo by identifier or raise if absent.
+
+        Args:
+            todo_id: Identifier of the todo to retrieve.
+
+        Raises:
+            TodoNotFoundError: If the todo cannot be located.
+
+        Returns:
+            Todo: Matching todo entity.
+        """
+        todo = await self.todo_repository.find_by_id(todo_id)
+        if todo is None:
+            raise TodoNotFoundError
+        return todo
+
+
+def new_async_find_todo_by_id_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncFindTodoByIdUseCase:
+    """Instantiate the async todo lookup by ID use case.
+
+    Args:
+        todo_repository: Async repository used to retrieve todos.
+
+    Returns:
+        AsyncFindTodoByIdUseCase: Configured use case implementation.
+    """
+    return AsyncFindTodoByIdUseCaseImpl(todo_repository)
@@ -0,0 +1,98 @@
+"""Provide use case implementations for counting todos per status."""
+
+from abc import ABC, abstractmethod
+
+from dddpy.domain.todo.repositories import AsyncTodoRepository, TodoRepository
+from dddpy.domain.todo.value_objects import TodoStatus
+
+
+class FindTodoStatsUseCase(ABC):
+    """Define the application boundary for reading todo counts per status."""
+
+    @abstractmethod
+    def execute(self) -> dict[TodoStatus, int]:
+        """Return how many todos are in each status.
+
+        Returns:
+            dict[TodoStatus, int]: Count for every status, zero included.
+        """
+
+
+class FindTodoStatsUseCaseImpl(FindTodoStatsUseCase):
+    """Concrete todo count lookup backed by a repository."""
+
+    def __init__(self, todo_repository: TodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Repository used to count todos.
+        """
+        self.todo_repository = todo_repository
+
+    def execute(self) -> dict[TodoStatus, int]:
+        """Return the maintained per-status counts without counting rows.
+
+        Returns:
+            dict[TodoStatus, int]: Count for every status, zero included.
+        """
+        return self.todo_repository.count_by_status()
+
+
+def new_find_todo_stats_usecase(
+    todo_repository: TodoRepository,
+) -> FindTodoStatsUseCase:
+    """Instantiate the todo count lookup use case.
+
+    Args:
+        todo_repository: Repository used to count todos.
+
+    Returns:
+        FindTodoStatsUseCase: Configured use case implementation.
+    """
+    return FindTodoStatsUseCaseImpl(todo_repository)
+
+
+class AsyncFindTodoStatsUseCase(ABC):
+    """Define the non-blocking application boundary for reading todo counts."""
+
+    @abstractmethod
+    async def execute(self) -> dict[TodoStatus, int]:
+        """Return how many todos are in each status.
+
+        Returns:
+            dict[TodoStatus, int]: Count for every status, zero included.
+        """
+
+
+class AsyncFindTodoStatsUseCaseImpl(AsyncFindTodoStatsUseCase):
+    """Concrete todo count lookup backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to count todos.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(self) -> dict[TodoStatus, int]:
+        """Return the maintained per-status counts without counting rows.
+
+        Returns:
+            dict[TodoStatus, int]: Count for every status, zero included.
+        """
+        return await self.todo_repository.count_by_status()
+
+
+def new_async_find_todo_stats_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncFindTodoStatsUseCase:
+    """Instantiate the async todo count lookup use case.
+
+    Args:
+        todo_repository: Async repository used to count todos.
+
+    Returns:
+        AsyncFindTodoStatsUseCase: Configured use case implementation.
+    """
+    return AsyncFindTodoStatsUseCaseImpl(todo_repository)
@@ -0,0 +1,110 @@
+"""Provide use case implementations for reading the version of a todo."""
+
+from abc import ABC, abstractmethod
+
+from dddpy.domain.todo.repositories import AsyncTodoRepository, TodoRepository
+from dddpy.domain.todo.value_objects import TodoId
+
+
+class FindTodoVersionUseCase(ABC):
+    """Define the application boundary for reading a todo's version."""
+
+    @abstractmethod
+    def execute(self, todo_id: TodoId) -> int | None:
+        """Return the current version of the todo.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[int]: Current version, or None if the todo is absent.
+        """
+
+
+class FindTodoVersionUseCaseImpl(FindTodoVersionUseCase):
+    """Concrete todo version lookup backed by a repository."""
+
+    def __init__(self, todo_repository: TodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Repository used to inspect todos.
+        """
+        self.todo_repository = todo_repository
+
+    def execute(self, todo_id: TodoId) -> int | None:
+        """Return the stored version without loading the todo.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[int]: Current version, or None if the todo is absent.
+        """
+        return self.todo_repository.find_version(todo_id)
+
+
+def new_find_todo_version_usecase(
+    todo_repository: TodoRepository,
+) -> FindTodoVersionUseCase:
+    """Instantiate the todo version lookup use case.
+
+    Args:
+        todo_repository: Repository used to inspect todos.
+
+    Returns:
+        FindTodoVersionUseCase: Configured use case implementation.
+    """
+    return FindTodoVersionUseCaseImpl(todo_repository)
+
+
+class AsyncFindTodoVersionUseCase(ABC):
+    """Define the non-blocking application boundary for reading a todo's version."""
+
+    @abstractmethod
+    async def execute(self, todo_id: TodoId) -> int | None:
+        """Return the current version of the todo.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[int]: Current version, or None if the todo is absent.
+        """
+
+
+class AsyncFindTodoVersionUseCaseImpl(AsyncFindTodoVersionUseCase):
+    """Concrete todo version lookup backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to inspect todos.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(self, todo_id: TodoId) -> int | None:
+        """Return the stored version without loading the todo.
+
+        Args:
+            todo_id: Identifier of the todo to inspect.
+
+        Returns:
+            Optional[int]: Current version, or None if the todo is absent.
+        """
+        return await self.todo_repository.find_version(todo_id)
+
+
+def new_async_find_todo_version_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncFindTodoVersionUseCase:
+    """Instantiate the async todo version lookup use case.
+
+    Args:
+        todo_repository: Async repository used to inspect todos.
+
+    Returns:
+        AsyncFindTodoVersionUseCase: Configured use case implementation.
+    """
+    return AsyncFindTodoVersionUseCaseImpl(todo_repository)
@@ -2,19 +2,37 @@
 
 from abc import ABC, abstractmethod
 
-from dddpy.domain.todo.entities import Todo
-from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.repositories import (
+    DEFAULT_TODO_PAGE_SIZE,
+    AsyncTodoRepository,
+    TodoFilter,
+    TodoPage,
+    TodoRepository,
+)
+from dddpy.domain.todo.value_objects import TodoSortKey
 
 
 class FindTodosUseCase(ABC):
     """Define the application boundary for listing todos."""
 
     @abstractmethod
-    def execute(self) -> list[Todo]:
-        """Return the collection of todos managed by the system.
+    def execute(
+        self,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+        sort_key: TodoSortKey = TodoSortKey.CREATED_AT,
+        todo_filter: TodoFilter | None = None,
+    ) -> TodoPage:
+        """Return one page of the todos managed by the system.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+            sort_key: Timestamp used to order the todos.
+            todo_filter: Criteria the listed todos must meet, if any.
 
         Returns:
-            List[Todo]: All persisted todo entities.
+            TodoPage: The requested todos and the cursor for the next page.
         """
 
 
@@ -29,9 +47,32 @@ class FindTodosUseCaseImpl(FindTodosUseCase):
         """
         self.todo_repository = todo_repository
 
-    def execute(self) -> list[Todo]:
-        """Return all todos ordered per repository implementation."""
-        return self.todo_repository.find_all()
+    def execute(
+        self,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+        sort_key: TodoSortKey = TodoSortKey.CREATED_AT,
+        todo_filter: TodoFilter | None = None,
+    ) -> TodoPage:
+        """Return a page of todos ordered per repository implementation.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+            sort_key: Timestamp used to order the todos.
+            todo_filter: Criteria the listed todos must meet, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded.
+            TodoInvalidFilterError: If a time bound applies to a timestamp
+                other than the sort key.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return self.todo_repository.find_all(
+            limit=limit, cursor=cursor, sort_key=sort_key, todo_filter=todo_filter
+        )
 
 
 def new_find_todos_usecase(todo_repository: TodoRepository) -> FindTodosUseCase:
@@ -44,3 +85,80 @@ def new_find_todos_usecase(todo_repository: TodoRepository) -> FindTodosUseCase:
         FindTodosUseCase: Configured use case implementation.
     """
     return FindTodosUseCaseImpl(todo_repository)
+
+
+class AsyncFindTodosUseCase(ABC):
+    """Define the non-blocking application boundary for listing todos."""
+
+    @abstractmethod
+    async def execute(
+        self,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+        sort_key: TodoSortKey = TodoSortKey.CREATED_AT,
+        todo_filter: TodoFilter | None = None,
+    ) -> TodoPage:
+        """Return one page of the todos managed by the system.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+            sort_key: Timestamp used to order the todos.
+            todo_filter: Criteria the listed todos must meet, if any.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+
+
+class AsyncFindTodosUseCaseImpl(AsyncFindTodosUseCase):
+    """Concrete todo listing use case backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to retrieve todos.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(
+        self,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+        sort_key: TodoSortKey = TodoSortKey.CREATED_AT,
+        todo_filter: TodoFilter | None = None,
+    ) -> TodoPage:
+        """Return a page of todos ordered per repository implementation.
+
+        Args:
+            limit: Maximum number of todos in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+            sort_key: Timestamp used to order the todos.
+            todo_filter: Criteria the listed todos must meet, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded.
+            TodoInvalidFilterError: If a time bound applies to a timestamp
+                other than the sort key.
+
+        Returns:
+            TodoPage: The requested todos and the cursor for the next page.
+        """
+        return await self.todo_repository.find_all(
+            limit=limit, cursor=cursor, sort_key=sort_key, todo_filter=todo_filter
+        )
+
+
+def new_async_find_todos_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncFindTodosUseCase:
+    """Instantiate the async todo listing use case.
+
+    Args:
+        todo_repository: Async repository used to retrieve todos.
+
+    Returns:
+        AsyncFindTodosUseCase: Configured use case implementation.
+    """
+    return AsyncFindTodosUseCaseImpl(todo_repository)
@@ -0,0 +1,101 @@
+"""Provide use case implementations for reading the version of the todo list."""
+
+from abc import ABC, abstractmethod
+
+from dddpy.domain.todo.repositories import (
+    AsyncTodoRepository,
+    TodoListVersion,
+    TodoRepository,
+)
+
+
+class FindTodosVersionUseCase(ABC):
+    """Define the application boundary for reading the todo list version."""
+
+    @abstractmethod
+    def execute(self) -> TodoListVersion:
+        """Return the current version of the todo collection.
+
+        Returns:
+            TodoListVersion: Marker that changes whenever any todo is written.
+        """
+
+
+class FindTodosVersionUseCaseImpl(FindTodosVersionUseCase):
+    """Concrete todo list version lookup backed by a repository."""
+
+    def __init__(self, todo_repository: TodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Repository used to inspect todos.
+        """
+        self.todo_repository = todo_repository
+
+    def execute(self) -> TodoListVersion:
+        """Return the collection version without loading any todo.
+
+        Returns:
+            TodoListVersion: Marker that changes whenever any todo is written.
+        """
+        return self.todo_repository.find_list_version()
+
+
+def new_find_todos_version_usecase(
+    todo_repository: TodoRepository,
+) -> FindTodosVersionUseCase:
+    """Instantiate the todo list version lookup use case.
+
+    Args:
+        todo_repository: Repository used to inspect todos.
+
+    Returns:
+        FindTodosVersionUseCase: Configured use case implementation.
+    """
+    return FindTodosVersionUseCaseImpl(todo_repository)
+
+
+class AsyncFindTodosVersionUseCase(ABC):
+    """Define the non-blocking application boundary for the todo list version."""
+
+    @abstractmethod
+    async def execute(self) -> TodoListVersion:
+        """Return the current version of the todo collection.
+
+        Returns:
+            TodoListVersion: Marker that changes whenever any todo is written.
+        """
+
+
+class AsyncFindTodosVersionUseCaseImpl(AsyncFindTodosVersionUseCase):
+    """Concrete todo list version lookup backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to inspect todos.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(self) -> TodoListVersion:
+        """Return the collection version without loading any todo.
+
+        Returns:
+            TodoListVersion: Marker that changes whenever any todo is written.
+        """
+        return await self.todo_repository.find_list_version()
+
+
+def new_async_find_todos_version_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncFindTodosVersionUseCase:
+    """Instantiate the async todo list version lookup use case.
+
+    Args:
+        todo_repository: Async repository used to inspect todos.
+
+    Returns:
+        AsyncFindTodosVersionUseCase: Configured use case implementation.
+    """
+    return AsyncFindTodosVersionUseCaseImpl(todo_repository)
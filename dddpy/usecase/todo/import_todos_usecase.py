@@ -0,0 +1,299 @@
+"""Provide use case implementations for importing todos from NDJSON lines."""
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.repositories import AsyncTodoUnitOfWork, TodoUnitOfWork
+from dddpy.domain.todo.value_objects import TodoDescription, TodoTitle
+
+# Lines written per transaction.
+IMPORT_CHUNK_SIZE = 5000
+# Lines validated per task when an executor spreads the work.
+IMPORT_VALIDATION_BATCH_SIZE = 500
+# Longest accepted line. A valid todo holds at most 1100 characters, which
+# fit even when each is escaped as a \uXXXX surrogate pair.
+MAX_IMPORT_LINE_BYTES = 16 * 1024
+INVALID_IMPORT_LINE_ERROR_MESSAGE = (
+    'Line must be a JSON object with a string title and optional description'
+)
+IMPORT_LINE_TOO_LONG_ERROR_MESSAGE = (
+    f'Line must not be longer than {MAX_IMPORT_LINE_BYTES} bytes'
+)
+IMPORT_LINE_TOO_DEEP_ERROR_MESSAGE = 'Line nests JSON values too deeply'
+
+ValidatedTodo = tuple[str, str | None]
+
+
+@dataclass(frozen=True)
+class TodoImportLine:
+    """Hold one raw line of an NDJSON import.
+
+    Attributes:
+        number: One-based line number within the upload.
+        content: Undecoded JSON object describing a todo. Readers may cut
+            an oversize line to ``MAX_IMPORT_LINE_BYTES + 1`` bytes, which
+            is still enough for it to be rejected.
+    """
+
+    number: int
+    content: bytes
+
+
+@dataclass(frozen=True)
+class TodoImportError:
+    """Report why one line of an import was rejected.
+
+    Attributes:
+        line: One-based line number within the upload.
+        error: Human-readable reason.
+    """
+
+    line: int
+    error: str
+
+
+@dataclass(frozen=True)
+class TodoImportResult:
+    """Summarize one imported chunk.
+
+    Attributes:
+        accepted: Number of todos written.
+        rejected: Number of lines that failed validation.
+        errors: One entry per rejected line, in input order.
+    """
+
+    accepted: int
+    rejected: int
+    errors: list[TodoImportError] = field(default_factory=list)
+
+
+def _parse_import_line(content: bytes) -> ValidatedTodo:
+    """Decode one line and validate it through the value objects."""
+    if len(content) > MAX_IMPORT_LINE_BYTES:
+        raise ValueError(IMPORT_LINE_TOO_LONG_ERROR_MESSAGE)
+    try:
+        data = json.loads(content)
+    except RecursionError as e:
+        raise ValueError(IMPORT_LINE_TOO_DEEP_ERROR_MESSAGE) from e
+    if not isinstance(data, dict):
+        raise TypeError(INVALID_IMPORT_LINE_ERROR_MESSAGE)
+    title, description = data.get('title'), data.get('description')
+    if not isinstance(title, str) or not isinstance(description, str | None):
+        raise TypeError(INVALID_IMPORT_LINE_ERROR_MESSAGE)
+    TodoTitle(title)
+    if description:
+        TodoDescription(description)
+    return title, description or None
+
+
+def validate_todo_import_lines(
+    lines: Sequence[TodoImportLine],
+) -> tuple[list[ValidatedTodo], list[TodoImportError]]:
+    """Validate raw import lines, separating valid todos from errors.
+
+    This is a module-level function so it can run in a process pool.
+
+    Args:
+        lines: Raw lines to validate.
+
+    Returns:
+        tuple[list[ValidatedTodo], list[TodoImportError]]: Validated titles
+            and descriptions, and the errors of the rejected lines.
+    """
+    valid: list[ValidatedTodo] = []
+    errors: list[TodoImportError] = []
+    for line in lines:
+        try:
+            valid.append(_parse_import_line(line.content))
+        except (TypeError, ValueError) as e:
+            errors.append(TodoImportError(line.number, str(e)))
+    return valid, errors
+
+
+def _validation_batches(
+    lines: Sequence[TodoImportLine],
+) -> list[Sequence[TodoImportLine]]:
+    """Split a chunk into the tasks handed to an executor."""
+    return [
+        lines[start : start + IMPORT_VALIDATION_BATCH_SIZE]
+        for start in range(0, len(lines), IMPORT_VALIDATION_BATCH_SIZE)
+    ]
+
+
+def _collect_validated(
+    outcomes: Sequence[tuple[list[ValidatedTodo], list[TodoImportError]]],
+) -> tuple[list[Todo], list[TodoImportError]]:
+    """Create todos from validated values and gather every error.
+
+    The values already passed the value object checks, so they are wrapped
+    without validating them a second time.
+    """
+    todos: list[Todo] = []
+    errors: list[TodoImportError] = []
+    for valid, rejected in outcomes:
+        todos.extend(
+            Todo.create(
+                TodoTitle.from_trusted(title),
+                TodoDescription.from_trusted(description) if description else None,
+            )
+            for title, description in valid
+        )
+        errors.extend(rejected)
+    return todos, errors
+
+
+class ImportTodosUseCase(ABC):
+    """Define the application boundary for importing a chunk of todos."""
+
+    @abstractmethod
+    def execute(self, lines: Sequence[TodoImportLine]) -> TodoImportResult:
+        """Validate and store one chunk of import lines in its own transaction.
+
+        Args:
+            lines: Raw lines of the chunk.
+
+        Returns:
+            TodoImportResult: Accepted and rejected counts for the chunk.
+        """
+
+
+class ImportTodosUseCaseImpl(ImportTodosUseCase):
+    """Concrete todo import backed by a unit of work.
+
+    Each chunk is committed on its own, so a large upload never holds one
+    long write transaction. Chunks committed before a failure stay stored.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: TodoUnitOfWork,
+        executor: Executor | None = None,
+    ):
+        """Store the dependencies.
+
+        Args:
+            unit_of_work: Unit of work inserting and committing the todos.
+            executor: Optional pool validating lines outside this process.
+        """
+        self.unit_of_work = unit_of_work
+        self.executor = executor
+
+    def execute(self, lines: Sequence[TodoImportLine]) -> TodoImportResult:
+        """Validate the chunk, insert the valid todos, and commit.
+
+        Args:
+            lines: Raw lines of the chunk.
+
+        Returns:
+            TodoImportResult: Accepted and rejected counts for the chunk.
+        """
+        if self.executor is None:
+            outcomes = [validate_todo_import_lines(lines)]
+        else:
+            outcomes = list(
+                self.executor.map(
+                    validate_todo_import_lines, _validation_batches(lines)
+                )
+            )
+        todos, errors = _collect_validated(outcomes)
+        if todos:
+            self.unit_of_work.todos.add_many(todos)
+            self.unit_of_work.commit()
+        return TodoImportResult(len(todos), len(errors), errors)
+
+
+def new_import_todos_usecase(
+    unit_of_work: TodoUnitOfWork,
+    executor: Executor | None = None,
+) -> ImportTodosUseCase:
+    """Instantiate the todo import use case.
+
+    Args:
+        unit_of_work: Unit of work inserting and committing the todos.
+        executor: Optional pool validating lines outside this process.
+
+    Returns:
+        ImportTodosUseCase: Configured use case implementation.
+    """
+    return ImportTodosUseCaseImpl(unit_of_work, executor)
+
+
+class AsyncImportTodosUseCase(ABC):
+    """Define the non-blocking application boundary for importing todos."""
+
+    @abstractmethod
+    async def execute(self, lines: Sequence[TodoImportLine]) -> TodoImportResult:
+        """Validate and store one chunk of import lines in its own transaction.
+
+        Args:
+            lines: Raw lines of the chunk.
+
+        Returns:
+            TodoImportResult: Accepted and rejected counts for the chunk.
+        """
+
+
+class AsyncImportTodosUseCaseImpl(AsyncImportTodosUseCase):
+    """Concrete todo import backed by an async unit of work."""
+
+    def __init__(
+        self,
+        unit_of_work: AsyncTodoUnitOfWork,
+        executor: Executor | None = None,
+    ):
+        """Store the dependencies.
+
+        Args:
+            unit_of_work: Unit of work inserting and committing the todos.
+            executor: Optional pool validating lines outside this process.
+        """
+        self.unit_of_work = unit_of_work
+        self.executor = executor
+
+    async def execute(self, lines: Sequence[TodoImportLine]) -> TodoImportResult:
+        """Validate the chunk, insert the valid todos, and commit.
+
+        Args:
+            lines: Raw lines of the chunk.
+
+        Returns:
+            TodoImportResult: Accepted and rejected counts for the chunk.
+        """
+        if self.executor is None:
+            outcomes = [validate_todo_import_lines(lines)]
+        else:
+            loop = asyncio.get_running_loop()
+            outcomes = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self.executor, validate_todo_import_lines, batch
+                    )
+                    for batch in _validation_batches(lines)
+                )
+            )
+        todos, errors = _collect_validated(outcomes)
+        if todos:
+            await self.unit_of_work.todos.add_many(todos)
+            await self.unit_of_work.commit()
+        return TodoImportResult(len(todos), len(errors), errors)
+
+
+def new_async_import_todos_usecase(
+    unit_of_work: AsyncTodoUnitOfWork,
+    executor: Executor | None = None,
+) -> AsyncImportTodosUseCase:
+    """Instantiate the async todo import use case.
+
+    Args:
+        unit_of_work: Unit of work inserting and committing the todos.
+        executor: Optional pool validating lines outside this process.
+
+    Returns:
+        AsyncImportTodosUseCase: Configured use case implementation.
+    """
+    return AsyncImportTodosUseCaseImpl(unit_of_work, executor)
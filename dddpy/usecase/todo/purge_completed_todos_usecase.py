@@ -0,0 +1,140 @@
+"""Provide use case implementations for purging old completed todos."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from functools import partial
+
+from dddpy.domain.todo.repositories import AsyncTodoUnitOfWork, TodoUnitOfWork
+from dddpy.usecase.todo.chunked_maintenance import (
+    MAINTENANCE_CHUNK_SIZE,
+    run_in_chunks,
+    run_in_chunks_async,
+)
+
+PURGE_CHUNK_SIZE = MAINTENANCE_CHUNK_SIZE
+
+
+class PurgeCompletedTodosUseCase(ABC):
+    """Define the application boundary for purging old completed todos."""
+
+    @abstractmethod
+    def execute(self, completed_before: datetime) -> int:
+        """Delete every todo completed before the given time.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+
+        Returns:
+            int: Number of todos deleted.
+        """
+
+
+class PurgeCompletedTodosUseCaseImpl(PurgeCompletedTodosUseCase):
+    """Concrete purge backed by a unit of work.
+
+    Todos are deleted through ``run_in_chunks``, one committed chunk of
+    ``chunk_size`` at a time. Chunks committed before a failure stay deleted.
+    """
+
+    def __init__(
+        self, unit_of_work: TodoUnitOfWork, chunk_size: int = PURGE_CHUNK_SIZE
+    ):
+        """Store the dependencies.
+
+        Args:
+            unit_of_work: Unit of work deleting and committing the todos.
+            chunk_size: Most todos deleted per transaction.
+        """
+        self.unit_of_work = unit_of_work
+        self.chunk_size = chunk_size
+
+    def execute(self, completed_before: datetime) -> int:
+        """Delete old completed todos one committed chunk at a time.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+
+        Returns:
+            int: Number of todos deleted.
+        """
+        return run_in_chunks(
+            partial(self.unit_of_work.todos.delete_completed_before, completed_before),
+            self.unit_of_work.commit,
+            self.chunk_size,
+        )
+
+
+def new_purge_completed_todos_usecase(
+    unit_of_work: TodoUnitOfWork, chunk_size: int = PURGE_CHUNK_SIZE
+) -> PurgeCompletedTodosUseCase:
+    """Instantiate the completed todo purge use case.
+
+    Args:
+        unit_of_work: Unit of work deleting and committing the todos.
+        chunk_size: Most todos deleted per transaction.
+
+    Returns:
+        PurgeCompletedTodosUseCase: Configured use case implementation.
+    """
+    return PurgeCompletedTodosUseCaseImpl(unit_of_work, chunk_size)
+
+
+class AsyncPurgeCompletedTodosUseCase(ABC):
+    """Define the non-blocking application boundary for purging todos."""
+
+    @abstractmethod
+    async def execute(self, completed_before: datetime) -> int:
+        """Delete every todo completed before the given time.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+
+        Returns:
+            int: Number of todos deleted.
+        """
+
+
+class AsyncPurgeCompletedTodosUseCaseImpl(AsyncPurgeCompletedTodosUseCase):
+    """Concrete purge backed by an async unit of work."""
+
+    def __init__(
+        self, unit_of_work: AsyncTodoUnitOfWork, chunk_size: int = PURGE_CHUNK_SIZE
+    ):
+        """Store the dependencies.
+
+        Args:
+            unit_of_work: Unit of work deleting and committing the todos.
+            chunk_size: Most todos deleted per transaction.
+        """
+        self.unit_of_work = unit_of_work
+        self.chunk_size = chunk_size
+
+    async def execute(self, completed_before: datetime) -> int:
+        """Delete old completed todos one committed chunk at a time.
+
+        Args:
+            completed_before: Exclusive upper bound on the completion time.
+
+        Returns:
+            int: Number of todos deleted.
+        """
+        return await run_in_chunks_async(
+            partial(self.unit_of_work.todos.delete_completed_before, completed_before),
+            self.unit_of_work.commit,
+            self.chunk_size,
+        )
+
+
+def new_async_purge_completed_todos_usecase(
+    unit_of_work: AsyncTodoUnitOfWork, chunk_size: int = PURGE_CHUNK_SIZE
+) -> AsyncPurgeCompletedTodosUseCase:
+    """Instantiate the async completed todo purge use case.
+
+    Args:
+        unit_of_work: Unit of work deleting and committing the todos.
+        chunk_size: Most todos deleted per transaction.
+
+    Returns:
+        AsyncPurgeCompletedTodosUseCase: Configured use case implementation.
+    """
+    return AsyncPurgeCompletedTodosUseCaseImpl(unit_of_work, chunk_size)
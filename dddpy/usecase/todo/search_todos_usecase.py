@@ -0,0 +1,148 @@
+"""Provide use case implementations for full-text todo search."""
+
+from abc import ABC, abstractmethod
+
+from dddpy.domain.todo.repositories import (
+    DEFAULT_TODO_PAGE_SIZE,
+    AsyncTodoRepository,
+    TodoRepository,
+    TodoSearchPage,
+)
+
+
+class SearchTodosUseCase(ABC):
+    """Define the application boundary for searching todos."""
+
+    @abstractmethod
+    def execute(
+        self,
+        query: str,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> TodoSearchPage:
+        """Return one page of todos matching the query, best match first.
+
+        Args:
+            query: Terms to look for in titles and descriptions.
+            limit: Maximum number of hits in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoSearchPage: The matching todos and the cursor for the next page.
+        """
+
+
+class SearchTodosUseCaseImpl(SearchTodosUseCase):
+    """Concrete todo search use case backed by a repository."""
+
+    def __init__(self, todo_repository: TodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Repository used to search todos.
+        """
+        self.todo_repository = todo_repository
+
+    def execute(
+        self,
+        query: str,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> TodoSearchPage:
+        """Return a page of todos ranked per repository implementation.
+
+        Args:
+            query: Terms to look for in titles and descriptions.
+            limit: Maximum number of hits in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded or was
+                issued for a different query.
+
+        Returns:
+            TodoSearchPage: The matching todos and the cursor for the next page.
+        """
+        return self.todo_repository.search(query, limit=limit, cursor=cursor)
+
+
+def new_search_todos_usecase(todo_repository: TodoRepository) -> SearchTodosUseCase:
+    """Instantiate the todo search use case.
+
+    Args:
+        todo_repository: Repository used to search todos.
+
+    Returns:
+        SearchTodosUseCase: Configured use case implementation.
+    """
+    return SearchTodosUseCaseImpl(todo_repository)
+
+
+class AsyncSearchTodosUseCase(ABC):
+    """Define the non-blocking application boundary for searching todos."""
+
+    @abstractmethod
+    async def execute(
+        self,
+        query: str,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> TodoSearchPage:
+        """Return one page of todos matching the query, best match first.
+
+        Args:
+            query: Terms to look for in titles and descriptions.
+            limit: Maximum number of hits in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Returns:
+            TodoSearchPage: The matching todos and the cursor for the next page.
+        """
+
+
+class AsyncSearchTodosUseCaseImpl(AsyncSearchTodosUseCase):
+    """Concrete todo search use case backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to search todos.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(
+        self,
+        query: str,
+        limit: int = DEFAULT_TODO_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> TodoSearchPage:
+        """Return a page of todos ranked per repository implementation.
+
+        Args:
+            query: Terms to look for in titles and descriptions.
+            limit: Maximum number of hits in the page.
+            cursor: Opaque cursor returned with the previous page, if any.
+
+        Raises:
+            TodoInvalidCursorError: If the cursor cannot be decoded or was
+                issued for a different query.
+
+        Returns:
+            TodoSearchPage: The matching todos and the cursor for the next page.
+        """
+        return await self.todo_repository.search(query, limit=limit, cursor=cursor)
+
+
+def new_async_search_todos_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncSearchTodosUseCase:
+    """Instantiate the async todo search use case.
+
+    Args:
+        todo_repository: Async repository used to search todos.
+
+    Returns:
+        AsyncSearchTodosUseCase: Configured use case implementation.
+    """
+    return AsyncSearchTodosUseCaseImpl(todo_repository)
@@ -1,6 +1,7 @@
 """Provide use case implementations for starting todos."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from dddpy.domain.todo.entities import Todo
 from dddpy.domain.todo.exceptions import (
@@ -8,7 +9,7 @@ from dddpy.domain.todo.exceptions import (
     TodoAlreadyStartedError,
     TodoNotFoundError,
 )
-from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.repositories import AsyncTodoRepository, TodoRepository
 from dddpy.domain.todo.value_objects import TodoId, TodoStatus
 
 
@@ -39,7 +40,9 @@ class StartTodoUseCaseImpl(StartTodoUseCase):
         self.todo_repository = todo_repository
 
     def execute(self, todo_id: TodoId) -> Todo:
-        """Start a todo after validating its current lifecycle state.
+        """Start a todo that has not been started, in one atomic write.
+
+        The lifecycle error is only looked up when the write is rejected.
 
         Args:
             todo_id: Identifier of the todo to start.
@@ -52,20 +55,21 @@ class StartTodoUseCaseImpl(StartTodoUseCase):
         Returns:
             Todo: Persisted todo marked as in progress.
         """
-        todo = self.todo_repository.find_by_id(todo_id)
+        todo = self.todo_repository.transition(
+            todo_id, TodoStatus.IN_PROGRESS, (TodoStatus.NOT_STARTED,), datetime.now()
+        )
+        if todo is not None:
+            return todo
+
+        status = self.todo_repository.find_status(todo_id)
 
-        if todo is None:
+        if status is None:
             raise TodoNotFoundError
 
-        if todo.is_completed:
+        if status == TodoStatus.COMPLETED:
             raise TodoAlreadyCompletedError
 
-        if todo.status == TodoStatus.IN_PROGRESS:
-            raise TodoAlreadyStartedError
-
-        todo.start()
-        self.todo_repository.save(todo)
-        return todo
+        raise TodoAlreadyStartedError
 
 
 def new_start_todo_usecase(todo_repository: TodoRepository) -> StartTodoUseCase:
@@ -78,3 +82,76 @@ def new_start_todo_usecase(todo_repository: TodoRepository) -> StartTodoUseCase:
         StartTodoUseCase: Configured use case implementation.
     """
     return StartTodoUseCaseImpl(todo_repository)
+
+
+class AsyncStartTodoUseCase(ABC):
+    """Define the non-blocking application boundary for starting todos."""
+
+    @abstractmethod
+    async def execute(self, todo_id: TodoId) -> Todo:
+        """Start a todo identified by the provided ID.
+
+        Args:
+            todo_id: Identifier of the todo to start.
+
+        Returns:
+            Todo: Updated todo entity in progress.
+        """
+
+
+class AsyncStartTodoUseCaseImpl(AsyncStartTodoUseCase):
+    """Concrete todo start use case backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to persist todo updates.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(self, todo_id: TodoId) -> Todo:
+        """Start a todo that has not been started, in one atomic write.
+
+        The lifecycle error is only looked up when the write is rejected.
+
+        Args:
+            todo_id: Identifier of the todo to start.
+
+        Raises:
+            TodoNotFoundError: If the todo cannot be located.
+            TodoAlreadyCompletedError: If the todo is already completed.
+            TodoAlreadyStartedError: If the todo is already in progress.
+
+        Returns:
+            Todo: Persisted todo marked as in progress.
+        """
+        todo = await self.todo_repository.transition(
+            todo_id, TodoStatus.IN_PROGRESS, (TodoStatus.NOT_STARTED,), datetime.now()
+        )
+        if todo is not None:
+            return todo
+
+        status = await self.todo_repository.find_status(todo_id)
+
+        if status is None:
+            raise TodoNotFoundError
+
+        if status == TodoStatus.COMPLETED:
+            raise TodoAlreadyCompletedError
+
+        raise TodoAlreadyStartedError
+
+
+def new_async_start_todo_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncStartTodoUseCase:
+    """Instantiate the async todo start use case.
+
+    Args:
+        todo_repository: Async repository used to persist todo updates.
+
+    Returns:
+        AsyncStartTodoUseCase: Configured use case implementation.
+    """
+    return AsyncStartTodoUseCaseImpl(todo_repository)
@@ -3,8 +3,8 @@
 from abc import ABC, abstractmethod
 
 from dddpy.domain.todo.entities import Todo
-from dddpy.domain.todo.exceptions import TodoNotFoundError
-from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.exceptions import TodoConflictError, TodoNotFoundError
+from dddpy.domain.todo.repositories import AsyncTodoRepository, TodoRepository
 from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
 
 
@@ -17,6 +17,7 @@ class UpdateTodoUseCase(ABC):
         todo_id: TodoId,
         title: TodoTitle | None = None,
         description: TodoDescription | None = None,
+        expected_version: int | None = None,
     ) -> Todo:
         """Update a todo using the provided values.
 
@@ -24,6 +25,7 @@ class UpdateTodoUseCase(ABC):
             todo_id: Identifier of the todo to update.
             title: Optional replacement title.
             description: Optional replacement description.
+            expected_version: Version the caller last read, if it sent one.
 
         Returns:
             Todo: Updated todo entity.
@@ -46,6 +48,7 @@ class UpdateTodoUseCaseImpl(UpdateTodoUseCase):
         todo_id: TodoId,
         title: TodoTitle | None = None,
         description: TodoDescription | None = None,
+        expected_version: int | None = None,
     ) -> Todo:
         """Update a todo and persist the changes.
 
@@ -53,9 +56,11 @@ class UpdateTodoUseCaseImpl(UpdateTodoUseCase):
             todo_id: Identifier of the todo to update.
             title: Optional replacement title.
             description: Optional replacement description.
+            expected_version: Version the caller last read, if it sent one.
 
         Raises:
             TodoNotFoundError: If no todo matches the provided identifier.
+            TodoConflictError: If the todo is no longer at ``expected_version``.
 
         Returns:
             Todo: Persisted todo reflecting the latest updates.
@@ -64,6 +69,8 @@ class UpdateTodoUseCaseImpl(UpdateTodoUseCase):
 
         if todo is None:
             raise TodoNotFoundError
+        if expected_version is not None and expected_version != todo.version:
+            raise TodoConflictError
 
         if title is not None:
             todo.update_title(title)
@@ -84,3 +91,90 @@ def new_update_todo_usecase(todo_repository: TodoRepository) -> UpdateTodoUseCas
         UpdateTodoUseCase: Configured use case implementation.
     """
     return UpdateTodoUseCaseImpl(todo_repository)
+
+
+class AsyncUpdateTodoUseCase(ABC):
+    """Define the non-blocking application boundary for updating todos."""
+
+    @abstractmethod
+    async def execute(
+        self,
+        todo_id: TodoId,
+        title: TodoTitle | None = None,
+        description: TodoDescription | None = None,
+        expected_version: int | None = None,
+    ) -> Todo:
+        """Update a todo using the provided values.
+
+        Args:
+            todo_id: Identifier of the todo to update.
+            title: Optional replacement title.
+            description: Optional replacement description.
+            expected_version: Version the caller last read, if it sent one.
+
+        Returns:
+            Todo: Updated todo entity.
+        """
+
+
+class AsyncUpdateTodoUseCaseImpl(AsyncUpdateTodoUseCase):
+    """Concrete todo update use case backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to persist todo updates.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(
+        self,
+        todo_id: TodoId,
+        title: TodoTitle | None = None,
+        description: TodoDescription | None = None,
+        expected_version: int | None = None,
+    ) -> Todo:
+        """Update a todo and persist the changes.
+
+        Args:
+            todo_id: Identifier of the todo to update.
+            title: Optional replacement title.
+            description: Optional replacement description.
+            expected_version: Version the caller last read, if it sent one.
+
+        Raises:
+            TodoNotFoundError: If no todo matches the provided identifier.
+            TodoConflictError: If the todo is no longer at ``expected_version``.
+
+        Returns:
+            Todo: Persisted todo reflecting the latest updates.
+        """
+        todo = await self.todo_repository.find_by_id(todo_id)
+
+        if todo is None:
+            raise TodoNotFoundError
+        if expected_version is not None and expected_version != todo.version:
+            raise TodoConflictError
+
+        if title is not None:
+            todo.update_title(title)
+        if description is not None:
+            todo.update_description(description)
+
+        await self.todo_repository.save(todo)
+        return todo
+
+
+def new_async_update_todo_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncUpdateTodoUseCase:
+    """Instantiate the async todo update use case.
+
+    Args:
+        todo_repository: Async repository used to persist todo updates.
+
+    Returns:
+        AsyncUpdateTodoUseCase: Configured use case implementation.
+    """
+    return AsyncUpdateTodoUseCaseImpl(todo_repository)
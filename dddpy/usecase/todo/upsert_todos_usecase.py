@@ -0,0 +1,221 @@
+"""Provide use case implementations for creating and updating todos in bulk."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoConflictError, TodoNotFoundError
+from dddpy.domain.todo.repositories import AsyncTodoRepository, TodoRepository
+from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
+
+
+@dataclass(frozen=True)
+class TodoUpsertItem:
+    """Describe one todo to create or update in a batch.
+
+    Attributes:
+        title: Raw title for the todo.
+        description: Optional raw description for the todo; on an update,
+            None keeps the stored description and an empty string clears it.
+        todo_id: Identifier of the todo to update; None creates a new todo.
+    """
+
+    title: str
+    description: str | None = None
+    todo_id: TodoId | None = None
+
+
+@dataclass(frozen=True)
+class TodoUpsertResult:
+    """Report the outcome for one item of a batch.
+
+    Attributes:
+        todo: Persisted todo when the item succeeded; otherwise None.
+        created: Whether the item created a new todo.
+        error: Human-readable reason when the item was rejected.
+    """
+
+    todo: Todo | None = None
+    created: bool = False
+    error: str | None = None
+
+
+def _apply_upsert_items(
+    items: Sequence[TodoUpsertItem], existing_todos: Sequence[Todo]
+) -> tuple[list[TodoUpsertResult], list[Todo]]:
+    """Validate batch items and apply them to new or existing todos.
+
+    Args:
+        items: Todos to create or update.
+        existing_todos: Stored todos referenced by the items.
+
+    Returns:
+        tuple[list[TodoUpsertResult], list[Todo]]: One result per item, in
+            input order, and the distinct todos that should be persisted.
+    """
+    existing = {todo.id: todo for todo in existing_todos}
+
+    results: list[TodoUpsertResult] = []
+    accepted: dict[TodoId, Todo] = {}
+    for item in items:
+        try:
+            title = TodoTitle(item.title)
+            description = (
+                TodoDescription(item.description) if item.description else None
+            )
+        except ValueError as e:
+            results.append(TodoUpsertResult(error=str(e)))
+            continue
+
+        if item.todo_id is None:
+            todo = Todo.create(title, description)
+        else:
+            found = existing.get(item.todo_id)
+            if found is None:
+                results.append(TodoUpsertResult(error=TodoNotFoundError.message))
+                continue
+            todo = found
+            todo.update_title(title)
+            if item.description is not None:
+                todo.update_description(description)
+
+        accepted[todo.id] = todo
+        results.append(TodoUpsertResult(todo, created=item.todo_id is None))
+
+    return results, list(accepted.values())
+
+
+def _report_conflicts(
+    results: list[TodoUpsertResult], conflicts: set[TodoId]
+) -> list[TodoUpsertResult]:
+    """Turn the results of todos that changed concurrently into errors.
+
+    Args:
+        results: One result per item, in input order.
+        conflicts: Identifiers of the todos the repository did not save.
+
+    Returns:
+        list[TodoUpsertResult]: The results with those items rejected.
+    """
+    if not conflicts:
+        return results
+    return [
+        TodoUpsertResult(error=TodoConflictError.message)
+        if result.todo is not None and result.todo.id in conflicts
+        else result
+        for result in results
+    ]
+
+
+class UpsertTodosUseCase(ABC):
+    """Define the application boundary for bulk todo creation and updates."""
+
+    @abstractmethod
+    def execute(self, items: Sequence[TodoUpsertItem]) -> list[TodoUpsertResult]:
+        """Create or update todos for every item in the batch.
+
+        Args:
+            items: Todos to create or update.
+
+        Returns:
+            list[TodoUpsertResult]: One result per item, in input order.
+        """
+
+
+class UpsertTodosUseCaseImpl(UpsertTodosUseCase):
+    """Concrete bulk todo upsert use case backed by a repository."""
+
+    def __init__(self, todo_repository: TodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Repository used to persist todos.
+        """
+        self.todo_repository = todo_repository
+
+    def execute(self, items: Sequence[TodoUpsertItem]) -> list[TodoUpsertResult]:
+        """Validate every item and persist the accepted ones in one batch.
+
+        Invalid items, and stored todos that changed since they were read,
+        are reported individually and do not prevent the remaining items from
+        being saved.
+
+        Args:
+            items: Todos to create or update.
+
+        Returns:
+            list[TodoUpsertResult]: One result per item, in input order.
+        """
+        ids = [item.todo_id for item in items if item.todo_id is not None]
+        existing = self.todo_repository.find_by_ids(ids)
+        results, accepted = _apply_upsert_items(items, existing)
+        return _report_conflicts(results, self.todo_repository.save_many(accepted))
+
+
+def new_upsert_todos_usecase(todo_repository: TodoRepository) -> UpsertTodosUseCase:
+    """Instantiate the bulk todo upsert use case.
+
+    Args:
+        todo_repository: Repository used to persist todos.
+
+    Returns:
+        UpsertTodosUseCase: Configured use case implementation.
+    """
+    return UpsertTodosUseCaseImpl(todo_repository)
+
+
+class AsyncUpsertTodosUseCase(ABC):
+    """Define the non-blocking application boundary for bulk upserts."""
+
+    @abstractmethod
+    async def execute(self, items: Sequence[TodoUpsertItem]) -> list[TodoUpsertResult]:
+        """Create or update the given todos in a single batch.
+
+        Args:
+            items: Todos to create or update.
+
+        Returns:
+            list[TodoUpsertResult]: One result per item, in input order.
+        """
+
+
+class AsyncUpsertTodosUseCaseImpl(AsyncUpsertTodosUseCase):
+    """Concrete bulk upsert use case backed by an async repository."""
+
+    def __init__(self, todo_repository: AsyncTodoRepository):
+        """Store the repository dependency.
+
+        Args:
+            todo_repository: Async repository used to persist todos.
+        """
+        self.todo_repository = todo_repository
+
+    async def execute(self, items: Sequence[TodoUpsertItem]) -> list[TodoUpsertResult]:
+        """Validate every item and persist the accepted ones in one batch.
+
+        Args:
+            items: Todos to create or update.
+
+        Returns:
+            list[TodoUpsertResult]: One result per item, in input order.
+        """
+        ids = [item.todo_id for item in items if item.todo_id is not None]
+        existing = await self.todo_repository.find_by_ids(ids)
+        results, accepted = _apply_upsert_items(items, existing)
+        conflicts = await self.todo_repository.save_many(accepted)
+        return _report_conflicts(results, conflicts)
+
+
+def new_async_upsert_todos_usecase(
+    todo_repository: AsyncTodoRepository,
+) -> AsyncUpsertTodosUseCase:
+    """Instantiate the async bulk todo upsert use case.
+
+    Args:
+        todo_repository: Async repository used to persist todos.
+
+    Returns:
+        AsyncUpsertTodosUseCase: Configured use case implementation.
+    """
+    return AsyncUpsertTodosUseCaseImpl(todo_repository)
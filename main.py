@@ -1,13 +1,27 @@
 """Bootstrap the FastAPI application and configure infrastructure."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
 from logging import config
 
 from fastapi import FastAPI
 
-from dddpy.infrastructure.sqlite.database import create_tables, engine
-from dddpy.presentation.api.todo.handlers.todo_api_route_handler import (
+from dddpy.infrastructure.di.injection import (
+    todo_import_executor,
+    todo_write_coordinator,
+)
+from dddpy.infrastructure.settings import settings
+from dddpy.infrastructure.sqlite.database import (
+    SessionLocal,
+    async_engine,
+    engine,
+)
+from dddpy.infrastructure.sqlite.migrations import apply_migrations, migrate
+from dddpy.infrastructure.sqlite.todo.todo_archive_job import run_todo_archive_job
+from dddpy.presentation.api.todo.handlers import (
+    AsyncTodoApiRouteHandler,
     TodoApiRouteHandler,
 )
 
@@ -25,9 +39,39 @@ async def lifespan(app: FastAPI):
     Yields:
         None: Control is yielded back to FastAPI after setup completes.
     """
-    create_tables()
+    online_migrations = migrate(engine)
+    # Online steps such as index builds finish while requests are served.
+    migration_job = (
+        asyncio.create_task(
+            asyncio.to_thread(apply_migrations, engine, online_migrations)
+        )
+        if online_migrations
+        else None
+    )
+    archive_job = (
+        asyncio.create_task(
+            run_todo_archive_job(
+                SessionLocal,
+                timedelta(days=settings.archive_after_days),
+                settings.archive_interval_seconds,
+            )
+        )
+        if settings.archive_after_days > 0
+        else None
+    )
     yield
+    if archive_job is not None:
+        archive_job.cancel()
+        with suppress(asyncio.CancelledError):
+            await archive_job
+    if migration_job is not None:
+        await migration_job
+    if todo_write_coordinator is not None:
+        todo_write_coordinator.close()
+    await async_engine.dispose()
     engine.dispose()
+    if todo_import_executor is not None:
+        todo_import_executor.shutdown()
 
 
 app = FastAPI(
@@ -37,5 +81,7 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-todo_route_handler = TodoApiRouteHandler()
+todo_route_handler = (
+    AsyncTodoApiRouteHandler() if settings.async_api else TodoApiRouteHandler()
+)
 todo_route_handler.register_routes(app)
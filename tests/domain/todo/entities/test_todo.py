@@ -171,3 +171,13 @@ def test_todo_equality():
     assert todo1 != todo2  # Different IDs
     assert todo3 == todo4  # Same ID, different titles
     assert todo1 != 'not a todo'  # Different type
+
+
+def test_todo_and_value_objects_have_no_instance_dict():
+    """Test that the entity and its value objects are slotted."""
+    todo = Todo.create(TodoTitle('Test Todo'), TodoDescription('Details'))
+
+    for obj in (todo, todo.id, todo.title, todo.description):
+        assert not hasattr(obj, '__dict__')
+    with pytest.raises(AttributeError):
+        todo.unknown_attribute = True  # type: ignore[attr-defined]
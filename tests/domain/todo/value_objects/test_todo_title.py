@@ -28,3 +28,9 @@ def test_str_representation():
     """Test the string representation of TodoTitle."""
     title = TodoTitle('Test Todo')
     assert str(title) == 'Test Todo'
+
+
+def test_from_trusted_equals_validated_title():
+    """Test that a trusted title behaves like one built through validation."""
+    assert TodoTitle.from_trusted('Test Todo') == TodoTitle('Test Todo')
+    assert hash(TodoTitle.from_trusted('Test Todo')) == hash(TodoTitle('Test Todo'))
@@ -0,0 +1,187 @@
+"""Test cases for TodoEntityCache and CachingTodoRepository."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoConflictError
+from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.value_objects import TodoStatus, TodoTitle
+from dddpy.infrastructure.cache import (
+    TodoCacheStats,
+    TodoEntityCache,
+    new_caching_todo_repository,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create a controllable clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    """Create a small cache driven by the fake clock."""
+    return TodoEntityCache(max_size=2, ttl_seconds=10, clock=clock)
+
+
+@pytest.fixture
+def todo_repository_mock():
+    """Create a mock TodoRepository."""
+    return Mock(spec=TodoRepository)
+
+
+@pytest.fixture
+def repository(todo_repository_mock, cache):
+    """Wrap the mock repository with the cache."""
+    return new_caching_todo_repository(todo_repository_mock, cache)
+
+
+def make_todo(title: str = 'Cached') -> Todo:
+    """Build a fresh todo."""
+    return Todo.create(TodoTitle(title))
+
+
+def test_cache_expires_entries_after_ttl(cache, clock):
+    """Test that entries older than the TTL are treated as misses."""
+    todo = make_todo()
+    cache.put(todo)
+
+    assert cache.get(todo.id) == todo
+    clock.now = 10
+    assert cache.get(todo.id) is None
+    assert cache.stats() == TodoCacheStats(hits=1, misses=1, evictions=0, size=0)
+
+
+def test_cache_evicts_least_recently_used(cache):
+    """Test that the least recently read entry is evicted when full."""
+    first, second, third = make_todo('1'), make_todo('2'), make_todo('3')
+    cache.put(first)
+    cache.put(second)
+    cache.get(first.id)
+    cache.put(third)
+
+    assert cache.get(second.id) is None
+    assert cache.get(first.id) == first
+    assert cache.stats().evictions == 1
+
+
+def test_cache_returns_copies(cache):
+    """Test that mutating a loaded todo does not change the cached one."""
+    todo = make_todo('Original')
+    cache.put(todo)
+
+    loaded = cache.get(todo.id)
+    assert loaded is not None
+    loaded.update_title(TodoTitle('Changed'))
+
+    cached = cache.get(todo.id)
+    assert cached is not None
+    assert cached.title.value == 'Original'
+
+
+def test_cache_rejects_invalid_bounds():
+    """Test that non-positive bounds are rejected."""
+    with pytest.raises(ValueError):
+        TodoEntityCache(max_size=0, ttl_seconds=1)
+
+
+def test_find_by_id_reads_through(repository, todo_repository_mock):
+    """Test that only the first lookup reaches the wrapped repository."""
+    todo = make_todo()
+    todo_repository_mock.find_by_id.return_value = todo
+
+    assert repository.find_by_id(todo.id) == todo
+    assert repository.find_by_id(todo.id) == todo
+
+    todo_repository_mock.find_by_id.assert_called_once_with(todo.id)
+
+
+def test_missing_todo_is_not_cached(repository, todo_repository_mock):
+    """Test that misses for unknown todos always reach the repository."""
+    todo = make_todo()
+    todo_repository_mock.find_by_id.return_value = None
+
+    repository.find_by_id(todo.id)
+    repository.find_by_id(todo.id)
+
+    assert todo_repository_mock.find_by_id.call_count == len(['first', 'second'])
+
+
+@pytest.mark.parametrize('write', ['save', 'save_many', 'delete'])
+def test_writes_invalidate_cached_entry(repository, cache, write):
+    """Test that every write path evicts the cached todo."""
+    todo = make_todo()
+    cache.put(todo)
+
+    if write == 'save':
+        repository.save(todo)
+    elif write == 'save_many':
+        repository.save_many([todo])
+    else:
+        repository.delete(todo.id)
+
+    assert cache.get(todo.id) is None
+
+
+@pytest.mark.parametrize('write', ['save', 'save_many', 'transition'])
+def test_failed_writes_still_evict_cached_entry(
+    repository, todo_repository_mock, cache, write
+):
+    """Test that a conflicting write does not leave the stale todo cached."""
+    todo = make_todo()
+    cache.put(todo)
+    getattr(todo_repository_mock, write).side_effect = TodoConflictError
+
+    with pytest.raises(TodoConflictError):
+        if write == 'save':
+            repository.save(todo)
+        elif write == 'save_many':
+            repository.save_many([todo])
+        else:
+            repository.transition(
+                todo.id,
+                TodoStatus.IN_PROGRESS,
+                (TodoStatus.NOT_STARTED,),
+                todo.updated_at,
+            )
+
+    assert cache.get(todo.id) is None
+
+
+def test_invalidate_written_evicts_rows_cached_before_commit(repository, cache):
+    """Test that a stale row cached by another request is evicted on commit."""
+    todo = make_todo()
+    repository.save(todo)
+    cache.put(todo)
+
+    repository.invalidate_written()
+
+    assert cache.get(todo.id) is None
+
+
+def test_find_by_ids_loads_only_misses(repository, todo_repository_mock, cache):
+    """Test that cached todos are not requested from the repository."""
+    cached, missing = make_todo('Cached'), make_todo('Missing')
+    cache.put(cached)
+    todo_repository_mock.find_by_ids.return_value = [missing]
+
+    result = repository.find_by_ids([cached.id, missing.id])
+
+    assert set(result) == {cached, missing}
+    todo_repository_mock.find_by_ids.assert_called_once_with([missing.id])
+    assert cache.get(missing.id) == missing
@@ -0,0 +1,121 @@
+"""Test cases for the context-bound todo unit of work."""
+
+import asyncio
+from contextvars import Context, copy_context
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from dddpy.domain.todo.repositories import (
+    AsyncTodoRepository,
+    AsyncTodoUnitOfWork,
+    TodoRepository,
+    TodoUnitOfWork,
+)
+from dddpy.domain.todo.value_objects import TodoId
+from dddpy.infrastructure.di.todo_context import (
+    bind_async_todo_unit_of_work,
+    bind_todo_unit_of_work,
+    new_async_context_todo_unit_of_work,
+    new_context_todo_unit_of_work,
+)
+
+
+def new_unit_of_work_mock() -> Mock:
+    """Create a mock TodoUnitOfWork holding a mock TodoRepository."""
+    unit_of_work = Mock(spec=TodoUnitOfWork)
+    unit_of_work.todos = Mock(spec=TodoRepository)
+    return unit_of_work
+
+
+def test_calls_are_forwarded_to_the_bound_unit_of_work():
+    """Test that the repository and commit reach the unit of work of the context."""
+    bound = new_unit_of_work_mock()
+    unit_of_work = new_context_todo_unit_of_work()
+    todo_id = TodoId.generate()
+
+    def handle_request():
+        bind_todo_unit_of_work(bound)
+        unit_of_work.todos.find_by_id(todo_id)
+        unit_of_work.commit()
+
+    copy_context().run(handle_request)
+
+    bound.todos.find_by_id.assert_called_once_with(todo_id)
+    bound.commit.assert_called_once_with()
+
+
+@pytest.mark.parametrize(
+    ('interface', 'attribute'),
+    [(TodoUnitOfWork, None), (TodoRepository, 'todos')],
+)
+def test_every_interface_method_is_forwarded(interface, attribute):
+    """Test that no abstract method is left out of the forwarding."""
+    bound = new_unit_of_work_mock()
+    unit_of_work = new_context_todo_unit_of_work()
+    target = getattr(unit_of_work, attribute) if attribute else unit_of_work
+    bound_target = getattr(bound, attribute) if attribute else bound
+
+    def handle_request():
+        bind_todo_unit_of_work(bound)
+        for name in interface.__abstractmethods__:
+            getattr(target, name)(name)
+
+    copy_context().run(handle_request)
+
+    for name in interface.__abstractmethods__:
+        getattr(bound_target, name).assert_called_once_with(name)
+
+
+def test_calls_without_a_bound_unit_of_work_raise():
+    """Test that using the context unit of work outside a request fails loudly."""
+    unit_of_work = new_context_todo_unit_of_work()
+
+    with pytest.raises(LookupError):
+        Context().run(unit_of_work.todos.count_by_status)
+
+
+def test_contexts_do_not_share_the_bound_unit_of_work():
+    """Test that each context keeps the unit of work it bound."""
+    first, second = new_unit_of_work_mock(), new_unit_of_work_mock()
+    unit_of_work = new_context_todo_unit_of_work()
+    first_context, second_context = copy_context(), copy_context()
+    first_context.run(bind_todo_unit_of_work, first)
+    second_context.run(bind_todo_unit_of_work, second)
+
+    first_context.run(unit_of_work.rollback)
+    second_context.run(unit_of_work.commit)
+
+    first.rollback.assert_called_once_with()
+    first.commit.assert_not_called()
+    second.commit.assert_called_once_with()
+    second.rollback.assert_not_called()
+
+
+async def handle_async_request(
+    unit_of_work: AsyncTodoUnitOfWork, bound: AsyncTodoUnitOfWork
+) -> None:
+    """Bind the unit of work, yield to other tasks, then commit through the proxy."""
+    bind_async_todo_unit_of_work(bound)
+    await asyncio.sleep(0)
+    await unit_of_work.todos.find_list_version()
+    await unit_of_work.commit()
+
+
+def test_concurrent_async_requests_use_their_own_unit_of_work():
+    """Test that interleaved tasks each reach the unit of work they bound."""
+    unit_of_work = new_async_context_todo_unit_of_work()
+    bound = [AsyncMock(spec=AsyncTodoUnitOfWork) for _ in range(3)]
+    for mock in bound:
+        mock.todos = AsyncMock(spec=AsyncTodoRepository)
+
+    async def run_requests() -> None:
+        await asyncio.gather(
+            *(handle_async_request(unit_of_work, mock) for mock in bound)
+        )
+
+    asyncio.run(run_requests())
+
+    for mock in bound:
+        mock.todos.find_list_version.assert_awaited_once_with()
+        mock.commit.assert_awaited_once_with()
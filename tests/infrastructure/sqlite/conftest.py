@@ -0,0 +1,23 @@
+"""Shared fixtures for SQLite infrastructure tests."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from dddpy.infrastructure.sqlite.database import Base
+
+
+@pytest.fixture
+def engine():
+    """Create an in-memory SQLite engine with the application schema."""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    """Open a session bound to the in-memory engine."""
+    with Session(engine) as session:
+        yield session
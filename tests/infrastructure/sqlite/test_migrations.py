@@ -0,0 +1,195 @@
+"""Test cases for the SQLite schema migrations."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy import Connection, create_engine, event, inspect, text
+from sqlalchemy.orm import Session
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoStatus, TodoTitle
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.migrations import (
+    MIGRATIONS,
+    Migration,
+    apply_migrations,
+    create_index,
+    migrate,
+    schema_version,
+)
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """Create an engine on an empty database file."""
+    engine = create_engine(f'sqlite:///{tmp_path / "todo.db"}')
+    yield engine
+    engine.dispose()
+
+
+def create_table(name: str) -> Callable[[Connection], Any]:
+    """Return the body of a step creating an empty table."""
+    return lambda connection: connection.exec_driver_sql(
+        f'CREATE TABLE IF NOT EXISTS {name} (id INTEGER PRIMARY KEY)'
+    )
+
+
+def index_names(engine, table: str) -> set[str]:
+    """Return the names of the indexes on a table."""
+    return {index['name'] for index in inspect(engine).get_indexes(table)}
+
+
+def test_new_database_is_brought_to_the_latest_version(file_engine):
+    """Test that every step runs and the todo schema is usable afterwards."""
+    apply_migrations(file_engine, migrate(file_engine))
+
+    with file_engine.connect() as connection:
+        assert schema_version(connection) == MIGRATIONS[-1].version
+    todo = Todo.create(TodoTitle('Migrated'))
+    with Session(file_engine) as session:
+        TodoRepositoryImpl(session).save(todo)
+        session.commit()
+        assert TodoRepositoryImpl(session).find_by_id(todo.id) == todo
+
+
+def test_current_database_is_checked_with_one_statement(file_engine):
+    """Test that starting on a migrated database only reads user_version."""
+    apply_migrations(file_engine, migrate(file_engine))
+    statements = []
+    event.listen(
+        file_engine,
+        'before_cursor_execute',
+        lambda _conn, _cursor, statement, *_: statements.append(statement),
+    )
+
+    migrate(file_engine)
+
+    assert statements == ['PRAGMA user_version']
+
+
+def declared_index_names(table: str) -> set[str]:
+    """Return the names of the indexes a model declares on a table."""
+    return {str(index.name) for index in Base.metadata.tables[table].indexes}
+
+
+def create_original_schema(engine) -> None:
+    """Create the todo table and indexes of the schema before migrations."""
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                'CREATE TABLE todo (id CHAR(32) PRIMARY KEY, title VARCHAR(100) '
+                'NOT NULL, description VARCHAR(1000), status VARCHAR NOT NULL, '
+                'created_at INTEGER NOT NULL, updated_at INTEGER NOT NULL, '
+                'completed_at INTEGER)'
+            )
+        )
+        for column in ('status', 'created_at', 'updated_at', 'completed_at'):
+            connection.execute(
+                text(f'CREATE INDEX ix_todo_{column} ON todo ({column})')
+            )
+
+
+def test_database_created_before_migrations_is_upgraded(file_engine):
+    """Test that the original todo schema gains the version column and indexes."""
+    create_original_schema(file_engine)
+
+    deferred = migrate(file_engine)
+
+    columns = {column['name'] for column in inspect(file_engine).get_columns('todo')}
+    assert 'version' in columns
+    assert [migration.version for migration in deferred] == [3, 4, 5, 6]
+    assert all(migration.online for migration in deferred)
+    apply_migrations(file_engine, deferred)
+    assert index_names(file_engine, 'todo') == declared_index_names('todo')
+
+
+def test_todos_stored_before_migrations_are_searched_and_counted(file_engine):
+    """Test that the search index and status counts cover existing todos."""
+    create_original_schema(file_engine)
+    with file_engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO todo VALUES ('00000000000000000000000000000001', "
+                "'groceries', NULL, 'not_started', 0, 0, NULL)"
+            )
+        )
+
+    apply_migrations(file_engine, migrate(file_engine))
+
+    with Session(file_engine) as session:
+        repository = TodoRepositoryImpl(session)
+        hits = repository.search('groceries').items
+        counts = repository.count_by_status()
+    assert [hit.todo.title.value for hit in hits] == ['groceries']
+    assert counts[TodoStatus.NOT_STARTED] == 1
+
+
+def test_database_at_version_3_builds_indexes_declared_since(file_engine):
+    """Test that an index added to a model reaches already-migrated databases."""
+    Base.metadata.create_all(file_engine)
+    with file_engine.begin() as connection:
+        connection.exec_driver_sql('DROP INDEX ix_todo_status_completed_at_id')
+        connection.exec_driver_sql('PRAGMA user_version = 3')
+
+    deferred = migrate(file_engine)
+
+    assert [migration.version for migration in deferred] == [4, 5, 6]
+    apply_migrations(file_engine, deferred)
+    assert index_names(file_engine, 'todo') == declared_index_names('todo')
+
+
+def test_trailing_online_steps_are_left_for_the_background(file_engine):
+    """Test that online steps at the end are returned instead of applied."""
+    Base.metadata.create_all(file_engine)
+    with file_engine.begin() as connection:
+        connection.exec_driver_sql('DROP INDEX ix_todo_archive_completed_at_id')
+    migrations = (
+        Migration(1, 'Keep the schema', lambda _: None),
+        Migration(
+            2,
+            'Index archived todos',
+            create_index('todo_archive', 'ix_todo_archive_completed_at_id'),
+            online=True,
+        ),
+    )
+
+    deferred = migrate(file_engine, migrations)
+
+    assert deferred == [migrations[1]]
+    assert index_names(file_engine, 'todo_archive') == set()
+    apply_migrations(file_engine, deferred)
+    assert index_names(file_engine, 'todo_archive') == {
+        'ix_todo_archive_completed_at_id'
+    }
+    with file_engine.connect() as connection:
+        assert schema_version(connection) == len(migrations)
+
+
+def test_online_step_followed_by_a_blocking_one_runs_at_startup(file_engine):
+    """Test that steps keep their order when an online step is not last."""
+    migrations = (
+        Migration(1, 'Create the first table', create_table('first'), online=True),
+        Migration(2, 'Create the second table', create_table('second')),
+    )
+
+    assert migrate(file_engine, migrations) == []
+    assert {'first', 'second'} <= set(inspect(file_engine).get_table_names())
+
+
+def test_applied_steps_are_skipped(file_engine):
+    """Test that a step recorded by another process is not run again."""
+    calls = []
+    migration = Migration(1, 'Count calls', calls.append)
+
+    apply_migrations(file_engine, [migration])
+    apply_migrations(file_engine, [migration])
+
+    assert len(calls) == 1
+
+
+def test_steps_must_be_numbered_consecutively(file_engine):
+    """Test that a gap in the version numbers is rejected."""
+    with pytest.raises(ValueError, match='consecutively'):
+        migrate(file_engine, (Migration(2, 'Skip one', create_table('item')),))
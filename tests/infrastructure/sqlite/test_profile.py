@@ -0,0 +1,29 @@
+"""Test cases for SQLite connection profiles."""
+
+import pytest
+from sqlalchemy import text
+
+from dddpy.infrastructure.sqlite.database import create_sqlite_engine
+from dddpy.infrastructure.sqlite.profile import SQLITE_PROFILES, get_sqlite_profile
+
+
+def test_profile_pragmas_are_applied_on_connect(tmp_path):
+    """Test that a new connection runs the profile's pragmas."""
+    profile = SQLITE_PROFILES['balanced']
+    engine = create_sqlite_engine(f'sqlite:///{tmp_path / "test.db"}', profile)
+
+    with engine.connect() as connection:
+        journal_mode = connection.execute(text('PRAGMA journal_mode')).scalar()
+        synchronous = connection.execute(text('PRAGMA synchronous')).scalar()
+        busy_timeout = connection.execute(text('PRAGMA busy_timeout')).scalar()
+    engine.dispose()
+
+    assert journal_mode == 'wal'
+    assert synchronous == 1  # NORMAL
+    assert busy_timeout == profile.busy_timeout_ms
+
+
+def test_get_sqlite_profile_rejects_unknown_name():
+    """Test that an unknown profile name fails loudly."""
+    with pytest.raises(ValueError, match='Unknown SQLite profile'):
+        get_sqlite_profile('turbo')
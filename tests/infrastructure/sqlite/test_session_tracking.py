@@ -0,0 +1,60 @@
+"""Test cases for session write tracking and read-only sessions."""
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoTitle
+from dddpy.infrastructure.sqlite.session_tracking import (
+    mark_session_read_only,
+    session_has_writes,
+    session_needs_commit,
+)
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+
+
+def test_unused_session_commits_without_writes(engine):
+    """Test that a session that never queried has nothing to roll back."""
+    with Session(engine) as session:
+        assert not session_has_writes(session)
+        assert session_needs_commit(session)
+
+
+def test_reads_alone_are_rolled_back(engine):
+    """Test that a transaction that only read does not need a commit."""
+    with Session(engine) as session:
+        TodoRepositoryImpl(session).find_all()
+
+        assert session.in_transaction()
+        assert not session_needs_commit(session)
+
+
+def test_writes_are_tracked_until_commit(engine):
+    """Test that a repository write is seen, and forgotten once committed."""
+    with Session(engine) as session:
+        repository = TodoRepositoryImpl(session)
+        repository.find_all()
+        repository.save(Todo.create(TodoTitle('Written')))
+
+        assert session_has_writes(session)
+        assert session_needs_commit(session)
+        session.commit()
+        assert not session_has_writes(session)
+
+
+def test_read_only_session_rejects_writes(engine):
+    """Test that a read-only session fails to write and leaves the pool writable."""
+    with Session(engine) as session:
+        mark_session_read_only(session)
+        repository = TodoRepositoryImpl(session)
+        repository.find_all()
+        with pytest.raises(OperationalError):
+            repository.save(Todo.create(TodoTitle('Rejected')))
+
+    todo = Todo.create(TodoTitle('Accepted'))
+    with Session(engine) as session:
+        TodoRepositoryImpl(session).save(todo)
+        session.commit()
+    with Session(engine) as session:
+        assert TodoRepositoryImpl(session).find_by_id(todo.id) == todo
@@ -0,0 +1,95 @@
+"""Test cases for the group-commit WriteCoordinator."""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoTitle
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo.group_commit_todo_repository import (
+    new_group_commit_todo_repository,
+)
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+from dddpy.infrastructure.sqlite.write_coordinator import WriteCoordinator
+
+WRITERS = 8
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """Create a file-backed engine so every thread sees the same database."""
+    engine = create_engine(f'sqlite:///{tmp_path / "todo.db"}')
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def coordinator(file_engine):
+    """Create a coordinator with a window wide enough to group every writer."""
+    coordinator = WriteCoordinator(sessionmaker(bind=file_engine), 0.2, WRITERS)
+    yield coordinator
+    coordinator.close()
+
+
+def save_job(todo: Todo):
+    """Return a write job saving the todo."""
+    return lambda session: TodoRepositoryImpl(session).save(todo)
+
+
+def test_concurrent_writes_share_one_commit(file_engine, coordinator):
+    """Test that writes arriving together are acknowledged after one commit."""
+    commits = []
+    event.listen(file_engine, 'commit', commits.append)
+    todos = [Todo.create(TodoTitle(f'Todo {i}')) for i in range(WRITERS)]
+    threads = [
+        threading.Thread(target=coordinator.write, args=(save_job(todo),))
+        for todo in todos
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(commits) == 1
+    with Session(file_engine) as session:
+        stored = TodoRepositoryImpl(session).find_by_ids([todo.id for todo in todos])
+    assert len(stored) == WRITERS
+
+
+def test_failing_write_is_rolled_back_alone(file_engine, coordinator):
+    """Test that an error in one write leaves the rest of its group committed."""
+    todo = Todo.create(TodoTitle('Kept'))
+
+    def fail(session: Session) -> None:
+        TodoRepositoryImpl(session).save(Todo.create(TodoTitle('Discarded')))
+        raise RuntimeError
+
+    failed = coordinator.submit(fail)
+    kept = coordinator.submit(save_job(todo))
+
+    with pytest.raises(RuntimeError):
+        failed.result()
+    kept.result()
+    with Session(file_engine) as session:
+        page = TodoRepositoryImpl(session).find_all()
+    assert [stored.id for stored in page.items] == [todo.id]
+
+
+def test_group_commit_repository_writes_before_the_session_commits(
+    file_engine, coordinator
+):
+    """Test that a save is durable once it returns, without a session commit."""
+    todo = Todo.create(TodoTitle('Durable'))
+    with Session(file_engine) as session:
+        repository = new_group_commit_todo_repository(
+            TodoRepositoryImpl(session), coordinator
+        )
+        repository.save(todo)
+        assert repository.find_by_id(todo.id) == todo
+
+    with Session(file_engine) as session:
+        assert TodoRepositoryImpl(session).find_by_id(todo.id) == todo
@@ -0,0 +1,60 @@
+"""Test cases for the aiosqlite-backed AsyncTodoRepositoryImpl."""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoDescription, TodoStatus, TodoTitle
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo.async_todo_repository import (
+    new_async_todo_repository,
+)
+
+
+async def exercise_repository() -> None:
+    """Save, list, and delete todos through a fresh in-memory database."""
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    first = Todo.create(TodoTitle('First'), TodoDescription('Details'))
+    second = Todo.create(TodoTitle('Second'))
+    try:
+        async with AsyncSession(engine) as session:
+            repository = new_async_todo_repository(session)
+            await repository.save(first)
+            await repository.save_many([second])
+            await session.commit()
+
+            found = await repository.find_by_id(first.id)
+            assert found is not None
+            assert found.description == first.description
+
+            page = await repository.find_all(limit=1)
+            assert len(page.items) == 1
+            assert page.next_cursor is not None
+            rest = await repository.find_all(limit=1, cursor=page.next_cursor)
+            assert {page.items[0].id, rest.items[0].id} == {first.id, second.id}
+
+            hits = await repository.search('details')
+            assert [hit.todo.id for hit in hits.items] == [first.id]
+
+            counts = await repository.count_by_status()
+            assert counts[TodoStatus.NOT_STARTED] == len([first, second])
+
+            streamed = [todo.id async for todo in repository.iter_all(batch_size=1)]
+            assert sorted(streamed, key=str) == sorted([first.id, second.id], key=str)
+
+            await repository.delete(first.id)
+            assert await repository.find_by_id(first.id) is None
+            assert [t.id for t in await repository.find_by_ids([second.id])] == [
+                second.id
+            ]
+    finally:
+        await engine.dispose()
+
+
+def test_async_repository_round_trip():
+    """Test that the async repository persists and queries todos."""
+    asyncio.run(exercise_repository())
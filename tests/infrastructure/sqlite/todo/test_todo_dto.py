@@ -0,0 +1,88 @@
+"""Test cases for mapping todos through TodoDTO."""
+
+from dataclasses import astuple
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
+from dddpy.infrastructure.sqlite.todo.todo_dto import (
+    TODO_COLUMNS,
+    TodoDTO,
+    from_epoch_ms,
+    to_epoch_ms,
+    todos_from_rows,
+)
+
+BASE_TIME = datetime(2025, 1, 1, 12, 30, 15, 123000, tzinfo=UTC)
+
+
+def test_trusted_entity_matches_validated_entity():
+    """Test that skipping validation reconstructs the same todo."""
+    todo = Todo(
+        id=TodoId.generate(),
+        title=TodoTitle('Write report'),
+        description=TodoDescription('Quarterly numbers'),
+        created_at=BASE_TIME,
+        updated_at=BASE_TIME,
+    )
+    todo.complete()
+    dto = TodoDTO.from_entity(todo)
+
+    trusted = dto.to_trusted_entity()
+    validated = dto.to_validated_entity()
+
+    assert astuple(trusted) == astuple(validated)
+    assert trusted.created_at == BASE_TIME
+    assert trusted.created_at.tzinfo is UTC
+
+
+def test_validated_entity_rejects_invalid_stored_title():
+    """Test that strict hydration still catches rows that break the rules."""
+    todo = Todo(id=TodoId.generate(), title=TodoTitle('Valid'))
+    dto = TodoDTO.from_entity(todo)
+    dto.title = 'a' * 101
+
+    with pytest.raises(ValueError, match='Title must be 100 characters or less'):
+        dto.to_validated_entity()
+
+
+def test_todos_from_rows_matches_to_entity(session):
+    """Test that batch row mapping builds the same todos as the ORM path."""
+    done = Todo(id=TodoId.generate(), title=TodoTitle('Done'), created_at=BASE_TIME)
+    done.complete()
+    open_todo = Todo(
+        id=TodoId.generate(),
+        title=TodoTitle('Open'),
+        description=TodoDescription('Shares a timestamp'),
+        created_at=BASE_TIME,
+        updated_at=BASE_TIME,
+    )
+    session.add_all([TodoDTO.from_entity(done), TodoDTO.from_entity(open_todo)])
+    session.flush()
+
+    rows = session.execute(select(*TODO_COLUMNS).order_by(TodoDTO.title)).all()
+    orm = session.scalars(select(TodoDTO).order_by(TodoDTO.title)).all()
+
+    todos = todos_from_rows(rows)
+    assert [astuple(todo) for todo in todos] == [
+        astuple(todo_dto.to_entity()) for todo_dto in orm
+    ]
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        BASE_TIME,
+        datetime(2025, 1, 1, 12, 30, 15, 123999),
+        datetime(1999, 12, 31, 23, 59, 59, 999000),
+    ],
+)
+def test_to_epoch_ms_matches_timestamp_and_round_trips(value):
+    """Test that aware and naive values convert like ``timestamp()``, exactly."""
+    stored = to_epoch_ms(value)
+
+    assert stored == int(value.timestamp() * 1000)
+    assert to_epoch_ms(from_epoch_ms(stored)) == stored
@@ -0,0 +1,134 @@
+"""Test cases for the session-scoped todo identity map."""
+
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.value_objects import TodoTitle
+from dddpy.infrastructure.sqlite.todo.todo_identity_map import (
+    disable_todo_identity_map,
+)
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+from dddpy.usecase.todo import (
+    new_complete_todo_usecase,
+    new_create_todo_usecase,
+    new_delete_todo_usecase,
+    new_find_todo_by_id_usecase,
+    new_start_todo_usecase,
+    new_update_todo_usecase,
+)
+
+UseCaseCall = Callable[[TodoRepository, Todo], object]
+
+
+@pytest.fixture
+def statements(engine):
+    """Record the first keyword of every statement sent to the database."""
+    executed: list[str] = []
+    event.listen(
+        engine,
+        'before_cursor_execute',
+        lambda _conn, _cursor, statement, *_: executed.append(statement.split()[0]),
+    )
+    return executed
+
+
+@pytest.fixture
+def stored_todo(engine, statements):
+    """Store an in-progress todo and commit it, without recording statements."""
+    with Session(engine) as session:
+        repository = TodoRepositoryImpl(session)
+        todo = new_create_todo_usecase(repository).execute(TodoTitle('Stored'))
+        new_start_todo_usecase(repository).execute(todo.id)
+        session.commit()
+    statements.clear()
+    return todo
+
+
+@pytest.mark.parametrize(
+    ('run', 'expected'),
+    [
+        (
+            lambda repository, _: new_create_todo_usecase(repository).execute(
+                TodoTitle('New')
+            ),
+            ['INSERT'],
+        ),
+        (
+            lambda repository, todo: new_find_todo_by_id_usecase(repository).execute(
+                todo.id
+            ),
+            ['SELECT'],
+        ),
+        (
+            lambda repository, todo: new_update_todo_usecase(repository).execute(
+                todo.id, TodoTitle('Renamed')
+            ),
+            ['SELECT', 'UPDATE'],
+        ),
+        (
+            lambda repository, todo: new_complete_todo_usecase(repository).execute(
+                todo.id
+            ),
+            ['UPDATE'],
+        ),
+        (
+            lambda repository, todo: new_delete_todo_usecase(repository).execute(
+                todo.id
+            ),
+            ['SELECT', 'DELETE'],
+        ),
+    ],
+    ids=['create', 'find', 'update', 'complete', 'delete'],
+)
+def test_statements_per_use_case(
+    engine, statements, stored_todo, run: UseCaseCall, expected
+):
+    """Test that each use case reads a todo at most once in a new session."""
+    with Session(engine) as session:
+        run(TodoRepositoryImpl(session), stored_todo)
+
+    assert statements == expected
+
+
+def test_todos_written_in_the_session_are_not_read_again(engine, statements):
+    """Test that use cases sharing a session reuse the todos it wrote."""
+    with Session(engine) as session:
+        repository = TodoRepositoryImpl(session)
+        todo = new_create_todo_usecase(repository).execute(TodoTitle('New'))
+        new_update_todo_usecase(repository).execute(todo.id, TodoTitle('Renamed'))
+        found = new_find_todo_by_id_usecase(repository).execute(todo.id)
+
+    assert found is todo
+    assert statements == ['INSERT', 'UPDATE']
+
+
+def test_rollback_forgets_tracked_todos(engine, statements, stored_todo):
+    """Test that a rolled back write is not served from the identity map."""
+    with Session(engine) as session:
+        repository = TodoRepositoryImpl(session)
+        new_update_todo_usecase(repository).execute(
+            stored_todo.id, TodoTitle('Discarded')
+        )
+        session.rollback()
+
+        found = repository.find_by_id(stored_todo.id)
+
+    assert found is not None
+    assert found.title == TodoTitle('Stored')
+    assert statements == ['SELECT', 'UPDATE', 'SELECT']
+
+
+def test_disabled_identity_map_always_reads(engine, statements, stored_todo):
+    """Test that a session without tracking queries on every lookup."""
+    with Session(engine) as session:
+        disable_todo_identity_map(session)
+        repository = TodoRepositoryImpl(session)
+        repository.find_by_id(stored_todo.id)
+        repository.find_by_id(stored_todo.id)
+
+    assert statements == ['SELECT', 'SELECT']
@@ -0,0 +1,780 @@
+"""Test cases for the SQLite TodoRepositoryImpl."""
+
+import base64
+import json
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from itertools import product
+
+import pytest
+from sqlalchemy import delete, event, update
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import (
+    TodoConflictError,
+    TodoInvalidCursorError,
+    TodoInvalidFilterError,
+)
+from dddpy.domain.todo.repositories import TodoFilter
+from dddpy.domain.todo.value_objects import (
+    TodoDescription,
+    TodoId,
+    TodoSortKey,
+    TodoStatus,
+    TodoTitle,
+)
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo.todo_cursor import encode_todo_cursor
+from dddpy.infrastructure.sqlite.todo.todo_dto import to_epoch_ms
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+from dddpy.infrastructure.sqlite.todo.todo_search_dto import (
+    TodoSearchKeyDTO,
+    rebuild_todo_search,
+    todo_search,
+)
+from dddpy.infrastructure.sqlite.todo.todo_status_count_dto import (
+    TodoStatusCountDTO,
+    reconcile_todo_status_counts,
+)
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def repository(session):
+    """Create a repository bound to the in-memory session."""
+    return TodoRepositoryImpl(session)
+
+
+def make_todo(index: int, created_at: datetime) -> Todo:
+    """Build a todo with deterministic timestamps."""
+    return Todo(
+        id=TodoId.generate(),
+        title=TodoTitle(f'Todo {index}'),
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+def test_save_and_find_by_id(repository):
+    """Test that a saved todo can be loaded again."""
+    todo = make_todo(1, BASE_TIME)
+    repository.save(todo)
+
+    found = repository.find_by_id(todo.id)
+
+    assert found == todo
+    assert found is not None
+    assert found.title == todo.title
+
+
+def test_find_all_walks_pages_without_gaps(repository):
+    """Test that following cursors yields every todo exactly once."""
+    # Several todos share a timestamp to exercise the id tie-breaker.
+    todos = [make_todo(i, BASE_TIME + timedelta(seconds=i // 3)) for i in range(10)]
+    for todo in todos:
+        repository.save(todo)
+
+    seen = []
+    cursor = None
+    while True:
+        page = repository.find_all(limit=4, cursor=cursor)
+        seen.extend(page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert len(seen) == len(todos)
+    assert set(seen) == set(todos)
+    created = [todo.created_at for todo in seen]
+    assert created == sorted(created, reverse=True)
+
+
+def test_find_all_does_not_load_orm_instances(repository, session):
+    """Test that listing maps plain rows and leaves the identity map empty."""
+    todos = [make_todo(i, BASE_TIME) for i in range(3)]
+    for todo in todos:
+        repository.save(todo)
+    session.commit()
+    session.expunge_all()
+
+    page = repository.find_all()
+
+    assert set(page.items) == set(todos)
+    assert len(session.identity_map) == 0
+
+
+def test_find_all_by_completed_at_skips_open_todos(repository):
+    """Test that sorting by completed_at lists completed todos only."""
+    open_todo = make_todo(1, BASE_TIME)
+    done_todo = make_todo(2, BASE_TIME)
+    done_todo.complete()
+    repository.save(open_todo)
+    repository.save(done_todo)
+
+    page = repository.find_all(sort_key=TodoSortKey.COMPLETED_AT)
+
+    assert page.items == [done_todo]
+    assert page.next_cursor is None
+
+
+def test_find_all_rejects_cursor_for_other_sort_key(repository):
+    """Test that a cursor is only valid for the sort key it was issued for."""
+    for i in range(3):
+        repository.save(make_todo(i, BASE_TIME + timedelta(seconds=i)))
+    page = repository.find_all(limit=1)
+
+    assert page.next_cursor is not None
+    with pytest.raises(TodoInvalidCursorError):
+        repository.find_all(cursor=page.next_cursor, sort_key=TodoSortKey.UPDATED_AT)
+
+
+def test_find_all_rejects_garbage_cursor(repository):
+    """Test that malformed cursors raise a domain error."""
+    with pytest.raises(TodoInvalidCursorError):
+        repository.find_all(cursor='not-a-cursor')
+
+
+def raw_cursor(payload: list) -> str:
+    """Encode a payload the way the cursors are, bypassing their checks."""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+@pytest.mark.parametrize(
+    'payload',
+    [
+        ['created_at', 0, 123],
+        ['created_at', 0, None],
+        ['created_at', 2**70, '0' * 32],
+        ['created_at', True, '0' * 32],
+        ['created_at', 0, 'not-a-uuid'],
+    ],
+)
+def test_find_all_rejects_well_formed_cursor_with_bad_values(repository, payload):
+    """Test that decodable cursors with unusable values raise a domain error."""
+    with pytest.raises(TodoInvalidCursorError):
+        repository.find_all(cursor=raw_cursor(payload))
+
+
+def test_cursor_of_deeply_nested_json_is_invalid(repository):
+    """Test that a cursor exhausting the JSON parser's recursion is rejected."""
+    cursor = base64.urlsafe_b64encode(b'[' * 3000).decode()
+
+    with pytest.raises(TodoInvalidCursorError):
+        repository.find_all(cursor=cursor)
+    with pytest.raises(TodoInvalidCursorError):
+        repository.search('milk', cursor=cursor)
+    with pytest.raises(TodoInvalidCursorError):
+        repository.find_archived(cursor=cursor)
+
+
+def test_save_many_inserts_and_updates(repository):
+    """Test that save_many upserts new and existing todos."""
+    existing = make_todo(1, BASE_TIME)
+    repository.save(existing)
+    existing.update_title(TodoTitle('Renamed'))
+    new_todos = [make_todo(i, BASE_TIME) for i in range(2, 5)]
+
+    repository.save_many([existing, *new_todos])
+
+    found = repository.find_by_ids([existing.id] + [todo.id for todo in new_todos])
+    titles = {todo.id: todo.title for todo in found}
+    assert len(found) == len(new_todos) + 1
+    assert titles[existing.id] == TodoTitle('Renamed')
+
+
+def test_add_many_inserts_new_todos(repository):
+    """Test that add_many stores every new todo."""
+    todos = [make_todo(i, BASE_TIME) for i in range(3)]
+
+    repository.add_many(todos)
+    repository.add_many([])
+
+    assert set(repository.find_by_ids([todo.id for todo in todos])) == set(todos)
+
+
+def test_find_by_ids_ignores_unknown_ids(repository):
+    """Test that unknown identifiers are simply absent from the result."""
+    todo = make_todo(1, BASE_TIME)
+    repository.save(todo)
+
+    found = repository.find_by_ids([todo.id, TodoId.generate()])
+
+    assert found == [todo]
+
+
+def test_iter_all_streams_every_todo_across_batches(repository):
+    """Test that streaming with small batches yields each todo once."""
+    todos = [make_todo(i, BASE_TIME) for i in range(5)]
+    repository.save_many(todos)
+
+    streamed = list(repository.iter_all(batch_size=2))
+
+    assert sorted(todo.id.value for todo in streamed) == sorted(
+        todo.id.value for todo in todos
+    )
+
+
+def make_status_todo(index: int, status: TodoStatus) -> Todo:
+    """Build a todo in the given status, created ``index`` seconds after base."""
+    moment = BASE_TIME + timedelta(seconds=index)
+    return Todo(
+        id=TodoId.generate(),
+        title=TodoTitle(f'Todo {index}'),
+        status=status,
+        created_at=moment,
+        updated_at=moment + timedelta(hours=1),
+        completed_at=moment if status is TodoStatus.COMPLETED else None,
+    )
+
+
+def test_find_all_filters_by_statuses_across_pages(repository):
+    """Test that several statuses are merged in order and paged without gaps."""
+    statuses = list(TodoStatus)
+    todos = [make_status_todo(i, statuses[i % 3]) for i in range(12)]
+    repository.save_many(todos)
+    wanted = (TodoStatus.NOT_STARTED, TodoStatus.IN_PROGRESS)
+
+    seen = []
+    cursor = None
+    while True:
+        page = repository.find_all(
+            limit=3, cursor=cursor, todo_filter=TodoFilter(statuses=wanted)
+        )
+        seen.extend(page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    expected = [todo for todo in reversed(todos) if todo.status in wanted]
+    assert [todo.id for todo in seen] == [todo.id for todo in expected]
+
+
+def test_find_all_filters_by_exclusive_time_bounds(repository):
+    """Test that created and updated bounds exclude the boundary values."""
+    todos = [make_status_todo(i, TodoStatus.NOT_STARTED) for i in range(5)]
+    repository.save_many(todos)
+
+    created = repository.find_all(
+        todo_filter=TodoFilter(
+            statuses=(TodoStatus.NOT_STARTED,),
+            created_after=todos[0].created_at,
+            created_before=todos[3].created_at,
+        )
+    )
+    updated = repository.find_all(
+        sort_key=TodoSortKey.UPDATED_AT,
+        todo_filter=TodoFilter(updated_after=todos[3].updated_at),
+    )
+
+    assert [todo.id for todo in created.items] == [todos[2].id, todos[1].id]
+    assert [todo.id for todo in updated.items] == [todos[4].id]
+
+
+@pytest.mark.parametrize(
+    ('sort_key', 'todo_filter'),
+    [
+        (TodoSortKey.CREATED_AT, TodoFilter(updated_after=BASE_TIME)),
+        (TodoSortKey.UPDATED_AT, TodoFilter(created_before=BASE_TIME)),
+        (TodoSortKey.COMPLETED_AT, TodoFilter(created_after=BASE_TIME)),
+    ],
+)
+def test_find_all_rejects_bounds_on_another_timestamp(
+    repository, sort_key, todo_filter
+):
+    """Test that only the sort key's timestamp can be bounded."""
+    with pytest.raises(TodoInvalidFilterError):
+        repository.find_all(sort_key=sort_key, todo_filter=todo_filter)
+
+
+def test_find_all_filters_never_scan_or_sort_the_todo_table(session):
+    """Test that every accepted combination is one ordered index seek."""
+    repository = TodoRepositoryImpl(session)
+    executed: list[tuple[str, tuple]] = []
+    event.listen(
+        session.bind,
+        'before_cursor_execute',
+        lambda _conn, _cursor, statement, parameters, *_: executed.append(
+            (statement, parameters)
+        ),
+    )
+    status_sets = [(), (TodoStatus.IN_PROGRESS,), tuple(TodoStatus)[:2]]
+    bounds = [None, BASE_TIME]
+
+    for sort_key, statuses, created, updated, paged in product(
+        TodoSortKey, status_sets, bounds, bounds, [False, True]
+    ):
+        todo_filter = TodoFilter(
+            statuses=statuses,
+            created_after=created,
+            created_before=created,
+            updated_after=updated,
+            updated_before=updated,
+        )
+        if not todo_filter.bounds_only(sort_key):
+            continue
+        cursor = (
+            encode_todo_cursor(
+                sort_key, to_epoch_ms(BASE_TIME), TodoId.generate().value
+            )
+            if paged
+            else None
+        )
+        repository.find_all(sort_key=sort_key, cursor=cursor, todo_filter=todo_filter)
+        statement, parameters = executed[-1]
+        plan = session.connection().exec_driver_sql(
+            f'EXPLAIN QUERY PLAN {statement}', parameters
+        )
+        details = [row.detail for row in plan]
+        combination = (sort_key, statuses, created, updated, paged, details)
+        assert any(detail.startswith('SEARCH todo USING') for detail in details)
+        assert not any('SCAN todo' in detail for detail in details), combination
+        assert not any('TEMP B-TREE' in detail for detail in details), combination
+
+
+def test_find_version_counts_stored_writes(repository):
+    """Test that every save advances the stored version by one."""
+    todo = make_todo(1, BASE_TIME)
+    repository.save(todo)
+    assert repository.find_version(todo.id) == todo.version == 1
+
+    todo.update_title(TodoTitle('Renamed'))
+    repository.save(todo)
+    assert repository.find_version(todo.id) == todo.version == 1 + 1
+    assert repository.find_version(TodoId.generate()) is None
+
+
+def test_save_rejects_stale_version(repository):
+    """Test that a save based on an outdated read raises a conflict."""
+    todo = make_todo(1, BASE_TIME)
+    repository.save(todo)
+    # Another request's copy, read before the first write below.
+    stale = replace(todo)
+
+    todo.update_title(TodoTitle('First writer'))
+    repository.save(todo)
+    stale.update_title(TodoTitle('Second writer'))
+
+    with pytest.raises(TodoConflictError):
+        repository.save(stale)
+    found = repository.find_by_id(todo.id)
+    assert found is not None
+    assert found.title == TodoTitle('First writer')
+
+
+def test_save_many_skips_stale_version(repository):
+    """Test that an outdated todo is reported while the others are saved."""
+    todos = [make_todo(i, BASE_TIME) for i in range(3)]
+    repository.add_many(todos)
+    stale = replace(todos[0])
+    todos[0].update_title(TodoTitle('Saved first'))
+    repository.save(todos[0])
+    stale.update_title(TodoTitle('Written late'))
+    for todo in todos[1:]:
+        todo.update_title(TodoTitle('Renamed'))
+
+    conflicts = repository.save_many([stale, *todos[1:]])
+
+    assert conflicts == {stale.id}
+    assert stale.version == 1
+    assert [todo.version for todo in todos[1:]] == [2, 2]
+    assert repository.find_by_id(stale.id) == todos[0]
+    for todo in todos[1:]:
+        assert repository.find_by_id(todo.id) == todo
+
+
+def test_transition_is_one_conditional_statement(repository, session):
+    """Test that a transition checks, writes, and reads back in one statement."""
+    todo = make_todo(1, BASE_TIME)
+    repository.save(todo)
+    session.flush()
+    executed: list[str] = []
+    event.listen(
+        session.bind,
+        'before_cursor_execute',
+        lambda _conn, _cursor, statement, *_: executed.append(statement),
+    )
+    at = BASE_TIME + timedelta(seconds=1)
+
+    started = repository.transition(
+        todo.id, TodoStatus.IN_PROGRESS, (TodoStatus.NOT_STARTED,), at
+    )
+
+    assert len(executed) == 1
+    assert started is not None
+    assert (started.status, started.updated_at, started.version) == (
+        TodoStatus.IN_PROGRESS,
+        at,
+        todo.version + 1,
+    )
+    assert started.completed_at is None
+
+
+def test_transition_rejects_other_statuses(repository):
+    """Test that a transition leaves todos outside the expected statuses alone."""
+    todo = make_todo(1, BASE_TIME)
+    repository.save(todo)
+    at = BASE_TIME + timedelta(seconds=1)
+
+    assert (
+        repository.transition(
+            todo.id, TodoStatus.COMPLETED, (TodoStatus.IN_PROGRESS,), at
+        )
+        is None
+    )
+    assert (
+        repository.transition(
+            TodoId.generate(), TodoStatus.IN_PROGRESS, (TodoStatus.NOT_STARTED,), at
+        )
+        is None
+    )
+    assert repository.find_status(todo.id) == TodoStatus.NOT_STARTED
+    assert repository.find_version(todo.id) == todo.version
+
+    repository.transition(
+        todo.id, TodoStatus.IN_PROGRESS, (TodoStatus.NOT_STARTED,), at
+    )
+    completed = repository.transition(
+        todo.id, TodoStatus.COMPLETED, (TodoStatus.IN_PROGRESS,), at
+    )
+    assert completed is not None
+    assert completed.completed_at == at
+    assert repository.find_status(TodoId.generate()) is None
+
+
+def test_find_list_version_changes_on_every_write(repository, session):
+    """Test that inserts, updates, and deletes all change the list version."""
+    empty = repository.find_list_version()
+    assert (empty.count, empty.latest_update, empty.deletions) == (0, None, 0)
+
+    first = make_todo(1, BASE_TIME)
+    repository.save(first)
+    session.flush()
+    created = repository.find_list_version()
+
+    first.updated_at = BASE_TIME + timedelta(seconds=1)
+    repository.save(first)
+    session.flush()
+    updated = repository.find_list_version()
+
+    # Replacing a todo with an older one keeps count and max(updated_at).
+    repository.delete(first.id)
+    repository.save(make_todo(2, BASE_TIME))
+    session.flush()
+    replaced = repository.find_list_version()
+
+    versions = [empty, created, updated, replaced]
+    assert len(set(versions)) == len(versions)
+    assert replaced.deletions == 1
+
+
+def test_find_list_version_reads_only_indexes(session):
+    """Test that the version query never visits todo table rows."""
+    repository = TodoRepositoryImpl(session)
+    executed: list[tuple[str, tuple]] = []
+    event.listen(
+        session.bind,
+        'before_cursor_execute',
+        lambda _conn, _cursor, statement, parameters, *_: executed.append(
+            (statement, parameters)
+        ),
+    )
+
+    repository.find_list_version()
+
+    statement, parameters = executed[-1]
+    plan = session.connection().exec_driver_sql(
+        f'EXPLAIN QUERY PLAN {statement}', parameters
+    )
+    details = [row.detail for row in plan if 'todo ' in f'{row.detail} ']
+    assert details
+    assert all('COVERING INDEX' in detail for detail in details)
+
+
+def make_titled_todo(title: str, description: str | None = None) -> Todo:
+    """Build a todo with the given text."""
+    return Todo(
+        id=TodoId.generate(),
+        title=TodoTitle(title),
+        description=TodoDescription(description) if description else None,
+        created_at=BASE_TIME,
+        updated_at=BASE_TIME,
+    )
+
+
+def test_search_ranks_title_matches_first_and_marks_terms(repository, session):
+    """Test that title hits outrank description hits and carry highlights."""
+    in_description = make_titled_todo('Plan week', 'draft the quarterly report')
+    in_title = make_titled_todo('Quarterly report', 'numbers for finance')
+    repository.save_many([in_description, in_title, make_titled_todo('Unrelated')])
+    session.flush()
+
+    page = repository.search('REPORT quarterly')
+
+    assert [hit.todo for hit in page.items] == [in_title, in_description]
+    assert page.items[0].title_highlight == '<mark>Quarterly</mark> <mark>report</mark>'
+    assert page.items[0].description_snippet == 'numbers for finance'
+    assert page.items[1].description_snippet == (
+        'draft the <mark>quarterly</mark> <mark>report</mark>'
+    )
+    assert page.next_cursor is None
+
+
+def test_search_walks_pages_without_gaps(repository, session):
+    """Test that following cursors yields every hit exactly once."""
+    todos = [make_titled_todo(f'Milk {i}') for i in range(7)]
+    repository.save_many(todos)
+    session.flush()
+
+    seen = []
+    cursor = None
+    while True:
+        page = repository.search('milk', limit=3, cursor=cursor)
+        seen.extend(hit.todo.id for hit in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert sorted(seen, key=str) == sorted((todo.id for todo in todos), key=str)
+
+
+def test_search_follows_updates_and_deletes(repository, session):
+    """Test that the triggers keep the index in step with the todo table."""
+    kept = make_titled_todo('Buy milk')
+    deleted = make_titled_todo('Milk the cows')
+    repository.save_many([kept, deleted])
+    session.flush()
+
+    kept.title = TodoTitle('Buy bread')
+    repository.save(kept)
+    repository.delete(deleted.id)
+    session.flush()
+
+    assert repository.search('milk').items == []
+    assert [hit.todo.id for hit in repository.search('bread').items] == [kept.id]
+
+
+def test_search_matches_query_syntax_literally(repository, session):
+    """Test that FTS5 operators and stray quotes in the query cannot fail."""
+    todo = make_titled_todo('Ship "v2" OR rollback')
+    repository.save(todo)
+    session.flush()
+
+    assert [hit.todo for hit in repository.search('"v2 OR').items] == [todo]
+    assert repository.search('title: NEAR(').items == []
+    assert repository.search('   ').items == []
+
+
+def test_search_rejects_cursor_for_other_query(repository, session):
+    """Test that a search cursor cannot be replayed against another query."""
+    repository.save_many([make_titled_todo('Milk'), make_titled_todo('Milk tea')])
+    session.flush()
+    cursor = repository.search('milk', limit=1).next_cursor
+    assert cursor is not None
+
+    with pytest.raises(TodoInvalidCursorError):
+        repository.search('tea', cursor=cursor)
+
+
+@pytest.mark.parametrize(
+    'payload',
+    [
+        ['milk', 0.5, 2**70],
+        ['milk', 0.5, '1'],
+        ['milk', float('nan'), 1],
+        ['milk', True, 1],
+    ],
+)
+def test_search_rejects_well_formed_cursor_with_bad_values(repository, payload):
+    """Test that decodable search cursors with unusable values raise."""
+    with pytest.raises(TodoInvalidCursorError):
+        repository.search('milk', cursor=raw_cursor(payload))
+
+
+def test_rebuild_todo_search_backfills_unindexed_todos(repository, session):
+    """Test that the rebuild indexes todos stored before the index existed."""
+    todo = make_titled_todo('Legacy todo')
+    repository.save(todo)
+    session.flush()
+    # Emulate a database written before search was added.
+    session.execute(delete(todo_search))
+    session.execute(delete(TodoSearchKeyDTO))
+    assert repository.search('legacy').items == []
+
+    assert rebuild_todo_search(session.connection()) == 1
+
+    assert [hit.todo for hit in repository.search('legacy').items] == [todo]
+
+
+def test_count_by_status_follows_every_write(repository, session):
+    """Test that the counters track inserts, status changes, and deletes."""
+    todos = [Todo.create(TodoTitle(f'Todo {index}')) for index in range(3)]
+    repository.save_many(todos)
+    todos[0].start()
+    todos[1].start()
+    todos[1].complete()
+    repository.save_many(todos[:2])
+    todos[2].update_title(TodoTitle('Renamed'))
+    repository.save(todos[2])
+    session.flush()
+
+    assert repository.count_by_status() == {
+        TodoStatus.NOT_STARTED: 1,
+        TodoStatus.IN_PROGRESS: 1,
+        TodoStatus.COMPLETED: 1,
+    }
+
+    repository.delete(todos[1].id)
+    session.flush()
+
+    assert repository.count_by_status()[TodoStatus.COMPLETED] == 0
+
+
+def test_count_by_status_rolls_back_with_the_write(repository, session):
+    """Test that a rolled-back save leaves the counters untouched."""
+    repository.save(Todo.create(TodoTitle('Kept')))
+    session.commit()
+    repository.save(Todo.create(TodoTitle('Discarded')))
+    session.flush()
+    session.rollback()
+
+    assert repository.count_by_status()[TodoStatus.NOT_STARTED] == 1
+
+
+def test_status_counts_are_seeded_from_existing_todos(engine, repository, session):
+    """Test that create_all seeds counters for todos stored before they existed."""
+    repository.save(Todo.create(TodoTitle('Legacy todo')))
+    session.commit()
+    # Emulate a database written before the counters were added.
+    session.execute(delete(TodoStatusCountDTO))
+    session.commit()
+
+    Base.metadata.create_all(bind=engine)
+
+    assert repository.count_by_status()[TodoStatus.NOT_STARTED] == 1
+
+
+def test_reconcile_todo_status_counts_reports_and_fixes_drift(repository, session):
+    """Test that reconciliation rewrites drifted counters and reports the delta."""
+    todos = [Todo.create(TodoTitle(f'Todo {index}')) for index in range(2)]
+    repository.save_many(todos)
+    session.flush()
+    assert reconcile_todo_status_counts(session.connection()) == {}
+    session.execute(
+        update(TodoStatusCountDTO)
+        .where(TodoStatusCountDTO.status == TodoStatus.NOT_STARTED.value)
+        .values(count=5)
+    )
+
+    drift = reconcile_todo_status_counts(session.connection())
+
+    assert drift == {TodoStatus.NOT_STARTED.value: -3}
+    assert repository.count_by_status()[TodoStatus.NOT_STARTED] == len(todos)
+
+
+def test_delete_completed_before_takes_oldest_chunk_first(repository):
+    """Test that a purge chunk deletes the oldest completed todos only."""
+    completed = [
+        replace(
+            make_todo(index, BASE_TIME),
+            status=TodoStatus.COMPLETED,
+            completed_at=BASE_TIME + timedelta(hours=index),
+        )
+        for index in range(4)
+    ]
+    open_todo = make_todo(9, BASE_TIME)
+    repository.add_many([open_todo, *reversed(completed)])
+    cutoff = BASE_TIME + timedelta(hours=3)
+
+    first = repository.delete_completed_before(cutoff, 2)
+    second = repository.delete_completed_before(cutoff, 2)
+
+    assert set(first) == {completed[0].id, completed[1].id}
+    assert second == [completed[2].id]
+    assert repository.delete_completed_before(cutoff, 2) == []
+    assert repository.find_by_id(completed[3].id) is not None
+    assert repository.find_by_id(open_todo.id) is not None
+    assert repository.count_by_status()[TodoStatus.COMPLETED] == 1
+
+
+def make_completed_todos(count: int) -> list[Todo]:
+    """Build completed todos finished one hour apart, oldest first."""
+    return [
+        replace(
+            make_todo(index, BASE_TIME),
+            status=TodoStatus.COMPLETED,
+            completed_at=BASE_TIME + timedelta(hours=index),
+        )
+        for index in range(count)
+    ]
+
+
+def test_archive_completed_before_moves_oldest_chunk(repository):
+    """Test that archived todos leave listings and counts but stay findable."""
+    completed = make_completed_todos(3)
+    open_todo = make_todo(9, BASE_TIME)
+    repository.add_many([open_todo, *completed])
+    cutoff = BASE_TIME + timedelta(hours=2)
+
+    archived = repository.archive_completed_before(cutoff, 1)
+    archived += repository.archive_completed_before(cutoff, 1)
+
+    assert archived == [completed[0].id, completed[1].id]
+    assert repository.archive_completed_before(cutoff, 1) == []
+    listed = repository.find_all().items
+    assert {todo.id for todo in listed} == {open_todo.id, completed[2].id}
+    assert repository.count_by_status()[TodoStatus.COMPLETED] == 1
+    assert repository.find_by_id(completed[0].id) == completed[0]
+    assert repository.find_version(completed[0].id) == 1
+    assert repository.find_status(completed[0].id) is TodoStatus.COMPLETED
+    assert set(repository.find_by_ids([completed[1].id, open_todo.id])) == {
+        completed[1],
+        open_todo,
+    }
+
+
+def test_find_archived_walks_pages_newest_first(repository):
+    """Test that archived todos are paged by completion time, newest first."""
+    completed = make_completed_todos(3)
+    repository.add_many(completed)
+    repository.archive_completed_before(BASE_TIME + timedelta(days=1), 10)
+
+    first = repository.find_archived(limit=2)
+    assert first.next_cursor is not None
+    second = repository.find_archived(limit=2, cursor=first.next_cursor)
+
+    assert [todo.id for todo in first.items + second.items] == [
+        todo.id for todo in reversed(completed)
+    ]
+    assert second.next_cursor is None
+
+
+def test_saving_archived_todo_restores_it(repository):
+    """Test that writing an archived todo moves it back into the todo table."""
+    todo = make_completed_todos(1)[0]
+    repository.add_many([todo])
+    repository.archive_completed_before(BASE_TIME + timedelta(days=1), 10)
+    archived = repository.find_by_id(todo.id)
+    assert archived is not None
+
+    archived.update_title(TodoTitle('Restored'))
+    repository.save(archived)
+
+    assert [found.title for found in repository.find_all().items] == [
+        TodoTitle('Restored')
+    ]
+    assert repository.find_archived().items == []
+    with pytest.raises(TodoConflictError):
+        repository.save(replace(todo, title=TodoTitle('Stale')))
+
+
+def test_delete_removes_archived_todo(repository):
+    """Test that deleting an archived todo removes it from the archive."""
+    todo = make_completed_todos(1)[0]
+    repository.add_many([todo])
+    repository.archive_completed_before(BASE_TIME + timedelta(days=1), 10)
+
+    repository.delete(todo.id)
+
+    assert repository.find_by_id(todo.id) is None
+    assert repository.find_archived().items == []
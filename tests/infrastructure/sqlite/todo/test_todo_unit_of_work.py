@@ -0,0 +1,82 @@
+"""Test cases for the SQLite TodoUnitOfWorkImpl."""
+
+import asyncio
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from dddpy.domain.todo.value_objects import TodoStatus, TodoTitle
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+from dddpy.infrastructure.sqlite.todo.todo_unit_of_work import (
+    new_async_todo_unit_of_work,
+    new_todo_unit_of_work,
+)
+from dddpy.usecase.todo import (
+    new_async_create_todo_usecase,
+    new_complete_todo_usecase,
+    new_create_todo_usecase,
+    new_start_todo_usecase,
+)
+
+
+def test_use_cases_share_one_commit(engine):
+    """Test that writes from several use cases are committed together once."""
+    commits = []
+    event.listen(engine, 'commit', commits.append)
+
+    with new_todo_unit_of_work(Session(engine)) as uow:
+        create_todo = new_create_todo_usecase(uow.todos)
+        todos = [create_todo.execute(TodoTitle(f'Todo {i}')) for i in range(3)]
+        start_todo = new_start_todo_usecase(uow.todos)
+        for todo in todos:
+            start_todo.execute(todo.id)
+        new_complete_todo_usecase(uow.todos).execute(todos[0].id)
+        uow.commit()
+
+    assert len(commits) == 1
+    with Session(engine) as session:
+        assert TodoRepositoryImpl(session).count_by_status() == {
+            TodoStatus.NOT_STARTED: 0,
+            TodoStatus.IN_PROGRESS: 2,
+            TodoStatus.COMPLETED: 1,
+        }
+
+
+def test_leaving_without_commit_discards_writes(engine):
+    """Test that uncommitted writes are rolled back when the block ends."""
+    with new_todo_unit_of_work(Session(engine)) as uow:
+        todo = new_create_todo_usecase(uow.todos).execute(TodoTitle('Discarded'))
+        assert uow.todos.find_by_id(todo.id) is not None
+
+    with Session(engine) as session:
+        assert TodoRepositoryImpl(session).find_by_id(todo.id) is None
+
+
+async def exercise_async_unit_of_work() -> None:
+    """Commit one async unit of work and discard another."""
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    try:
+        async with new_async_todo_unit_of_work(AsyncSession(engine)) as uow:
+            kept = await new_async_create_todo_usecase(uow.todos).execute(
+                TodoTitle('Kept')
+            )
+            await uow.commit()
+        async with new_async_todo_unit_of_work(AsyncSession(engine)) as uow:
+            discarded = await new_async_create_todo_usecase(uow.todos).execute(
+                TodoTitle('Discarded')
+            )
+
+        async with new_async_todo_unit_of_work(AsyncSession(engine)) as uow:
+            assert await uow.todos.find_by_id(kept.id) is not None
+            assert await uow.todos.find_by_id(discarded.id) is None
+    finally:
+        await engine.dispose()
+
+
+def test_async_unit_of_work_commits_or_discards():
+    """Test that the async unit of work commits and rolls back like the sync one."""
+    asyncio.run(exercise_async_unit_of_work())
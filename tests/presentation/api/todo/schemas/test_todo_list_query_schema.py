@@ -0,0 +1,29 @@
+"""Test cases for the todo list query parameters."""
+
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from dddpy.presentation.api.todo.schemas.todo_list_query_schema import (
+    MAX_EPOCH_MS,
+    TodoListQuerySchema,
+)
+
+
+@pytest.mark.parametrize(
+    'field', ['created_after', 'created_before', 'updated_after', 'updated_before']
+)
+def test_time_bounds_past_the_last_datetime_are_rejected(field):
+    """Test that a bound no datetime can hold fails validation."""
+    with pytest.raises(ValidationError):
+        TodoListQuerySchema.model_validate({field: 10**15})
+
+
+def test_latest_time_bound_converts():
+    """Test that the largest accepted bound still becomes a datetime."""
+    query = TodoListQuerySchema(created_before=MAX_EPOCH_MS)
+
+    created_before = query.to_filter().created_before
+
+    assert created_before == datetime.max.replace(microsecond=999000, tzinfo=UTC)
@@ -0,0 +1,28 @@
+"""Test cases for the completed todo purge parameters."""
+
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from dddpy.presentation.api.todo.schemas.todo_list_query_schema import MAX_EPOCH_MS
+from dddpy.presentation.api.todo.schemas.todo_purge_schema import (
+    TodoPurgeQuerySchema,
+)
+
+
+def test_cutoff_past_the_last_datetime_is_rejected():
+    """Test that a cutoff no datetime can hold fails validation."""
+    with pytest.raises(ValidationError):
+        TodoPurgeQuerySchema(completed_before=10**16)
+
+
+def test_cutoff_converts_exactly():
+    """Test that accepted cutoffs become exact datetimes."""
+    assert TodoPurgeQuerySchema(completed_before=1735689600000).cutoff() == datetime(
+        2025, 1, 1, tzinfo=UTC
+    )
+    assert (
+        TodoPurgeQuerySchema(completed_before=MAX_EPOCH_MS).cutoff().year
+        == datetime.max.year
+    )
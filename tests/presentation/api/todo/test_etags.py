@@ -0,0 +1,27 @@
+"""Test cases for conditional request helpers."""
+
+import pytest
+
+from dddpy.presentation.api.todo.etags import (
+    UNMATCHABLE_VERSION,
+    if_match_version,
+    todo_etag,
+)
+
+
+@pytest.mark.parametrize(
+    ('if_match', 'expected'),
+    [
+        (None, None),
+        ('*', None),
+        (todo_etag(3), 3),
+        (f' {todo_etag(3)} ', 3),
+        (f'W/{todo_etag(3)}', UNMATCHABLE_VERSION),
+        (f'{todo_etag(3)}, {todo_etag(4)}', UNMATCHABLE_VERSION),
+        ('"5d41402abc4b2a76b9719d911017c592"', UNMATCHABLE_VERSION),
+        ('3', UNMATCHABLE_VERSION),
+    ],
+)
+def test_if_match_version(if_match, expected):
+    """Test that only a single strong version tag yields an expected version."""
+    assert if_match_version(if_match) == expected
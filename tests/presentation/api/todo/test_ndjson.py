@@ -0,0 +1,55 @@
+"""Test cases for NDJSON import splitting."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from dddpy.presentation.api.todo.ndjson import import_line_chunks
+
+
+async def body(*parts: bytes) -> AsyncIterator[bytes]:
+    """Yield the parts of a request body as they would arrive."""
+    for part in parts:
+        yield part
+
+
+def split(
+    *parts: bytes,
+    chunk_size: int = 2,
+    max_line_bytes: int = 8,
+    max_chunk_bytes: int = 100,
+):
+    """Collect the chunks produced for a body."""
+
+    async def collect():
+        return [
+            [(line.number, line.content) for line in chunk]
+            async for chunk in import_line_chunks(
+                body(*parts), chunk_size, max_line_bytes, max_chunk_bytes
+            )
+        ]
+
+    return asyncio.run(collect())
+
+
+def test_import_line_chunks_numbers_lines_across_parts():
+    """Test that lines split across parts are joined and blank ones counted."""
+    assert split(b'{"a"', b':1}\n\n{"b":2}\n', b'{"c":3}') == [
+        [(1, b'{"a":1}'), (3, b'{"b":2}')],
+        [(4, b'{"c":3}')],
+    ]
+
+
+def test_import_line_chunks_truncates_oversize_lines():
+    """Test that an oversize line keeps one byte past the limit and no more."""
+    assert split(b'0123456', b'789abcdef', b'ghij\nok\n0123456789') == [
+        [(1, b'012345678'), (2, b'ok')],
+        [(3, b'012345678')],
+    ]
+
+
+def test_import_line_chunks_flushes_at_the_byte_budget():
+    """Test that long lines end a chunk before it reaches its line count."""
+    assert split(b'0123\n45\n6789\n0\n', chunk_size=10, max_chunk_bytes=6) == [
+        [(1, b'0123'), (2, b'45')],
+        [(3, b'6789'), (4, b'0')],
+    ]
@@ -0,0 +1,20 @@
+"""Test cases for the pre-encoded todo JSON fast path."""
+
+import json
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoDescription, TodoTitle
+from dddpy.presentation.api.todo.schemas import TodoSchema
+from dddpy.presentation.api.todo.todo_json import encode_todo, encode_todos
+
+
+def test_encoded_todos_match_schema_serialization():
+    """Test that the fast path produces the same JSON as TodoSchema."""
+    completed = Todo.create(TodoTitle('Done'), TodoDescription('Details'))
+    completed.complete()
+    todos = [Todo.create(TodoTitle('Open')), completed]
+
+    expected = [TodoSchema.from_entity(todo).model_dump(mode='json') for todo in todos]
+
+    assert json.loads(encode_todos(todos)) == expected
+    assert json.loads(encode_todo(completed)) == expected[1]
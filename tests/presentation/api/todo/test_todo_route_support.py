@@ -0,0 +1,42 @@
+"""Test cases for the helpers shared by the todo route handlers."""
+
+import pytest
+from fastapi import HTTPException, status
+
+from dddpy.domain.todo.exceptions import (
+    TodoConflictError,
+    TodoInvalidCursorError,
+    TodoInvalidFilterError,
+    TodoNotFoundError,
+)
+from dddpy.presentation.api.todo.handlers.todo_route_support import (
+    parse_todo_fields,
+    todo_http_errors,
+)
+
+
+@pytest.mark.parametrize(
+    ('error', 'status_code', 'detail'),
+    [
+        (TodoNotFoundError(), 404, TodoNotFoundError.message),
+        (TodoInvalidCursorError(), 400, TodoInvalidCursorError.message),
+        (TodoInvalidFilterError(), 400, TodoInvalidFilterError.message),
+        (TodoConflictError(), 409, TodoConflictError.message),
+        (RuntimeError('database is locked'), 500, 'Internal Server Error'),
+    ],
+)
+def test_todo_http_errors_maps_status_codes(error, status_code, detail):
+    """Test that domain errors keep their message and others become a 500."""
+    with pytest.raises(HTTPException) as raised, todo_http_errors():
+        raise error
+
+    assert raised.value.status_code == status_code
+    assert raised.value.detail == detail
+
+
+def test_parse_todo_fields_rejects_invalid_title():
+    """Test that a value breaking a domain rule is a 400."""
+    with pytest.raises(HTTPException) as raised:
+        parse_todo_fields('', None)
+
+    assert raised.value.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,27 @@
+"""Test cases for ArchiveCompletedTodosUseCaseImpl."""
+
+from datetime import datetime
+from unittest.mock import Mock, call
+
+from dddpy.domain.todo.repositories import TodoRepository, TodoUnitOfWork
+from dddpy.domain.todo.value_objects import TodoId
+from dddpy.usecase.todo.archive_completed_todos_usecase import (
+    ArchiveCompletedTodosUseCaseImpl,
+)
+
+
+def test_archive_commits_each_chunk():
+    """Test that every chunk is committed before the next one is moved."""
+    cutoff = datetime(2025, 1, 1)
+    unit_of_work = Mock(spec=TodoUnitOfWork)
+    unit_of_work.todos = Mock(spec=TodoRepository)
+    chunks = [[TodoId.generate(), TodoId.generate()], [TodoId.generate()]]
+    unit_of_work.todos.archive_completed_before.side_effect = chunks
+
+    archived = ArchiveCompletedTodosUseCaseImpl(unit_of_work, 2).execute(cutoff)
+
+    assert archived == sum(len(chunk) for chunk in chunks)
+    assert unit_of_work.mock_calls == [
+        call.todos.archive_completed_before(cutoff, 2),
+        call.commit(),
+    ] * len(chunks)
@@ -0,0 +1,249 @@
+"""Test cases for the async todo use case implementations."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import ANY, AsyncMock, call
+
+import pytest
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import (
+    TodoAlreadyCompletedError,
+    TodoNotFoundError,
+    TodoNotStartedError,
+)
+from dddpy.domain.todo.repositories import (
+    AsyncTodoRepository,
+    AsyncTodoUnitOfWork,
+    TodoFilter,
+    TodoPage,
+    TodoSearchHit,
+    TodoSearchPage,
+)
+from dddpy.domain.todo.value_objects import TodoId, TodoSortKey, TodoStatus, TodoTitle
+from dddpy.usecase.todo import (
+    TodoImportLine,
+    TodoUpsertItem,
+    new_async_complete_todo_usecase,
+    new_async_create_todo_usecase,
+    new_async_delete_todo_usecase,
+    new_async_find_todo_by_id_usecase,
+    new_async_find_todo_stats_usecase,
+    new_async_find_todos_usecase,
+    new_async_import_todos_usecase,
+    new_async_purge_completed_todos_usecase,
+    new_async_search_todos_usecase,
+    new_async_start_todo_usecase,
+    new_async_update_todo_usecase,
+    new_async_upsert_todos_usecase,
+)
+
+
+@pytest.fixture
+def todo_repository_mock():
+    """Create a mock AsyncTodoRepository."""
+    return AsyncMock(spec=AsyncTodoRepository)
+
+
+@pytest.fixture
+def todo():
+    """Create a sample Todo for testing."""
+    return Todo.create(TodoTitle('Test Todo'))
+
+
+def test_create_todo(todo_repository_mock):
+    """Test that a created todo is saved and returned."""
+    usecase = new_async_create_todo_usecase(todo_repository_mock)
+
+    result = asyncio.run(usecase.execute(TodoTitle('New Todo')))
+
+    assert result.title.value == 'New Todo'
+    todo_repository_mock.save.assert_awaited_once_with(result)
+
+
+def test_start_and_complete_todo(todo_repository_mock, todo):
+    """Test that the lifecycle transitions are single repository writes."""
+    todo_repository_mock.transition.return_value = todo
+
+    asyncio.run(new_async_start_todo_usecase(todo_repository_mock).execute(todo.id))
+    asyncio.run(new_async_complete_todo_usecase(todo_repository_mock).execute(todo.id))
+
+    assert todo_repository_mock.transition.await_args_list == [
+        call(todo.id, TodoStatus.IN_PROGRESS, (TodoStatus.NOT_STARTED,), ANY),
+        call(todo.id, TodoStatus.COMPLETED, (TodoStatus.IN_PROGRESS,), ANY),
+    ]
+    todo_repository_mock.find_status.assert_not_awaited()
+    todo_repository_mock.save.assert_not_awaited()
+
+    todo_repository_mock.transition.return_value = None
+    todo_repository_mock.find_status.return_value = TodoStatus.COMPLETED
+    with pytest.raises(TodoAlreadyCompletedError):
+        asyncio.run(
+            new_async_complete_todo_usecase(todo_repository_mock).execute(todo.id)
+        )
+
+
+def test_complete_not_started_todo(todo_repository_mock, todo):
+    """Test that completing a todo that has not started fails."""
+    todo_repository_mock.transition.return_value = None
+    todo_repository_mock.find_status.return_value = TodoStatus.NOT_STARTED
+    usecase = new_async_complete_todo_usecase(todo_repository_mock)
+
+    with pytest.raises(TodoNotStartedError):
+        asyncio.run(usecase.execute(todo.id))
+
+
+def test_update_todo(todo_repository_mock, todo):
+    """Test that updating a todo saves the new title."""
+    todo_repository_mock.find_by_id.return_value = todo
+    usecase = new_async_update_todo_usecase(todo_repository_mock)
+
+    result = asyncio.run(usecase.execute(todo.id, title=TodoTitle('Updated')))
+
+    assert result.title.value == 'Updated'
+    todo_repository_mock.save.assert_awaited_once_with(todo)
+
+
+@pytest.mark.parametrize(
+    'factory',
+    [
+        new_async_start_todo_usecase,
+        new_async_complete_todo_usecase,
+        new_async_update_todo_usecase,
+        new_async_delete_todo_usecase,
+        new_async_find_todo_by_id_usecase,
+    ],
+)
+def test_missing_todo_raises_not_found(todo_repository_mock, factory):
+    """Test that every id-based use case reports missing todos."""
+    todo_repository_mock.find_by_id.return_value = None
+    todo_repository_mock.transition.return_value = None
+    todo_repository_mock.find_status.return_value = None
+    usecase = factory(todo_repository_mock)
+
+    with pytest.raises(TodoNotFoundError):
+        asyncio.run(usecase.execute(TodoId.generate()))
+
+
+def test_delete_todo(todo_repository_mock, todo):
+    """Test that deleting an existing todo delegates to the repository."""
+    todo_repository_mock.find_by_id.return_value = todo
+    usecase = new_async_delete_todo_usecase(todo_repository_mock)
+
+    asyncio.run(usecase.execute(todo.id))
+
+    todo_repository_mock.delete.assert_awaited_once_with(todo.id)
+
+
+def test_find_todos(todo_repository_mock, todo):
+    """Test that the listing use case forwards paging and filter arguments."""
+    page = TodoPage(items=[todo], next_cursor='next')
+    todo_repository_mock.find_all.return_value = page
+    usecase = new_async_find_todos_usecase(todo_repository_mock)
+
+    todo_filter = TodoFilter(statuses=(TodoStatus.IN_PROGRESS,))
+
+    result = asyncio.run(
+        usecase.execute(
+            limit=5,
+            cursor='abc',
+            sort_key=TodoSortKey.UPDATED_AT,
+            todo_filter=todo_filter,
+        )
+    )
+
+    assert result == page
+    todo_repository_mock.find_all.assert_awaited_once_with(
+        limit=5,
+        cursor='abc',
+        sort_key=TodoSortKey.UPDATED_AT,
+        todo_filter=todo_filter,
+    )
+
+
+def test_search_todos(todo_repository_mock, todo):
+    """Test that the search use case forwards the query and paging arguments."""
+    page = TodoSearchPage(items=[TodoSearchHit(todo, 'Todo')], next_cursor='next')
+    todo_repository_mock.search.return_value = page
+    usecase = new_async_search_todos_usecase(todo_repository_mock)
+
+    result = asyncio.run(usecase.execute('todo', limit=5, cursor='abc'))
+
+    assert result == page
+    todo_repository_mock.search.assert_awaited_once_with('todo', limit=5, cursor='abc')
+
+
+def test_find_todo_stats(todo_repository_mock):
+    """Test that the stats use case returns the repository counts."""
+    counts = {TodoStatus.NOT_STARTED: 2, TodoStatus.COMPLETED: 1}
+    todo_repository_mock.count_by_status.return_value = counts
+    usecase = new_async_find_todo_stats_usecase(todo_repository_mock)
+
+    result = asyncio.run(usecase.execute())
+
+    assert result == counts
+    todo_repository_mock.count_by_status.assert_awaited_once_with()
+
+
+def test_upsert_todos(todo_repository_mock, todo):
+    """Test that the async upsert reports per-item results and saves once."""
+    todo_repository_mock.find_by_ids.return_value = [todo]
+    todo_repository_mock.save_many.return_value = set()
+    usecase = new_async_upsert_todos_usecase(todo_repository_mock)
+
+    results = asyncio.run(
+        usecase.execute(
+            [
+                TodoUpsertItem(title='Created'),
+                TodoUpsertItem(title='Renamed', todo_id=todo.id),
+                TodoUpsertItem(title='Unknown', todo_id=TodoId.generate()),
+            ]
+        )
+    )
+
+    assert [r.created for r in results] == [True, False, False]
+    assert results[2].error == TodoNotFoundError.message
+    saved = todo_repository_mock.save_many.await_args.args[0]
+    assert [t.title.value for t in saved] == ['Created', 'Renamed']
+    assert todo.title.value == 'Renamed'
+
+
+def test_import_todos(todo_repository_mock):
+    """Test that the async import inserts valid lines and commits the chunk."""
+    unit_of_work = AsyncMock(spec=AsyncTodoUnitOfWork)
+    unit_of_work.todos = todo_repository_mock
+    usecase = new_async_import_todos_usecase(unit_of_work)
+
+    result = asyncio.run(
+        usecase.execute(
+            [
+                TodoImportLine(1, b'{"title": "Imported"}'),
+                TodoImportLine(2, b'{"title": ""}'),
+            ]
+        )
+    )
+
+    assert (result.accepted, result.rejected) == (1, 1)
+    assert [error.line for error in result.errors] == [2]
+    added = todo_repository_mock.add_many.await_args.args[0]
+    assert [t.title.value for t in added] == ['Imported']
+    unit_of_work.commit.assert_awaited_once_with()
+
+
+def test_purge_completed_todos(todo_repository_mock, todo):
+    """Test that the async purge commits every chunk until one comes back short."""
+    unit_of_work = AsyncMock(spec=AsyncTodoUnitOfWork)
+    unit_of_work.todos = todo_repository_mock
+    todo_repository_mock.delete_completed_before.side_effect = [[todo.id], []]
+    cutoff = datetime(2025, 1, 1)
+
+    deleted = asyncio.run(
+        new_async_purge_completed_todos_usecase(unit_of_work, 1).execute(cutoff)
+    )
+
+    assert deleted == 1
+    assert todo_repository_mock.delete_completed_before.await_args_list == [
+        call(cutoff, 1),
+        call(cutoff, 1),
+    ]
+    unit_of_work.commit.assert_has_awaits([call(), call()])
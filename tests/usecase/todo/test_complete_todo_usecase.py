@@ -1,6 +1,6 @@
 """Test cases for CompleteTodoUseCaseImpl."""
 
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
 import pytest
 
@@ -35,9 +35,10 @@ def todo():
 
 
 def test_complete_todo_success(complete_todo_usecase, todo_repository_mock, todo):
-    """Test completing a Todo successfully."""
+    """Test completing a Todo with a single conditional write."""
     # Arrange
-    todo_repository_mock.find_by_id.return_value = todo
+    todo.complete()
+    todo_repository_mock.transition.return_value = todo
 
     # Act
     result = complete_todo_usecase.execute(todo.id)
@@ -45,15 +46,20 @@ def test_complete_todo_success(complete_todo_usecase, todo_repository_mock, todo
     # Assert
     assert result.status == TodoStatus.COMPLETED
     assert result.completed_at is not None
-    todo_repository_mock.find_by_id.assert_called_once_with(todo.id)
-    todo_repository_mock.save.assert_called_once_with(result)
+    todo_repository_mock.transition.assert_called_once_with(
+        todo.id, TodoStatus.COMPLETED, (TodoStatus.IN_PROGRESS,), ANY
+    )
+    todo_repository_mock.find_by_id.assert_not_called()
+    todo_repository_mock.find_status.assert_not_called()
+    todo_repository_mock.save.assert_not_called()
 
 
 def test_complete_todo_not_found(complete_todo_usecase, todo_repository_mock):
     """Test completing a non-existent Todo."""
     # Arrange
     todo_id = TodoId.generate()
-    todo_repository_mock.find_by_id.return_value = None
+    todo_repository_mock.transition.return_value = None
+    todo_repository_mock.find_status.return_value = None
 
     # Act & Assert
     with pytest.raises(Exception) as exc_info:
@@ -66,8 +72,8 @@ def test_complete_already_completed_todo(
 ):
     """Test completing an already completed Todo."""
     # Arrange
-    todo.complete()  # Make the todo completed
-    todo_repository_mock.find_by_id.return_value = todo
+    todo_repository_mock.transition.return_value = None
+    todo_repository_mock.find_status.return_value = TodoStatus.COMPLETED
 
     # Act & Assert
     with pytest.raises(Exception) as exc_info:
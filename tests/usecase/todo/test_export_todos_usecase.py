@@ -0,0 +1,21 @@
+"""Test cases for ExportTodosUseCaseImpl."""
+
+from unittest.mock import Mock
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.value_objects import TodoTitle
+from dddpy.usecase.todo.export_todos_usecase import ExportTodosUseCaseImpl
+
+
+def test_export_todos_streams_repository_iterator():
+    """Test that the export passes the batch size through and stays lazy."""
+    todos = [Todo.create(TodoTitle('First')), Todo.create(TodoTitle('Second'))]
+    todo_repository_mock = Mock(spec=TodoRepository)
+    todo_repository_mock.iter_all.return_value = iter(todos)
+
+    result = ExportTodosUseCaseImpl(todo_repository_mock).execute(batch_size=50)
+
+    todo_repository_mock.iter_all.assert_called_once_with(50)
+    assert list(result) == todos
+    todo_repository_mock.find_all.assert_not_called()
@@ -0,0 +1,24 @@
+"""Test cases for FindArchivedTodosUseCaseImpl."""
+
+from unittest.mock import Mock
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.repositories import TodoPage, TodoRepository
+from dddpy.domain.todo.value_objects import TodoTitle
+from dddpy.usecase.todo.find_archived_todos_usecase import (
+    FindArchivedTodosUseCaseImpl,
+)
+
+
+def test_find_archived_todos_returns_repository_page():
+    """Test that the page size and cursor reach the repository."""
+    page = TodoPage([Todo.create(TodoTitle('Shipped'))], 'next')
+    todo_repository_mock = Mock(spec=TodoRepository)
+    todo_repository_mock.find_archived.return_value = page
+
+    result = FindArchivedTodosUseCaseImpl(todo_repository_mock).execute(
+        limit=5, cursor='cursor'
+    )
+
+    assert result is page
+    todo_repository_mock.find_archived.assert_called_once_with(limit=5, cursor='cursor')
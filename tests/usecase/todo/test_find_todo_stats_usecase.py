@@ -0,0 +1,23 @@
+"""Test cases for FindTodoStatsUseCaseImpl."""
+
+from unittest.mock import Mock
+
+from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.value_objects import TodoStatus
+from dddpy.usecase.todo.find_todo_stats_usecase import FindTodoStatsUseCaseImpl
+
+
+def test_find_todo_stats_returns_repository_counts():
+    """Test that the counts come straight from the repository."""
+    counts = {
+        TodoStatus.NOT_STARTED: 2,
+        TodoStatus.IN_PROGRESS: 0,
+        TodoStatus.COMPLETED: 1,
+    }
+    todo_repository_mock = Mock(spec=TodoRepository)
+    todo_repository_mock.count_by_status.return_value = counts
+
+    result = FindTodoStatsUseCaseImpl(todo_repository_mock).execute()
+
+    assert result == counts
+    todo_repository_mock.count_by_status.assert_called_once_with()
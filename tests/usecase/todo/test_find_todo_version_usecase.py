@@ -0,0 +1,20 @@
+"""Test cases for FindTodoVersionUseCaseImpl."""
+
+from unittest.mock import Mock
+
+from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.value_objects import TodoId
+from dddpy.usecase.todo.find_todo_version_usecase import FindTodoVersionUseCaseImpl
+
+
+def test_find_todo_version_reads_version_only():
+    """Test that the version comes from the repository without loading the todo."""
+    todo_repository_mock = Mock(spec=TodoRepository)
+    todo_repository_mock.find_version.return_value = 1
+    todo_id = TodoId.generate()
+
+    result = FindTodoVersionUseCaseImpl(todo_repository_mock).execute(todo_id)
+
+    assert result == 1
+    todo_repository_mock.find_version.assert_called_once_with(todo_id)
+    todo_repository_mock.find_by_id.assert_not_called()
@@ -5,8 +5,14 @@ from unittest.mock import Mock
 import pytest
 
 from dddpy.domain.todo.entities import Todo
-from dddpy.domain.todo.repositories import TodoRepository
-from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
+from dddpy.domain.todo.repositories import TodoFilter, TodoPage, TodoRepository
+from dddpy.domain.todo.value_objects import (
+    TodoDescription,
+    TodoId,
+    TodoSortKey,
+    TodoStatus,
+    TodoTitle,
+)
 from dddpy.usecase.todo.find_todos_usecase import FindTodosUseCaseImpl
 
 
@@ -25,13 +31,14 @@ def find_todos_usecase(todo_repository_mock):
 def test_find_todos_empty_list(find_todos_usecase, todo_repository_mock):
     """Test finding todos when there are no todos."""
     # Arrange
-    todo_repository_mock.find_all.return_value = []
+    todo_repository_mock.find_all.return_value = TodoPage([])
 
     # Act
     result = find_todos_usecase.execute()
 
     # Assert
-    assert len(result) == 0
+    assert len(result.items) == 0
+    assert result.next_cursor is None
     todo_repository_mock.find_all.assert_called_once()
 
 
@@ -50,13 +57,37 @@ def test_find_todos_with_items(find_todos_usecase, todo_repository_mock):
             description=TodoDescription('Description 2'),
         ),
     ]
-    todo_repository_mock.find_all.return_value = todos
+    todo_repository_mock.find_all.return_value = TodoPage(todos, 'next')
 
     # Act
     result = find_todos_usecase.execute()
 
     # Assert
-    assert len(result) == len(todos)
-    assert result[0].title == todos[0].title
-    assert result[1].title == todos[1].title
+    assert len(result.items) == len(todos)
+    assert result.items[0].title == todos[0].title
+    assert result.items[1].title == todos[1].title
+    assert result.next_cursor == 'next'
     todo_repository_mock.find_all.assert_called_once()
+
+
+def test_find_todos_forwards_page_options(find_todos_usecase, todo_repository_mock):
+    """Test that paging and filter options are passed through to the repository."""
+    # Arrange
+    todo_repository_mock.find_all.return_value = TodoPage([])
+    todo_filter = TodoFilter(statuses=(TodoStatus.IN_PROGRESS,))
+
+    # Act
+    find_todos_usecase.execute(
+        limit=5,
+        cursor='abc',
+        sort_key=TodoSortKey.UPDATED_AT,
+        todo_filter=todo_filter,
+    )
+
+    # Assert
+    todo_repository_mock.find_all.assert_called_once_with(
+        limit=5,
+        cursor='abc',
+        sort_key=TodoSortKey.UPDATED_AT,
+        todo_filter=todo_filter,
+    )
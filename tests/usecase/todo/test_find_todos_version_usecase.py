@@ -0,0 +1,18 @@
+"""Test cases for FindTodosVersionUseCaseImpl."""
+
+from unittest.mock import Mock
+
+from dddpy.domain.todo.repositories import TodoListVersion, TodoRepository
+from dddpy.usecase.todo.find_todos_version_usecase import FindTodosVersionUseCaseImpl
+
+
+def test_find_todos_version_does_not_list_todos():
+    """Test that the list version comes from the repository without a listing."""
+    todo_repository_mock = Mock(spec=TodoRepository)
+    version = TodoListVersion(count=3, latest_update=None, deletions=1)
+    todo_repository_mock.find_list_version.return_value = version
+
+    result = FindTodosVersionUseCaseImpl(todo_repository_mock).execute()
+
+    assert result == version
+    todo_repository_mock.find_all.assert_not_called()
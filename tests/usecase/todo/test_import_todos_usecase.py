@@ -0,0 +1,112 @@
+"""Test cases for ImportTodosUseCaseImpl."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from dddpy.domain.todo.repositories import TodoRepository, TodoUnitOfWork
+from dddpy.usecase.todo import import_todos_usecase
+from dddpy.usecase.todo.import_todos_usecase import (
+    IMPORT_LINE_TOO_DEEP_ERROR_MESSAGE,
+    IMPORT_LINE_TOO_LONG_ERROR_MESSAGE,
+    IMPORT_VALIDATION_BATCH_SIZE,
+    INVALID_IMPORT_LINE_ERROR_MESSAGE,
+    MAX_IMPORT_LINE_BYTES,
+    ImportTodosUseCaseImpl,
+    TodoImportLine,
+)
+
+
+def make_lines(*objects: object) -> list[TodoImportLine]:
+    """Encode objects as numbered import lines."""
+    return [
+        TodoImportLine(number, json.dumps(value).encode())
+        for number, value in enumerate(objects, start=1)
+    ]
+
+
+@pytest.fixture
+def unit_of_work_mock():
+    """Create a mock TodoUnitOfWork holding a mock TodoRepository."""
+    unit_of_work = Mock(spec=TodoUnitOfWork)
+    unit_of_work.todos = Mock(spec=TodoRepository)
+    return unit_of_work
+
+
+def test_import_reports_invalid_lines_and_commits_valid_ones(unit_of_work_mock):
+    """Test that valid lines are inserted and committed, invalid ones reported."""
+    lines = make_lines(
+        {'title': 'First', 'description': 'Details'},
+        {'title': ''},
+        ['not', 'an', 'object'],
+        {'title': 'Second'},
+    )
+    lines.append(TodoImportLine(5, b'{broken'))
+
+    result = ImportTodosUseCaseImpl(unit_of_work_mock).execute(lines)
+
+    assert (result.accepted, result.rejected) == (2, 3)
+    assert [error.line for error in result.errors] == [2, 3, 5]
+    assert result.errors[0].error == 'Title is required'
+    assert result.errors[1].error == INVALID_IMPORT_LINE_ERROR_MESSAGE
+    added = unit_of_work_mock.todos.add_many.call_args.args[0]
+    assert [todo.title.value for todo in added] == ['First', 'Second']
+    assert added[0].description is not None
+    unit_of_work_mock.commit.assert_called_once_with()
+
+
+def test_import_validates_through_executor(unit_of_work_mock):
+    """Test that an executor validates batches and keeps the input order."""
+    lines = make_lines(*({'title': f'Todo {i}'} for i in range(1200)))
+
+    with ThreadPoolExecutor(2) as executor:
+        result = ImportTodosUseCaseImpl(unit_of_work_mock, executor).execute(lines)
+
+    assert result.accepted == len(lines) > IMPORT_VALIDATION_BATCH_SIZE
+    added = unit_of_work_mock.todos.add_many.call_args.args[0]
+    assert [todo.title.value for todo in added] == [
+        f'Todo {i}' for i in range(len(lines))
+    ]
+
+
+def test_import_skips_commit_when_nothing_is_valid(unit_of_work_mock):
+    """Test that a chunk of rejected lines writes nothing."""
+
+    result = ImportTodosUseCaseImpl(unit_of_work_mock).execute(
+        make_lines({'title': ''})
+    )
+
+    assert result.accepted == 0
+    unit_of_work_mock.todos.add_many.assert_not_called()
+    unit_of_work_mock.commit.assert_not_called()
+
+
+def test_import_rejects_oversize_and_deeply_nested_lines(
+    unit_of_work_mock, monkeypatch
+):
+    """Test that lines too long or too deep to decode are line errors."""
+
+    def loads(content: bytes) -> object:
+        # How deep a line must nest to exhaust recursion depends on the
+        # interpreter, so the decoder is made to fail for nested arrays.
+        if content.startswith(b'[['):
+            raise RecursionError
+        return json.loads(content)
+
+    monkeypatch.setattr(import_todos_usecase, 'json', SimpleNamespace(loads=loads))
+    lines = [
+        TodoImportLine(1, b'{"title": "' + b'x' * MAX_IMPORT_LINE_BYTES + b'"}'),
+        TodoImportLine(2, b'[[[]]]'),
+        TodoImportLine(3, b'{"title": "Kept"}'),
+    ]
+
+    result = ImportTodosUseCaseImpl(unit_of_work_mock).execute(lines)
+
+    assert (result.accepted, result.rejected) == (1, 2)
+    assert [(error.line, error.error) for error in result.errors] == [
+        (1, IMPORT_LINE_TOO_LONG_ERROR_MESSAGE),
+        (2, IMPORT_LINE_TOO_DEEP_ERROR_MESSAGE),
+    ]
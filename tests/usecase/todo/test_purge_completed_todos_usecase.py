@@ -0,0 +1,60 @@
+"""Test cases for PurgeCompletedTodosUseCaseImpl."""
+
+from datetime import datetime
+from unittest.mock import Mock, call
+
+import pytest
+
+from dddpy.domain.todo.repositories import TodoRepository, TodoUnitOfWork
+from dddpy.domain.todo.value_objects import TodoId
+from dddpy.usecase.todo.purge_completed_todos_usecase import (
+    PurgeCompletedTodosUseCaseImpl,
+)
+
+CUTOFF = datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def unit_of_work_mock():
+    """Create a mock TodoUnitOfWork holding a mock TodoRepository."""
+    unit_of_work = Mock(spec=TodoUnitOfWork)
+    unit_of_work.todos = Mock(spec=TodoRepository)
+    return unit_of_work
+
+
+def test_purge_commits_each_chunk(unit_of_work_mock):
+    """Test that every chunk is committed before the next one is deleted."""
+    chunks = [
+        [TodoId.generate(), TodoId.generate()],
+        [TodoId.generate(), TodoId.generate()],
+        [TodoId.generate()],
+    ]
+    unit_of_work_mock.todos.delete_completed_before.side_effect = chunks
+
+    deleted = PurgeCompletedTodosUseCaseImpl(unit_of_work_mock, 2).execute(CUTOFF)
+
+    assert deleted == sum(len(chunk) for chunk in chunks)
+    assert unit_of_work_mock.mock_calls == [
+        call.todos.delete_completed_before(CUTOFF, 2),
+        call.commit(),
+    ] * len(chunks)
+
+
+def test_purge_stops_after_an_empty_chunk(unit_of_work_mock):
+    """Test that a full last chunk is followed by one empty, committed chunk."""
+    unit_of_work_mock.todos.delete_completed_before.side_effect = [
+        [TodoId.generate()],
+        [],
+    ]
+
+    deleted = PurgeCompletedTodosUseCaseImpl(unit_of_work_mock, 1).execute(CUTOFF)
+
+    assert deleted == 1
+    assert (
+        unit_of_work_mock.mock_calls
+        == [
+            call.todos.delete_completed_before(CUTOFF, 1),
+            call.commit(),
+        ]
+        * 2
+    )
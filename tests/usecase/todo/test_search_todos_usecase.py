@@ -0,0 +1,29 @@
+"""Test cases for SearchTodosUseCaseImpl."""
+
+from unittest.mock import Mock
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.repositories import (
+    TodoRepository,
+    TodoSearchHit,
+    TodoSearchPage,
+)
+from dddpy.domain.todo.value_objects import TodoTitle
+from dddpy.usecase.todo.search_todos_usecase import SearchTodosUseCaseImpl
+
+
+def test_search_todos_returns_repository_page():
+    """Test that the query, page size, and cursor reach the repository."""
+    todo = Todo.create(TodoTitle('Write report'))
+    page = TodoSearchPage([TodoSearchHit(todo, 'Write <mark>report</mark>')], 'next')
+    todo_repository_mock = Mock(spec=TodoRepository)
+    todo_repository_mock.search.return_value = page
+
+    result = SearchTodosUseCaseImpl(todo_repository_mock).execute(
+        'report', limit=5, cursor='cursor'
+    )
+
+    assert result is page
+    todo_repository_mock.search.assert_called_once_with(
+        'report', limit=5, cursor='cursor'
+    )
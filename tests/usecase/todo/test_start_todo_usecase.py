@@ -1,10 +1,11 @@
 """Test cases for StartTodoUseCaseImpl."""
 
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
 import pytest
 
 from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoAlreadyStartedError
 from dddpy.domain.todo.repositories import TodoRepository
 from dddpy.domain.todo.value_objects import TodoId, TodoStatus, TodoTitle
 from dddpy.usecase.todo.start_todo_usecase import StartTodoUseCaseImpl
@@ -33,24 +34,30 @@ def todo():
 
 
 def test_start_todo_success(start_todo_usecase, todo_repository_mock, todo):
-    """Test starting a Todo successfully."""
+    """Test starting a Todo with a single conditional write."""
     # Arrange
-    todo_repository_mock.find_by_id.return_value = todo
+    todo.start()
+    todo_repository_mock.transition.return_value = todo
 
     # Act
     result = start_todo_usecase.execute(todo.id)
 
     # Assert
     assert result.status == TodoStatus.IN_PROGRESS
-    todo_repository_mock.find_by_id.assert_called_once_with(todo.id)
-    todo_repository_mock.save.assert_called_once_with(result)
+    todo_repository_mock.transition.assert_called_once_with(
+        todo.id, TodoStatus.IN_PROGRESS, (TodoStatus.NOT_STARTED,), ANY
+    )
+    todo_repository_mock.find_by_id.assert_not_called()
+    todo_repository_mock.find_status.assert_not_called()
+    todo_repository_mock.save.assert_not_called()
 
 
 def test_start_todo_not_found(start_todo_usecase, todo_repository_mock):
     """Test starting a non-existent Todo."""
     # Arrange
     todo_id = TodoId.generate()
-    todo_repository_mock.find_by_id.return_value = None
+    todo_repository_mock.transition.return_value = None
+    todo_repository_mock.find_status.return_value = None
 
     # Act & Assert
     with pytest.raises(Exception) as exc_info:
@@ -61,10 +68,21 @@ def test_start_todo_not_found(start_todo_usecase, todo_repository_mock):
 def test_start_completed_todo(start_todo_usecase, todo_repository_mock, todo):
     """Test starting a completed Todo."""
     # Arrange
-    todo.complete()  # Make the todo completed
-    todo_repository_mock.find_by_id.return_value = todo
+    todo_repository_mock.transition.return_value = None
+    todo_repository_mock.find_status.return_value = TodoStatus.COMPLETED
 
     # Act & Assert
     with pytest.raises(Exception) as exc_info:
         start_todo_usecase.execute(todo.id)
     assert 'The Todo is already completed' in str(exc_info.value)
+
+
+def test_start_started_todo(start_todo_usecase, todo_repository_mock, todo):
+    """Test starting a Todo that is already in progress."""
+    # Arrange
+    todo_repository_mock.transition.return_value = None
+    todo_repository_mock.find_status.return_value = TodoStatus.IN_PROGRESS
+
+    # Act & Assert
+    with pytest.raises(TodoAlreadyStartedError):
+        start_todo_usecase.execute(todo.id)
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 import pytest
 
 from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoConflictError
 from dddpy.domain.todo.repositories import TodoRepository
 from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
 from dddpy.usecase.todo.update_todo_usecase import UpdateTodoUseCaseImpl
@@ -94,3 +95,17 @@ def test_update_todo_not_found(update_todo_usecase, todo_repository_mock):
     with pytest.raises(Exception) as exc_info:
         update_todo_usecase.execute(todo_id, title=new_title)
     assert 'The Todo you specified does not exist' in str(exc_info.value)
+
+
+def test_update_todo_stale_version(update_todo_usecase, todo_repository_mock, todo):
+    """Test that an update expecting an older version is rejected."""
+    # Arrange
+    todo.version = 3
+    todo_repository_mock.find_by_id.return_value = todo
+
+    # Act & Assert
+    with pytest.raises(TodoConflictError):
+        update_todo_usecase.execute(
+            todo.id, title=TodoTitle('Updated Title'), expected_version=2
+        )
+    todo_repository_mock.save.assert_not_called()
@@ -0,0 +1,120 @@
+"""Test cases for UpsertTodosUseCaseImpl."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoConflictError
+from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
+from dddpy.usecase.todo.upsert_todos_usecase import (
+    TodoUpsertItem,
+    UpsertTodosUseCaseImpl,
+)
+
+
+@pytest.fixture
+def todo_repository_mock():
+    """Create a mock TodoRepository."""
+    repository = Mock(spec=TodoRepository)
+    repository.find_by_ids.return_value = []
+    repository.save_many.return_value = set()
+    return repository
+
+
+@pytest.fixture
+def upsert_todos_usecase(todo_repository_mock):
+    """Create an UpsertTodosUseCaseImpl instance with mocked repository."""
+    return UpsertTodosUseCaseImpl(todo_repository_mock)
+
+
+def test_upsert_creates_new_todos(upsert_todos_usecase, todo_repository_mock):
+    """Test that items without an id create todos in one batch save."""
+    # Act
+    results = upsert_todos_usecase.execute(
+        [TodoUpsertItem('First'), TodoUpsertItem('Second', 'Details')]
+    )
+
+    # Assert
+    assert [result.created for result in results] == [True, True]
+    assert results[1].todo is not None
+    assert results[1].todo.description == TodoDescription('Details')
+    todo_repository_mock.save_many.assert_called_once_with(
+        [result.todo for result in results]
+    )
+
+
+def test_upsert_updates_existing_todo(upsert_todos_usecase, todo_repository_mock):
+    """Test that items with a known id update the loaded todo."""
+    # Arrange
+    todo = Todo(id=TodoId.generate(), title=TodoTitle('Original'))
+    todo_repository_mock.find_by_ids.return_value = [todo]
+
+    # Act
+    results = upsert_todos_usecase.execute([TodoUpsertItem('Renamed', todo_id=todo.id)])
+
+    # Assert
+    assert results[0].todo is todo
+    assert not results[0].created
+    assert todo.title == TodoTitle('Renamed')
+    todo_repository_mock.find_by_ids.assert_called_once_with([todo.id])
+    todo_repository_mock.save_many.assert_called_once_with([todo])
+
+
+def test_upsert_reports_invalid_items(upsert_todos_usecase, todo_repository_mock):
+    """Test that invalid and unknown items are rejected individually."""
+    # Act
+    results = upsert_todos_usecase.execute(
+        [
+            TodoUpsertItem(''),
+            TodoUpsertItem('Missing', todo_id=TodoId.generate()),
+            TodoUpsertItem('Valid'),
+        ]
+    )
+
+    # Assert
+    assert results[0].error == 'Title is required'
+    assert results[1].error == 'The Todo you specified does not exist.'
+    assert results[2].todo is not None
+    todo_repository_mock.save_many.assert_called_once_with([results[2].todo])
+
+
+def test_upsert_clears_description_with_empty_string(
+    upsert_todos_usecase, todo_repository_mock
+):
+    """Test that an empty description clears it while None keeps it."""
+    # Arrange
+    kept = Todo(TodoId.generate(), TodoTitle('Kept'), TodoDescription('Keep me'))
+    cleared = Todo(TodoId.generate(), TodoTitle('Cleared'), TodoDescription('Drop'))
+    todo_repository_mock.find_by_ids.return_value = [kept, cleared]
+
+    # Act
+    upsert_todos_usecase.execute(
+        [
+            TodoUpsertItem('Kept', todo_id=kept.id),
+            TodoUpsertItem('Cleared', '', todo_id=cleared.id),
+        ]
+    )
+
+    # Assert
+    assert kept.description == TodoDescription('Keep me')
+    assert cleared.description is None
+
+
+def test_upsert_reports_conflicting_items(upsert_todos_usecase, todo_repository_mock):
+    """Test that todos changed concurrently fail alone instead of the batch."""
+    # Arrange
+    stale = Todo(id=TodoId.generate(), title=TodoTitle('Stale'), version=1)
+    todo_repository_mock.find_by_ids.return_value = [stale]
+    todo_repository_mock.save_many.return_value = {stale.id}
+
+    # Act
+    results = upsert_todos_usecase.execute(
+        [TodoUpsertItem('Renamed', todo_id=stale.id), TodoUpsertItem('Created')]
+    )
+
+    # Assert
+    assert results[0].todo is None
+    assert results[0].error == TodoConflictError.message
+    assert results[1].created